@@ -99,9 +99,18 @@ def build_cognitive_digest(paths) -> CognitiveDigest:
     """
     digest = CognitiveDigest()
 
-    # Mood from state file
+    # Mood from state file (through the resident store, which may hold unflushed changes)
+    state = {}
+    try:
+        from daemon.state_core import get_state_store
+        store = get_state_store()
+        if store.path == paths.state_file:
+            state = store.load()
+        else:
+            state = json.loads(paths.state_file.read_text())
+    except Exception:
+        pass
     try:
-        state = json.loads(paths.state_file.read_text())
         digest.mood_valence = float(state.get("valence", 0))
         digest.mood_energy = float(state.get("energy", 0))
         digest.mood_openness = float(state.get("openness", 0))
@@ -110,26 +119,22 @@ def build_cognitive_digest(paths) -> CognitiveDigest:
 
     # Memory count from ChromaDB
     try:
-        import chromadb
-        client = chromadb.PersistentClient(path=str(paths.memory_db))
-        col = client.get_collection("memories")
-        digest.memory_count = col.count()
-    except Exception:
-        pass
-
-    # Models count
-    try:
-        models_dir = paths.models_dir
-        if models_dir.is_dir():
-            digest.model_count = sum(1 for f in models_dir.iterdir() if f.suffix == ".json")
+        from memory.chroma import ChromaRegistry, get_chroma
+        chroma = get_chroma()
+        if chroma.paths.data_dir != paths.data_dir:
+            chroma = ChromaRegistry(paths)
+        digest.memory_count = chroma.collection("elara_memories").count()
     except Exception:
         pass
 
-    # Predictions count
+    # Models and predictions counts
     try:
-        pred_dir = paths.predictions_dir
-        if pred_dir.is_dir():
-            digest.prediction_count = sum(1 for f in pred_dir.iterdir() if f.suffix == ".json")
+        from daemon.record_store import RecordStore, get_record_store
+        store = get_record_store()
+        if store.paths.data_dir != paths.data_dir:
+            store = RecordStore(paths)
+        digest.model_count = store.count("models")
+        digest.prediction_count = store.count("predictions")
     except Exception:
         pass
 
@@ -172,7 +177,6 @@ def build_cognitive_digest(paths) -> CognitiveDigest:
 
     # Allostatic load from state
     try:
-        state = json.loads(paths.state_file.read_text())
         digest.allostatic_load = float(state.get("allostatic_load", 0))
     except Exception:
         pass
@@ -20,7 +20,6 @@ import json
 import logging
 import os
 import threading
-import time
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -132,8 +131,9 @@ class L1Bridge:
         self._seen_artifact_ids: set = set()
         self._dedup_lock = threading.Lock()
         self._dedup_max = 10_000
-        self._rate_timestamps: list = []
         self._rate_limit = int(os.environ.get("ELARA_BRIDGE_RATE_LIMIT", "120"))
+        from network.ratelimit import SlidingWindowLimiter
+        self._rate_limiter = SlidingWindowLimiter(self._rate_limit, window_seconds=60.0)
 
         logger.info(
             "Layer 1 bridge initialized — identity=%s, dag_records=%d",
@@ -220,14 +220,10 @@ class L1Bridge:
 
     def _check_rate_limit(self) -> bool:
         """Sliding window rate limit (default 120/min)."""
-        now = time.monotonic()
-        cutoff = now - 60.0
-        self._rate_timestamps = [t for t in self._rate_timestamps if t > cutoff]
-        if len(self._rate_timestamps) >= self._rate_limit:
+        if not self._rate_limiter.allow("events"):
             self._metrics.skipped_rate_limit += 1
             logger.warning("Rate limit: %d events/min exceeded", self._rate_limit)
             return False
-        self._rate_timestamps.append(now)
         return True
 
     # ------------------------------------------------------------------
@@ -144,6 +144,13 @@ class ElaraPaths:
     def reflections_dir(self) -> Path:
         return self._root / "elara-reflections"
 
+    # ------------------------------------------------------------------
+    # Shared vector store (every ChromaDB collection, one client)
+    # ------------------------------------------------------------------
+    @property
+    def chroma_db(self) -> Path:
+        return self._root / "elara-chroma-db"
+
     # ------------------------------------------------------------------
     # Memory databases
     # ------------------------------------------------------------------
@@ -155,6 +162,10 @@ class ElaraPaths:
     def recall_log(self) -> Path:
         return self._root / "elara-recall-log.jsonl"
 
+    @property
+    def recall_index(self) -> Path:
+        return self._root / "elara-recall-index.db"
+
     @property
     def consolidation_state(self) -> Path:
         return self._root / "elara-consolidation-state.json"
@@ -167,10 +178,30 @@ class ElaraPaths:
     def memory_contradictions(self) -> Path:
         return self._root / "elara-memory-contradictions.json"
 
+    @property
+    def embedding_cache(self) -> Path:
+        return self._root / "elara-embeddings.db"
+
+    @property
+    def llm_cache(self) -> Path:
+        return self._root / "elara-llm-cache.db"
+
     @property
     def conversations_db(self) -> Path:
         return self._root / "elara-conversations-db"
 
+    @property
+    def ingest_request(self) -> Path:
+        return self._root / "elara-ingest-request.json"
+
+    @property
+    def ingest_watermark(self) -> Path:
+        return self._root / "elara-ingest-watermark.json"
+
+    @property
+    def ingest_lock(self) -> Path:
+        return self._root / "elara-ingest.lock"
+
     @property
     def episodes_dir(self) -> Path:
         return self._root / "elara-episodes"
@@ -233,6 +264,10 @@ class ElaraPaths:
     def synthesis_db(self) -> Path:
         return self._root / "elara-synthesis-db"
 
+    @property
+    def records_db(self) -> Path:
+        return self._root / "elara-records.sqlite"
+
     # ------------------------------------------------------------------
     # Business
     # ------------------------------------------------------------------
@@ -355,10 +390,25 @@ class ElaraPaths:
     def overwatch_log(self) -> Path:
         return self._root / "elara-overwatch.log"
 
+    @property
+    def overwatch_stats(self) -> Path:
+        return self._root / "elara-overwatch-stats.json"
+
     @property
     def session_snapshot(self) -> Path:
         return self._root / "elara-session-snapshot.json"
 
+    # ------------------------------------------------------------------
+    # Enrichment server (resident UserPromptSubmit hook backend)
+    # ------------------------------------------------------------------
+    @property
+    def enrich_socket(self) -> Path:
+        return self._root / "elara-enrich.sock"
+
+    @property
+    def enrich_pid(self) -> Path:
+        return self._root / "elara-enrich.pid"
+
     # ------------------------------------------------------------------
     # Knowledge Graph
     # ------------------------------------------------------------------
@@ -410,6 +460,10 @@ class ElaraPaths:
     def attestations_db(self) -> Path:
         return self._root / "elara-attestations.sqlite"
 
+    @property
+    def network_sync_state(self) -> Path:
+        return self._root / "elara-network-sync.json"
+
     # ------------------------------------------------------------------
     # Workflows (learned action sequences)
     # ------------------------------------------------------------------
@@ -449,6 +503,7 @@ class ElaraPaths:
             self.handoff_archive,
             self.corrections_db,
             self.reflections_dir,
+            self.chroma_db,
             self.memory_db,
             self.conversations_db,
             self.episodes_dir,
@@ -23,21 +23,14 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
 from daemon.schemas import atomic_write_json
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 logger = logging.getLogger("elara.briefing")
 
 # Paths
 _p = get_paths()
 FEEDS_CONFIG = _p.feeds_config
-BRIEFING_DB_DIR = _p.briefing_db
 BRIEFING_FILE = _p.briefing_file
 
 # Defaults
@@ -115,28 +108,10 @@ def list_feeds() -> List[Dict]:
 # ChromaDB collection
 # ============================================================================
 
-_chroma_client = None
-_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _collection
-    if _collection is not None:
-        return _collection
-
     if not CHROMA_AVAILABLE:
         return None
-
-    BRIEFING_DB_DIR.mkdir(parents=True, exist_ok=True)
-    _chroma_client = chromadb.PersistentClient(
-        path=str(BRIEFING_DB_DIR),
-        settings=Settings(anonymized_telemetry=False),
-    )
-    _collection = _chroma_client.get_or_create_collection(
-        name="elara_briefing",
-        metadata={"hnsw:space": "cosine"},
-    )
-    return _collection
+    return get_chroma().collection("elara_briefing")
 
 
 # ============================================================================
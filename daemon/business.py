@@ -6,27 +6,26 @@
 Elara Business Intelligence — Track ideas, competitors, viability scoring.
 
 Wraps reasoning + synthesis + outcomes with business vocabulary.
-No ChromaDB needed (small dataset, direct JSON lookup).
+No ChromaDB needed (small dataset, direct lookup by id).
 
-Storage: ~/.claude/elara-business/ (one JSON per idea)
+Storage: "business" records in the shared record store (daemon/record_store.py)
 """
 
 import logging
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, List, Dict
 
-from core.paths import get_paths
 from daemon.events import bus, Events
+from daemon.record_store import get_record_store
 from daemon.schemas import (
-    BusinessIdea, Competitor, IdeaScore, load_validated, save_validated,
+    BusinessIdea, Competitor, IdeaScore,
     ElaraNotFoundError, ElaraValidationError,
 )
 
 logger = logging.getLogger("elara.business")
 
-BUSINESS_DIR = get_paths().business_dir
+_KIND = "business"
 
 # Status lifecycle
 VALID_STATUSES = ("exploring", "validated", "building", "launched", "abandoned")
@@ -36,14 +35,6 @@ VALID_STATUSES = ("exploring", "validated", "building", "launched", "abandoned")
 # Storage layer
 # ============================================================================
 
-def _ensure_dirs():
-    BUSINESS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _idea_path(idea_id: str) -> Path:
-    return BUSINESS_DIR / f"{idea_id}.json"
-
-
 def _generate_id(name: str) -> str:
     """Slug-style ID from name."""
     slug = name.lower().strip()
@@ -57,35 +48,15 @@ def _generate_id(name: str) -> str:
 
 
 def _load_idea(idea_id: str) -> Optional[Dict]:
-    path = _idea_path(idea_id)
-    if not path.exists():
-        return None
-    try:
-        model = load_validated(path, BusinessIdea)
-        return model.model_dump()
-    except Exception as e:
-        logger.warning("Failed to load idea %s: %s", idea_id, e)
-        return None
+    return get_record_store().get(_KIND, idea_id)
 
 
 def _save_idea(idea: Dict):
-    _ensure_dirs()
-    model = BusinessIdea.model_validate(idea)
-    path = _idea_path(idea["idea_id"])
-    save_validated(path, model)
+    get_record_store().put(_KIND, idea)
 
 
-def _load_all_ideas() -> List[Dict]:
-    _ensure_dirs()
-    ideas = []
-    for p in sorted(BUSINESS_DIR.glob("*.json")):
-        if not p.name.endswith(".tmp"):
-            try:
-                model = load_validated(p, BusinessIdea)
-                ideas.append(model.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load idea file %s: %s", p.name, e)
-    return ideas
+def _load_all_ideas(status: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=status)
 
 
 # ============================================================================
@@ -219,10 +190,7 @@ def list_ideas(
     n: int = 20,
 ) -> List[Dict]:
     """List ideas, optionally filtered by status and minimum score."""
-    ideas = _load_all_ideas()
-
-    if status:
-        ideas = [i for i in ideas if i.get("status") == status]
+    ideas = _load_all_ideas(status=status or None)
 
     if min_score is not None:
         ideas = [
@@ -6,7 +6,7 @@
 Elara Corrections System v2 — Learn from mistakes, know when they apply.
 
 Storage: ~/.claude/elara-corrections.json (JSON, append-only, never decays)
-Index:   ~/.claude/elara-corrections-db/ (ChromaDB, semantic search)
+Index:   elara_corrections in the shared ChromaDB store (semantic search)
 
 v2 upgrades:
 - correction_type: "tendency" (behavioral) vs "technical" (code/task patterns)
@@ -22,14 +22,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import query_args_for
+from memory.index_sync import sync_collection
 from daemon.events import bus, Events
 from daemon.schemas import Correction, load_validated_list, save_validated_list
 
@@ -37,7 +33,6 @@ logger = logging.getLogger("elara.corrections")
 
 _p = get_paths()
 CORRECTIONS_FILE = _p.corrections_file
-CORRECTIONS_DB_DIR = _p.corrections_db
 MAX_CORRECTIONS = 50
 
 
@@ -59,33 +54,11 @@ def _save(corrections: List[Dict]):
 # ChromaDB index layer (semantic search)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
     """Get or create the corrections ChromaDB collection."""
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
-
-    if _chroma_collection is not None:
-        return _chroma_collection
-
-    CORRECTIONS_DB_DIR.mkdir(parents=True, exist_ok=True)
-    _chroma_client = chromadb.PersistentClient(
-        path=str(CORRECTIONS_DB_DIR),
-        settings=Settings(anonymized_telemetry=False)
-    )
-    _chroma_collection = _chroma_client.get_or_create_collection(
-        name="elara_corrections",
-        metadata={
-            "description": "Elara's corrections — semantic mistake matching",
-            "hnsw:space": "cosine",
-        }
-    )
-    return _chroma_collection
+    return get_chroma().collection("elara_corrections")
 
 
 def _correction_id(entry: Dict) -> str:
@@ -106,30 +79,29 @@ def _index_text(entry: Dict) -> str:
     return " | ".join(parts)
 
 
+def _index_entry(entry: Dict) -> tuple:
+    """(document, metadata) for a correction."""
+    return _index_text(entry), {
+        "correction_id": entry["id"],
+        "correction_type": entry.get("correction_type", "tendency"),
+        "date": entry.get("date", ""),
+        "times_surfaced": entry.get("times_surfaced", 0),
+    }
+
+
 def _sync_to_chroma(corrections: List[Dict]):
-    """Sync all corrections to ChromaDB. Idempotent."""
+    """Bring the index in line with the full corrections list. Idempotent.
+
+    Only corrections added, edited or removed since the last sync reach
+    ChromaDB; activation counters are a metadata-only update.
+    """
     collection = _get_collection()
     if not collection:
         return
-    logger.debug("Syncing %d corrections to ChromaDB", len(corrections))
-
-    ids = []
-    documents = []
-    metadatas = []
-
-    for entry in corrections:
-        cid = _correction_id(entry)
-        ids.append(cid)
-        documents.append(_index_text(entry))
-        metadatas.append({
-            "correction_id": entry["id"],
-            "correction_type": entry.get("correction_type", "tendency"),
-            "date": entry.get("date", ""),
-            "times_surfaced": entry.get("times_surfaced", 0),
-        })
-
-    if ids:
-        collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+    report = sync_collection(
+        collection, {_correction_id(entry): _index_entry(entry) for entry in corrections},
+    )
+    logger.debug("Corrections index sync: %s", report)
 
 
 # ============================================================================
@@ -179,8 +151,8 @@ def add_correction(
 
     _save(corrections)
 
-    # Index in ChromaDB
-    _sync_to_chroma([entry])
+    # Index in ChromaDB (also drops anything the cap just removed)
+    _sync_to_chroma(corrections)
 
     bus.emit(Events.CORRECTION_ADDED, {
         "id": entry["id"],
@@ -231,7 +203,9 @@ class CorrectionSearchError(Exception):
     pass
 
 
-def check_corrections(task_description: str, n_results: int = 3) -> List[Dict]:
+def check_corrections(
+    task_description: str, n_results: int = 3, query_embedding: Optional[List[float]] = None,
+) -> List[Dict]:
     """
     Semantic search: find corrections relevant to current task context.
 
@@ -244,6 +218,8 @@ def check_corrections(task_description: str, n_results: int = 3) -> List[Dict]:
 
     Returns corrections with their conditions (fails_when/fine_when)
     so the caller can decide whether to heed the warning.
+
+    query_embedding: precomputed vector for task_description (see embed_query).
     """
     collection = _get_collection()
 
@@ -258,7 +234,7 @@ def check_corrections(task_description: str, n_results: int = 3) -> List[Dict]:
 
     try:
         results = collection.query(
-            query_texts=[task_description],
+            **query_args_for(task_description, query_embedding),
             n_results=min(n_results, collection.count()),
         )
     except Exception as e:
@@ -96,18 +96,8 @@ def _gather_corrections() -> List[dict]:
 
 def _gather_mood_journal(days: int = 7) -> List[dict]:
     """Get mood journal entries from last N days."""
-    from daemon.state import read_mood_journal
-    entries = read_mood_journal(n=200)
-    cutoff = datetime.now() - timedelta(days=days)
-    recent = []
-    for e in entries:
-        try:
-            ts = datetime.fromisoformat(e.get("ts", ""))
-            if ts >= cutoff:
-                recent.append(e)
-        except (ValueError, TypeError):
-            pass
-    return recent
+    from daemon.state import read_mood_journal_since
+    return read_mood_journal_since(datetime.now() - timedelta(days=days))
 
 
 def _gather_memories(days: int = 7) -> List[dict]:
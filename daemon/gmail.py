@@ -12,7 +12,7 @@ and local LLM for triage/summarization.
 Storage:
 - Credentials: ~/.claude/elara-gmail-credentials.json (OAuth client secret)
 - Token:       ~/.claude/elara-gmail-token.json (user auth, auto-refreshed)
-- Index:       ~/.claude/elara-gmail-db/ (ChromaDB collection, cosine)
+- Index:       elara_gmail in the shared ChromaDB store (cosine)
 - Cache:       ~/.claude/elara-gmail-cache.json (sync state)
 
 OAuth scope: gmail.modify (read + send + archive + label, no permanent delete)
@@ -35,7 +35,6 @@ logger = logging.getLogger("elara.gmail")
 _p = get_paths()
 CREDENTIALS_FILE = _p.gmail_credentials
 TOKEN_FILE = _p.gmail_token
-GMAIL_DB_DIR = _p.gmail_db
 CACHE_FILE = _p.gmail_cache
 
 # Gmail API scope
@@ -459,36 +458,14 @@ def summarize_inbox(max_results: int = 10) -> str:
 # ChromaDB indexing & semantic search
 # ============================================================================
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-_chroma_client = None
-_collection = None
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
 
 
 def _get_collection():
     """Lazy-init ChromaDB collection for Gmail messages."""
-    global _chroma_client, _collection
-    if _collection is not None:
-        return _collection
-
     if not CHROMA_AVAILABLE:
         return None
-
-    GMAIL_DB_DIR.mkdir(parents=True, exist_ok=True)
-    _chroma_client = chromadb.PersistentClient(
-        path=str(GMAIL_DB_DIR),
-        settings=Settings(anonymized_telemetry=False),
-    )
-    _collection = _chroma_client.get_or_create_collection(
-        name="elara_gmail",
-        metadata={"hnsw:space": "cosine"},
-    )
-    return _collection
+    return get_chroma().collection("elara_gmail")
 
 
 def _message_doc_id(message_id: str) -> str:
@@ -0,0 +1,331 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Append-only JSONL logs — tail reads from the end, sparse index for time and key.
+
+Problem: read_mood_journal(n) and read_imprint_archive(n) parsed the whole
+file to return the last N lines. get_session_arc pulled 200 entries to pick
+out one episode, and dream_core's "last N days" filtered those same 200
+(silently capped). The temperament log did readlines() for its last 5.
+Cost grew with the file, forever.
+
+Solution:
+  - tail(n) reads the file backwards in TAIL_BLOCK chunks and stops as soon
+    as it has n lines: O(n), independent of file size.
+  - A sidecar index (<log>.idx, itself append-only JSONL) records a mark
+    {"o": byte offset, "t": timestamp, "k": key} every INDEX_STRIDE entries
+    and wherever the key field (e.g. episode) changes value.
+  - between(start, end) bisects the marks and reads forward from the last
+    mark before `start`: O(result + INDEX_STRIDE).
+  - for_key(value) reads only the runs of marks carrying that key: every
+    key change starts a new mark, so a run holds that key and nothing else.
+
+Writers stay dumb: append() is a single O_APPEND write and never touches
+the index. Readers catch the index up lazily from its last mark, so lines
+appended by other processes (or before the index existed) are picked up
+on the next query. Entries are assumed to be appended in timestamp order,
+which holds for logs stamped with datetime.now() at write time.
+
+Usage:
+    from daemon.jsonl_log import get_log
+    journal = get_log(MOOD_JOURNAL_FILE, key_field="episode")
+    journal.append(entry)
+    journal.tail(50)
+    journal.between(start=cutoff)
+    journal.for_key(episode_id)
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger("elara.jsonl_log")
+
+TAIL_BLOCK = 64 * 1024
+INDEX_STRIDE = 256      # entries between time marks
+
+Timestamp = Union[str, datetime]
+
+
+def _ts(value: Optional[Timestamp]) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _parse(line: bytes) -> Optional[Dict[str, Any]]:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+class JsonlLog:
+    """One append-only JSONL file plus its sparse sidecar index."""
+
+    def __init__(self, path: Path, ts_field: str = "ts", key_field: Optional[str] = None,
+                 stride: int = INDEX_STRIDE):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.ts_field = ts_field
+        self.key_field = key_field
+        self.stride = stride
+        self._lock = threading.Lock()
+        # Marks sorted by offset: (offset, ts, key)
+        self._marks: List[Tuple[int, Optional[str], Any]] = []
+        self._index_read = 0    # bytes of the sidecar already loaded
+        self._scanned = 0       # bytes of the log already indexed
+        self._since_mark = 0    # entries scanned since the last mark
+        self._last_key: Any = None
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Append one entry. Raises OSError like a plain open/write would."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = (json.dumps(entry) + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Last n entries, oldest first. Unparseable lines are skipped."""
+        if n <= 0:
+            return []
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return []
+        entries: List[Dict[str, Any]] = []
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0 and len(entries) < n:
+                step = min(TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                # The first piece may be the end of a line that starts earlier
+                carry = lines.pop(0) if pos > 0 else b""
+                for line in reversed(lines):
+                    entry = _parse(line)
+                    if entry is not None:
+                        entries.append(entry)
+                        if len(entries) == n:
+                            break
+            if len(entries) < n and carry:
+                entry = _parse(carry)
+                if entry is not None:
+                    entries.append(entry)
+        entries.reverse()
+        return entries
+
+    def between(self, start: Optional[Timestamp] = None,
+                end: Optional[Timestamp] = None) -> List[Dict[str, Any]]:
+        """Entries with start <= timestamp < end, oldest first.
+
+        Timestamps are compared as ISO strings; either bound may be omitted.
+        """
+        start, end = _ts(start), _ts(end)
+        with self._lock:
+            self._refresh()
+            offset = 0
+            if start is not None:
+                times = [m[1] or "" for m in self._marks]
+                i = bisect.bisect_left(times, start) - 1
+                offset = self._marks[i][0] if i >= 0 else 0
+        result = []
+        for _, entry in self._read_from(offset):
+            ts = entry.get(self.ts_field)
+            if not isinstance(ts, str):
+                continue
+            if end is not None and ts >= end:
+                break
+            if start is None or ts >= start:
+                result.append(entry)
+        return result
+
+    def for_key(self, value: Any) -> List[Dict[str, Any]]:
+        """All entries whose key field equals value, oldest first."""
+        if self.key_field is None:
+            raise ValueError(f"{self.path.name} has no key field")
+        with self._lock:
+            self._refresh()
+            ranges: List[List[Optional[int]]] = []
+            for i, (offset, _, key) in enumerate(self._marks):
+                if key != value:
+                    continue
+                stop = self._marks[i + 1][0] if i + 1 < len(self._marks) else None
+                if ranges and ranges[-1][1] == offset:
+                    ranges[-1][1] = stop
+                else:
+                    ranges.append([offset, stop])
+        result = []
+        for offset, stop in ranges:
+            for pos, entry in self._read_from(offset):
+                if stop is not None and pos >= stop:
+                    break
+                if entry.get(self.key_field) == value:
+                    result.append(entry)
+        return result
+
+    def _read_from(self, offset: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(offset, entry) for each parseable line from offset to EOF."""
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        with f:
+            f.seek(offset)
+            pos = offset
+            for line in f:
+                entry = _parse(line)
+                if entry is not None:
+                    yield pos, entry
+                pos += len(line)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def reindex(self) -> int:
+        """Drop the sidecar and rebuild it from the log. Returns the mark count."""
+        with self._lock:
+            self._reset()
+            try:
+                self.index_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._refresh()
+            return len(self._marks)
+
+    def _reset(self):
+        self._marks = []
+        self._index_read = 0
+        self._scanned = 0
+        self._since_mark = 0
+        self._last_key = None
+
+    def _load_index(self):
+        """Pick up marks appended to the sidecar since we last looked."""
+        try:
+            with open(self.index_path, "rb") as f:
+                f.seek(self._index_read)
+                data = f.read()
+        except OSError:
+            return
+        complete = data.rfind(b"\n") + 1
+        self._index_read += complete
+        for line in data[:complete].split(b"\n"):
+            mark = _parse(line)
+            if mark is None or not isinstance(mark.get("o"), int):
+                continue
+            # Two readers catching up at once may both write a mark
+            if self._marks and mark["o"] <= self._marks[-1][0]:
+                continue
+            self._marks.append((mark["o"], mark.get("t"), mark.get("k")))
+            if mark["o"] >= self._scanned:
+                self._scanned = mark["o"]
+                self._since_mark = 0
+                self._last_key = mark.get("k")
+
+    def _refresh(self):
+        """Bring the index up to the current end of the log."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            self._reset()
+            return
+        self._load_index()
+        if size < self._scanned:
+            # Log truncated or replaced: the offsets mean nothing now
+            logger.info("%s shrank below its index, rebuilding", self.path.name)
+            self._reset()
+            try:
+                self.index_path.unlink()
+            except FileNotFoundError:
+                pass
+        if size == self._scanned:
+            return
+
+        new_marks = []
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        with f:
+            f.seek(self._scanned)
+            pos = self._scanned
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # writer mid-append: picked up next time
+                here, pos = pos, pos + len(line)
+                entry = _parse(line)
+                if entry is None or (self._marks and here == self._marks[-1][0]):
+                    continue
+                key = entry.get(self.key_field) if self.key_field else None
+                self._since_mark += 1
+                if (not self._marks or self._since_mark >= self.stride
+                        or key != self._last_key):
+                    ts = entry.get(self.ts_field)
+                    mark = (here, ts if isinstance(ts, str) else None, key)
+                    self._marks.append(mark)
+                    new_marks.append(mark)
+                    self._since_mark = 0
+                self._last_key = key
+        self._scanned = pos
+
+        if new_marks:
+            lines = "".join(
+                json.dumps({"o": o, "t": t, "k": k}) + "\n" for o, t, k in new_marks
+            ).encode()
+            try:
+                fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, lines)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.debug("Could not write index for %s: %s", self.path.name, e)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return {"path": str(self.path), "marks": len(self._marks)}
+
+
+_logs: Dict[Path, JsonlLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_log(path: Path, ts_field: str = "ts", key_field: Optional[str] = None) -> JsonlLog:
+    """Shared JsonlLog for a path, so the in-memory index survives between calls."""
+    path = Path(path)
+    with _logs_lock:
+        log = _logs.get(path)
+        if log is None:
+            log = _logs[path] = JsonlLog(path, ts_field=ts_field, key_field=key_field)
+        return log
+
+
+def reset_logs():
+    """Forget cached logs (for testing)."""
+    with _logs_lock:
+        _logs.clear()
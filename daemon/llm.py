@@ -14,15 +14,28 @@ Gives Elara a second brain for autonomous judgment:
 
 Runs on localhost:11434, zero cost, zero latency to external APIs.
 Falls back gracefully when Ollama is down — nothing breaks.
+
+Lists of prompts go through query_batch(): a bounded pool of keep-alive
+connections with per-call timeouts and coalescing of identical requests.
+
+Deterministic judgments (triage, relevance, classification) pass cache=<kind>
+and are memoised on disk by daemon.llm_cache, with a TTL per kind.
 """
 
+import hashlib
+import http.client
 import json
 import logging
 import threading
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
-from typing import Optional, Dict, Any, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Sequence, Union
+
+from daemon.llm_cache import get_llm_cache
 
 logger = logging.getLogger("elara.llm")
 
@@ -38,31 +51,81 @@ _CHECK_INTERVAL = 60  # recheck every 60s
 _check_lock = threading.Lock()
 
 
+# Batched execution: bounded pool of keep-alive connections
+BATCH_CONCURRENCY = 4   # parallel requests in flight (match OLLAMA_NUM_PARALLEL)
+_BATCH_HISTORY = 20     # recent batch latency records kept for status()
+
+_local = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+_batch_history: deque = deque(maxlen=_BATCH_HISTORY)
+
+
+def _connection(timeout: float) -> http.client.HTTPConnection:
+    """Per-thread persistent HTTP/1.1 connection to Ollama."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "url", None) != OLLAMA_URL:
+        if conn is not None:
+            conn.close()
+        parsed = urllib.parse.urlsplit(OLLAMA_URL)
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=timeout)
+        _local.conn = conn
+        _local.url = OLLAMA_URL
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
 def _api_call(
     endpoint: str,
     payload: dict,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> Optional[dict]:
-    """Raw HTTP call to Ollama API. Returns parsed JSON or None on failure."""
-    url = f"{OLLAMA_URL}{endpoint}"
-    data = json.dumps(payload).encode("utf-8")
+    """Raw HTTP call to Ollama API. Returns parsed JSON or None on failure.
 
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    Reuses a keep-alive connection per thread; a connection the server
+    closed while idle is reopened once before giving up.
+    """
+    path = urllib.parse.urlsplit(OLLAMA_URL).path.rstrip("/") + endpoint
+    data = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
 
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, OSError) as e:
-        logger.debug(f"Ollama API error ({endpoint}): {e}")
-        return None
-    except Exception as e:
-        logger.warning(f"Ollama unexpected error: {e}")
-        return None
+    for attempt in range(2):
+        try:
+            conn = _connection(timeout)
+            conn.request("POST", path, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            if resp.status >= 400:
+                logger.debug(f"Ollama API error ({endpoint}): HTTP {resp.status}")
+                return None
+            return json.loads(body.decode("utf-8"))
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError,
+                http.client.CannotSendRequest, http.client.ResponseNotReady) as e:
+            _drop_connection()
+            if attempt == 0:
+                continue
+            logger.debug(f"Ollama API error ({endpoint}): {e}")
+            return None
+        except (http.client.HTTPException, TimeoutError, OSError) as e:
+            _drop_connection()
+            logger.debug(f"Ollama API error ({endpoint}): {e}")
+            return None
+        except Exception as e:
+            _drop_connection()
+            logger.warning(f"Ollama unexpected error: {e}")
+            return None
+    return None
 
 
 def is_available() -> bool:
@@ -96,15 +159,47 @@ def query(
     timeout: int = DEFAULT_TIMEOUT,
     temperature: float = 0.3,
     max_tokens: int = 256,
+    cache: Optional[str] = None,
 ) -> Optional[str]:
     """
     Send a prompt to Ollama, get a text response.
 
+    cache names a kind in LLM_CACHE_TTLS; a fresh cached response for the
+    same model/system/prompt/sampling is returned without calling Ollama.
+
     Returns None if Ollama is unavailable (caller should fall back).
     """
+    payload = _generate_payload(prompt, system, model, temperature, max_tokens)
+    if cache:
+        cached = get_llm_cache().get(cache, payload)
+        if cached is not None:
+            return cached
+
     if not is_available():
         return None
 
+    result = _generate(payload, timeout)
+    if cache and result is not None:
+        get_llm_cache().put(cache, payload, result)
+    return result
+
+
+# ============================================================================
+# Batched execution
+# ============================================================================
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=BATCH_CONCURRENCY, thread_name_prefix="elara-llm",
+            )
+        return _pool
+
+
+def _generate_payload(prompt: str, system: Optional[str], model: str,
+                      temperature: float, max_tokens: int) -> dict:
     payload = {
         "model": model,
         "prompt": prompt,
@@ -116,13 +211,135 @@ def query(
     }
     if system:
         payload["system"] = system
+    return payload
+
 
+def _generate(payload: dict, timeout: float) -> Optional[str]:
     result = _api_call("/api/generate", payload, timeout=timeout)
     if result and "response" in result:
         return result["response"].strip()
     return None
 
 
+def _submit(payload: dict, timeout: float) -> Future:
+    """
+    Queue a generate request on the shared pool.
+
+    Identical requests already in flight (from this batch or any other
+    caller) share one Future instead of hitting Ollama twice.
+    """
+    key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        if fut is not None:
+            return fut
+        fut = _executor().submit(_generate, payload, timeout)
+        _inflight[key] = fut
+
+    def _forget(_f, key=key):
+        with _inflight_lock:
+            if _inflight.get(key) is _f:
+                del _inflight[key]
+
+    fut.add_done_callback(_forget)
+    return fut
+
+
+def query_batch(
+    prompts: Sequence[Union[str, Dict[str, Any]]],
+    system: str = None,
+    model: str = DEFAULT_MODEL,
+    timeout: int = DEFAULT_TIMEOUT,
+    temperature: float = 0.3,
+    max_tokens: int = 256,
+    label: str = "batch",
+    cache: Optional[str] = None,
+) -> List[Optional[str]]:
+    """
+    Run many prompts concurrently on the bounded keep-alive pool.
+
+    Each item is a prompt string, or a dict with "prompt" plus optional
+    per-item overrides (system, model, temperature, max_tokens, timeout).
+    Results come back in input order; an item that fails or exceeds its
+    timeout is None. Completion latency is logged and kept for status().
+    With cache=<kind>, cached items are answered from disk and only the
+    misses are sent to Ollama.
+    """
+    if not prompts:
+        return []
+
+    started = time.monotonic()
+    response_cache = get_llm_cache() if cache else None
+    payloads = []
+    results: List[Optional[str]] = [None] * len(prompts)
+    for i, item in enumerate(prompts):
+        spec = item if isinstance(item, dict) else {"prompt": item}
+        payload = _generate_payload(
+            spec["prompt"],
+            spec.get("system", system),
+            spec.get("model", model),
+            spec.get("temperature", temperature),
+            spec.get("max_tokens", max_tokens),
+        )
+        payloads.append((payload, spec.get("timeout", timeout)))
+        if response_cache:
+            results[i] = response_cache.get(cache, payload)
+
+    pending = [i for i, r in enumerate(results) if r is None]
+    if pending and not is_available():
+        return results
+
+    futures = {i: _submit(*payloads[i]) for i in pending}
+    latencies = []
+    for i, fut in futures.items():
+        try:
+            results[i] = fut.result()
+        except Exception as e:
+            logger.debug(f"Batch item failed: {e}")
+        latencies.append(time.monotonic() - started)
+        if response_cache and results[i] is not None:
+            response_cache.put(cache, payloads[i][0], results[i])
+
+    elapsed = time.monotonic() - started
+    ordered = sorted(latencies) or [elapsed]
+    record = {
+        "label": label,
+        "size": len(prompts),
+        "cached": len(prompts) - len(pending),
+        "unique": len({id(f) for f in futures.values()}),
+        "failed": sum(1 for r in results if r is None),
+        "total_ms": round(elapsed * 1000, 1),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "at": time.time(),
+    }
+    _batch_history.append(record)
+    logger.info(
+        "LLM %s: %d prompts (%d cached, %d unique sent) in %.0fms, %d failed",
+        label, record["size"], record["cached"], record["unique"],
+        record["total_ms"], record["failed"],
+    )
+    return results
+
+
+def batch_stats() -> List[Dict[str, Any]]:
+    """Latency records for the most recent batches (oldest first)."""
+    return list(_batch_history)
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss/size stats for the persistent response cache."""
+    try:
+        return get_llm_cache().stats()
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def clear_cache() -> int:
+    """Drop every cached response. Returns the number removed."""
+    return get_llm_cache().clear()
+
+
 def classify(
     text: str,
     categories: List[str],
@@ -138,7 +355,7 @@ def classify(
         f"Classify as one of: {cats}\n"
         f"Reply with ONLY the label.\n\n{text[:500]}"
     )
-    result = query(prompt, model=model, temperature=0.1, max_tokens=10)
+    result = query(prompt, model=model, temperature=0.1, max_tokens=10, cache="classify")
     if result:
         # Find which category the response matches (fuzzy)
         result_lower = result.lower().strip().rstrip(".")
@@ -159,7 +376,7 @@ def summarize(
     prompt = (
         f"Summarize in {max_sentences} sentence(s). Be concise.\n\n{text[:1000]}"
     )
-    return query(prompt, model=model, temperature=0.3, max_tokens=80)
+    return query(prompt, model=model, temperature=0.3, max_tokens=80, cache="summarize")
 
 
 def judge(
@@ -177,7 +394,7 @@ def judge(
         prompt += f"\n\nContext:\n{context[:300]}"
     prompt += "\n\nAnswer YES or NO only."
 
-    result = query(prompt, model=model, temperature=0.1, max_tokens=3)
+    result = query(prompt, model=model, temperature=0.1, max_tokens=3, cache="judge")
     if result:
         lower = result.lower().strip()
         if lower.startswith("yes"):
@@ -202,7 +419,8 @@ def generate_search_queries(
         f"Generate {n_queries} search queries (5-10 words each) to find related conversations. "
         f"One per line, nothing else.\n\n{exchange_text[:500]}"
     )
-    result = query(prompt, model=model, temperature=0.4, max_tokens=60)
+    result = query(prompt, model=model, temperature=0.4, max_tokens=60,
+                   cache="search_queries")
     if result:
         lines = [l.strip().lstrip("0123456789.-) ") for l in result.split("\n") if l.strip()]
         return lines[:n_queries] if lines else None
@@ -223,30 +441,53 @@ def triage_memory(
         - importance: float (0-1)
     Or None if unavailable.
     """
-    prompt = (
+    result = query(_triage_prompt(user_text, assistant_text),
+                   model=model, temperature=0.1, max_tokens=40, cache="triage")
+    return _parse_json_reply(result)
+
+
+def triage_memories(
+    exchanges: Sequence[Dict[str, str]],
+    model: str = DEFAULT_MODEL,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batched triage_memory() for many exchanges ({user_text, assistant_text}).
+    Results are in input order; None where unavailable or unparseable.
+    """
+    prompts = [_triage_prompt(ex["user_text"], ex["assistant_text"]) for ex in exchanges]
+    results = query_batch(prompts, model=model, temperature=0.1, max_tokens=40,
+                          label="triage", cache="triage")
+    return [_parse_json_reply(r) for r in results]
+
+
+def _triage_prompt(user_text: str, assistant_text: str) -> str:
+    return (
         "Reply with JSON only, no explanation:\n"
         '{"worth_keeping": true/false, "category": "technical|emotional|planning|casual|meta", "importance": 0.0-1.0}\n\n'
         "worth_keeping=false for greetings/confirmations. importance 0.8+ for decisions/insights.\n\n"
         f"User: {user_text[:200]}\nAssistant: {assistant_text[:200]}"
     )
-    result = query(prompt, model=model, temperature=0.1, max_tokens=40)
-    if result:
-        # Try to parse JSON from response
-        try:
-            # Handle markdown code blocks
-            cleaned = result.strip().strip("`").strip()
-            if cleaned.startswith("json"):
-                cleaned = cleaned[4:].strip()
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            # Try to extract JSON from mixed text
-            for line in result.split("\n"):
-                line = line.strip()
-                if line.startswith("{"):
-                    try:
-                        return json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
+
+
+def _parse_json_reply(result: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a JSON object from a model reply (handles code fences and chatter)."""
+    if not result:
+        return None
+    try:
+        # Handle markdown code blocks
+        cleaned = result.strip().strip("`").strip()
+        if cleaned.startswith("json"):
+            cleaned = cleaned[4:].strip()
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        # Try to extract JSON from mixed text
+        for line in result.split("\n"):
+            line = line.strip()
+            if line.startswith("{"):
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError:
+                    continue
     return None
 
 
@@ -311,29 +552,31 @@ def judge_relevance(
         - importance: float (0-1)
     Or None if unavailable.
     """
-    prompt = (
+    result = query(_relevance_prompt(current_text, historical_text),
+                   model=model, temperature=0.1, max_tokens=96, timeout=45,
+                   cache="relevance")
+    return _parse_json_reply(result)
+
+
+def judge_relevance_batch(
+    current_text: str,
+    historical_texts: Sequence[str],
+    model: str = DEFAULT_MODEL,
+) -> List[Optional[Dict[str, Any]]]:
+    """Batched judge_relevance() of several candidates against one text."""
+    prompts = [_relevance_prompt(current_text, h) for h in historical_texts]
+    results = query_batch(prompts, model=model, temperature=0.1, max_tokens=96,
+                          timeout=45, label="relevance", cache="relevance")
+    return [_parse_json_reply(r) for r in results]
+
+
+def _relevance_prompt(current_text: str, historical_text: str) -> str:
+    return (
         f"Current: \"{current_text[:200]}\"\n"
         f"Old context: \"{historical_text[:200]}\"\n\n"
         "Is the old context useful for the current discussion? "
         "Answer JSON only: {\"relevant\": true/false, \"reason\": \"...\", \"importance\": 0.0-1.0}"
     )
-    result = query(prompt, model=model, temperature=0.1, max_tokens=96, timeout=45)
-    if result:
-        try:
-            cleaned = result.strip().strip("`").strip()
-            if cleaned.startswith("json"):
-                cleaned = cleaned[4:].strip()
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            # Try line-by-line extraction
-            for line in result.split("\n"):
-                line = line.strip()
-                if line.startswith("{"):
-                    try:
-                        return json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-    return None
 
 
 def status() -> Dict[str, Any]:
@@ -343,6 +586,9 @@ def status() -> Dict[str, Any]:
         "available": available,
         "url": OLLAMA_URL,
         "default_model": DEFAULT_MODEL,
+        "batch_concurrency": BATCH_CONCURRENCY,
+        "recent_batches": batch_stats()[-5:],
+        "cache": cache_stats(),
     }
 
     if available:
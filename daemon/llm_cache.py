@@ -0,0 +1,237 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+LLM response cache — persistent prompt → response memo for daemon.llm.
+
+Overwatch re-judges the same historical exchanges, overnight re-classifies
+the same memory pairs, triage sees the same exchange more than once. Each
+of those is seconds of Ollama time for an answer we already have.
+
+Design:
+  - SQLite table keyed on sha256(model, system, prompt, temperature, max_tokens)
+  - Per-kind TTLs (LLM_CACHE_TTLS); kind 0/missing = not cached
+  - LRU eviction by last_used once total response bytes exceed the cap
+  - Hit/miss/eviction counters, surfaced through the elara_llm tool
+  - Any cache error degrades to a plain miss — the LLM call still happens
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from core.paths import get_paths
+
+logger = logging.getLogger("elara.llm.cache")
+
+# Seconds a cached response stays valid, per call kind
+LLM_CACHE_TTLS: Dict[str, float] = {
+    "relevance": 7 * 86400,
+    "triage": 30 * 86400,
+    "classify": 30 * 86400,
+    "contradiction": 30 * 86400,
+    "judge": 7 * 86400,
+    "search_queries": 86400,
+    "summarize": 7 * 86400,
+}
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024  # total response text kept on disk
+_TOUCH_INTERVAL = 60                # don't rewrite last_used more often than this
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    expires REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Key for an /api/generate payload: model, system, prompt, sampling."""
+    options = payload.get("options", {})
+    material = json.dumps([
+        payload.get("model", ""),
+        payload.get("system", ""),
+        payload.get("prompt", ""),
+        options.get("temperature"),
+        options.get("num_predict"),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Disk-backed LRU cache of Ollama responses with per-kind TTLs."""
+
+    def __init__(self, path=None, max_bytes: int = MAX_CACHE_BYTES):
+        self.path = path or get_paths().llm_cache
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(bytes), 0) FROM responses"
+        ).fetchone()[0]
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Get / put
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, payload: Dict[str, Any]) -> Optional[str]:
+        """Cached response for payload, or None on miss/expiry."""
+        if not LLM_CACHE_TTLS.get(kind):
+            return None
+        key = cache_key(payload)
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._db()
+                row = db.execute(
+                    "SELECT response, expires, last_used FROM responses WHERE key = ?", (key,),
+                ).fetchone()
+                if row is None or row[1] < now:
+                    self._misses[kind] = self._misses.get(kind, 0) + 1
+                    return None
+                if now - row[2] > _TOUCH_INTERVAL:
+                    db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                    db.commit()
+                self._hits[kind] = self._hits.get(kind, 0) + 1
+                return row[0]
+        except sqlite3.Error as e:
+            logger.debug("LLM cache read failed: %s", e)
+            return None
+
+    def put(self, kind: str, payload: Dict[str, Any], response: str) -> None:
+        """Store a response under the kind's TTL, then enforce the byte cap."""
+        ttl = LLM_CACHE_TTLS.get(kind)
+        if not ttl or response is None:
+            return
+        key = cache_key(payload)
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        try:
+            with self._lock:
+                db = self._db()
+                old = db.execute("SELECT bytes FROM responses WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    """INSERT OR REPLACE INTO responses
+                       (key, kind, model, response, bytes, created, last_used, expires)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (key, kind, payload.get("model", ""), response, size, now, now, now + ttl),
+                )
+                self._total_bytes += size - (old[0] if old else 0)
+                if self._total_bytes > self.max_bytes:
+                    self._evict(db, now)
+                db.commit()
+        except sqlite3.Error as e:
+            logger.debug("LLM cache write failed: %s", e)
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows, then least-recently-used rows until under 90% of the cap."""
+        cur = db.execute("DELETE FROM responses WHERE expires < ?", (now,))
+        self._evictions += cur.rowcount
+        self._total_bytes = db.execute(
+            "SELECT COALESCE(SUM(bytes), 0) FROM responses"
+        ).fetchone()[0]
+
+        target = int(self.max_bytes * 0.9)
+        if self._total_bytes <= target:
+            return
+        freed = 0
+        doomed = []
+        for key, size in db.execute("SELECT key, bytes FROM responses ORDER BY last_used"):
+            if self._total_bytes - freed <= target:
+                break
+            doomed.append((key,))
+            freed += size
+        db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._total_bytes -= freed
+        self._evictions += len(doomed)
+
+    def clear(self) -> int:
+        """Remove every cached response. Returns rows deleted."""
+        with self._lock:
+            db = self._db()
+            cur = db.execute("DELETE FROM responses")
+            db.commit()
+            self._total_bytes = 0
+            return cur.rowcount
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            db = self._db()
+            entries = db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            by_kind = dict(db.execute(
+                "SELECT kind, COUNT(*) FROM responses GROUP BY kind"
+            ).fetchall())
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                "evictions": self._evictions,
+                "entries_by_kind": by_kind,
+                "hits_by_kind": dict(self._hits),
+                "misses_by_kind": dict(self._misses),
+            }
+
+
+# Singleton
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache()
+        return _cache
+
+
+def reset_llm_cache():
+    """Drop the singleton (used by tests after reconfiguring paths)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -5,8 +5,8 @@
 """
 Elara Cognitive Models — Persistent understanding that accumulates over time.
 
-Storage: ~/.elara/elara-models/ (JSON files, one per model)
-Index:   ~/.elara/elara-models-db/ (ChromaDB, cosine similarity)
+Storage: "models" records in the shared record store (daemon/record_store.py)
+Index:   elara_models in the shared ChromaDB store (cosine similarity)
 
 Models are statements of understanding about the world, the user, or work patterns.
 They strengthen with confirming evidence, weaken with contradictions, and invalidate
@@ -23,28 +23,20 @@ Confidence mechanics:
 import logging
 import hashlib
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.index_sync import build_items, sync_collection, upsert_items
 from daemon.events import bus, Events
+from daemon.record_store import get_record_store
 from daemon.schemas import (
-    CognitiveModel, ModelEvidence, load_validated, save_validated,
+    CognitiveModel, ModelEvidence,
     ElaraNotFoundError,
 )
 
 logger = logging.getLogger("elara.models")
 
-_p = get_paths()
-MODELS_DIR = _p.models_dir
-MODELS_DB_DIR = _p.models_db
+_KIND = "models"
 
 # Confidence adjustment constants
 SUPPORTS_DELTA = 0.05
@@ -57,88 +49,43 @@ TIME_DECAY_DAYS = 30
 
 
 # ============================================================================
-# Storage layer (JSON files — source of truth)
+# Storage layer (record store — source of truth)
 # ============================================================================
 
-def _ensure_dirs():
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _model_path(model_id: str) -> Path:
-    return MODELS_DIR / f"{model_id}.json"
-
-
 def _generate_id(statement: str) -> str:
     raw = f"{statement}:{datetime.now().isoformat()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
 def _load_model(model_id: str) -> Optional[Dict]:
-    path = _model_path(model_id)
-    if not path.exists():
-        return None
-    model = load_validated(path, CognitiveModel)
-    return model.model_dump()
+    return get_record_store().get(_KIND, model_id)
 
 
 def _save_model(model: Dict):
-    _ensure_dirs()
-    validated = CognitiveModel.model_validate(model)
-    path = _model_path(model["model_id"])
-    save_validated(path, validated)
+    get_record_store().put(_KIND, model)
 
 
-def _load_all_models() -> List[Dict]:
-    _ensure_dirs()
-    models = []
-    for p in sorted(MODELS_DIR.glob("*.json")):
-        if p.suffix == ".json" and not p.name.endswith(".tmp"):
-            try:
-                m = load_validated(p, CognitiveModel)
-                models.append(m.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load model %s: %s", p.name, e)
-    return models
+def _load_all_models(status: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=status)
 
 
 # ============================================================================
 # ChromaDB index (semantic search over models)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        MODELS_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(
-            path=str(MODELS_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _chroma_collection = _chroma_client.get_or_create_collection(
-            name="elara_models",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_models")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to init models ChromaDB: %s", e)
         return None
 
 
-def _index_model(model: Dict):
-    collection = _get_collection()
-    if not collection:
-        return
-
+def _index_entry(model: Dict) -> Optional[tuple]:
+    """(document, metadata) for a model, or None if it has nothing to index."""
     parts = [model.get("statement", "")]
     for ev in model.get("evidence", []):
         parts.append(ev.get("text", ""))
@@ -146,25 +93,44 @@ def _index_model(model: Dict):
 
     text = " ".join(p for p in parts if p)
     if not text.strip():
-        return
+        return None
 
-    metadata = {
+    return text, {
         "domain": model.get("domain", "general"),
         "status": model.get("status", "active"),
         "confidence": model.get("confidence", 0.5),
         "created": model.get("created", ""),
     }
 
+
+def _index_model(model: Dict):
+    collection = _get_collection()
+    if not collection:
+        return
+
+    entry = _index_entry(model)
+    if entry is None:
+        return
+
     try:
-        collection.upsert(
-            ids=[model["model_id"]],
-            documents=[text],
-            metadatas=[metadata],
-        )
+        upsert_items(collection, {model["model_id"]: entry})
     except Exception as e:
         logger.warning("Failed to index model %s: %s", model.get("model_id", "?"), e)
 
 
+def _sync_all_to_chroma(models: List[Dict]) -> Dict:
+    """Bring the index in line with all models, pushing only changes."""
+    collection = _get_collection()
+    if not collection:
+        return {}
+
+    try:
+        return sync_collection(collection, build_items(models, "model_id", _index_entry))
+    except Exception as e:
+        logger.warning("Model bulk sync failed: %s", e)
+        return {}
+
+
 # ============================================================================
 # Core operations
 # ============================================================================
@@ -321,12 +287,8 @@ def get_active_models(
     min_confidence: float = 0.3,
 ) -> List[Dict]:
     """Get all active models, optionally filtered by domain and confidence."""
-    models = _load_all_models()
-    active = [
-        m for m in models
-        if m.get("status") == "active"
-        and m.get("confidence", 0) >= min_confidence
-    ]
+    models = _load_all_models(status="active")
+    active = [m for m in models if m.get("confidence", 0) >= min_confidence]
     if domain:
         active = [m for m in active if m.get("domain") == domain]
     active.sort(key=lambda m: m.get("confidence", 0), reverse=True)
@@ -386,10 +348,8 @@ def list_models(
     n: int = 50,
 ) -> List[Dict]:
     """List models, optionally filtered."""
-    models = _load_all_models()
+    models = _load_all_models(status=status or None)
 
-    if status:
-        models = [m for m in models if m.get("status") == status]
     if domain:
         models = [m for m in models if m.get("domain") == domain]
 
@@ -440,14 +400,11 @@ def apply_time_decay() -> List[Dict]:
     Apply confidence decay to models not checked in TIME_DECAY_DAYS days.
     Called by overnight brain. Returns list of decayed models.
     """
-    models = _load_all_models()
+    models = _load_all_models(status="active")
     cutoff = datetime.now() - timedelta(days=TIME_DECAY_DAYS)
     decayed = []
 
     for m in models:
-        if m.get("status") != "active":
-            continue
-
         last_checked = m.get("last_checked", "")
         if not last_checked:
             continue
@@ -471,8 +428,6 @@ def apply_time_decay() -> List[Dict]:
 
 
 def reindex_all() -> Dict:
-    """Rebuild ChromaDB index from JSON files."""
+    """Bring the ChromaDB index in line with the record store, pushing only changes."""
     models = _load_all_models()
-    for m in models:
-        _index_model(m)
-    return {"indexed": len(models)}
+    return {"indexed": len(models), **_sync_all_to_chroma(models)}
@@ -9,7 +9,6 @@ External code imports from daemon.state (re-export layer), not directly from her
 """
 
 import logging
-import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -19,7 +18,7 @@ from daemon.emotions import (
 )
 from daemon.state_core import (
     _load_state, _save_state, _apply_time_decay, _log_mood,
-    TEMPERAMENT, MOOD_JOURNAL_FILE, IMPRINT_ARCHIVE_FILE,
+    _mood_journal, _imprint_archive, TEMPERAMENT,
 )
 from daemon.events import bus, Events
 from daemon.cache import cache, CacheKeys, CACHE_TTLS
@@ -310,8 +309,7 @@ def get_session_arc() -> dict:
     if not episode_id:
         return {"pattern": "no_session", "description": "No active session."}
 
-    journal = read_mood_journal(n=200)
-    episode_entries = [e for e in journal if e.get("episode") == episode_id]
+    episode_entries = _mood_journal().for_key(episode_id)
 
     if len(episode_entries) < 2:
         start = state.get("session_mood_start", {})
@@ -348,31 +346,14 @@ def get_session_arc() -> dict:
 
 def read_mood_journal(n: int = 50) -> List[dict]:
     """Read last N mood journal entries."""
-    if not MOOD_JOURNAL_FILE.exists():
-        return []
-    entries = []
-    try:
-        with open(MOOD_JOURNAL_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    entries.append(json.loads(line))
-        return entries[-n:]
-    except (json.JSONDecodeError, OSError):
-        return []
+    return _mood_journal().tail(n)
+
+
+def read_mood_journal_since(since: datetime) -> List[dict]:
+    """Read mood journal entries stamped at or after `since`."""
+    return _mood_journal().between(start=since)
 
 
 def read_imprint_archive(n: int = 20) -> List[dict]:
     """Read last N archived (faded) imprints."""
-    if not IMPRINT_ARCHIVE_FILE.exists():
-        return []
-    entries = []
-    try:
-        with open(IMPRINT_ARCHIVE_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    entries.append(json.loads(line))
-        return entries[-n:]
-    except (json.JSONDecodeError, OSError):
-        return []
+    return _imprint_archive().tail(n)
@@ -5,7 +5,7 @@
 """
 Elara Outcome Tracking — Link decisions to results. Close the learning loop.
 
-Storage: ~/.claude/elara-outcomes/ (JSON files, one per outcome)
+Storage: "outcomes" records in the shared record store (daemon/record_store.py)
 
 We make decisions but never check if they were right.
 "Chose asyncio" → "debugging harder" → "lesson: only worth it above 100 connections"
@@ -15,61 +15,36 @@ That's calibrated intuition.
 import logging
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, List, Dict
 
-from core.paths import get_paths
 from daemon.events import bus, Events
-from daemon.schemas import Outcome, load_validated, save_validated, ElaraNotFoundError, ElaraValidationError
+from daemon.record_store import get_record_store
+from daemon.schemas import Outcome, ElaraNotFoundError, ElaraValidationError
 
 logger = logging.getLogger("elara.outcomes")
 
-OUTCOMES_DIR = get_paths().outcomes_dir
+_KIND = "outcomes"
 
 
 # ============================================================================
-# Storage layer
+# Storage layer (record store)
 # ============================================================================
 
-def _ensure_dirs():
-    OUTCOMES_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _outcome_path(outcome_id: str) -> Path:
-    return OUTCOMES_DIR / f"{outcome_id}.json"
-
-
 def _generate_id(decision: str) -> str:
     raw = f"{decision}:{datetime.now().isoformat()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
 def _load_outcome(outcome_id: str) -> Optional[Dict]:
-    path = _outcome_path(outcome_id)
-    if not path.exists():
-        return None
-    model = load_validated(path, Outcome)
-    return model.model_dump()
+    return get_record_store().get(_KIND, outcome_id)
 
 
 def _save_outcome(outcome: Dict):
-    _ensure_dirs()
-    model = Outcome.model_validate(outcome)
-    path = _outcome_path(outcome["outcome_id"])
-    save_validated(path, model)
+    get_record_store().put(_KIND, outcome)
 
 
-def _load_all_outcomes() -> List[Dict]:
-    _ensure_dirs()
-    outcomes = []
-    for p in sorted(OUTCOMES_DIR.glob("*.json")):
-        if p.suffix == ".json" and not p.name.endswith(".tmp"):
-            try:
-                model = load_validated(p, Outcome)
-                outcomes.append(model.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load outcome %s: %s", p.name, e)
-    return outcomes
+def _load_all_outcomes(assessment: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=assessment)
 
 
 # ============================================================================
@@ -166,19 +141,15 @@ def list_outcomes(
     unchecked_only: bool = False,
     n: int = 20,
 ) -> List[Dict]:
-    """List outcomes, optionally filtered."""
-    outcomes = _load_all_outcomes()
-
-    if assessment:
-        outcomes = [o for o in outcomes if o.get("assessment") == assessment]
-    if tag:
-        outcomes = [o for o in outcomes if tag in o.get("tags", [])]
+    """List outcomes, optionally filtered. Most recent first."""
     if unchecked_only:
-        outcomes = [o for o in outcomes if o.get("assessment") == "too_early"]
-
-    # Most recent first
-    outcomes.sort(key=lambda o: o.get("recorded", ""), reverse=True)
-    return outcomes[:n]
+        if assessment and assessment != "too_early":
+            return []
+        assessment = "too_early"
+    return get_record_store().list(
+        _KIND, status=assessment or None, tag=tag or None,
+        order_by="created", descending=True, limit=n,
+    )
 
 
 def search_outcomes_by_tags(tags: List[str], n: int = 10) -> List[Dict]:
@@ -201,37 +172,26 @@ def search_outcomes_by_tags(tags: List[str], n: int = 10) -> List[Dict]:
 def get_outcome_stats() -> Dict:
     """Overall stats: win rate, common loss tags, unchecked count."""
     logger.debug("Computing outcome stats")
-    outcomes = _load_all_outcomes()
-    if not outcomes:
-        return {
-            "total": 0,
-            "checked": 0,
-            "unchecked": 0,
-            "wins": 0,
-            "partial_wins": 0,
-            "losses": 0,
-            "win_rate": None,
-        }
-
-    checked = [o for o in outcomes if o.get("assessment") != "too_early"]
-    unchecked = [o for o in outcomes if o.get("assessment") == "too_early"]
-    wins = [o for o in checked if o.get("assessment") == "win"]
-    partials = [o for o in checked if o.get("assessment") == "partial_win"]
-    losses = [o for o in checked if o.get("assessment") == "loss"]
+    counts = {a: row["count"] for a, row in get_record_store().status_summary(_KIND).items()}
+    total = sum(counts.values())
+    unchecked = counts.get("too_early", 0)
+    checked = total - unchecked
+    wins = counts.get("win", 0)
+    partials = counts.get("partial_win", 0)
 
     win_rate = None
     if checked:
         # Count wins as 1, partial_wins as 0.5
-        score = len(wins) + 0.5 * len(partials)
-        win_rate = round(score / len(checked), 2)
+        score = wins + 0.5 * partials
+        win_rate = round(score / checked, 2)
 
     return {
-        "total": len(outcomes),
-        "checked": len(checked),
-        "unchecked": len(unchecked),
-        "wins": len(wins),
-        "partial_wins": len(partials),
-        "losses": len(losses),
+        "total": total,
+        "checked": checked,
+        "unchecked": unchecked,
+        "wins": wins,
+        "partial_wins": partials,
+        "losses": counts.get("loss", 0),
         "win_rate": win_rate,
     }
 
@@ -349,8 +309,7 @@ def get_loss_patterns(min_losses: int = 2) -> List[Dict]:
     Find tags that appear in multiple losses — overestimation patterns.
     Used by blind_spots(): "You tend to overestimate X."
     """
-    outcomes = _load_all_outcomes()
-    losses = [o for o in outcomes if o.get("assessment") == "loss"]
+    losses = _load_all_outcomes(assessment="loss")
 
     tag_counts = {}
     tag_lessons = {}
@@ -377,13 +336,11 @@ def get_loss_patterns(min_losses: int = 2) -> List[Dict]:
 
 def get_unchecked_outcomes(days_old: int = 7) -> List[Dict]:
     """Get outcomes that were recorded but never checked — forgotten decisions."""
-    outcomes = _load_all_outcomes()
+    outcomes = _load_all_outcomes(assessment="too_early")
     now = datetime.now()
     old_unchecked = []
 
     for o in outcomes:
-        if o.get("assessment") != "too_early":
-            continue
         try:
             recorded = datetime.fromisoformat(o["recorded"])
             age_days = (now - recorded).days
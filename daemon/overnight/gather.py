@@ -68,69 +68,23 @@ def gather_all(days: int = 30) -> Dict[str, Any]:
         logger.warning("  Mood journal failed: %s", e)
         context["mood_journal"] = []
 
-    # --- Reasoning trails ---
-    try:
-        p = get_paths()
-        trails = []
-        if p.reasoning_dir.exists():
-            for f in sorted(p.reasoning_dir.glob("*.json"))[-20:]:
-                try:
-                    trails.append(json.loads(f.read_text()))
-                except (json.JSONDecodeError, OSError):
-                    pass
-        context["reasoning_trails"] = trails
-        logger.info("  Reasoning trails: %d", len(trails))
-    except Exception as e:
-        logger.warning("  Reasoning trails failed: %s", e)
-        context["reasoning_trails"] = []
-
-    # --- Outcomes ---
-    try:
-        p = get_paths()
-        outcomes = []
-        if p.outcomes_dir.exists():
-            for f in sorted(p.outcomes_dir.glob("*.json"))[-20:]:
-                try:
-                    outcomes.append(json.loads(f.read_text()))
-                except (json.JSONDecodeError, OSError):
-                    pass
-        context["outcomes"] = outcomes
-        logger.info("  Outcomes: %d", len(outcomes))
-    except Exception as e:
-        logger.warning("  Outcomes failed: %s", e)
-        context["outcomes"] = []
-
-    # --- Synthesis (recurring ideas) ---
-    try:
-        p = get_paths()
-        syntheses = []
-        if p.synthesis_dir.exists():
-            for f in sorted(p.synthesis_dir.glob("*.json"))[-20:]:
-                try:
-                    syntheses.append(json.loads(f.read_text()))
-                except (json.JSONDecodeError, OSError):
-                    pass
-        context["synthesis"] = syntheses
-        logger.info("  Synthesis ideas: %d", len(syntheses))
-    except Exception as e:
-        logger.warning("  Synthesis failed: %s", e)
-        context["synthesis"] = []
-
-    # --- Business ideas ---
-    try:
-        p = get_paths()
-        ideas = []
-        if p.business_dir.exists():
-            for f in sorted(p.business_dir.glob("*.json")):
-                try:
-                    ideas.append(json.loads(f.read_text()))
-                except (json.JSONDecodeError, OSError):
-                    pass
-        context["business_ideas"] = ideas
-        logger.info("  Business ideas: %d", len(ideas))
-    except Exception as e:
-        logger.warning("  Business ideas failed: %s", e)
-        context["business_ideas"] = []
+    # --- Reasoning trails, outcomes, synthesis, business ideas ---
+    for key, kind, label, limit in (
+        ("reasoning_trails", "reasoning", "Reasoning trails", 20),
+        ("outcomes", "outcomes", "Outcomes", 20),
+        ("synthesis", "synthesis", "Synthesis ideas", 20),
+        ("business_ideas", "business", "Business ideas", None),
+    ):
+        try:
+            from daemon.record_store import get_record_store
+            # Most recent `limit` records, in chronological order
+            records = get_record_store().list(kind, order_by="created", descending=True,
+                                              limit=limit)
+            context[key] = records[::-1]
+            logger.info("  %s: %d", label, len(records))
+        except Exception as e:
+            logger.warning("  %s failed: %s", label, e)
+            context[key] = []
 
     # --- Handoff (current session state) ---
     try:
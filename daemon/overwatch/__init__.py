@@ -14,8 +14,16 @@ Split into mixins:
 - SearchMixin (search.py) — history search, events, LLM filtering, injection
 - IngestMixin (ingest.py) — micro-ingestion, triage, synthesis
 - SnapshotMixin (snapshot.py) — session snapshots for boot continuity
+- PipelineMixin (pipeline.py) — asyncio stages with a deadline on injection
+
+Session tailing is event-driven (watcher.py): inotify wakes the loop on
+writes to session JSONL files, with directory polling as the fallback.
+
+Also hosts a background IngestWorker: full conversation ingests requested
+by the prompt hook run here, off the prompt path.
 """
 
+import asyncio
 import os
 import json
 import time
@@ -24,17 +32,21 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from memory.conversations import get_conversations, ConversationMemory
+from memory.conversations.ingest_queue import IngestWorker
 from daemon.overwatch.config import (
-    PROJECTS_DIR, PID_PATH, INJECT_PATH, SESSION_STATE_PATH,
+    PROJECTS_DIR, PID_PATH, INJECT_PATH, SESSION_STATE_PATH, STATS_PATH,
     POLL_INTERVAL, HEARTBEAT_TIMEOUT, log,
 )
 from daemon.overwatch.parser import ParserMixin
 from daemon.overwatch.search import SearchMixin
 from daemon.overwatch.ingest import IngestMixin
 from daemon.overwatch.snapshot import SnapshotMixin
+from daemon.overwatch.pipeline import PipelineMixin
+from daemon.overwatch.watcher import WatchMetrics, make_session_watcher
+from daemon.schemas import atomic_write_json
 
 
-class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
+class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin, PipelineMixin):
     def __init__(self):
         self.conv: ConversationMemory = get_conversations()
         self.last_position: int = 0
@@ -63,21 +75,29 @@ class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
         self.last_snapshot_time: float = 0
         self.recent_exchanges: List[Dict[str, str]] = []
 
+        # Session tailing (inotify, or polling fallback) + latency metrics
+        self.watcher = make_session_watcher(PROJECTS_DIR, POLL_INTERVAL)
+        self.metrics = WatchMetrics()
+
     def find_active_session(self) -> Optional[Path]:
-        """Find the most recently modified JSONL file — that's the active session."""
-        if not PROJECTS_DIR.exists():
-            return None
-        newest = None
-        newest_mtime = 0
-        for project_dir in PROJECTS_DIR.iterdir():
-            if not project_dir.is_dir() or project_dir.name.startswith("."):
-                continue
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                mtime = jsonl_file.stat().st_mtime
-                if mtime > newest_mtime:
-                    newest = jsonl_file
-                    newest_mtime = mtime
-        return newest
+        """The most recently written JSONL file — that's the active session."""
+        return self.watcher.active_session()
+
+    def watch_stats(self) -> Dict[str, Any]:
+        """Watcher mode/counters plus wake → read / wake → inject latencies."""
+        return {
+            "watcher": self.watcher.stats(),
+            "latency": self.metrics.summary(),
+            "injections": self.injection_count,
+            "session_id": self.current_session_id,
+            "updated": time.time(),
+        }
+
+    def _write_watch_stats(self):
+        try:
+            atomic_write_json(STATS_PATH, self.watch_stats())
+        except OSError as e:
+            log.error(f"Stats write error: {e}")
 
     def _load_session_state(self) -> Dict[str, Any]:
         if SESSION_STATE_PATH.exists():
@@ -87,114 +107,69 @@ class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
                 return {}
         return {}
 
-    def _process_exchange(self, exchange: Dict[str, str]):
-        """Core logic: process one new exchange."""
-        combined = exchange["user_text"] + " " + exchange["assistant_text"]
-
-        # 1. Search history for cross-references
-        results = self._search_history(combined, threshold=0.65)
-
-        # 2. Detect events
-        events = self._detect_events(exchange)
-        event_results = self._search_for_events(events) if events else []
-
-        # 3. Inject if anything found
-        if results or event_results:
-            self._write_inject(results, event_results)
-
-        # 4. Queue for micro-ingestion + synthesis
-        self.exchange_counter += 1
-        exchange["exchange_index"] = self.exchange_counter
+    def _queue_exchange(self, exchange: Dict[str, str]):
+        """Queue a processed exchange for micro-ingestion, synthesis and snapshots."""
         self.pending_exchanges.append(exchange)
         self.pending_exchanges_for_synthesis.append(exchange)
         self.exchanges_since_ingest += 1
-        self._check_micro_ingest()
-
         self.prev_user_text = exchange["user_text"]
 
-        # Track for snapshot
         self.recent_exchanges.append(exchange)
         if len(self.recent_exchanges) > 10:
             self.recent_exchanges = self.recent_exchanges[-10:]
-        self._check_snapshot()
+
+    def _session_stale(self, active: Path) -> bool:
+        """Heartbeat: a JSONL untouched for HEARTBEAT_TIMEOUT means the session is dead."""
+        try:
+            if time.time() - active.stat().st_mtime > HEARTBEAT_TIMEOUT:
+                log.info(f"Session JSONL stale for {HEARTBEAT_TIMEOUT}s, exiting (orphan prevention)")
+                return True
+        except OSError:
+            pass
+        return False
+
+    def _switch_session(self, active: Path):
+        """Start tailing a new session from its current end (reader-side state)."""
+        self.current_jsonl = active
+        self.current_session_id = active.stem
+        self.last_position = active.stat().st_size
+        self.cooldowns.clear()
+        self.exchange_counter = 0
+        self._pending_user = None
+        self._assistant_texts = []
+        self.session_state = self._load_session_state()
+        log.info(f"Watching: {active.name} (session {self.current_session_id[:8]}...)")
+
+    def _reset_ingest_state(self):
+        """Ingest-side state reset, applied once the old session is flushed."""
+        self.pending_exchanges = []
+        self.pending_exchanges_for_synthesis = []
+        self.exchanges_since_ingest = 0
+        self.last_ingest_time = time.time()
+        self.last_snapshot_time = 0
+        self.recent_exchanges = []
 
     def watch(self):
-        """Main loop — find active session, tail it, react."""
+        """Main loop — find active session, tail it, react (see pipeline.py)."""
         log.info("Overwatch starting...")
         log.info(f"Conversations in DB: {self.conv.count()}")
         overdue = self.session_state.get("overdue_items", [])
         if overdue:
             log.info(f"Session state loaded: {len(overdue)} overdue items")
+        log.info(f"Session watcher: {self.watcher.mode}")
+        ingest_worker = IngestWorker(self.conv.ingest_all, name="overwatch").start()
 
-        while self.running:
-            try:
-                active = self.find_active_session()
-
-                if active is None:
-                    time.sleep(POLL_INTERVAL * 5)
-                    continue
-
-                # Heartbeat
-                try:
-                    mtime = active.stat().st_mtime
-                    if time.time() - mtime > HEARTBEAT_TIMEOUT:
-                        if self.recent_exchanges:
-                            self._build_snapshot()
-                        if self.pending_exchanges:
-                            self._micro_ingest()
-                        log.info(f"Session JSONL stale for {HEARTBEAT_TIMEOUT}s, exiting (orphan prevention)")
-                        break
-                except OSError:
-                    pass
-
-                # New session detected
-                if active != self.current_jsonl:
-                    if self.pending_exchanges:
-                        self._micro_ingest()
-
-                    self.current_jsonl = active
-                    self.current_session_id = active.stem
-                    self.last_position = active.stat().st_size
-                    self.cooldowns.clear()
-                    self.exchange_counter = 0
-                    self.pending_exchanges = []
-                    self.pending_exchanges_for_synthesis = []
-                    self.exchanges_since_ingest = 0
-                    self._pending_user = None
-                    self._assistant_texts = []
-                    self.last_ingest_time = time.time()
-                    self.last_snapshot_time = 0
-                    self.recent_exchanges = []
-                    self.session_state = self._load_session_state()
-                    log.info(f"Watching: {active.name} (session {self.current_session_id[:8]}...)")
-
-                # Read new lines
-                new_entries = self._read_new_lines(active)
-                if not new_entries:
-                    self._check_micro_ingest()
-                    time.sleep(POLL_INTERVAL)
-                    continue
-
-                # Parse into exchanges
-                exchanges = self._parse_exchanges(new_entries)
-                if exchanges:
-                    log.info(f"Parsed {len(exchanges)} exchange(s) from {len(new_entries)} entries")
-
-                for exchange in exchanges:
-                    self._process_exchange(exchange)
-                    log.info(f"Processed: {exchange['user_text'][:60]}...")
-
-                time.sleep(POLL_INTERVAL)
-
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                log.error(f"Watch loop error: {e}")
-                time.sleep(POLL_INTERVAL * 2)
+        try:
+            asyncio.run(self._run_pipeline())
+        except KeyboardInterrupt:
+            pass
 
         # Final flush
+        ingest_worker.stop()
         if self.pending_exchanges:
             self._micro_ingest()
+        self._write_watch_stats()
+        self.watcher.close()
         log.info("Overwatch stopped.")
 
     def stop(self):
@@ -20,11 +20,13 @@ INJECT_PATH = _p.overwatch_inject
 INJECT_TMP_PATH = INJECT_PATH.with_suffix(".tmp")
 PID_PATH = _p.overwatch_pid
 LOG_PATH = _p.overwatch_log
+STATS_PATH = _p.overwatch_stats
 SESSION_STATE_PATH = _p.session_state
 SNAPSHOT_PATH = _p.session_snapshot
 
 # Tuning
-POLL_INTERVAL = 2.0          # seconds between file checks
+POLL_INTERVAL = 2.0          # seconds between file checks (polling fallback)
+WATCH_IDLE_TIMEOUT = 10.0    # inotify: wake this often with no writes (heartbeat, micro-ingest, shutdown)
 RELEVANCE_THRESHOLD = 0.58   # minimum combined score to inject (cosine on conversations clusters 0.5-0.7)
 COOLDOWN_SECONDS = 600       # 10 min cooldown per topic cluster
 MAX_INJECTIONS_PER_CHECK = 3 # max results per injection
@@ -34,6 +36,11 @@ TWENTY_FOUR_HOURS = 86400    # seconds — downweight recent results to prevent
 RECENT_DOWNWEIGHT = 0.5      # multiply score by this for results < 24h old
 OVERDUE_BOOST = 0.15         # score boost for results matching overdue items
 
+# Pipeline
+INJECT_DEADLINE = 2.5        # seconds from wake to injection; slower LLM filtering finishes in background
+PIPELINE_QUEUE_SIZE = 8      # bounded queue between pipeline stages (backpressure)
+PIPELINE_LLM_WORKERS = 2     # threads for relevance judgments + event searches
+
 # Micro-ingestion
 MICRO_INGEST_EXCHANGES = 5   # ingest every N exchanges
 MICRO_INGEST_SECONDS = 600   # or every N seconds, whichever first
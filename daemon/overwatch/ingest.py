@@ -36,9 +36,9 @@ class IngestMixin:
         try:
             ingested = 0
             triaged = 0
-            for ex in self.pending_exchanges:
-                # Try LLM triage — classify and score importance
-                triage = llm.triage_memory(ex["user_text"], ex["assistant_text"])
+            # LLM triage for the whole pending set in one concurrent batch
+            triages = llm.triage_memories(self.pending_exchanges)
+            for ex, triage in zip(self.pending_exchanges, triages):
                 if triage:
                     triaged += 1
                     # Use importance score (1.5B model's worth_keeping is unreliable)
@@ -51,7 +51,7 @@ class IngestMixin:
                     user_text=ex["user_text"],
                     assistant_text=ex["assistant_text"],
                     timestamp=ex.get("timestamp", ""),
-                    session_id=self.current_session_id,
+                    session_id=ex.get("session_id", self.current_session_id),
                     exchange_index=ex.get("exchange_index", -1),
                 )
                 if ok:
@@ -67,7 +67,7 @@ class IngestMixin:
                 synthesis_exchanges = [
                     {
                         "text": ex["user_text"] + " " + ex["assistant_text"],
-                        "session_id": self.current_session_id,
+                        "session_id": ex.get("session_id", self.current_session_id),
                         "timestamp": ex.get("timestamp", ""),
                     }
                     for ex in self.pending_exchanges_for_synthesis
@@ -0,0 +1,277 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch pipeline — asyncio stages from session tail to injection.
+
+    read/parse → search → judge/inject → ingest
+
+Stages are connected by bounded asyncio queues (PIPELINE_QUEUE_SIZE), so a
+slow stage applies backpressure instead of stalling the tail. Blocking
+work runs on thread pools: ChromaDB search and micro-ingest on the io pool,
+relevance judgments and event searches on the llm pool. The event loop
+itself only moves jobs between stages and writes the inject file.
+
+Injection carries a latency budget (INJECT_DEADLINE, from the watcher wake):
+if the LLM filter or event searches are still running at the deadline, the
+best unfiltered results are injected and the filter finishes in the
+background. A late verdict refines the inject file if the hook hasn't
+consumed it yet, otherwise only genuinely new results are injected.
+
+Jobs are dicts: {"kind": "exchange" | "switch", ...}. None stops the stage
+and is forwarded downstream, so every stage drains before shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from daemon import llm
+from daemon.overwatch.config import (
+    INJECT_PATH, INJECT_DEADLINE, MAX_INJECTIONS_PER_CHECK, PIPELINE_QUEUE_SIZE,
+    PIPELINE_LLM_WORKERS, POLL_INTERVAL, WATCH_IDLE_TIMEOUT, log,
+)
+
+
+logger = logging.getLogger("elara.overwatch.pipeline")
+
+HISTORY_THRESHOLD = 0.65
+
+
+class PipelineMixin:
+    """Mixin for the asyncio read → search → judge/inject → ingest pipeline."""
+
+    async def _run_pipeline(self):
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="overwatch-io")
+        self._llm_pool = ThreadPoolExecutor(
+            max_workers=PIPELINE_LLM_WORKERS, thread_name_prefix="overwatch-llm",
+        )
+        self._background: set = set()
+        self._stale_exit = False
+
+        search_q: asyncio.Queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+        inject_q: asyncio.Queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+        ingest_q: asyncio.Queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+        try:
+            await asyncio.gather(
+                self._read_stage(search_q),
+                self._search_stage(search_q, inject_q),
+                self._inject_stage(inject_q, ingest_q),
+                self._ingest_stage(ingest_q),
+            )
+            if self._background:
+                # Give late LLM verdicts one more budget to land before exit
+                await asyncio.wait(self._background, timeout=INJECT_DEADLINE)
+        finally:
+            self._io_pool.shutdown(wait=False)
+            self._llm_pool.shutdown(wait=False)
+
+    async def _blocking(self, pool, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _read_stage(self, out: asyncio.Queue):
+        """Tail the active session; emit one job per parsed exchange."""
+        while self.running:
+            try:
+                active = self.find_active_session()
+                if active is None:
+                    await self._blocking(None, self.watcher.wait, POLL_INTERVAL * 5)
+                    continue
+
+                if self._session_stale(active):
+                    self._stale_exit = True
+                    break
+
+                if active != self.current_jsonl:
+                    self._switch_session(active)
+                    await out.put({"kind": "switch"})
+
+                entries = await self._blocking(None, self._read_new_lines, active)
+                if not entries:
+                    await self._blocking(None, self.watcher.wait, WATCH_IDLE_TIMEOUT)
+                    continue
+
+                woke = self.watcher.last_wake
+                self.metrics.record("wake_to_read", time.monotonic() - woke)
+                exchanges = self._parse_exchanges(entries)
+                if exchanges:
+                    log.info(f"Parsed {len(exchanges)} exchange(s) from {len(entries)} entries")
+
+                for exchange in exchanges:
+                    self.exchange_counter += 1
+                    exchange["exchange_index"] = self.exchange_counter
+                    exchange["session_id"] = self.current_session_id
+                    await out.put({"kind": "exchange", "exchange": exchange, "woke": woke})
+
+            except Exception as e:
+                log.error(f"Read stage error: {e}")
+                await asyncio.sleep(POLL_INTERVAL * 2)
+
+        await out.put(None)
+
+    async def _search_stage(self, inp: asyncio.Queue, out: asyncio.Queue):
+        """Vector search (no LLM), then start judgment + event searches without waiting."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await inp.get()
+            if job is None or job["kind"] != "exchange":
+                await out.put(job)
+                if job is None:
+                    return
+                continue
+
+            exchange = job["exchange"]
+            text = exchange["user_text"] + " " + exchange["assistant_text"]
+            job.update(candidates=[], judge=None, events=None)
+            try:
+                candidates = await self._blocking(
+                    self._io_pool, self._rank_history, text, HISTORY_THRESHOLD,
+                )
+                job["candidates"] = candidates
+                if candidates and await self._blocking(None, llm.is_available):
+                    job["judge"] = loop.run_in_executor(
+                        self._llm_pool, self._judge_candidates, text, candidates,
+                    )
+                events = self._detect_events(exchange)
+                if events:
+                    job["events"] = loop.run_in_executor(
+                        self._llm_pool, self._search_for_events, events,
+                    )
+            except Exception as e:
+                log.error(f"Search stage error: {e}")
+            await out.put(job)
+
+    async def _inject_stage(self, inp: asyncio.Queue, out: asyncio.Queue):
+        """Inject the best results available at the deadline."""
+        while True:
+            job = await inp.get()
+            if job is None or job["kind"] != "exchange":
+                await out.put(job)
+                if job is None:
+                    return
+                continue
+            try:
+                await self._inject_by_deadline(job)
+            except Exception as e:
+                log.error(f"Inject stage error: {e}")
+            await out.put(job)
+
+    async def _ingest_stage(self, inp: asyncio.Queue):
+        """Queue exchanges for micro-ingestion and snapshots; flush on session switch."""
+        while True:
+            try:
+                job = await asyncio.wait_for(inp.get(), timeout=WATCH_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                await self._blocking(self._io_pool, self._check_micro_ingest)
+                continue
+
+            if job is None:
+                break
+            try:
+                if job["kind"] == "switch":
+                    if self.pending_exchanges:
+                        await self._blocking(self._io_pool, self._micro_ingest)
+                    self._reset_ingest_state()
+                    continue
+
+                exchange = job["exchange"]
+                self._queue_exchange(exchange)
+                await self._blocking(self._io_pool, self._check_micro_ingest)
+                self._check_snapshot()
+                log.info(f"Processed: {exchange['user_text'][:60]}...")
+            except Exception as e:
+                log.error(f"Ingest stage error: {e}")
+
+        if self._stale_exit and self.recent_exchanges:
+            self._build_snapshot()
+        if self.pending_exchanges:
+            await self._blocking(self._io_pool, self._micro_ingest)
+
+    # ------------------------------------------------------------------
+    # Deadline injection
+    # ------------------------------------------------------------------
+
+    async def _inject_by_deadline(self, job: Dict[str, Any]):
+        pending = [f for f in (job["judge"], job["events"]) if f is not None]
+        remaining = job["woke"] + INJECT_DEADLINE - time.monotonic()
+        if pending and remaining > 0:
+            await asyncio.wait(pending, timeout=remaining)
+
+        results = self._settled(job["judge"], self._unjudged(job["candidates"]))
+        event_results = self._settled(job["events"], [])
+        results = self._off_cooldown(results)
+        event_results = self._off_cooldown(event_results)
+
+        provisional = None
+        if results or event_results:
+            if self._record_injection(results, event_results, job["woke"]):
+                provisional = self.injection_count
+
+        if any(not f.done() for f in pending):
+            log.info(f"Inject deadline ({INJECT_DEADLINE}s) hit, LLM filter continues in background")
+            task = asyncio.ensure_future(self._finish_late(job, provisional))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _finish_late(self, job: Dict[str, Any], provisional: Optional[int]):
+        """Apply a late LLM verdict to what was injected at the deadline."""
+        pending = [f for f in (job["judge"], job["events"]) if f is not None]
+        await asyncio.wait(pending)
+        results = self._settled(job["judge"], self._unjudged(job["candidates"]))
+        event_results = self._settled(job["events"], [])
+
+        unconsumed = (provisional is not None and provisional == self.injection_count
+                      and INJECT_PATH.exists())
+        if unconsumed:
+            # The hook hasn't read the provisional injection yet — replace it
+            if results or event_results:
+                self._write_inject(results, event_results)
+                log.info("Injection refined by late LLM verdict")
+            else:
+                INJECT_PATH.unlink(missing_ok=True)
+                log.info("Injection withdrawn by late LLM verdict")
+            return
+
+        results = self._off_cooldown(results)
+        event_results = self._off_cooldown(event_results)
+        if results or event_results:
+            self._write_inject(results, event_results)
+
+    def _record_injection(self, results: List[Dict[str, Any]],
+                          event_results: List[Dict[str, Any]], woke: float) -> bool:
+        """Write the inject file and record wake → inject latency. True if written."""
+        injected_before = self.injection_count
+        self._write_inject(results, event_results)
+        if self.injection_count == injected_before:
+            return False
+        latency = time.monotonic() - woke
+        self.metrics.record("wake_to_inject", latency)
+        log.info(f"Wake → inject: {latency * 1000:.0f}ms ({self.watcher.mode})")
+        self._write_watch_stats()
+        return True
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _settled(fut, fallback):
+        """Result of a finished future, else fallback (still running or failed)."""
+        if fut is None or not fut.done() or fut.cancelled() or fut.exception() is not None:
+            return fallback
+        return fut.result()
+
+    @staticmethod
+    def _unjudged(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return candidates[:MAX_INJECTIONS_PER_CHECK]
+
+    def _off_cooldown(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop topics injected since the search ran (stages overlap)."""
+        return [r for r in results if not self._is_on_cooldown(self._topic_hash(r["content"]))]
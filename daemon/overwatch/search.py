@@ -8,6 +8,7 @@ Overwatch search — history search, event detection, LLM filtering, injection w
 
 import logging
 import json
+import os
 import time
 import hashlib
 from typing import List, Dict, Any, Optional
@@ -29,9 +30,10 @@ class SearchMixin:
     """Mixin for history search, event detection, and injection."""
 
     def _is_on_cooldown(self, topic_hash: str) -> bool:
-        if topic_hash not in self.cooldowns:
+        ts = self.cooldowns.get(topic_hash)
+        if ts is None:
             return False
-        return time.time() - self.cooldowns[topic_hash] < COOLDOWN_SECONDS
+        return time.time() - ts < COOLDOWN_SECONDS
 
     def _set_cooldown(self, topic_hash: str):
         self.cooldowns[topic_hash] = time.time()
@@ -68,6 +70,13 @@ class SearchMixin:
 
     def _search_history(self, text: str, threshold: float, n_results: int = 10) -> List[Dict[str, Any]]:
         """Search all conversation history, excluding current session."""
+        relevant = self._rank_history(text, threshold, n_results)
+        if relevant and llm.is_available():
+            relevant = self._judge_candidates(text, relevant)
+        return relevant[:MAX_INJECTIONS_PER_CHECK]
+
+    def _rank_history(self, text: str, threshold: float, n_results: int = 10) -> List[Dict[str, Any]]:
+        """Vector search + score adjustments, no LLM. Best first."""
         try:
             results = self.conv.recall(text, n_results=n_results)
         except Exception as e:
@@ -107,26 +116,27 @@ class SearchMixin:
             r["score"] = score
             relevant.append(r)
 
-        # LLM relevance judgment — filter false positives
-        if relevant and llm.is_available():
-            judged = []
-            for r in relevant[:MAX_INJECTIONS_PER_CHECK + 2]:
-                judgment = llm.judge_relevance(
-                    current_text=text,
-                    historical_text=r.get("content", r.get("user_text", "")),
-                )
-                if judgment and judgment.get("relevant"):
-                    ollama_importance = judgment.get("importance", 0.5)
-                    r["score"] = r["score"] * 0.6 + ollama_importance * 0.4
-                    r["_llm_reason"] = judgment.get("reason", "")
-                    judged.append(r)
-                elif judgment is None:
-                    judged.append(r)
-                else:
-                    log.debug(f"LLM filtered: {r.get('content', '')[:50]}... — {judgment.get('reason', '')}")
-            relevant = judged
-
-        return relevant[:MAX_INJECTIONS_PER_CHECK]
+        relevant.sort(key=lambda r: r["score"], reverse=True)
+        return relevant
+
+    def _judge_candidates(self, text: str, relevant: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """LLM relevance judgment — filter false positives from ranked candidates."""
+        judged = []
+        candidates = relevant[:MAX_INJECTIONS_PER_CHECK + 2]
+        judgments = llm.judge_relevance_batch(
+            text, [r.get("content", r.get("user_text", "")) for r in candidates],
+        )
+        for r, judgment in zip(candidates, judgments):
+            if judgment and judgment.get("relevant"):
+                ollama_importance = judgment.get("importance", 0.5)
+                r = dict(r, score=r["score"] * 0.6 + ollama_importance * 0.4,
+                         _llm_reason=judgment.get("reason", ""))
+                judged.append(r)
+            elif judgment is None:
+                judged.append(r)
+            else:
+                log.debug(f"LLM filtered: {r.get('content', '')[:50]}... — {judgment.get('reason', '')}")
+        return judged[:MAX_INJECTIONS_PER_CHECK]
 
     def _search_for_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Run broader searches triggered by events."""
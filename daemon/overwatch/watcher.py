@@ -0,0 +1,284 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch watcher — event-driven session tailing.
+
+The old loop slept POLL_INTERVAL and re-globbed + stat'd every *.jsonl in
+every project dir on each tick. With thousands of sessions that is a lot of
+syscalls for nothing, and up to a full interval of latency before injection.
+
+InotifySessionWatcher (Linux, stdlib ctypes binding):
+  - one scan at startup to seed the newest session
+  - inotify watches on the projects dir and each project subdir
+  - a write to any *.jsonl makes it the active session — no rescans
+  - wait() blocks in select() until a write arrives or the idle timeout
+  - queue overflow falls back to a single rescan
+
+PollingSessionWatcher keeps the original behaviour for other platforms,
+or when inotify is unavailable / out of watches.
+
+WatchMetrics records wake → read and wake → inject latencies.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from daemon.overwatch.config import log
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_ROOT_MASK = IN_CREATE | IN_MOVED_TO | IN_DELETE_SELF
+_PROJECT_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_MOVED_TO
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+_libc = None
+INOTIFY_AVAILABLE = False
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        INOTIFY_AVAILABLE = True
+    except (OSError, AttributeError):
+        _libc = None
+
+
+def scan_newest_session(projects_dir: Path) -> Optional[Path]:
+    """Full scan: the most recently modified JSONL across all project dirs."""
+    if not projects_dir.exists():
+        return None
+    newest = None
+    newest_mtime = 0
+    for project_dir in projects_dir.iterdir():
+        if not project_dir.is_dir() or project_dir.name.startswith("."):
+            continue
+        for jsonl_file in project_dir.glob("*.jsonl"):
+            try:
+                mtime = jsonl_file.stat().st_mtime
+            except OSError:
+                continue
+            if mtime > newest_mtime:
+                newest = jsonl_file
+                newest_mtime = mtime
+    return newest
+
+
+class WatchMetrics:
+    """Rolling latency samples (seconds) keyed by stage."""
+
+    def __init__(self, size: int = 200):
+        self._size = size
+        self._samples: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, stage: str, seconds: float):
+        self._samples.setdefault(stage, deque(maxlen=self._size)).append(seconds)
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        out = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            out[stage] = {
+                "count": self.counts[stage],
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+        return out
+
+
+class PollingSessionWatcher:
+    """Original behaviour: rescan every project dir, sleep between checks."""
+
+    mode = "poll"
+
+    def __init__(self, projects_dir: Path, poll_interval: float):
+        self.projects_dir = projects_dir
+        self.poll_interval = poll_interval
+        self.wakes = 0
+        self.rescans = 0
+        self.last_wake: float = time.monotonic()
+
+    def active_session(self) -> Optional[Path]:
+        self.rescans += 1
+        return scan_newest_session(self.projects_dir)
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep one poll interval. Always reports a possible change."""
+        time.sleep(min(timeout, self.poll_interval))
+        self.wakes += 1
+        self.last_wake = time.monotonic()
+        return True
+
+    def close(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "wakes": self.wakes, "rescans": self.rescans}
+
+
+class InotifySessionWatcher(PollingSessionWatcher):
+    """inotify-driven: tracks the newest session from write events alone."""
+
+    mode = "inotify"
+
+    def __init__(self, projects_dir: Path, poll_interval: float):
+        super().__init__(projects_dir, poll_interval)
+        self.events = 0
+        self._wd_dirs: Dict[int, Path] = {}
+        self._root_wd: Optional[int] = None
+        self._newest: Optional[Path] = None
+        self._newest_mtime: float = 0
+
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            self._root_wd = self._add_watch(projects_dir, _ROOT_MASK)
+            for project_dir in projects_dir.iterdir():
+                if project_dir.is_dir() and not project_dir.name.startswith("."):
+                    self._add_watch(project_dir, _PROJECT_MASK)
+        except OSError:
+            self.close()
+            raise
+        self._rescan()
+
+    def _add_watch(self, path: Path, mask: int) -> int:
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch({path}): {os.strerror(err)}")
+        self._wd_dirs[wd] = path
+        return wd
+
+    def _rescan(self):
+        self.rescans += 1
+        self._newest = scan_newest_session(self.projects_dir)
+        self._newest_mtime = time.time()
+
+    def _touch(self, path: Path):
+        self._newest = path
+        self._newest_mtime = time.time()
+
+    def active_session(self) -> Optional[Path]:
+        return self._newest
+
+    def _drain(self) -> bool:
+        """Read and apply every queued event. True if a session file was written."""
+        touched = False
+        while True:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not buf:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + length].split(b"\0", 1)[0].decode("utf-8", "replace")
+                offset += length
+                self.events += 1
+                touched |= self._handle(wd, mask, name)
+        return touched
+
+    def _handle(self, wd: int, mask: int, name: str) -> bool:
+        if mask & IN_Q_OVERFLOW:
+            log.warning("inotify queue overflow, rescanning sessions")
+            self._rescan()
+            return True
+        if mask & IN_IGNORED:
+            self._wd_dirs.pop(wd, None)
+            return False
+
+        directory = self._wd_dirs.get(wd)
+        if directory is None:
+            return False
+
+        if wd == self._root_wd:
+            if mask & IN_ISDIR and name and not name.startswith("."):
+                # New project dir: watch it, then pick up files created before the watch
+                project_dir = directory / name
+                try:
+                    self._add_watch(project_dir, _PROJECT_MASK)
+                except OSError as e:
+                    log.warning(f"Cannot watch {project_dir}: {e}")
+                    return False
+                latest = max(project_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, default=None)
+                if latest is not None:
+                    self._touch(latest)
+                    return True
+            return False
+
+        if name.endswith(".jsonl") and not mask & IN_ISDIR:
+            self._touch(directory / name)
+            return True
+        return False
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a session file is written or timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            except InterruptedError:
+                continue
+            if not ready:
+                return False
+            if self._drain():
+                self.wakes += 1
+                self.last_wake = time.monotonic()
+                return True
+
+    def close(self):
+        if self._fd is not None and self._fd >= 0:
+            os.close(self._fd)
+        self._fd = None
+
+    def stats(self) -> Dict[str, Any]:
+        info = super().stats()
+        info["events"] = self.events
+        info["watches"] = len(self._wd_dirs)
+        return info
+
+
+def make_session_watcher(projects_dir: Path, poll_interval: float) -> PollingSessionWatcher:
+    """inotify watcher when possible, polling otherwise."""
+    if INOTIFY_AVAILABLE and projects_dir.exists():
+        try:
+            return InotifySessionWatcher(projects_dir, poll_interval)
+        except OSError as e:
+            log.warning(f"inotify unavailable ({e}), falling back to polling")
+    return PollingSessionWatcher(projects_dir, poll_interval)
@@ -5,8 +5,8 @@
 """
 Elara Predictions — Explicit forecasts with deadlines and verification.
 
-Storage: ~/.elara/elara-predictions/ (JSON files, one per prediction)
-Index:   ~/.elara/elara-predictions-db/ (ChromaDB, cosine similarity)
+Storage: "predictions" records in the shared record store (daemon/record_store.py)
+Index:   elara_predictions in the shared ChromaDB store (cosine similarity)
 
 The overnight brain makes predictions based on cognitive models.
 When deadlines pass, predictions get checked against reality.
@@ -19,113 +19,60 @@ This closes the foresight loop:
 import logging
 import hashlib
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.index_sync import build_items, sync_collection, upsert_items
 from daemon.events import bus, Events
+from daemon.record_store import get_record_store
 from daemon.schemas import (
-    Prediction, load_validated, save_validated,
+    Prediction,
     ElaraNotFoundError, ElaraValidationError,
 )
 
 logger = logging.getLogger("elara.predictions")
 
-_p = get_paths()
-PREDICTIONS_DIR = _p.predictions_dir
-PREDICTIONS_DB_DIR = _p.predictions_db
+_KIND = "predictions"
 
 
 # ============================================================================
-# Storage layer (JSON files — source of truth)
+# Storage layer (record store — source of truth)
 # ============================================================================
 
-def _ensure_dirs():
-    PREDICTIONS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _prediction_path(prediction_id: str) -> Path:
-    return PREDICTIONS_DIR / f"{prediction_id}.json"
-
-
 def _generate_id(statement: str) -> str:
     raw = f"{statement}:{datetime.now().isoformat()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
 def _load_prediction(prediction_id: str) -> Optional[Dict]:
-    path = _prediction_path(prediction_id)
-    if not path.exists():
-        return None
-    model = load_validated(path, Prediction)
-    return model.model_dump()
+    return get_record_store().get(_KIND, prediction_id)
 
 
 def _save_prediction(prediction: Dict):
-    _ensure_dirs()
-    validated = Prediction.model_validate(prediction)
-    path = _prediction_path(prediction["prediction_id"])
-    save_validated(path, validated)
+    get_record_store().put(_KIND, prediction)
 
 
-def _load_all_predictions() -> List[Dict]:
-    _ensure_dirs()
-    predictions = []
-    for p in sorted(PREDICTIONS_DIR.glob("*.json")):
-        if p.suffix == ".json" and not p.name.endswith(".tmp"):
-            try:
-                m = load_validated(p, Prediction)
-                predictions.append(m.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load prediction %s: %s", p.name, e)
-    return predictions
+def _load_all_predictions(status: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=status)
 
 
 # ============================================================================
 # ChromaDB index (semantic search over predictions)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        PREDICTIONS_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(
-            path=str(PREDICTIONS_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _chroma_collection = _chroma_client.get_or_create_collection(
-            name="elara_predictions",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_predictions")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to init predictions ChromaDB: %s", e)
         return None
 
 
-def _index_prediction(prediction: Dict):
-    collection = _get_collection()
-    if not collection:
-        return
-
+def _index_entry(prediction: Dict) -> Optional[tuple]:
+    """(document, metadata) for a prediction, or None if it has nothing to index."""
     parts = [
         prediction.get("statement", ""),
         prediction.get("actual_outcome", "") or "",
@@ -135,25 +82,44 @@ def _index_prediction(prediction: Dict):
 
     text = " ".join(p for p in parts if p)
     if not text.strip():
-        return
+        return None
 
-    metadata = {
+    return text, {
         "status": prediction.get("status", "pending"),
         "confidence": prediction.get("confidence", 0.5),
         "deadline": prediction.get("deadline", ""),
         "created": prediction.get("created", ""),
     }
 
+
+def _index_prediction(prediction: Dict):
+    collection = _get_collection()
+    if not collection:
+        return
+
+    entry = _index_entry(prediction)
+    if entry is None:
+        return
+
     try:
-        collection.upsert(
-            ids=[prediction["prediction_id"]],
-            documents=[text],
-            metadatas=[metadata],
-        )
+        upsert_items(collection, {prediction["prediction_id"]: entry})
     except Exception as e:
         logger.warning("Failed to index prediction %s: %s", prediction.get("prediction_id", "?"), e)
 
 
+def _sync_all_to_chroma(predictions: List[Dict]) -> Dict:
+    """Bring the index in line with all predictions, pushing only changes."""
+    collection = _get_collection()
+    if not collection:
+        return {}
+
+    try:
+        return sync_collection(collection, build_items(predictions, "prediction_id", _index_entry))
+    except Exception as e:
+        logger.warning("Prediction bulk sync failed: %s", e)
+        return {}
+
+
 # ============================================================================
 # Core operations
 # ============================================================================
@@ -247,13 +213,11 @@ def check_expired_predictions() -> List[Dict]:
     Find predictions whose deadline has passed but status is still pending.
     Returns them for manual or overnight verification.
     """
-    predictions = _load_all_predictions()
+    predictions = _load_all_predictions(status="pending")
     now = datetime.now()
     expired = []
 
     for p in predictions:
-        if p.get("status") != "pending":
-            continue
         deadline_str = p.get("deadline", "")
         if not deadline_str:
             continue
@@ -271,14 +235,12 @@ def check_expired_predictions() -> List[Dict]:
 
 def get_pending_predictions(days_ahead: int = 14) -> List[Dict]:
     """Get predictions with upcoming deadlines."""
-    predictions = _load_all_predictions()
+    predictions = _load_all_predictions(status="pending")
     now = datetime.now()
     cutoff = now + timedelta(days=days_ahead)
     pending = []
 
     for p in predictions:
-        if p.get("status") != "pending":
-            continue
         deadline_str = p.get("deadline", "")
         if not deadline_str:
             pending.append(p)
@@ -297,16 +259,21 @@ def get_pending_predictions(days_ahead: int = 14) -> List[Dict]:
 
 
 def get_prediction_accuracy() -> Dict:
-    """Calculate prediction accuracy rates over time."""
-    predictions = _load_all_predictions()
-    checked = [p for p in predictions if p.get("status") != "pending"]
-    pending = [p for p in predictions if p.get("status") == "pending"]
+    """Calculate prediction accuracy rates over time.
+
+    One grouped query over the indexed status column; no records are loaded.
+    """
+    summary = get_record_store().status_summary(_KIND, average="confidence", default=0.5)
+    counts = {status: row["count"] for status, row in summary.items()}
+    total = sum(counts.values())
+    pending = counts.get("pending", 0)
+    checked = total - pending
 
     if not checked:
         return {
-            "total": len(predictions),
+            "total": total,
             "checked": 0,
-            "pending": len(pending),
+            "pending": pending,
             "correct": 0,
             "wrong": 0,
             "partially_correct": 0,
@@ -316,31 +283,29 @@ def get_prediction_accuracy() -> Dict:
             "calibration": None,
         }
 
-    correct = [p for p in checked if p.get("status") == "correct"]
-    wrong = [p for p in checked if p.get("status") == "wrong"]
-    partial = [p for p in checked if p.get("status") == "partially_correct"]
-    expired = [p for p in checked if p.get("status") == "expired"]
+    correct = counts.get("correct", 0)
+    partial = counts.get("partially_correct", 0)
 
     # Accuracy: correct=1, partial=0.5, wrong/expired=0
-    score = len(correct) + 0.5 * len(partial)
-    accuracy = round(score / len(checked), 2) if checked else None
+    score = correct + 0.5 * partial
+    accuracy = round(score / checked, 2)
 
     # Calibration: avg predicted confidence vs actual accuracy
-    avg_confidence = None
-    if checked:
-        avg_confidence = round(sum(p.get("confidence", 0.5) for p in checked) / len(checked), 2)
+    confidence_sum = sum(row["count"] * row["avg"] for status, row in summary.items()
+                         if status != "pending")
+    avg_confidence = round(confidence_sum / checked, 2)
 
     return {
-        "total": len(predictions),
-        "checked": len(checked),
-        "pending": len(pending),
-        "correct": len(correct),
-        "wrong": len(wrong),
-        "partially_correct": len(partial),
-        "expired": len(expired),
+        "total": total,
+        "checked": checked,
+        "pending": pending,
+        "correct": correct,
+        "wrong": counts.get("wrong", 0),
+        "partially_correct": partial,
+        "expired": counts.get("expired", 0),
         "accuracy": accuracy,
         "avg_confidence": avg_confidence,
-        "calibration": round(accuracy - avg_confidence, 2) if accuracy is not None and avg_confidence is not None else None,
+        "calibration": round(accuracy - avg_confidence, 2),
     }
 
 
@@ -348,14 +313,10 @@ def list_predictions(
     status: Optional[str] = None,
     n: int = 50,
 ) -> List[Dict]:
-    """List predictions, optionally filtered by status."""
-    predictions = _load_all_predictions()
-
-    if status:
-        predictions = [p for p in predictions if p.get("status") == status]
-
-    predictions.sort(key=lambda p: p.get("created", ""), reverse=True)
-    return predictions[:n]
+    """List predictions, optionally filtered by status. Newest first."""
+    return get_record_store().list(
+        _KIND, status=status or None, order_by="created", descending=True, limit=n,
+    )
 
 
 def get_prediction(prediction_id: str) -> Optional[Dict]:
@@ -411,8 +372,6 @@ def _keyword_search_predictions(query: str, n: int) -> List[Dict]:
 
 
 def reindex_all() -> Dict:
-    """Rebuild ChromaDB index from JSON files."""
+    """Bring the ChromaDB index in line with the record store, pushing only changes."""
     predictions = _load_all_predictions()
-    for p in predictions:
-        _index_prediction(p)
-    return {"indexed": len(predictions)}
+    return {"indexed": len(predictions), **_sync_all_to_chroma(predictions)}
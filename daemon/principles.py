@@ -6,7 +6,7 @@
 Elara Principles — Crystallized self-derived rules from repeated insights.
 
 Storage: ~/.elara/elara-principles.json (JSON list, like corrections)
-Index:   ~/.elara/elara-principles-db/ (ChromaDB, cosine similarity)
+Index:   elara_principles in the shared ChromaDB store (cosine similarity)
 
 Principles emerge when the same insight appears 3+ times across overnight runs.
 They represent wisdom — high-level rules that should guide behavior.
@@ -21,14 +21,10 @@ import hashlib
 from datetime import datetime
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import query_args_for
+from memory.index_sync import build_items, sync_collection, upsert_items
 from daemon.events import bus, Events
 from daemon.schemas import (
     Principle, load_validated_list, save_validated_list,
@@ -39,7 +35,6 @@ logger = logging.getLogger("elara.principles")
 
 _p = get_paths()
 PRINCIPLES_FILE = _p.principles_file
-PRINCIPLES_DB_DIR = _p.principles_db
 
 # Confidence mechanics
 CONFIRM_DELTA = 0.05
@@ -71,40 +66,19 @@ def _generate_id(statement: str) -> str:
 # ChromaDB index (semantic search for crystallization + retrieval)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        PRINCIPLES_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(
-            path=str(PRINCIPLES_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _chroma_collection = _chroma_client.get_or_create_collection(
-            name="elara_principles",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_principles")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to init principles ChromaDB: %s", e)
         return None
 
 
-def _index_principle(principle: Dict):
-    collection = _get_collection()
-    if not collection:
-        return
-
+def _index_entry(principle: Dict) -> Optional[tuple]:
+    """(document, metadata) for a principle, or None if it has nothing to index."""
     parts = [
         principle.get("statement", ""),
         principle.get("domain", ""),
@@ -113,9 +87,9 @@ def _index_principle(principle: Dict):
 
     text = " ".join(p for p in parts if p)
     if not text.strip():
-        return
+        return None
 
-    metadata = {
+    return text, {
         "domain": principle.get("domain", "general"),
         "status": principle.get("status", "active"),
         "confidence": principle.get("confidence", 0.5),
@@ -123,49 +97,33 @@ def _index_principle(principle: Dict):
         "times_confirmed": principle.get("times_confirmed", 0),
     }
 
+
+def _index_principle(principle: Dict):
+    collection = _get_collection()
+    if not collection:
+        return
+
+    entry = _index_entry(principle)
+    if entry is None:
+        return
+
     try:
-        collection.upsert(
-            ids=[principle["principle_id"]],
-            documents=[text],
-            metadatas=[metadata],
-        )
+        upsert_items(collection, {principle["principle_id"]: entry})
     except Exception as e:
         logger.warning("Failed to index principle %s: %s", principle.get("principle_id", "?"), e)
 
 
-def _sync_all_to_chroma(principles: List[Dict]):
-    """Bulk sync all principles to ChromaDB."""
+def _sync_all_to_chroma(principles: List[Dict]) -> Dict:
+    """Bring the index in line with all principles, pushing only changes."""
     collection = _get_collection()
-    if not collection or not principles:
-        return
-
-    ids = []
-    documents = []
-    metadatas = []
+    if not collection:
+        return {}
 
-    for p in principles:
-        pid = p.get("principle_id", "")
-        if not pid:
-            continue
-        text = f"{p.get('statement', '')} {p.get('domain', '')} {' '.join(p.get('tags', []))}"
-        if not text.strip():
-            continue
-
-        ids.append(pid)
-        documents.append(text)
-        metadatas.append({
-            "domain": p.get("domain", "general"),
-            "status": p.get("status", "active"),
-            "confidence": p.get("confidence", 0.5),
-            "created": p.get("created", ""),
-            "times_confirmed": p.get("times_confirmed", 0),
-        })
-
-    if ids:
-        try:
-            collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
-        except Exception as e:
-            logger.warning("Principles bulk sync failed: %s", e)
+    try:
+        return sync_collection(collection, build_items(principles, "principle_id", _index_entry))
+    except Exception as e:
+        logger.warning("Principles bulk sync failed: %s", e)
+        return {}
 
 
 # ============================================================================
@@ -350,8 +308,8 @@ def check_for_crystallization(
         return None
 
 
-def search_principles(query: str, n: int = 5) -> List[Dict]:
-    """Semantic search across principles."""
+def search_principles(query: str, n: int = 5, query_embedding: Optional[List[float]] = None) -> List[Dict]:
+    """Semantic search across principles (query_embedding: precomputed vector)."""
     collection = _get_collection()
     if not collection:
         return _keyword_search(query, n)
@@ -362,7 +320,7 @@ def search_principles(query: str, n: int = 5) -> List[Dict]:
             return []
 
         results = collection.query(
-            query_texts=[query],
+            **query_args_for(query, query_embedding),
             n_results=min(n, count),
         )
 
@@ -468,5 +426,5 @@ def get_principle_stats() -> Dict:
 def reindex_all() -> Dict:
     """Rebuild ChromaDB index from JSON file."""
     principles = _load()
-    _sync_all_to_chroma(principles)
-    return {"indexed": len(principles)}
+    report = _sync_all_to_chroma(principles)
+    return {"indexed": len(principles), **report}
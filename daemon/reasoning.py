@@ -5,8 +5,8 @@
 """
 Elara Reasoning Trails — Track hypothesis → evidence → conclusion → outcome chains.
 
-Storage: ~/.claude/elara-reasoning/ (JSON files, one per trail)
-Index:   ~/.claude/elara-reasoning-db/ (ChromaDB, cosine similarity)
+Storage: "reasoning" records in the shared record store (daemon/record_store.py)
+Index:   elara_reasoning in the shared ChromaDB store (cosine similarity)
 
 When we debug something complex, track the chain:
   tried X → failed because Y → tried Z → worked because W
@@ -17,115 +17,62 @@ re-discovering the same thing.
 
 import logging
 import hashlib
-import json
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import query_args_for
+from memory.index_sync import build_items, delete_items, sync_collection, upsert_items
 from daemon.events import bus, Events
+from daemon.record_store import get_record_store
 from daemon.schemas import (
-    ReasoningTrail, Hypothesis, load_validated, save_validated,
+    ReasoningTrail, Hypothesis,
     ElaraNotFoundError, ElaraValidationError,
 )
 
 logger = logging.getLogger("elara.reasoning")
 
-_p = get_paths()
-REASONING_DIR = _p.reasoning_dir
-REASONING_DB_DIR = _p.reasoning_db
+_KIND = "reasoning"
 
 
 # ============================================================================
-# Storage layer (JSON files — source of truth)
+# Storage layer (record store — source of truth)
 # ============================================================================
 
-def _ensure_dirs():
-    REASONING_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _trail_path(trail_id: str) -> Path:
-    return REASONING_DIR / f"{trail_id}.json"
-
-
 def _generate_id(context: str) -> str:
     raw = f"{context}:{datetime.now().isoformat()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
 def _load_trail(trail_id: str) -> Optional[Dict]:
-    path = _trail_path(trail_id)
-    if not path.exists():
-        return None
-    model = load_validated(path, ReasoningTrail)
-    return model.model_dump()
+    return get_record_store().get(_KIND, trail_id)
 
 
 def _save_trail(trail: Dict):
-    _ensure_dirs()
-    model = ReasoningTrail.model_validate(trail)
-    path = _trail_path(trail["trail_id"])
-    save_validated(path, model)
+    get_record_store().put(_KIND, trail)
 
 
 def _load_all_trails() -> List[Dict]:
-    _ensure_dirs()
-    trails = []
-    for p in sorted(REASONING_DIR.glob("*.json")):
-        if p.suffix == ".json" and not p.name.endswith(".tmp"):
-            try:
-                model = load_validated(p, ReasoningTrail)
-                trails.append(model.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load trail %s: %s", p.name, e)
-    return trails
+    return get_record_store().list(_KIND)
 
 
 # ============================================================================
 # ChromaDB index (semantic search over trails)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        REASONING_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(
-            path=str(REASONING_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _chroma_collection = _chroma_client.get_or_create_collection(
-            name="elara_reasoning",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_reasoning")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to init reasoning ChromaDB: %s", e)
         return None
 
 
-def _index_trail(trail: Dict):
-    collection = _get_collection()
-    if not collection:
-        return
-
+def _index_entry(trail: Dict) -> Optional[tuple]:
+    """(document, metadata) for a trail, or None if it has nothing to index."""
     # Build searchable text from all parts of the trail
     parts = [trail.get("context", "")]
     for h in trail.get("hypotheses", []):
@@ -139,30 +86,49 @@ def _index_trail(trail: Dict):
 
     text = " ".join(p for p in parts if p)
     if not text.strip():
-        return
+        return None
 
-    metadata = {
+    return text, {
         "started": trail.get("started", ""),
         "resolved": str(trail.get("resolved", False)),
         "tags": ",".join(trail.get("tags", [])),
     }
 
+
+def _index_trail(trail: Dict):
+    collection = _get_collection()
+    if not collection:
+        return
+
+    entry = _index_entry(trail)
+    if entry is None:
+        return
+
     try:
-        collection.upsert(
-            ids=[trail["trail_id"]],
-            documents=[text],
-            metadatas=[metadata],
-        )
+        upsert_items(collection, {trail["trail_id"]: entry})
     except Exception as e:
         logger.warning("Failed to index trail %s: %s", trail.get("trail_id", "?"), e)
 
 
+def _sync_all_to_chroma(trails: List[Dict]) -> Dict:
+    """Bring the index in line with all trails, pushing only changes."""
+    collection = _get_collection()
+    if not collection:
+        return {}
+
+    try:
+        return sync_collection(collection, build_items(trails, "trail_id", _index_entry))
+    except Exception as e:
+        logger.warning("Trail bulk sync failed: %s", e)
+        return {}
+
+
 def _remove_from_index(trail_id: str):
     collection = _get_collection()
     if not collection:
         return
     try:
-        collection.delete(ids=[trail_id])
+        delete_items(collection, [trail_id])
     except Exception as e:
         logger.warning("Failed to remove trail %s from index: %s", trail_id, e)
 
@@ -281,8 +247,8 @@ def solve_trail(
     return trail
 
 
-def search_trails(query: str, n: int = 5) -> List[Dict]:
-    """Search past reasoning trails by problem similarity."""
+def search_trails(query: str, n: int = 5, query_embedding: Optional[List[float]] = None) -> List[Dict]:
+    """Search past reasoning trails by problem similarity (query_embedding: precomputed vector)."""
     collection = _get_collection()
     if not collection:
         # Fallback: keyword search
@@ -295,7 +261,7 @@ def search_trails(query: str, n: int = 5) -> List[Dict]:
             return []
 
         results = collection.query(
-            query_texts=[query],
+            **query_args_for(query, query_embedding),
             n_results=min(n, count),
         )
 
@@ -341,17 +307,11 @@ def list_trails(
     tag: Optional[str] = None,
     n: int = 20,
 ) -> List[Dict]:
-    """List trails, optionally filtered."""
-    trails = _load_all_trails()
-
-    if resolved is not None:
-        trails = [t for t in trails if t.get("resolved") == resolved]
-    if tag:
-        trails = [t for t in trails if tag in t.get("tags", [])]
-
-    # Sort by most recent first
-    trails.sort(key=lambda t: t.get("started", ""), reverse=True)
-    return trails[:n]
+    """List trails, optionally filtered. Most recent first."""
+    return get_record_store().list(
+        _KIND, status=resolved, tag=tag or None,
+        order_by="created", descending=True, limit=n,
+    )
 
 
 def get_active_trail() -> Optional[Dict]:
@@ -369,24 +329,14 @@ def get_recurring_problem_tags(min_count: int = 3) -> List[Dict]:
     Find tags that appear in multiple trails — recurring problem areas.
     Used by blind_spots() to surface patterns.
     """
-    trails = _load_all_trails()
-    tag_counts = {}
-    tag_trails = {}
-
-    for t in trails:
-        for tag in t.get("tags", []):
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-            if tag not in tag_trails:
-                tag_trails[tag] = []
-            tag_trails[tag].append(t["trail_id"])
-
+    store = get_record_store()
     recurring = []
-    for tag, count in tag_counts.items():
+    for tag, count in store.tag_counts(_KIND).items():
         if count >= min_count:
             recurring.append({
                 "tag": tag,
                 "count": count,
-                "trail_ids": tag_trails[tag],
+                "trail_ids": [t["trail_id"] for t in store.list(_KIND, tag=tag)],
             })
 
     recurring.sort(key=lambda x: x["count"], reverse=True)
@@ -408,9 +358,8 @@ def get_abandonment_rate() -> Dict:
     }
 
 
-def reindex_all():
-    """Rebuild ChromaDB index from JSON files. Run at boot if needed."""
+def reindex_all() -> Dict:
+    """Bring the ChromaDB index in line with the record store, pushing only changes.
+    Run at boot if needed."""
     trails = _load_all_trails()
-    for t in trails:
-        _index_trail(t)
-    return len(trails)
+    return {"indexed": len(trails), **_sync_all_to_chroma(trails)}
@@ -0,0 +1,398 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Record Store — one SQLite table for the cognitive artifacts.
+
+Problem: reasoning trails, outcomes, syntheses, business ideas, models,
+predictions and workflows each lived as one JSON file per item. Every
+list, stats or accuracy call globbed the directory, then opened, parsed
+and Pydantic-validated every file. With 10k trails that meant 10k file
+opens per call.
+
+Solution: the records table, keyed on (kind, id), stores each record as a
+JSON document. Its status and created date are copied into indexed
+columns, and tags go into a side table with its own index.
+  - Records are validated against their schema once, on write. Reads
+    return the stored document without re-validating it.
+  - Listing, filtering by status/tag/date, counting and simple
+    aggregates (get_prediction_accuracy) run as indexed queries.
+  - The modules keep their function APIs. Only their _load/_save
+    helpers changed.
+
+Legacy JSON directories are imported automatically the first time a kind
+is accessed; a flag in the meta table records that the import ran. Import
+uses INSERT OR IGNORE, so it never overwrites a record that has since
+changed in the store. `elara records migrate` runs the same import on
+demand: for dry runs, and to pick up files written by an older process
+after the first import. The JSON files are left in place as a backup.
+
+Usage:
+    from daemon.record_store import get_record_store
+    store = get_record_store()
+    store.put("predictions", prediction)
+    store.list("reasoning", status=False, order_by="created", descending=True, limit=20)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from core.paths import ElaraPaths, get_paths
+from daemon.schemas import (
+    BusinessIdea, CognitiveModel, ElaraModel, Outcome, Prediction,
+    ReasoningTrail, Synthesis, WorkflowPattern,
+)
+
+logger = logging.getLogger("elara.record_store")
+
+
+@dataclass(frozen=True)
+class RecordKind:
+    """How one artifact type maps onto the shared table."""
+    schema: Type[ElaraModel]
+    id_field: str
+    created_field: str      # sortable ISO timestamp
+    status_field: str       # copied into the indexed status column
+    legacy_dir: str         # ElaraPaths attribute of the old one-file-per-item dir
+
+
+KINDS: Dict[str, RecordKind] = {
+    "reasoning": RecordKind(ReasoningTrail, "trail_id", "started", "resolved", "reasoning_dir"),
+    "outcomes": RecordKind(Outcome, "outcome_id", "recorded", "assessment", "outcomes_dir"),
+    "synthesis": RecordKind(Synthesis, "synthesis_id", "created", "status", "synthesis_dir"),
+    "business": RecordKind(BusinessIdea, "idea_id", "created", "status", "business_dir"),
+    "models": RecordKind(CognitiveModel, "model_id", "created", "status", "models_dir"),
+    "predictions": RecordKind(Prediction, "prediction_id", "created", "status", "predictions_dir"),
+    "workflows": RecordKind(WorkflowPattern, "workflow_id", "created", "status", "workflows_dir"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    status TEXT,
+    created TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_records_status ON records(kind, status, created);
+CREATE INDEX IF NOT EXISTS idx_records_created ON records(kind, created);
+
+CREATE TABLE IF NOT EXISTS record_tags (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (kind, tag, id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_record_tags_id ON record_tags(kind, id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ORDER_COLUMNS = {"id": "id", "created": "created"}
+
+
+def _status_value(value: Any) -> Optional[str]:
+    """Status column text. Booleans (trail `resolved`) become 'true'/'false'."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class RecordStore:
+    """SQLite-backed store for the JSON-shaped cognitive artifacts."""
+
+    def __init__(self, paths: Optional[ElaraPaths] = None):
+        self.paths = paths or get_paths()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._imported: set = set()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        db_path = self.paths.records_db
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: transactions are explicit (BEGIN IMMEDIATE) below
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _transaction(self):
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _kind(self, kind: str) -> RecordKind:
+        spec = KINDS.get(kind)
+        if spec is None:
+            raise ValueError(f"Unknown record kind: {kind}")
+        with self._lock:
+            if kind not in self._imported:
+                self._import_once(kind, spec)
+                self._imported.add(kind)
+        return spec
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, record_id: str) -> Optional[Dict]:
+        self._kind(kind)
+        with self._lock:
+            row = self._db().execute(
+                "SELECT data FROM records WHERE kind = ? AND id = ?", (kind, record_id),
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def list(
+        self,
+        kind: str,
+        status: Any = None,
+        tag: Optional[str] = None,
+        since: Optional[str] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """Records of a kind, filtered on the indexed columns.
+
+        status matches the kind's status field (a bool for trails); since
+        keeps records created at or after an ISO timestamp.
+        """
+        self._kind(kind)
+        sql = ["SELECT r.data FROM records r"]
+        params: List[Any] = []
+        if tag is not None:
+            sql.append("JOIN record_tags t ON t.kind = r.kind AND t.id = r.id AND t.tag = ?")
+            params.append(tag)
+        sql.append("WHERE r.kind = ?")
+        params.append(kind)
+        if status is not None:
+            sql.append("AND r.status = ?")
+            params.append(_status_value(status))
+        if since is not None:
+            sql.append("AND r.created >= ?")
+            params.append(since)
+        sql.append(f"ORDER BY r.{_ORDER_COLUMNS[order_by]} {'DESC' if descending else 'ASC'}")
+        if limit is not None:
+            sql.append("LIMIT ?")
+            params.append(limit)
+        with self._lock:
+            rows = self._db().execute(" ".join(sql), params).fetchall()
+        return [json.loads(r["data"]) for r in rows]
+
+    def count(self, kind: str, status: Any = None) -> int:
+        self._kind(kind)
+        sql, params = "SELECT COUNT(*) FROM records WHERE kind = ?", [kind]
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(_status_value(status))
+        with self._lock:
+            return self._db().execute(sql, params).fetchone()[0]
+
+    def status_summary(self, kind: str, average: Optional[str] = None,
+                       default: float = 0.0) -> Dict[str, Dict[str, Any]]:
+        """{status: {"count": n, "avg": mean of a numeric field}} in one query.
+
+        Records missing the field count as `default` toward the mean.
+        """
+        self._kind(kind)
+        avg_sql = "NULL"
+        params: List[Any] = []
+        if average:
+            avg_sql = "AVG(COALESCE(json_extract(data, ?), ?))"
+            params = [f"$.{average}", default]
+        with self._lock:
+            rows = self._db().execute(
+                f"SELECT status, COUNT(*) AS n, {avg_sql} AS avg FROM records "
+                "WHERE kind = ? GROUP BY status",
+                params + [kind],
+            ).fetchall()
+        return {r["status"]: {"count": r["n"], "avg": r["avg"]} for r in rows}
+
+    def tag_counts(self, kind: str) -> Dict[str, int]:
+        self._kind(kind)
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT tag, COUNT(*) AS n FROM record_tags WHERE kind = ? GROUP BY tag",
+                (kind,),
+            ).fetchall()
+        return {r["tag"]: r["n"] for r in rows}
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, kind: str, record: Dict) -> Dict:
+        """Validate and upsert one record. Returns the stored document."""
+        return self.put_many(kind, [record])[0]
+
+    def put_many(self, kind: str, records: Iterable[Dict]) -> List[Dict]:
+        """Validate and upsert records in one transaction."""
+        spec = self._kind(kind)
+        docs = [spec.schema.model_validate(r).model_dump() for r in records]
+        with self._lock, self._transaction() as db:
+            self._write(db, kind, spec, docs, replace=True)
+        return docs
+
+    def delete(self, kind: str, record_id: str) -> bool:
+        self._kind(kind)
+        with self._lock, self._transaction() as db:
+            db.execute("DELETE FROM record_tags WHERE kind = ? AND id = ?", (kind, record_id))
+            cur = db.execute("DELETE FROM records WHERE kind = ? AND id = ?", (kind, record_id))
+        return cur.rowcount > 0
+
+    @staticmethod
+    def _write(db: sqlite3.Connection, kind: str, spec: RecordKind,
+               docs: List[Dict], replace: bool) -> int:
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        written = 0
+        for doc in docs:
+            record_id = doc[spec.id_field]
+            cur = db.execute(
+                f"{verb} INTO records (kind, id, status, created, data) VALUES (?, ?, ?, ?, ?)",
+                (kind, record_id, _status_value(doc.get(spec.status_field)),
+                 doc.get(spec.created_field) or "", json.dumps(doc)),
+            )
+            if cur.rowcount == 0:
+                continue  # INSERT OR IGNORE kept the existing record
+            written += 1
+            db.execute("DELETE FROM record_tags WHERE kind = ? AND id = ?", (kind, record_id))
+            db.executemany(
+                "INSERT OR IGNORE INTO record_tags (kind, id, tag) VALUES (?, ?, ?)",
+                [(kind, record_id, t) for t in doc.get("tags") or []],
+            )
+        return written
+
+    # ------------------------------------------------------------------
+    # Legacy JSON import
+    # ------------------------------------------------------------------
+
+    def _import_once(self, kind: str, spec: RecordKind):
+        key = f"imported:{kind}"
+        db = self._db()
+        if db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return
+        with self._transaction() as db:
+            # Re-check under the write lock: another process may have just done it
+            if db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return
+            report = self._import_dir(db, kind, spec)
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                       (key, datetime.now().isoformat()))
+        if report["files"]:
+            logger.info("Imported %d/%d legacy %s records from %s",
+                        report["imported"], report["files"], kind, report["from"])
+
+    def _import_dir(self, db: Optional[sqlite3.Connection], kind: str,
+                    spec: RecordKind) -> Dict[str, Any]:
+        """Read a legacy directory; write to db unless it is None (dry run)."""
+        src = getattr(self.paths, spec.legacy_dir)
+        report = {"from": str(src), "files": 0, "imported": 0, "invalid": 0}
+        if not src.is_dir():
+            return report
+        docs = []
+        for path in sorted(src.glob("*.json")):
+            report["files"] += 1
+            try:
+                docs.append(spec.schema.model_validate(json.loads(path.read_text())).model_dump())
+            except Exception as e:
+                report["invalid"] += 1
+                logger.warning("Skipping unreadable %s record %s: %s", kind, path.name, e)
+        if db is None:
+            report["imported"] = len(docs)
+        else:
+            report["imported"] = self._write(db, kind, spec, docs, replace=False)
+        return report
+
+    def import_legacy(self, kind: str, dry_run: bool = False) -> Dict[str, Any]:
+        """Import a kind's JSON directory now, whether or not it was imported before."""
+        spec = KINDS[kind]
+        with self._lock:
+            if dry_run:
+                return self._import_dir(None, kind, spec)
+            with self._transaction() as db:
+                report = self._import_dir(db, kind, spec)
+                db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                           (f"imported:{kind}", datetime.now().isoformat()))
+            self._imported.add(kind)
+            return report
+
+
+def migrate_json_dirs(paths: Optional[ElaraPaths] = None,
+                      dry_run: bool = False) -> Dict[str, Any]:
+    """One-shot import of every legacy one-file-per-item directory into the store."""
+    store = RecordStore(paths)
+    try:
+        return {
+            "store": str(store.paths.records_db),
+            "dry_run": dry_run,
+            "kinds": {kind: store.import_legacy(kind, dry_run=dry_run) for kind in KINDS},
+        }
+    finally:
+        store.close()
+
+
+# ============================================================================
+# Singleton
+# ============================================================================
+
+_instance: Optional[RecordStore] = None
+_instance_lock = threading.Lock()
+
+
+def get_record_store() -> RecordStore:
+    """Return the global RecordStore (follows the configured data dir)."""
+    global _instance
+    with _instance_lock:
+        if _instance is not None and _instance.paths.data_dir != get_paths().data_dir:
+            _instance.close()
+            _instance = None
+        if _instance is None:
+            _instance = RecordStore()
+        return _instance
+
+
+def reset_record_store():
+    """Close and drop the singleton. For testing."""
+    global _instance
+    with _instance_lock:
+        if _instance is not None:
+            _instance.close()
+        _instance = None
@@ -23,6 +23,7 @@ from daemon.state_core import (  # noqa: F401
     DEFAULT_STATE, SESSION_TYPE_RULES,
     _log_mood, _archive_imprint,
     _load_state, _save_state, _apply_time_decay, _decay_imprints,
+    get_state_store, reset_state_store,
 )
 
 # --- Mood ---
@@ -31,7 +32,7 @@ from daemon.mood import (  # noqa: F401
     create_imprint, get_imprints, get_full_state, set_flag,
     describe_mood, describe_self, get_residue_summary,
     get_emotional_context_for_memory, get_current_emotions, get_session_arc,
-    read_mood_journal, read_imprint_archive,
+    read_mood_journal, read_mood_journal_since, read_imprint_archive,
 )
 
 # --- Sessions ---
@@ -9,10 +9,9 @@ This is the foundation that mood, sessions, and temperament all depend on.
 Everything here is internal — external code imports from daemon.state (the re-export layer).
 """
 
+import copy
 import logging
-import json
 import math
-import os
 import random
 import threading
 from pathlib import Path
@@ -20,21 +19,31 @@ from datetime import datetime
 from typing import Optional, List
 
 from core.paths import get_paths
-from daemon.schemas import atomic_write_json
+from daemon.jsonl_log import JsonlLog, get_log
+from daemon.state_store import StateStore
 
 from daemon.emotions import get_primary_emotion
 
 logger = logging.getLogger("elara.state_core")
 
-# Thread safety for concurrent tool calls (Cortical Layer 2)
-_state_lock = threading.Lock()
-
 _p = get_paths()
 STATE_FILE = _p.state_file
 MOOD_JOURNAL_FILE = _p.mood_journal
 IMPRINT_ARCHIVE_FILE = _p.imprint_archive
 TEMPERAMENT_LOG_FILE = _p.temperament_log
 
+
+def _mood_journal() -> JsonlLog:
+    return get_log(MOOD_JOURNAL_FILE, key_field="episode")
+
+
+def _imprint_archive() -> JsonlLog:
+    return get_log(IMPRINT_ARCHIVE_FILE, ts_field="archived")
+
+
+def _temperament_log() -> JsonlLog:
+    return get_log(TEMPERAMENT_LOG_FILE)
+
 # My temperament - who I am at my core, where I return to
 TEMPERAMENT = {
     "valence": 0.55,
@@ -113,9 +122,7 @@ def _log_mood(state: dict, reason: Optional[str] = None, trigger: str = "adjust"
             "trigger": trigger,
             "episode": state.get("current_session", {}).get("id"),
         }
-        MOOD_JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(MOOD_JOURNAL_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        _mood_journal().append(entry)
     except OSError:
         pass
 
@@ -124,50 +131,70 @@ def _archive_imprint(imprint: dict) -> None:
     """Save dying imprint to archive."""
     try:
         entry = {"archived": datetime.now().isoformat(), **imprint}
-        IMPRINT_ARCHIVE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(IMPRINT_ARCHIVE_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        _imprint_archive().append(entry)
     except OSError:
         pass
 
 
+def _normalize_state(state: dict) -> dict:
+    """Fill in keys added after older state files were written."""
+    if "temperament" not in state:
+        state["temperament"] = TEMPERAMENT.copy()
+    if "imprints" not in state:
+        state["imprints"] = []
+    if "consolidation" not in state:
+        state["consolidation"] = DEFAULT_STATE["consolidation"].copy()
+    if "allostatic_load" not in state:
+        state["allostatic_load"] = 0
+    if "current_session" not in state:
+        state["current_session"] = DEFAULT_STATE["current_session"].copy()
+    return state
+
+
+_store: Optional[StateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """The resident emotional state, created on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = StateStore(
+                STATE_FILE,
+                default_factory=lambda: copy.deepcopy(DEFAULT_STATE),
+                normalize=_normalize_state,
+            )
+        return _store
+
+
+def reset_state_store() -> None:
+    """Flush and drop the resident state (used by tests)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.flush()
+        _store = None
+
+
 def _load_state() -> dict:
-    """Load current emotional state with crash recovery. Thread-safe."""
-    logger.debug("Loading state from %s", STATE_FILE)
-    with _state_lock:
-        tmp_file = STATE_FILE.with_suffix(".json.tmp")
-
-        # Crash recovery: if .tmp exists but .json doesn't, the rename was interrupted
-        if tmp_file.exists() and not STATE_FILE.exists():
-            os.rename(str(tmp_file), str(STATE_FILE))
-        elif tmp_file.exists():
-            # Both exist — .tmp is stale from a failed write, discard it
-            tmp_file.unlink()
-
-        if STATE_FILE.exists():
-            try:
-                state = json.loads(STATE_FILE.read_text())
-                if "temperament" not in state:
-                    state["temperament"] = TEMPERAMENT.copy()
-                if "imprints" not in state:
-                    state["imprints"] = []
-                if "consolidation" not in state:
-                    state["consolidation"] = DEFAULT_STATE["consolidation"].copy()
-                if "allostatic_load" not in state:
-                    state["allostatic_load"] = 0
-                if "current_session" not in state:
-                    state["current_session"] = DEFAULT_STATE["current_session"].copy()
-                return state
-            except json.JSONDecodeError:
-                logger.error("Corrupt state file %s, using defaults", STATE_FILE)
-        return DEFAULT_STATE.copy()
+    """Load current emotional state. Thread-safe.
+
+    Served from the resident copy; the file is read on first use or after
+    another process rewrote it. Crash recovery of a half-written .tmp
+    happens on that read.
+    """
+    return get_state_store().load()
 
 
 def _save_state(data: dict) -> None:
-    """Save emotional state via atomic rename (write .tmp then rename). Thread-safe."""
-    with _state_lock:
-        data["last_update"] = datetime.now().isoformat()
-        atomic_write_json(STATE_FILE, data)
+    """Save emotional state. Thread-safe.
+
+    Coalesced into one atomic snapshot per flush window, or written through
+    immediately in strict durability mode (see daemon.state_store).
+    """
+    data["last_update"] = datetime.now().isoformat()
+    get_state_store().save(data)
 
 
 def _apply_time_decay(state: dict) -> dict:
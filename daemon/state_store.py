@@ -0,0 +1,309 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Resident JSON state with write-behind, coalesced atomic snapshots.
+
+Problem: every mood adjust, imprint and flag change went through
+_load_state (tmp-file check + read + JSON parse) and _save_state
+(write tmp + fsync + rename), all under one global lock. A burst of tool
+calls meant several full-file fsyncs per second for a file a few KB long.
+
+Solution: StateStore keeps the state in memory.
+  - load() hands out a deep copy of the resident state. The disk is only
+    read on first use, or when a stat() shows another process replaced
+    the file while we had nothing unsaved.
+  - save() replaces the resident state and marks it dirty. In "batched"
+    mode (default) a timer writes one atomic, fsynced snapshot
+    STATE_FLUSH_SECONDS after the first unsaved change, however many
+    saves land in that window. "strict" mode writes through on every
+    save, exactly like before.
+  - Dirty stores are flushed at interpreter exit, and on SIGTERM once
+    install_signal_handlers() has been called from the main thread.
+
+Trade-off (batched mode): a hard kill loses at most the last window of
+changes, and other processes see them up to one window late.
+
+Several processes share the file. A flush holds an flock on <state>.lock,
+and if another process replaced the file since we last read it, our
+unsaved changes (values that differ from what we read) are re-applied on
+top of theirs instead of overwriting them. Where both changed the same
+value, the later flush wins.
+
+Config: ELARA_STATE_DURABILITY=strict|batched, ELARA_STATE_FLUSH_SECONDS.
+
+Usage:
+    store = StateStore(path, default_factory=lambda: dict(DEFAULTS))
+    state = store.load()
+    state["x"] = 1
+    store.save(state)      # memory-speed; snapshot follows within the window
+    store.flush()          # force it now
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import signal
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from daemon.schemas import atomic_write_json
+
+logger = logging.getLogger("elara.state_store")
+
+DURABILITY_STRICT = "strict"
+DURABILITY_BATCHED = "batched"
+DURABILITY_MODES = (DURABILITY_STRICT, DURABILITY_BATCHED)
+
+STATE_FLUSH_SECONDS = 1.0
+
+
+def _env_durability() -> str:
+    mode = os.environ.get("ELARA_STATE_DURABILITY", DURABILITY_BATCHED).lower()
+    if mode not in DURABILITY_MODES:
+        logger.warning("Unknown ELARA_STATE_DURABILITY %r, using %s", mode, DURABILITY_BATCHED)
+        return DURABILITY_BATCHED
+    return mode
+
+
+def _env_window() -> float:
+    try:
+        return max(0.0, float(os.environ.get("ELARA_STATE_FLUSH_SECONDS", STATE_FLUSH_SECONDS)))
+    except ValueError:
+        return STATE_FLUSH_SECONDS
+
+
+_MISSING = object()
+
+
+def _merge(base: Any, ours: Any, theirs: Any) -> Any:
+    """Three-way merge: our changes since base, applied on top of theirs."""
+    if ours == base:
+        return theirs
+    if not (isinstance(base, dict) and isinstance(ours, dict) and isinstance(theirs, dict)):
+        return ours
+    merged = dict(theirs)
+    for key in set(base) | set(ours):
+        mine = ours.get(key, _MISSING)
+        was = base.get(key, _MISSING)
+        if mine is _MISSING:
+            merged.pop(key, None)  # we deleted it
+        elif mine != was:
+            merged[key] = _merge(was, mine, theirs.get(key, _MISSING))
+    return merged
+
+
+class StateStore:
+    """One JSON state file, held in memory and written behind."""
+
+    def __init__(self, path: Path,
+                 default_factory: Callable[[], Dict[str, Any]] = dict,
+                 normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                 durability: Optional[str] = None,
+                 window: Optional[float] = None):
+        self.path = Path(path)
+        self._default_factory = default_factory
+        self._normalize = normalize
+        self._lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._base: Optional[Dict[str, Any]] = None   # the disk state _state started from
+        self._disk_sig: Optional[Tuple[int, int, int]] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self.durability = DURABILITY_BATCHED
+        self.set_durability(durability or _env_durability())
+        self.window = _env_window() if window is None else window
+        self.saves = 0
+        self.flushes = 0
+        _stores.add(self)
+
+    # ------------------------------------------------------------------
+    # Disk
+    # ------------------------------------------------------------------
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read_disk(self) -> Dict[str, Any]:
+        tmp_file = self.path.with_suffix(self.path.suffix + ".tmp")
+
+        # Crash recovery: if .tmp exists but the file doesn't, the rename was interrupted
+        if tmp_file.exists() and not self.path.exists():
+            os.rename(str(tmp_file), str(self.path))
+        elif tmp_file.exists():
+            # Both exist — .tmp is stale from a failed write, discard it
+            tmp_file.unlink()
+
+        self._disk_sig = self._stat()
+        if self._disk_sig is not None:
+            try:
+                state = json.loads(self.path.read_text())
+                if isinstance(state, dict):
+                    return self._normalize(state) if self._normalize else state
+                logger.error("State file %s is not an object, using defaults", self.path)
+            except (json.JSONDecodeError, OSError):
+                logger.error("Corrupt state file %s, using defaults", self.path)
+        return self._default_factory()
+
+    def _catch_up(self) -> None:
+        """Re-read the file if another process replaced it, keeping our unsaved changes."""
+        sig = self._stat()
+        if self._state is not None and sig == self._disk_sig:
+            return
+        if self._dirty and sig is None:
+            return  # file gone: nothing to merge with, ours gets written as is
+        logger.debug("Loading state from %s", self.path)
+        theirs = self._read_disk()
+        base, self._base = self._base, copy.deepcopy(theirs)
+        self._state = _merge(base, self._state, theirs) if self._dirty else theirs
+
+    def _resident(self) -> Dict[str, Any]:
+        """The in-memory state, re-read if another process replaced the file."""
+        self._catch_up()
+        return self._state
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict[str, Any]:
+        """A private copy of the current state; mutate it and save() it back."""
+        with self._lock:
+            return copy.deepcopy(self._resident())
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """Replace the state. Persisted now (strict) or within the window (batched)."""
+        with self._lock:
+            self._state = copy.deepcopy(data)
+            self._dirty = True
+            self.saves += 1
+            if self.durability == DURABILITY_STRICT or self.window <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """Write the pending snapshot, if any. Returns whether anything was written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> bool:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._dirty:
+            return False
+        try:
+            with self._file_lock():
+                self._catch_up()
+                atomic_write_json(self.path, self._state)
+        except OSError as e:
+            # Stay dirty: the next save or flush tries again
+            logger.error("Could not write state %s: %s", self.path, e)
+            return False
+        self._dirty = False
+        self._disk_sig = self._stat()
+        self._base = copy.deepcopy(self._state)
+        self.flushes += 1
+        return True
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialize check-and-write against other processes sharing the file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "a") as lock:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def set_durability(self, mode: str) -> None:
+        """Switch between "strict" (write-through) and "batched" (write-behind)."""
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {mode!r}")
+        with self._lock:
+            self.durability = mode
+            if mode == DURABILITY_STRICT:
+                self._flush_locked()
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def invalidate(self) -> None:
+        """Flush, then drop the resident copy so the next load reads the disk."""
+        with self._lock:
+            self._flush_locked()
+            self._state = None
+            self._base = None
+            self._disk_sig = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "durability": self.durability,
+            "window": self.window,
+            "saves": self.saves,
+            "flushes": self.flushes,
+            "dirty": self._dirty,
+        }
+
+
+# Every live store, for the exit / SIGTERM flush
+_stores: "weakref.WeakSet[StateStore]" = weakref.WeakSet()
+
+
+def flush_all() -> None:
+    for store in list(_stores):
+        try:
+            store.flush()
+        except Exception as e:
+            logger.error("Flush of %s failed: %s", store.path, e)
+
+
+_signals_installed = False
+
+
+def install_signal_handlers() -> None:
+    """Flush pending state on SIGTERM, then defer to whatever handled it before.
+
+    Must be called from the main thread. Safe to call more than once.
+    """
+    global _signals_installed
+    if _signals_installed:
+        return
+    if threading.current_thread() is not threading.main_thread():
+        logger.debug("Not on the main thread, SIGTERM flush not installed")
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def _handle_sigterm(signum, frame):
+        flush_all()
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    _signals_installed = True
+
+
+atexit.register(flush_all)
@@ -5,8 +5,8 @@
 """
 Elara Idea Synthesis — Detect recurring half-formed ideas across sessions.
 
-Storage: ~/.claude/elara-synthesis/ (JSON files, one per synthesis)
-Index:   ~/.claude/elara-synthesis-db/ (ChromaDB, cosine similarity for seed clustering)
+Storage: "synthesis" records in the shared record store (daemon/record_store.py)
+Index:   elara_synthesis + elara_synthesis_seeds in the shared ChromaDB store (cosine similarity for seed clustering)
 
 When the same idea keeps surfacing across sessions — even in different words —
 this system notices and says: "You keep coming back to this. Ready to build?"
@@ -15,25 +15,16 @@ this system notices and says: "You keep coming back to this. Ready to build?"
 import logging
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
 from daemon.events import bus, Events
-from daemon.schemas import Synthesis, SynthesisSeed, load_validated, save_validated, ElaraNotFoundError, ElaraValidationError
+from daemon.record_store import get_record_store
+from daemon.schemas import Synthesis, SynthesisSeed, ElaraNotFoundError, ElaraValidationError
 
 logger = logging.getLogger("elara.synthesis")
 
-_p = get_paths()
-SYNTHESIS_DIR = _p.synthesis_dir
-SYNTHESIS_DB_DIR = _p.synthesis_db
+_KIND = "synthesis"
 
 # Clustering threshold — how similar two quotes need to be to count as same idea
 SEED_SIMILARITY_THRESHOLD = 0.75
@@ -43,84 +34,33 @@ SEED_SIMILARITY_THRESHOLD = 0.75
 # Storage layer
 # ============================================================================
 
-def _ensure_dirs():
-    SYNTHESIS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _synthesis_path(synthesis_id: str) -> Path:
-    return SYNTHESIS_DIR / f"{synthesis_id}.json"
-
-
 def _generate_id(concept: str) -> str:
     raw = f"{concept}:{datetime.now().isoformat()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
 def _load_synthesis(synthesis_id: str) -> Optional[Dict]:
-    path = _synthesis_path(synthesis_id)
-    if not path.exists():
-        return None
-    model = load_validated(path, Synthesis)
-    return model.model_dump()
+    return get_record_store().get(_KIND, synthesis_id)
 
 
 def _save_synthesis(synth: Dict):
-    _ensure_dirs()
-    model = Synthesis.model_validate(synth)
-    path = _synthesis_path(synth["synthesis_id"])
-    save_validated(path, model)
+    get_record_store().put(_KIND, synth)
 
 
-def _load_all_syntheses() -> List[Dict]:
-    _ensure_dirs()
-    syntheses = []
-    for p in sorted(SYNTHESIS_DIR.glob("*.json")):
-        if p.suffix == ".json" and not p.name.endswith(".tmp"):
-            try:
-                model = load_validated(p, Synthesis)
-                syntheses.append(model.model_dump())
-            except Exception as e:
-                logger.warning("Failed to load synthesis %s: %s", p.name, e)
-    return syntheses
+def _load_all_syntheses(status: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=status)
 
 
 # ============================================================================
 # ChromaDB index (for seed clustering)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-_chroma_seed_collection = None
-
-
-def _get_client():
-    global _chroma_client
-    if _chroma_client is not None:
-        return _chroma_client
-    SYNTHESIS_DB_DIR.mkdir(parents=True, exist_ok=True)
-    _chroma_client = chromadb.PersistentClient(
-        path=str(SYNTHESIS_DB_DIR),
-        settings=Settings(anonymized_telemetry=False),
-    )
-    return _chroma_client
-
-
 def _get_collection():
-    global _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        client = _get_client()
-        _chroma_collection = client.get_or_create_collection(
-            name="elara_synthesis",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_synthesis")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to get synthesis ChromaDB collection: %s", e)
         return None
@@ -128,21 +68,11 @@ def _get_collection():
 
 def _get_seed_collection():
     """Separate collection for individual seeds — used for clustering."""
-    global _chroma_seed_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_seed_collection is not None:
-        return _chroma_seed_collection
-
     try:
-        client = _get_client()
-        _chroma_seed_collection = client.get_or_create_collection(
-            name="elara_synthesis_seeds",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_seed_collection
+        return get_chroma().collection("elara_synthesis_seeds")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to get synthesis seed collection: %s", e)
         return None
@@ -284,10 +214,8 @@ def list_syntheses(
     n: int = 20,
 ) -> List[Dict]:
     """List syntheses, optionally filtered."""
-    syntheses = _load_all_syntheses()
+    syntheses = _load_all_syntheses(status=status or None)
 
-    if status:
-        syntheses = [s for s in syntheses if s.get("status") == status]
     if min_seeds > 0:
         syntheses = [s for s in syntheses if len(s.get("seeds", [])) >= min_seeds]
 
@@ -9,13 +9,12 @@ External code imports from daemon.state (re-export layer), not directly from her
 """
 
 import logging
-import json
 from datetime import datetime
 from typing import Dict
 
 from daemon.state_core import (
-    _load_state, _save_state,
-    TEMPERAMENT, FACTORY_TEMPERAMENT, TEMPERAMENT_MAX_DRIFT, TEMPERAMENT_LOG_FILE,
+    _load_state, _save_state, _temperament_log,
+    TEMPERAMENT, FACTORY_TEMPERAMENT, TEMPERAMENT_MAX_DRIFT,
 )
 
 
@@ -43,9 +42,7 @@ def _log_temperament_adjustment(dimension: str, delta: float, reason: str, new_v
             "factory": FACTORY_TEMPERAMENT.get(dimension, 0),
             "drift": round(new_value - FACTORY_TEMPERAMENT.get(dimension, 0), 4),
         }
-        TEMPERAMENT_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(TEMPERAMENT_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        _temperament_log().append(entry)
     except OSError:
         pass
 
@@ -131,17 +128,7 @@ def get_temperament_status() -> dict:
         if abs(d) > 0.005:
             drift[dim] = round(d, 4)
 
-    recent_log = []
-    if TEMPERAMENT_LOG_FILE.exists():
-        try:
-            with open(TEMPERAMENT_LOG_FILE) as f:
-                lines = f.readlines()
-            for line in lines[-5:]:
-                line = line.strip()
-                if line:
-                    recent_log.append(json.loads(line))
-        except (json.JSONDecodeError, OSError):
-            pass
+    recent_log = _temperament_log().tail(5)
 
     return {
         "current": {k: round(v, 4) for k, v in temperament.items()},
@@ -6,7 +6,8 @@
 Unified Decision Registry (UDR) — crystallized judgments that prevent repetition.
 
 Storage: ~/.elara/elara-udr.db (SQLite, WAL mode)
-In-memory: Python set of rejected action_signatures for O(1) hook checks
+In-memory: Python set of rejected action_signatures for O(1) hook checks,
+           plus an Aho-Corasick automaton over their entity names
 
 The UDR solves a fundamental problem: across 110+ sessions, Elara repeatedly
 suggests things already tried and failed (arXiv 5x, ESA, TechRxiv, etc.).
@@ -15,16 +16,20 @@ suggests things already tried and failed (arXiv 5x, ESA, TechRxiv, etc.).
 Architecture:
   WRITE-TIME: corrections/outcomes/manual → DecisionRegistry (SQLite)
   BOOT-TIME:  Load rejected entity set into memory (Python set, O(1))
-  HOOK-TIME:  Keyword scan prompt → entity set → [DECISION-CHECK] injection
+  HOOK-TIME:  One automaton pass over the prompt → [DECISION-CHECK] injection
 
 Design decisions:
   - SQLite over JSON/ChromaDB: need indexed lookups by signature, exact match
   - Python set over bloom filter: <1000 decisions, O(1), simpler, swappable
+  - Automaton over per-entity substring scans: a prompt scan is O(len(text))
+    however many decisions exist, and needs no DB read unless another
+    process has written to the registry since the last scan
   - Upsert semantics: same domain:entity bumps confidence +0.1, no duplicates
   - Fail-silent feeds: UDR failure never breaks corrections or outcomes
 """
 
 import logging
+import re
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
@@ -59,6 +64,111 @@ CREATE INDEX IF NOT EXISTS idx_decisions_verdict ON decisions(verdict);
 """
 
 
+# ============================================================================
+# Entity matcher
+# ============================================================================
+
+# Underscores, hyphens and whitespace runs all fold to one space, so
+# "tokenomics_whitepaper" matches "tokenomics whitepaper" and "Tokenomics-Whitepaper"
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+MIN_ENTITY_LENGTH = 3  # shorter entities cause too many false positives
+
+
+def _fold(text: str) -> str:
+    return _SEPARATORS.sub(" ", text.lower())
+
+
+class EntityMatcher:
+    """
+    Aho-Corasick automaton mapping entity names to decision signatures.
+
+    Entities are added and removed one at a time as decisions are recorded.
+    Adding a new name extends the trie; failure links are recomputed lazily
+    on the next scan. Removing a name only drops its signatures, leaving
+    the trie alone. Matches must sit on word boundaries: "esa" does not
+    match inside "research".
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._term: List[Optional[str]] = [None]   # pattern ending at node
+        self._link: List[int] = [0]                # next terminal on fail chain
+        self._signatures: Dict[str, Set[str]] = {}  # pattern -> signatures
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return sum(1 for sigs in self._signatures.values() if sigs)
+
+    def add(self, entity: str, signature: str):
+        pattern = _fold(entity).strip()
+        if len(pattern) < MIN_ENTITY_LENGTH:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._term.append(None)
+                self._link.append(0)
+            node = nxt
+        if self._term[node] is None:
+            self._term[node] = pattern
+            self._dirty = True
+        self._signatures.setdefault(pattern, set()).add(signature)
+
+    def discard(self, entity: str, signature: str):
+        sigs = self._signatures.get(_fold(entity).strip())
+        if sigs:
+            sigs.discard(signature)
+
+    def _build(self):
+        """Breadth-first pass computing failure and output links."""
+        goto, fail, term, link = self._goto, self._fail, self._term, self._link
+        queue = list(goto[0].values())
+        for child in queue:
+            fail[child] = 0
+            link[child] = 0
+        for node in queue:  # appending while iterating walks the trie level by level
+            for ch, child in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                fail_node = fail[child]
+                link[child] = fail_node if term[fail_node] else link[fail_node]
+                queue.append(child)
+        self._dirty = False
+
+    def scan(self, text: str) -> List[str]:
+        """Signatures whose entity appears in text, in order of first appearance."""
+        if self._dirty:
+            self._build()
+        goto, fail, term, link = self._goto, self._fail, self._term, self._link
+        text = _fold(text)
+        last = len(text) - 1
+        found: Dict[str, None] = {}
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if term[node] else link[node]
+            while hit:
+                pattern = term[hit]
+                start = i - len(pattern) + 1
+                if ((start == 0 or not text[start - 1].isalnum())
+                        and (i == last or not text[i + 1].isalnum())):
+                    for sig in sorted(self._signatures.get(pattern, ())):
+                        found[sig] = None
+                hit = link[hit]
+        return list(found)
+
+
 # ============================================================================
 # DecisionRegistry
 # ============================================================================
@@ -74,6 +184,8 @@ class DecisionRegistry:
         self._p = get_paths()
         self._conn: Optional[sqlite3.Connection] = None
         self._entity_set: Set[str] = set()  # rejected signatures for O(1) check
+        self._matcher = EntityMatcher()      # rejected entity names for prompt scans
+        self._data_version: Optional[int] = None
         self._booted = False
 
     # ------------------------------------------------------------------
@@ -86,7 +198,7 @@ class DecisionRegistry:
 
         db_path = self._p.udr_file
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(db_path))
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.executescript(_SCHEMA)
@@ -180,11 +292,13 @@ class DecisionRegistry:
             logger.info("UDR recorded: %s [%s] (conf=%.2f)",
                         sig, verdict, confidence)
 
-        # Update in-memory set
+        # Update in-memory set and matcher
         if verdict in ("rejected", "failed"):
             self._entity_set.add(sig)
+            self._matcher.add(entity_n, sig)
         else:
             self._entity_set.discard(sig)
+            self._matcher.discard(entity_n, sig)
 
         # Emit event (lazy import to avoid circular deps at module level)
         try:
@@ -230,33 +344,24 @@ class DecisionRegistry:
         Scan text for any entity keywords in the rejected set.
         Returns matching decisions. Used by the intention hook.
 
-        Zero LLM calls — pure keyword matching against entity names.
+        Zero LLM calls — one pass of the entity automaton over the text.
+        Entities match as whole words, with underscores, hyphens and spaces
+        treated alike ("tokenomics_whitepaper" matches "tokenomics whitepaper").
         """
-        if not self._entity_set:
+        if not self._booted or self._changed_elsewhere():
             self._load_entity_set()
 
-        text_lower = text.lower()
-        matches = []
+        sigs = self._matcher.scan(text)[:2]  # Max 2 hits per hook principle
+        if not sigs:
+            return []
 
-        # Build entity lookup: entity_name → list of signatures
         db = self._db()
         rows = db.execute(
-            "SELECT * FROM decisions WHERE verdict IN ('rejected', 'failed')"
+            f"SELECT * FROM decisions WHERE action_signature IN ({','.join('?' * len(sigs))})",
+            sigs,
         ).fetchall()
-
-        for row in rows:
-            entity = row["entity"]
-            # Skip very short entities to reduce false positives
-            if len(entity) < 3:
-                continue
-            # Match entity as-is OR with underscores as spaces
-            # (entities stored as "tokenomics_whitepaper" should match
-            #  "tokenomics whitepaper" in natural text)
-            entity_spaced = entity.replace("_", " ")
-            if entity in text_lower or entity_spaced in text_lower:
-                matches.append(self._row_to_dict(row))
-
-        return matches[:2]  # Max 2 hits per hook principle
+        by_sig = {r["action_signature"]: self._row_to_dict(r) for r in rows}
+        return [by_sig[s] for s in sigs if s in by_sig]
 
     def list_decisions(
         self,
@@ -323,6 +428,7 @@ class DecisionRegistry:
             "by_source": by_source,
             "avg_confidence": round(avg_conf, 3) if avg_conf else 0,
             "entity_set_size": len(self._entity_set),
+            "matcher_entities": len(self._matcher),
         }
 
     def boot_decisions(self) -> str:
@@ -331,7 +437,6 @@ class DecisionRegistry:
         Called at session start for instant hook checks.
         """
         self._load_entity_set()
-        self._booted = True
 
         if not self._entity_set:
             return "UDR: No rejected decisions loaded."
@@ -416,14 +521,28 @@ class DecisionRegistry:
     # ------------------------------------------------------------------
 
     def _load_entity_set(self):
-        """Load all rejected/failed signatures into memory."""
+        """Load all rejected/failed signatures (and the matcher) into memory."""
         db = self._db()
+        self._data_version = db.execute("PRAGMA data_version").fetchone()[0]
         rows = db.execute(
-            "SELECT action_signature FROM decisions WHERE verdict IN ('rejected', 'failed')"
+            "SELECT action_signature, entity FROM decisions WHERE verdict IN ('rejected', 'failed')"
         ).fetchall()
         self._entity_set = {r["action_signature"] for r in rows}
+        self._matcher = EntityMatcher()
+        for r in rows:
+            self._matcher.add(r["entity"], r["action_signature"])
+        self._booted = True
         logger.debug("Entity set loaded: %d entries", len(self._entity_set))
 
+    def _changed_elsewhere(self) -> bool:
+        """True if another connection committed since the last load.
+
+        PRAGMA data_version only moves for other connections' commits, so
+        this process's own record_decision calls (already applied to the
+        matcher) don't force a reload.
+        """
+        return self._db().execute("PRAGMA data_version").fetchone()[0] != self._data_version
+
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> Dict:
         """Convert a sqlite3.Row to a regular dict."""
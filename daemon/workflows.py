@@ -5,8 +5,8 @@
 """
 Elara Workflows — Learned action sequences from episode history.
 
-Storage: ~/.elara/elara-workflows/{workflow_id}.json (individual files)
-Index:   ~/.elara/elara-workflows-db/ (ChromaDB, cosine similarity)
+Storage: "workflows" records in the shared record store (daemon/record_store.py)
+Index:   elara_workflows in the shared ChromaDB store (cosine similarity)
 
 Workflows are proactive: when the current task matches the trigger of a
 known workflow, remaining steps are surfaced as suggestions.
@@ -16,22 +16,16 @@ crystallizes them into workflow patterns. Confidence rises with
 confirmation, drops with skips.
 """
 
-import json
 import hashlib
 import logging
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, List, Dict
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import query_args_for
+from memory.index_sync import build_items, sync_collection, upsert_items
 from daemon.events import bus, Events
+from daemon.record_store import get_record_store
 from daemon.schemas import (
     WorkflowPattern, WorkflowStep,
     ElaraNotFoundError,
@@ -39,9 +33,7 @@ from daemon.schemas import (
 
 logger = logging.getLogger("elara.workflows")
 
-_p = get_paths()
-WORKFLOWS_DIR = _p.workflows_dir
-WORKFLOWS_DB_DIR = _p.workflows_db
+_KIND = "workflows"
 
 # Confidence mechanics
 CONFIRM_DELTA = 0.05
@@ -52,51 +44,19 @@ RETIRE_THRESHOLD = 0.15
 
 
 # ============================================================================
-# Storage layer (individual JSON files — source of truth)
+# Storage layer (record store — source of truth)
 # ============================================================================
 
-def _workflow_path(workflow_id: str) -> Path:
-    return WORKFLOWS_DIR / f"{workflow_id}.json"
-
-
 def _load_workflow(workflow_id: str) -> Optional[Dict]:
-    path = _workflow_path(workflow_id)
-    if not path.exists():
-        return None
-    try:
-        data = json.loads(path.read_text())
-        return WorkflowPattern.model_validate(data).model_dump()
-    except (json.JSONDecodeError, Exception) as e:
-        logger.warning("Failed to load workflow %s: %s", workflow_id, e)
-        return None
+    return get_record_store().get(_KIND, workflow_id)
 
 
 def _save_workflow(workflow: Dict):
-    WORKFLOWS_DIR.mkdir(parents=True, exist_ok=True)
-    model = WorkflowPattern.model_validate(workflow)
-    path = _workflow_path(workflow["workflow_id"])
-    tmp = path.with_suffix(".json.tmp")
-    tmp.write_text(model.model_dump_json(indent=2))
-    import os
-    fd = os.open(str(tmp), os.O_RDONLY)
-    try:
-        os.fsync(fd)
-    finally:
-        os.close(fd)
-    os.rename(str(tmp), str(path))
+    get_record_store().put(_KIND, workflow)
 
 
-def _load_all() -> List[Dict]:
-    if not WORKFLOWS_DIR.exists():
-        return []
-    workflows = []
-    for f in sorted(WORKFLOWS_DIR.glob("*.json")):
-        try:
-            data = json.loads(f.read_text())
-            workflows.append(WorkflowPattern.model_validate(data).model_dump())
-        except (json.JSONDecodeError, Exception):
-            pass
-    return workflows
+def _load_all(status: Optional[str] = None) -> List[Dict]:
+    return get_record_store().list(_KIND, status=status)
 
 
 def _generate_id(name: str) -> str:
@@ -108,30 +68,12 @@ def _generate_id(name: str) -> str:
 # ChromaDB index (semantic search for activation)
 # ============================================================================
 
-_chroma_client = None
-_chroma_collection = None
-
-
 def _get_collection():
-    global _chroma_client, _chroma_collection
-
     if not CHROMA_AVAILABLE:
         return None
 
-    if _chroma_collection is not None:
-        return _chroma_collection
-
     try:
-        WORKFLOWS_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(
-            path=str(WORKFLOWS_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _chroma_collection = _chroma_client.get_or_create_collection(
-            name="elara_workflows",
-            metadata={"hnsw:space": "cosine"},
-        )
-        return _chroma_collection
+        return get_chroma().collection("elara_workflows")
     except (OSError, ValueError, RuntimeError) as e:
         logger.warning("Failed to init workflows ChromaDB: %s", e)
         return None
@@ -147,16 +89,13 @@ def _build_document(workflow: Dict) -> str:
     return f"{name}. Trigger: {trigger}. Steps: {steps_text}"
 
 
-def _index_workflow(workflow: Dict):
-    collection = _get_collection()
-    if not collection:
-        return
-
+def _index_entry(workflow: Dict) -> Optional[tuple]:
+    """(document, metadata) for a workflow, or None if it has nothing to index."""
     text = _build_document(workflow)
     if not text.strip():
-        return
+        return None
 
-    metadata = {
+    return text, {
         "domain": workflow.get("domain", "development"),
         "status": workflow.get("status", "active"),
         "confidence": workflow.get("confidence", 0.5),
@@ -164,16 +103,35 @@ def _index_workflow(workflow: Dict):
         "times_matched": workflow.get("times_matched", 0),
     }
 
+
+def _index_workflow(workflow: Dict):
+    collection = _get_collection()
+    if not collection:
+        return
+
+    entry = _index_entry(workflow)
+    if entry is None:
+        return
+
     try:
-        collection.upsert(
-            ids=[workflow["workflow_id"]],
-            documents=[text],
-            metadatas=[metadata],
-        )
+        upsert_items(collection, {workflow["workflow_id"]: entry})
     except Exception as e:
         logger.warning("Failed to index workflow %s: %s", workflow.get("workflow_id", "?"), e)
 
 
+def _sync_all_to_chroma(workflows: List[Dict]) -> Dict:
+    """Bring the index in line with all workflows, pushing only changes."""
+    collection = _get_collection()
+    if not collection:
+        return {}
+
+    try:
+        return sync_collection(collection, build_items(workflows, "workflow_id", _index_entry))
+    except Exception as e:
+        logger.warning("Workflow bulk sync failed: %s", e)
+        return {}
+
+
 # ============================================================================
 # Core operations
 # ============================================================================
@@ -240,9 +198,7 @@ def list_workflows(
     domain: Optional[str] = None,
 ) -> List[Dict]:
     """List all workflows, optionally filtered."""
-    workflows = _load_all()
-    if status:
-        workflows = [w for w in workflows if w.get("status") == status]
+    workflows = _load_all(status=status or None)
     if domain:
         workflows = [w for w in workflows if w.get("domain") == domain]
     workflows.sort(key=lambda w: w.get("confidence", 0), reverse=True)
@@ -282,12 +238,15 @@ def search_workflows(query: str, n: int = 5) -> List[Dict]:
         return _keyword_search(query, n)
 
 
-def check_workflows(task_context: str, n: int = 3) -> List[Dict]:
+def check_workflows(
+    task_context: str, n: int = 3, query_embedding: Optional[List[float]] = None,
+) -> List[Dict]:
     """
     Activation function — find workflows matching current task context.
 
     Like corrections.check_corrections but for proactive workflow surfacing.
     Only returns active workflows above a similarity threshold.
+    query_embedding: precomputed vector for task_context (see embed_query).
     """
     collection = _get_collection()
     if not collection:
@@ -299,7 +258,7 @@ def check_workflows(task_context: str, n: int = 3) -> List[Dict]:
             return []
 
         results = collection.query(
-            query_texts=[task_context],
+            **query_args_for(task_context, query_embedding),
             n_results=min(n, count),
             where={"status": "active"},
         )
@@ -471,11 +430,9 @@ def get_workflow_stats() -> Dict:
 
 
 def reindex_all() -> Dict:
-    """Rebuild ChromaDB index from JSON files."""
+    """Bring the ChromaDB index in line with the record store, pushing only changes."""
     workflows = _load_all()
-    for w in workflows:
-        _index_workflow(w)
-    return {"indexed": len(workflows)}
+    return {"indexed": len(workflows), **_sync_all_to_chroma(workflows)}
 
 
 # ============================================================================
@@ -28,6 +28,13 @@ Usage:
     elara dag stats                Show DAG statistics
     elara continuity status        Show continuity chain info
     elara continuity verify        Verify chain integrity
+    elara ingest                   Index Claude Code session files
+    elara ingest --workers 4       Parse sessions in a 4-process pool
+    elara enrich-server            Serve prompt-hook enrichment from a warm process
+    elara chroma status            Show ChromaDB layout and collection sizes
+    elara chroma migrate           Move per-module stores into one shared store
+    elara records status           Show record store counts per kind
+    elara records migrate          Import legacy one-file-per-item JSON directories
     elara testnet                  Run 2-node testnet demo
     elara testnet --nodes 3        Run N-node testnet
     elara --data-dir PATH          Override data directory
@@ -577,6 +584,126 @@ def _dag_stats(data_dir: Path) -> None:
     dag.close()
 
 
+def _ingest(data_dir: Path, force: bool = False, workers: int = 0) -> None:
+    """Index conversation session files into conversation memory."""
+    from core.paths import configure
+    configure(data_dir)
+
+    from memory.conversations import ConversationMemory
+    from memory.conversations.cli import print_ingest_stats
+
+    print("Ingesting conversations...")
+    cm = ConversationMemory()
+    stats = cm.ingest_all(force=force, workers=workers)
+    print_ingest_stats(stats)
+    print(f"Total indexed: {cm.count()}")
+
+
+def _enrich_server(data_dir: Path, socket_path: Path = None) -> None:
+    """Run the resident enrichment server for the UserPromptSubmit hook."""
+    from core.paths import configure
+    configure(data_dir)
+
+    from hooks.enrich_server import main as serve_enrichment
+    serve_enrichment(socket_path)
+
+
+def _running_pids(paths) -> list:
+    """PIDs from the resident processes' pid files that are still alive."""
+    import os
+    alive = []
+    for pid_file in (paths.overwatch_pid, paths.enrich_pid):
+        try:
+            pid = int(pid_file.read_text().strip())
+            os.kill(pid, 0)
+            alive.append(pid)
+        except (OSError, ValueError):
+            pass
+    return alive
+
+
+def _chroma_status(data_dir: Path) -> None:
+    """Show the ChromaDB layout and collection sizes."""
+    from core.paths import configure
+    paths = configure(data_dir)
+
+    from memory.chroma import COLLECTIONS, get_chroma, legacy_stores
+    chroma = get_chroma()
+    print(f"Layout: {'consolidated' if chroma.consolidated else 'legacy (per-module stores)'}")
+    print(f"Store:  {paths.chroma_db}")
+    for name in COLLECTIONS:
+        store = chroma.path_for(name)
+        count = "-"
+        if (store / "chroma.sqlite3").exists():
+            try:
+                count = chroma.client(store).get_collection(name).count()
+            except Exception:
+                pass  # store exists, collection never created
+        print(f"  {name:<24} {count}")
+    legacy = legacy_stores(paths)
+    if legacy and not chroma.consolidated:
+        print(f"{len(legacy)} legacy stores — run `elara chroma migrate` to consolidate.")
+
+
+def _chroma_migrate(data_dir: Path, dry_run: bool = False, force: bool = False) -> None:
+    """Copy per-module ChromaDB stores into the shared store."""
+    from core.paths import configure
+    paths = configure(data_dir)
+
+    running = _running_pids(paths)
+    if running and not dry_run and not force:
+        print(f"Elara processes are running (pids {running}). Stop Overwatch and the "
+              "enrichment server first, or pass --force.")
+        sys.exit(1)
+
+    from memory.chroma import migrate_to_shared_store
+    report = migrate_to_shared_store(paths, dry_run=dry_run)
+    for name, entry in report["collections"].items():
+        copied = "" if dry_run else f" copied {entry['copied']}"
+        print(f"  {name:<24} {entry['count']:>7}{copied}  ({entry['from']})")
+    if not report["collections"]:
+        print("No legacy collections found.")
+    if dry_run:
+        print("Dry run — nothing written.")
+    else:
+        print(f"Shared store: {report['store']} ({report['elapsed_s']}s). "
+              "Legacy directories were left in place; remove them once you're happy.")
+
+
+def _records_status(data_dir: Path) -> None:
+    """Show record counts per kind in the record store."""
+    from core.paths import configure
+    paths = configure(data_dir)
+
+    from daemon.record_store import KINDS, get_record_store
+    store = get_record_store()
+    print(f"Store: {paths.records_db}")
+    for kind in KINDS:
+        print(f"  {kind:<12} {store.count(kind):>7}")
+
+
+def _records_migrate(data_dir: Path, dry_run: bool = False) -> None:
+    """Import legacy JSON directories into the record store."""
+    from core.paths import configure
+    paths = configure(data_dir)
+
+    from daemon.record_store import migrate_json_dirs
+    report = migrate_json_dirs(paths, dry_run=dry_run)
+    for kind, entry in report["kinds"].items():
+        if not entry["files"]:
+            continue
+        invalid = f", {entry['invalid']} invalid" if entry["invalid"] else ""
+        print(f"  {kind:<12} {entry['files']:>7} files -> {entry['imported']} new{invalid}"
+              f"  ({entry['from']})")
+    if not any(e["files"] for e in report["kinds"].values()):
+        print("No legacy JSON records found.")
+    if dry_run:
+        print("Dry run — nothing written.")
+    else:
+        print(f"Record store: {report['store']}. "
+              "Legacy directories were left in place; remove them once you're happy.")
+
+
 # ---------------------------------------------------------------------------
 # Continuity Chain CLI
 # ---------------------------------------------------------------------------
@@ -826,6 +953,51 @@ def main() -> None:
     cont_parser.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
                               help="Override data directory")
 
+    # ingest
+    ingest_parser = sub.add_parser("ingest", help="Index conversation session files")
+    ingest_parser.add_argument("--force", action="store_true",
+                               help="Re-index every session from scratch")
+    ingest_parser.add_argument("--workers", type=int, default=0,
+                               help="Parse files in N worker processes (default: serial)")
+    ingest_parser.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                               help="Override data directory")
+
+    # enrich-server
+    enrich_parser = sub.add_parser("enrich-server",
+                                   help="Serve prompt-hook enrichment from a warm process")
+    enrich_parser.add_argument("--socket", type=Path, default=None,
+                               help="Unix socket path (default: <data-dir>/elara-enrich.sock)")
+    enrich_parser.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                               help="Override data directory")
+
+    # chroma
+    chroma_parser = sub.add_parser("chroma", help="ChromaDB store layout")
+    chroma_sub = chroma_parser.add_subparsers(dest="chroma_command")
+    chroma_status_p = chroma_sub.add_parser("status", help="Show layout and collection sizes")
+    chroma_status_p.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                                 help="Override data directory")
+    chroma_migrate_p = chroma_sub.add_parser(
+        "migrate", help="Move per-module stores into one shared store (offline)")
+    chroma_migrate_p.add_argument("--dry-run", action="store_true",
+                                  help="Report what would be copied")
+    chroma_migrate_p.add_argument("--force", action="store_true",
+                                  help="Migrate even if Elara processes are running")
+    chroma_migrate_p.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                                  help="Override data directory")
+
+    # records
+    records_parser = sub.add_parser("records", help="Record store for cognitive artifacts")
+    records_sub = records_parser.add_subparsers(dest="records_command")
+    records_status_p = records_sub.add_parser("status", help="Show record counts per kind")
+    records_status_p.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                                  help="Override data directory")
+    records_migrate_p = records_sub.add_parser(
+        "migrate", help="Import legacy one-file-per-item JSON directories")
+    records_migrate_p.add_argument("--dry-run", action="store_true",
+                                   help="Report what would be imported")
+    records_migrate_p.add_argument("--data-dir", type=Path, default=None, dest="sub_data_dir",
+                                   help="Override data directory")
+
     # testnet
     testnet_parser = sub.add_parser("testnet", help="Run 2-node testnet demo")
     testnet_parser.add_argument("--nodes", type=int, default=2,
@@ -905,6 +1077,28 @@ def main() -> None:
         else:
             cont_parser.print_help()
             sys.exit(1)
+    elif args.command == "ingest":
+        _ingest(data_dir, force=args.force, workers=args.workers)
+    elif args.command == "enrich-server":
+        _enrich_server(data_dir, args.socket)
+    elif args.command == "chroma":
+        cmd = getattr(args, "chroma_command", None)
+        if cmd == "status":
+            _chroma_status(data_dir)
+        elif cmd == "migrate":
+            _chroma_migrate(data_dir, dry_run=args.dry_run, force=args.force)
+        else:
+            chroma_parser.print_help()
+            sys.exit(1)
+    elif args.command == "records":
+        cmd = getattr(args, "records_command", None)
+        if cmd == "status":
+            _records_status(data_dir)
+        elif cmd == "migrate":
+            _records_migrate(data_dir, dry_run=args.dry_run)
+        else:
+            records_parser.print_help()
+            sys.exit(1)
     elif args.command == "testnet":
         _testnet(args.nodes, args.port_base, args.verbose)
     elif args.command == "dag":
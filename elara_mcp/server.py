@@ -190,6 +190,10 @@ _init_cortical()
 # Register shutdown handler
 atexit.register(_shutdown_cortical)
 
+# Write out coalesced state changes if we are stopped with SIGTERM
+from daemon.state_store import install_signal_handlers
+install_signal_handlers()
+
 
 if __name__ == "__main__":
     mcp.run()
@@ -26,6 +26,8 @@ def elara_llm(
             "classify"  — Classify text into categories (needs text + categories)
             "summarize" — Summarize text in 2 sentences (needs text)
             "triage"    — Assess conversation importance (needs text)
+            "cache"     — Response cache stats (hits, misses, size, evictions)
+            "cache_clear" — Drop every cached response
 
     Returns:
         Result from local LLM, or status info
@@ -34,6 +36,13 @@ def elara_llm(
         info = llm.status()
         return json.dumps(info, indent=2)
 
+    if action == "cache":
+        return json.dumps(llm.cache_stats(), indent=2)
+
+    if action == "cache_clear":
+        removed = llm.clear_cache()
+        return f"Cleared {removed} cached LLM responses"
+
     if action == "query":
         if not prompt:
             return "Error: 'prompt' required for query action"
@@ -71,4 +80,4 @@ def elara_llm(
             return "Ollama unavailable"
         return json.dumps(result, indent=2)
 
-    return f"Unknown action: {action}. Use: status, query, classify, summarize, triage"
+    return f"Unknown action: {action}. Use: status, query, classify, summarize, triage, cache, cache_clear"
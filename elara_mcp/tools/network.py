@@ -21,7 +21,8 @@ def elara_network(
     host: Optional[str] = None,
     port: Optional[int] = None,
     record_id: Optional[str] = None,
-    limit: int = 20,
+    limit: Optional[int] = None,
+    quorum: int = 2,
 ) -> str:
     """
     Layer 2 network operations — peer discovery, record exchange, witnessing.
@@ -34,14 +35,20 @@ def elara_network(
             "peers"        — List discovered peers
             "start"        — Start network (discovery + server)
             "stop"         — Stop network
-            "push"         — Push recent records to a peer (needs host, port)
-            "sync"         — Pull records from a peer (needs host, port)
-            "witness"      — Request witness from a peer for a record (needs host, port, record_id)
+            "push"         — Push recent records to a peer in batches (needs host, port)
+            "sync"         — Pull everything new from a peer, page by page (needs host, port).
+                             Resumes an interrupted sync; later syncs only fetch newer records.
+            "reconcile"    — Compare DAGs with a peer and exchange only the records either
+                             side is missing, in both directions (needs host, port)
+            "witness"      — Request witness for a record (needs record_id). With host/port,
+                             asks that peer; without, asks every connected peer at once
+                             and stops at `quorum` valid attestations
             "attestations" — Query attestations for a record from a peer (needs host, port, record_id)
-        host: Peer hostname/IP (for push, sync, witness, attestations)
-        port: Peer port (for push, sync, witness, attestations)
+        host: Peer hostname/IP (for push, sync, reconcile, witness, attestations)
+        port: Peer port (for push, sync, reconcile, witness, attestations)
         record_id: Record ID (for witness, attestations)
-        limit: Max records for sync (default 20)
+        limit: Records to push (default 20), or page size for sync (default 500)
+        quorum: Attestations wanted when witnessing across all peers (default 2)
 
     Returns:
         Network status, peer list, or operation result
@@ -57,20 +64,27 @@ def elara_network(
     if action == "push":
         if not host or not port:
             return "Error: host and port required for push."
-        return _push(host, port, limit)
+        return _push(host, port, limit or 20)
     if action == "sync":
         if not host or not port:
             return "Error: host and port required for sync."
-        return _sync(host, port, limit)
+        from network.sync import DEFAULT_PAGE_SIZE
+        return _sync(host, port, limit or DEFAULT_PAGE_SIZE)
+    if action == "reconcile":
+        if not host or not port:
+            return "Error: host and port required for reconcile."
+        return _reconcile(host, port)
     if action == "witness":
-        if not host or not port or not record_id:
-            return "Error: host, port, and record_id required for witness."
+        if not record_id:
+            return "Error: record_id required for witness."
+        if not host or not port:
+            return _witness_quorum(record_id, quorum)
         return _witness(host, port, record_id)
     if action == "attestations":
         if not host or not port or not record_id:
             return "Error: host, port, and record_id required for attestations."
         return _attestations(host, port, record_id)
-    return f"Unknown action: {action}. Use: status, peers, start, stop, push, sync, witness, attestations"
+    return f"Unknown action: {action}. Use: status, peers, start, stop, push, sync, reconcile, witness, attestations"
 
 
 # ---------------------------------------------------------------------------
@@ -228,12 +242,14 @@ def _run_async(coro):
 
 
 def _push(host: str, port: int, limit: int) -> str:
-    """Push recent records to a peer."""
+    """Push recent records to a peer, MAX_BATCH_RECORDS per request."""
     bridge = _get_bridge()
     if bridge is None:
         return "Cannot push — Layer 1 bridge not initialized."
 
+    import time
     from network.client import NetworkClient
+    from network.sync import MAX_BATCH_RECORDS
 
     async def _do_push():
         records = bridge._dag.query(limit=limit)
@@ -241,17 +257,27 @@ def _push(host: str, port: int, limit: int) -> str:
             return "No records to push."
 
         client = NetworkClient()
-        pushed = 0
-        errors = 0
-        for record in records:
-            wire = record.to_bytes()
-            result = await client.submit_record(host, port, wire)
-            if result.get("accepted"):
-                pushed += 1
-            else:
-                errors += 1
-        await client.close()
-        return f"Pushed {pushed} records to {host}:{port} ({errors} errors)"
+        totals = {"accepted": 0, "duplicates": 0, "rejected": 0}
+        failed = 0
+        started = time.monotonic()
+        try:
+            for i in range(0, len(records), MAX_BATCH_RECORDS):
+                chunk = [r.to_bytes() for r in records[i:i + MAX_BATCH_RECORDS]]
+                result = await client.push_records(host, port, chunk)
+                if "error" in result and "received" not in result:
+                    failed += len(chunk)
+                    continue
+                for key in totals:
+                    totals[key] += result.get(key, 0)
+        finally:
+            await client.close()
+        elapsed = time.monotonic() - started
+
+        line = (f"Pushed {totals['accepted']} records to {host}:{port} "
+                f"({totals['duplicates']} already there, {totals['rejected']} rejected")
+        if failed:
+            line += f", {failed} not delivered"
+        return line + f") — {_rate(len(records), elapsed)}"
 
     try:
         return _run_async(_do_push())
@@ -259,36 +285,76 @@ def _push(host: str, port: int, limit: int) -> str:
         return f"Push failed: {e}"
 
 
-def _sync(host: str, port: int, limit: int) -> str:
-    """Pull records from a peer."""
+def _sync(host: str, port: int, page_size: int) -> str:
+    """Pull records from a peer, page by page, until its DAG walk is done.
+
+    The cursor is saved after every page so an interrupted sync resumes
+    where it stopped. A completed sync records the newest timestamp seen,
+    and the next one only walks back to just before it.
+    """
     bridge = _get_bridge()
     if bridge is None:
         return "Cannot sync — Layer 1 bridge not initialized."
 
+    import time
     from network.client import NetworkClient
+    from network.sync import (
+        MAX_BATCH_RECORDS, get_record, load_sync_state, resume_since, save_sync_state,
+    )
+
+    page_size = max(1, min(page_size, MAX_BATCH_RECORDS))
 
     async def _do_sync():
-        client = NetworkClient()
-        records = await client.query_records(host, port, limit=limit)
-        await client.close()
+        from elara_protocol.record import ValidationRecord
 
-        if not records:
-            return f"No records from {host}:{port}"
-
-        inserted = 0
-        for rec_data in records:
-            wire_hex = rec_data.get("wire_hex", "")
-            if wire_hex:
-                try:
-                    from elara_protocol.record import ValidationRecord
-                    wire = bytes.fromhex(wire_hex)
-                    record = ValidationRecord.from_bytes(wire)
-                    bridge._dag.insert(record, verify_signature=False)
-                    inserted += 1
-                except Exception:
-                    pass
-
-        return f"Synced {inserted}/{len(records)} records from {host}:{port}"
+        state = load_sync_state(host, port)
+        cursor = state.get("cursor")
+        since = resume_since(state)
+        high_water = state.get("high_water", 0.0)
+        pages = received = inserted = present = failed = 0
+
+        client = NetworkClient()
+        started = time.monotonic()
+        try:
+            while True:
+                page = await client.pull_records(host, port, cursor=cursor,
+                                                 limit=page_size, since=since)
+                if "error" in page:
+                    if cursor and pages == 0:
+                        cursor = None  # stale cursor from an old sync: start over
+                        continue
+                    return f"Sync from {host}:{port} stopped after {pages} pages: {page['error']}"
+
+                pages += 1
+                for wire in page["records"]:
+                    received += 1
+                    try:
+                        record = ValidationRecord.from_bytes(wire)
+                        high_water = max(high_water, record.timestamp)
+                        if get_record(bridge._dag, record.id) is not None:
+                            present += 1
+                            continue
+                        bridge._dag.insert(record, verify_signature=False)
+                        inserted += 1
+                    except Exception:
+                        failed += 1
+
+                cursor = page["cursor"]
+                if cursor is None:
+                    save_sync_state(host, port, {"cursor": None, "high_water": high_water})
+                    break
+                # Newest records come first: keep their timestamps across a resume
+                save_sync_state(host, port, {"cursor": cursor, "since": since,
+                                             "high_water": high_water})
+        finally:
+            await client.close()
+        elapsed = time.monotonic() - started
+
+        if not received:
+            return f"No new records from {host}:{port}"
+        line = (f"Synced {inserted} new records from {host}:{port} "
+                f"({present} already held, {failed} failed, {pages} pages)")
+        return line + f" — {_rate(received, elapsed)}"
 
     try:
         return _run_async(_do_sync())
@@ -296,6 +362,46 @@ def _sync(host: str, port: int, limit: int) -> str:
         return f"Sync failed: {e}"
 
 
+def _reconcile(host: str, port: int) -> str:
+    """Anti-entropy exchange with a peer (see network.reconcile)."""
+    bridge = _get_bridge()
+    if bridge is None:
+        return "Cannot reconcile — Layer 1 bridge not initialized."
+
+    from network.client import NetworkClient
+    from network.reconcile import reconcile
+
+    async def _do_reconcile():
+        client = NetworkClient()
+        try:
+            return await reconcile(client, host, port, bridge._dag, push=True)
+        finally:
+            await client.close()
+
+    try:
+        report = _run_async(_do_reconcile())
+    except Exception as e:
+        return f"Reconcile failed: {e}"
+    if "error" in report:
+        return f"Reconcile with {host}:{port} failed: {report['error']}"
+    if not report["fetched"] and not report["peer_missing"]:
+        return (f"Already in sync with {host}:{port} "
+                f"({report['round_trips']} round trips, {report['elapsed_s']}s)")
+    return (
+        f"Reconciled with {host}:{port}: fetched {report['fetched']}, "
+        f"pushed {report['pushed']}/{report['peer_missing']}"
+        + (f", {report['failed']} failed" if report["failed"] else "")
+        + f"\n  {report['round_trips']} round trips, {report['buckets_compared']} buckets compared, "
+        f"{report['ids_listed']} ids listed, {report['elapsed_s']}s"
+    )
+
+
+def _rate(count: int, elapsed: float) -> str:
+    if elapsed <= 0:
+        return f"{count} records"
+    return f"{count} records in {elapsed:.2f}s, {count / elapsed:.0f} records/s"
+
+
 def _attestations(host: str, port: int, record_id: str) -> str:
     """Query attestations for a record from a remote node."""
     from network.client import NetworkClient
@@ -321,6 +427,57 @@ def _attestations(host: str, port: int, record_id: str) -> str:
         return f"Query attestations failed: {e}"
 
 
+def _witness_quorum(record_id: str, quorum: int) -> str:
+    """Collect counter-signatures for a record from every connected peer."""
+    bridge = _get_bridge()
+    if bridge is None:
+        return "Cannot witness — Layer 1 bridge not initialized."
+    if not _discovery:
+        return "Discovery not started. Use action='start' first, or pass host and port."
+    peers = _discovery.connected_peers
+    if not peers:
+        return "No connected peers to witness with."
+
+    from network.sync import get_record
+    target = get_record(bridge._dag, record_id)
+    if target is None:
+        return f"Record {record_id} not found in local DAG."
+
+    from network.client import NetworkClient
+    from network.collect import collect_witnesses
+    from network.trust import TrustScore
+
+    manager = _server._witness_manager if _server else None
+
+    async def _do_collect():
+        client = NetworkClient()
+        try:
+            return await collect_witnesses(client, peers, [target], quorum=quorum,
+                                           manager=manager)
+        finally:
+            await client.close()
+
+    try:
+        report = _run_async(_do_collect())
+    except Exception as e:
+        return f"Witness failed: {e}"
+
+    got = report["attestations"][record_id]
+    score = TrustScore.compute(len(got))
+    status = "quorum reached" if record_id in report["reached"] else "quorum NOT reached"
+    lines = [
+        f"Record {record_id[:12]}... — {len(got)}/{quorum} witnesses, {status} "
+        f"({len(peers)} peers asked, {report['elapsed_s']}s)",
+        f"  Trust: {score:.2f} ({TrustScore.level(score)})",
+    ]
+    for identity, entry in report["peers"].items():
+        detail = entry["error"] or f"{entry['attested']} attested"
+        if entry["invalid"]:
+            detail += f", {entry['invalid']} invalid"
+        lines.append(f"  {identity[:16]}... {detail} ({entry['ms']}ms)")
+    return "\n".join(lines)
+
+
 def _witness(host: str, port: int, record_id: str) -> str:
     """Request witness attestation for a record."""
     bridge = _get_bridge()
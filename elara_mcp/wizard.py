@@ -286,11 +286,14 @@ def run_health_check(data_dir: Path) -> list[tuple[str, bool, str]]:
     if exists:
         try:
             import chromadb
-            mem_db = data_dir / "elara-memory-db"
+            from memory.chroma import LAYOUT_MARKER
+            shared = (data_dir / "elara-chroma-db" / LAYOUT_MARKER).exists()
+            mem_db = data_dir / ("elara-chroma-db" if shared else "elara-memory-db")
             if mem_db.is_dir():
                 client = chromadb.PersistentClient(path=str(mem_db))
                 cols = client.list_collections()
-                results.append(("  Collections", True, str(len(cols))))
+                layout = "shared store" if shared else "legacy layout: elara chroma migrate"
+                results.append(("  Collections", True, f"{len(cols)} ({layout})"))
             else:
                 results.append(("  Collections", False, "no memory-db yet (normal on first run)"))
         except Exception as e:
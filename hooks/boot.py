@@ -174,6 +174,9 @@ def boot():
     # Start Overwatch daemon if not already running
     _start_overwatch()
 
+    # Start the enrichment server behind the prompt hook
+    _start_enrich_server()
+
 
 from core.paths import get_paths
 SNAPSHOT_PATH = get_paths().session_snapshot
@@ -232,6 +235,17 @@ def _start_overwatch():
             pass  # Don't break boot if Overwatch fails to start
 
 
+def _start_enrich_server():
+    """Start the enrichment server if not already running (quietly)."""
+    import subprocess
+    script = Path(__file__).parent.parent / "scripts" / "enrich-start.sh"
+    if script.exists():
+        try:
+            subprocess.run([str(script)], capture_output=True, timeout=5)
+        except Exception:
+            pass  # Prompt hook falls back to in-process enrichment
+
+
 def goodbye(summary: str = None):
     """Run shutdown sequence."""
     if not ELARA_AVAILABLE:
@@ -0,0 +1,252 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Enrichment server — resident backend for the UserPromptSubmit hook.
+
+Problem: hooks/intention-hook.py ran as a fresh interpreter on every
+prompt. Each run re-imported chromadb, loaded the embedding model and
+opened persistent clients for seven stores before printing ~300 tokens.
+
+Solution: this process imports everything once, warms the stores
+(hooks.enrichment.warm_up) and answers over a Unix-domain socket. The
+hook is now a stdlib-only client; if the socket is absent it falls back
+to running hooks.enrichment in-process, exactly as before.
+
+Protocol — one request per connection, one JSON line each way:
+  → {"prompt": "..."}   ← {"ok": true, "enrichment": "...", "ms": 41.2}
+  → {"op": "stats"}     ← {"ok": true, "stats": {...}}   (latency, late sections)
+  → {"op": "ping"}      ← {"ok": true}
+
+Requests are handled serially: enrichment updates small shared files
+(message buffer, injection cache, Overwatch inject) and prompts arrive
+one at a time anyway. The process also runs an IngestWorker, so session
+ingests the hook requests happen here rather than on the prompt path.
+
+Run:
+    elara enrich-server --data-dir ~/.claude
+    python3 -m hooks.enrich_server
+"""
+
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from core.paths import get_paths
+
+logger = logging.getLogger("elara.hooks.enrich_server")
+
+MAX_REQUEST_BYTES = 256 * 1024      # prompts are truncated to 200 chars downstream anyway
+LATENCY_WINDOW = 1000               # recent request timings kept for p50/p99
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def socket_in_use(path: Path) -> bool:
+    """True if something is accepting connections on this socket path."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(0.2)
+    try:
+        probe.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = 5.0  # per-connection read timeout; a stuck client can't wedge the server
+
+    def handle(self):
+        try:
+            raw = self.rfile.readline(MAX_REQUEST_BYTES)
+            request = json.loads(raw or b"{}")
+            reply = self.server.owner.dispatch(request)
+        except (OSError, ValueError) as e:
+            reply = {"ok": False, "error": str(e)}
+        try:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+        except OSError:
+            pass  # client gave up — nothing to do
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    owner: "EnrichmentServer"
+
+
+class EnrichmentServer:
+    """Serves prompt enrichment over a Unix socket from one warm process."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        build: Optional[Callable[[str], str]] = None,
+        refresh: Optional[Callable[[], Any]] = None,
+        mark_fresh: Optional[Callable[[], Any]] = None,
+        report: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        self.socket_path = Path(socket_path or get_paths().enrich_socket)
+        if None in (build, refresh, mark_fresh, report):
+            from hooks import enrichment
+            build = build or enrichment.enrich
+            refresh = refresh or enrichment.refresh_stale_stores
+            mark_fresh = mark_fresh or enrichment.mark_stores_fresh
+            report = report or enrichment.last_report
+        self._build = build
+        self._refresh = refresh
+        self._mark_fresh = mark_fresh
+        self._report = report
+        self.late_sections: Dict[str, int] = {}
+        self._server: Optional[_UnixServer] = None
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.store_reopens = 0
+        self.started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op", "enrich")
+        if op == "ping":
+            return {"ok": True}
+        if op == "stats":
+            return {"ok": True, "stats": self.stats()}
+        if op != "enrich":
+            return {"ok": False, "error": f"unknown op: {op}"}
+
+        started = time.perf_counter()
+        self.requests += 1
+        try:
+            reopened = self._refresh()
+            text = self._build(str(request.get("prompt", "")))
+            if reopened:
+                self.store_reopens += 1
+                self._mark_fresh()  # reopening writes to the store; don't chase our own tail
+            for name in self._report().get("late", []):
+                self.late_sections[name] = self.late_sections.get(name, 0) + 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Enrichment failed: %s", e)
+            return {"ok": False, "error": str(e)}
+        ms = (time.perf_counter() - started) * 1000
+        self._latencies.append(ms)
+        return {"ok": True, "enrichment": text or "", "ms": round(ms, 2)}
+
+    def stats(self) -> Dict[str, Any]:
+        lat = list(self._latencies)
+        return {
+            "socket": str(self.socket_path),
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "requests": self.requests,
+            "errors": self.errors,
+            "store_reopens": self.store_reopens,
+            "late_sections": dict(self.late_sections),
+            "p50_ms": round(_percentile(lat, 50), 2),
+            "p99_ms": round(_percentile(lat, 99), 2),
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def bind(self):
+        """Claim the socket path (clearing a stale one) and start listening."""
+        if self.socket_path.exists():
+            if socket_in_use(self.socket_path):
+                raise RuntimeError(f"Enrichment server already running on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _UnixServer(str(self.socket_path), _Handler)
+        self._server.owner = self
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self):
+        if self._server is None:
+            self.bind()
+        logger.info("Enrichment server listening on %s", self.socket_path)
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def shutdown(self):
+        """Stop serve_forever() — safe to call from another thread or a signal handler."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+
+def main(socket_path: Optional[Path] = None, warm: bool = True):
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [enrich] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    paths = get_paths()
+    server = EnrichmentServer(socket_path)
+    if socket_in_use(server.socket_path):
+        logger.info("Enrichment server already running on %s", server.socket_path)
+        return
+
+    # Warm before binding: until the socket exists the hook keeps using
+    # its in-process path instead of queueing behind the model load.
+    if warm:
+        from hooks.enrichment import warm_up
+        started = time.perf_counter()
+        warmed = warm_up()
+        logger.info("Warmed %s in %.0f ms", ", ".join(warmed) or "nothing",
+                    (time.perf_counter() - started) * 1000)
+
+    try:
+        server.bind()
+    except (RuntimeError, OSError) as e:
+        logger.warning("Could not bind %s: %s", server.socket_path, e)
+        return
+
+    def _handle_signal(signum, frame):
+        logger.info("Received signal %s, shutting down...", signum)
+        server.shutdown()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    # Background conversation ingest requested by the hook on new sessions
+    from hooks.enrichment import ingest_conversations_in_process
+    from memory.conversations.ingest_queue import IngestWorker
+    ingest_worker = IngestWorker(ingest_conversations_in_process, name="enrich").start()
+
+    paths.enrich_pid.write_text(str(os.getpid()))
+    try:
+        server.serve_forever()
+    finally:
+        ingest_worker.stop()
+        if paths.enrich_pid.exists():
+            paths.enrich_pid.unlink()
+        logger.info("Enrichment server stopped (%d requests)", server.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1167 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Prompt enrichment — the body of the UserPromptSubmit hook.
+
+Builds the compact [CONTEXT]/[MOOD]/[RECALL]/... block injected before
+every user prompt (see hooks/intention-hook.py for the output format).
+
+Imported by two callers:
+  - hooks/enrich_server.py — the resident server, which keeps ChromaDB
+    clients, collections and the embedding model warm between prompts
+  - hooks/intention-hook.py — in-process fallback when no server is running
+
+Design principles:
+  - Zero LLM calls — only ChromaDB semantic search + file reads
+  - Fail silent — every source swallows its own errors
+  - Detect frustration signals for CompletionPattern learning
+  - Rolling message buffer for compound queries (better recall quality)
+"""
+
+import json
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, wait
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Completion patterns file (accumulated frustration-derived learning)
+PATTERNS_FILE = Path.home() / ".claude" / "elara-completion-patterns.json"
+
+# Rolling message buffer — compound queries for better semantic recall
+BUFFER_FILE = Path("/tmp/elara-msg-buffer.jsonl")
+MAX_BUFFER_MESSAGES = 5
+
+# Recent injection cache — dedup to avoid repeating same memories
+INJECTION_CACHE_FILE = Path("/tmp/elara-injection-cache.json")
+MAX_INJECTION_CACHE = 10
+
+# Session boundary detection — clear caches on new session
+SESSION_MARKER_FILE = Path("/tmp/elara-session-marker")
+SESSION_GAP_SECONDS = 300  # 5 min gap = new session
+
+# Independent lookups run concurrently under one budget per prompt
+SECTION_DEADLINE = 1.0       # seconds from the start of build_enrichment
+COLD_SECTION_DEADLINE = 5.0  # in-process fallback: imports and store opens land inside the budget
+SECTION_WORKERS = 12         # > sections per prompt, so one stuck lookup can't starve the next prompt
+
+# Frustration signal regexes (compiled once)
+FRUSTRATION_SIGNALS = [
+    re.compile(r"\bbut you didn'?t\b", re.IGNORECASE),
+    re.compile(r"\byou forgot\b", re.IGNORECASE),
+    re.compile(r"\bi told you to\b", re.IGNORECASE),
+    re.compile(r"\bwhy didn'?t you\b", re.IGNORECASE),
+    re.compile(r"\byou missed\b", re.IGNORECASE),
+    re.compile(r"\byou were supposed to\b", re.IGNORECASE),
+    re.compile(r"\bthat'?s not what i asked\b", re.IGNORECASE),
+    re.compile(r"\byou skipped\b", re.IGNORECASE),
+    re.compile(r"\byou left out\b", re.IGNORECASE),
+    re.compile(r"\byou ignored\b", re.IGNORECASE),
+]
+
+
+# ---------------------------------------------------------------------------
+# Rolling message buffer — builds compound queries for better recall
+# ---------------------------------------------------------------------------
+
+def detect_and_handle_new_session():
+    """Clear caches if this looks like a new session (>5min gap).
+
+    Returns True if this is the first message of a new session.
+    Also asks for an incremental conversation ingest on new sessions so
+    semantic recall can see all prior sessions from today. The ingest
+    itself runs in the background (Overwatch / enrichment server, see
+    memory.conversations.ingest_queue); this only checks the watermark
+    and files a request.
+    """
+    is_new = False
+    try:
+        now = datetime.now(timezone.utc).timestamp()
+        if SESSION_MARKER_FILE.exists():
+            last_ts = float(SESSION_MARKER_FILE.read_text().strip())
+            gap = now - last_ts
+            if gap > SESSION_GAP_SECONDS:
+                # New session — clear stale caches
+                is_new = True
+                if INJECTION_CACHE_FILE.exists():
+                    INJECTION_CACHE_FILE.unlink()
+                if BUFFER_FILE.exists():
+                    BUFFER_FILE.unlink()
+        else:
+            is_new = True  # No marker = first ever message
+        SESSION_MARKER_FILE.write_text(str(now))
+    except Exception:
+        pass
+
+    # Request ingest on session boundary so recall sees today's work —
+    # unless something (e.g. the boot hook) ingested within the gap already
+    if is_new:
+        try:
+            from memory.conversations.ingest_queue import ingest_age, request_ingest
+            if ingest_age() > SESSION_GAP_SECONDS:
+                request_ingest("new-session")
+        except Exception:
+            pass  # Never block on ingest failure
+
+    return is_new
+
+
+def mood_description_from_values(valence: float, energy: float, openness: float) -> str:
+    """Generate a compact mood description from raw values.
+
+    Valence: -1 (negative) to +1 (positive)
+    Energy: 0 (low) to 1 (high)
+    Openness: 0 (guarded) to 1 (open/vulnerable)
+    """
+    # Valence bucket
+    if valence > 0.5:
+        v_word = "warm"
+    elif valence > 0.2:
+        v_word = "steady"
+    elif valence > -0.2:
+        v_word = "neutral"
+    elif valence > -0.5:
+        v_word = "flat"
+    else:
+        v_word = "low"
+
+    # Energy bucket
+    if energy > 0.7:
+        e_word = "energized"
+    elif energy > 0.4:
+        e_word = "calm"
+    else:
+        e_word = "tired"
+
+    # Openness bucket
+    if openness > 0.7:
+        o_word = "open"
+    elif openness > 0.4:
+        o_word = "present"
+    else:
+        o_word = "guarded"
+
+    return f"{v_word}, {e_word}, {o_word}"
+
+
+def append_to_buffer(prompt: str):
+    """Add this message to the rolling buffer."""
+    try:
+        lines = []
+        if BUFFER_FILE.exists():
+            lines = [l for l in BUFFER_FILE.read_text().strip().split("\n") if l]
+        lines.append(json.dumps({
+            "t": datetime.now(timezone.utc).isoformat(),
+            "p": prompt[:200],
+        }))
+        lines = lines[-MAX_BUFFER_MESSAGES:]
+        BUFFER_FILE.write_text("\n".join(lines) + "\n")
+    except Exception:
+        pass
+
+
+def get_compound_query(prompt: str) -> str:
+    """Build a richer query from recent messages + current context.
+
+    Instead of querying ChromaDB with just the current message (which may
+    be vague like "do it" or "hello"), we concatenate recent messages and
+    the current working context for much better semantic matching.
+    """
+    parts = []
+
+    # Prepend current context topic (anchors the search)
+    context = get_current_context()
+    if context:
+        parts.append(context)
+
+    # Add last few messages from buffer
+    try:
+        if BUFFER_FILE.exists():
+            for line in BUFFER_FILE.read_text().strip().split("\n")[-3:]:
+                if line:
+                    entry = json.loads(line)
+                    parts.append(entry.get("p", ""))
+    except Exception:
+        pass
+
+    # Always include current prompt
+    parts.append(prompt[:200])
+
+    return " ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Semantic memory recall — the hippocampus
+# ---------------------------------------------------------------------------
+
+def get_query_embedding(query: str):
+    """Embed the compound query once for every semantic section below.
+
+    All stores share one embedding model, so the same vector is fanned out
+    to each collection instead of each search embedding the query again.
+    None (model unavailable) makes every search embed for itself, as before.
+    """
+    try:
+        from memory.embeddings import embed_query
+        return embed_query(query)
+    except Exception:
+        return None
+
+
+def get_relevant_memories(query: str, query_embedding=None) -> list:
+    """Semantic recall from the memories collection.
+
+    Returns top memories above relevance threshold, truncated for
+    compact injection. This is the core "reflexive memory" feature.
+    """
+    try:
+        from memory.vector import recall
+        results = recall(query, n_results=3, mood_weight=0.1,
+                         query_embedding=query_embedding)
+        # Filter by relevance — inject matches above threshold
+        # Note: cosine similarity in our corpus peaks around 0.40-0.45,
+        # so 0.30 captures meaningful matches without noise
+        return [
+            m for m in results
+            if m.get("relevance", 0) > 0.30
+        ]
+    except Exception:
+        return []
+
+
+def get_injection_cache() -> set:
+    """Load recently injected memory IDs to avoid repeating."""
+    try:
+        if INJECTION_CACHE_FILE.exists():
+            data = json.loads(INJECTION_CACHE_FILE.read_text())
+            return set(data.get("ids", []))
+    except Exception:
+        pass
+    return set()
+
+
+def update_injection_cache(memory_ids: list):
+    """Track which memories were just injected."""
+    try:
+        existing = list(get_injection_cache())
+        combined = existing + memory_ids
+        # Keep only last N to prevent unbounded growth
+        combined = combined[-MAX_INJECTION_CACHE:]
+        INJECTION_CACHE_FILE.write_text(json.dumps({"ids": combined}))
+    except Exception:
+        pass
+
+
+def format_memory_for_injection(mem: dict) -> str:
+    """Format a memory compactly for context injection (~30-80 chars)."""
+    content = mem.get("content", "")
+    # Collapse newlines and extra whitespace
+    content = " ".join(content.split())
+    # Strip common prefixes
+    for prefix in ("[Feeling: ", "[Decision: "):
+        if content.startswith(prefix):
+            content = content[len(prefix):]
+    # Truncate to keep injection compact
+    if len(content) > 80:
+        content = content[:77] + "..."
+    return content
+
+
+# ---------------------------------------------------------------------------
+# Frustration detection
+# ---------------------------------------------------------------------------
+
+def detect_frustration(prompt: str) -> bool:
+    """Check if prompt contains frustration signals and log if found."""
+    for pattern in FRUSTRATION_SIGNALS:
+        match = pattern.search(prompt)
+        if match:
+            _log_frustration(prompt, match.group())
+            return True
+    return False
+
+
+def _log_frustration(prompt: str, signal: str):
+    """Append frustration event to completion patterns file."""
+    try:
+        if PATTERNS_FILE.exists():
+            patterns = json.loads(PATTERNS_FILE.read_text())
+        else:
+            patterns = []
+
+        # Truncate prompt for storage (first 200 chars)
+        snippet = prompt[:200].strip()
+
+        patterns.append({
+            "signal": signal,
+            "prompt_snippet": snippet,
+            "detected": datetime.now(timezone.utc).isoformat(),
+            "resolved": False,
+        })
+
+        # Keep last 50 patterns max
+        patterns = patterns[-50:]
+        PATTERNS_FILE.write_text(json.dumps(patterns, indent=2))
+    except Exception:
+        pass  # Never fail on logging
+
+
+def get_overwatch_injection() -> str:
+    """Read and consume Overwatch injection file (replaces overwatch-inject.sh)."""
+    inject_file = Path.home() / ".claude" / "elara-overwatch-inject.md"
+    if inject_file.exists():
+        try:
+            content = inject_file.read_text().strip()
+            inject_file.unlink()
+            return content
+        except Exception:
+            pass
+    return ""
+
+
+def get_corrections(prompt: str, query_embedding=None) -> list:
+    """Find corrections relevant to this prompt."""
+    try:
+        from daemon.corrections import check_corrections
+        matches = check_corrections(prompt, n_results=2, query_embedding=query_embedding)
+        return [
+            c for c in matches
+            if not c.get("_error") and c.get("relevance", 0) > 0.35
+        ]
+    except Exception:
+        return []
+
+
+def get_decision_checks(prompt: str) -> list:
+    """Check UDR for rejected entities mentioned in this prompt.
+    Zero LLM calls — keyword scan against entity set. Fail-silent."""
+    try:
+        from daemon.udr import get_registry
+        reg = get_registry()
+        return reg.check_entities(prompt)
+    except Exception:
+        return []
+
+
+def get_workflows(prompt: str, query_embedding=None) -> list:
+    """Find workflow patterns matching this prompt."""
+    try:
+        from daemon.workflows import check_workflows
+        return check_workflows(prompt, n=1, query_embedding=query_embedding)
+    except Exception:
+        return []
+
+
+def get_active_goals() -> list:
+    """Get active goals (max 5), sorted by build_order."""
+    try:
+        from daemon.goals import list_goals
+        goals = list_goals(status="active")[:5]
+        return sorted(goals, key=lambda g: g.get("build_order") or 999)
+    except Exception:
+        return []
+
+
+def get_handoff_items(max_carried: int = 14) -> list:
+    """Get carry-forward items from last handoff.
+
+    Items carried for more than max_carried sessions are suppressed
+    from automatic injection (still available for on-demand recall).
+    This prevents 'Gmail OAuth setup' from appearing for the 45th time.
+    """
+    try:
+        from daemon.handoff import load_handoff
+        handoff = load_handoff()
+        if not handoff:
+            return []
+
+        items = []
+        for key in ("unfinished", "promises", "reminders"):
+            for item in handoff.get(key, [])[:2]:
+                text = item.get("text", "").strip()
+                carried = item.get("carried", 0)
+                if text and carried <= max_carried:
+                    items.append(text)
+        return items[:3]
+    except Exception:
+        return []
+
+
+def get_handoff_summary() -> str:
+    """Build a detailed last-session summary from the handoff.
+
+    Injected as [LAST-SESSION] on new sessions so the model knows
+    what just happened. Includes session summary, files changed,
+    commits, mood, and top plans.
+    """
+    try:
+        from daemon.handoff import load_handoff
+        handoff = load_handoff()
+        if not handoff:
+            return ""
+
+        session_num = handoff.get("session_number", "?")
+        mood = handoff.get("mood_and_mode", "").strip()
+        ts = handoff.get("timestamp", "")[:16]
+
+        lines = [f"Session {session_num} ({ts})"]
+
+        # What we actually did (the new mandatory field)
+        summary = handoff.get("session_summary", [])
+        if summary:
+            lines.append("Done: " + " | ".join(s[:80] for s in summary[:5]))
+
+        # Key files changed
+        files = handoff.get("files_changed", [])
+        if files:
+            lines.append("Files: " + ", ".join(f[:50] for f in files[:5]))
+
+        # Commits from the session
+        commits = handoff.get("commits", [])
+        if commits:
+            commit_strs = [
+                f"{c.get('hash', '?')[:7]} ({c.get('repo', '?')})"
+                for c in commits[:4]
+            ]
+            lines.append("Commits: " + ", ".join(commit_strs))
+
+        # Mood/energy context
+        if mood:
+            lines.append(mood[:120])
+
+        # Top 3 next_plans (what was planned next)
+        plans = handoff.get("next_plans", [])
+        plan_texts = [p.get("text", "")[:70] for p in plans[:3] if p.get("text")]
+        if plan_texts:
+            lines.append("Next: " + " | ".join(plan_texts))
+
+        return " — ".join(lines)
+    except Exception:
+        return ""
+
+
+def get_current_context() -> str:
+    """Get current working context (project + episode type).
+
+    Skips stale context (>24h old) to avoid injecting irrelevant frames.
+    """
+    try:
+        ctx_file = Path.home() / ".claude" / "elara-context.json"
+        if ctx_file.exists():
+            ctx = json.loads(ctx_file.read_text())
+            topic = ctx.get("topic", "")
+            if not topic:
+                return ""
+            # Check staleness — skip if >24h old
+            updated_ts = ctx.get("updated_ts", 0)
+            if updated_ts:
+                age_hours = (datetime.now(timezone.utc).timestamp() - updated_ts) / 3600
+                if age_hours > 24:
+                    return ""
+            return topic
+    except Exception:
+        pass
+    return ""
+
+
+# ---------------------------------------------------------------------------
+# NEW: Conversation recall — past dialogue about this topic
+# ---------------------------------------------------------------------------
+
+def get_relevant_conversations(query: str, query_embedding=None) -> list:
+    """Search past conversation exchanges for relevant context.
+
+    Fetches 8 results to ensure enough survive relevance filtering.
+    Today's exchanges get a recency boost from the scoring model,
+    so they naturally rise to the top.
+    """
+    try:
+        from memory.conversations import recall_conversation
+        results = recall_conversation(query, n_results=8, query_embedding=query_embedding)
+        return [c for c in results if c.get("relevance", 0) > 0.30]
+    except Exception:
+        return []
+
+
+def get_recent_exchanges(n: int = 5) -> list:
+    """Get the most recent conversation exchanges by pure recency.
+
+    Used on new session boot instead of semantic search (which fails
+    on vague greetings like 'hello'). Returns the last N exchanges
+    from the most recent session(s), giving real context about what
+    we actually did.
+    """
+    try:
+        from memory.conversations import get_conversations
+        conv = get_conversations()
+        if not conv.collection:
+            return []
+        # Use a maximally generic query with near-pure recency weighting
+        # so results sort by time, not semantic match
+        results = conv.recall(
+            "session work build implement",
+            n_results=n,
+            recency_weight=0.95,
+        )
+        return results
+    except Exception:
+        return []
+
+
+def get_next_action() -> str:
+    """Get the first incomplete item from handoff next_plans.
+
+    Returns a concrete 'what to do next' instead of abstract goals.
+    """
+    try:
+        from daemon.handoff import load_handoff
+        handoff = load_handoff()
+        if not handoff:
+            return ""
+        plans = handoff.get("next_plans", [])
+        for p in plans:
+            text = p.get("text", "").strip()
+            if text:
+                return text[:100]
+    except Exception:
+        pass
+    return ""
+
+
+def format_conversation_for_injection(conv: dict) -> str:
+    """Format a conversation exchange compactly."""
+    date = conv.get("date", "?")[:10]
+    # Try user_text_preview first, fall back to content
+    preview = conv.get("user_text_preview", "")
+    if not preview:
+        content = conv.get("content", "")
+        # Content format is "User: ...\n\nElara: ..."
+        if content.startswith("User: "):
+            preview = content[6:].split("\n")[0]
+    preview = " ".join(preview.split())[:70]
+    if preview:
+        return f"{date}: \"{preview}\""
+    return f"{date}: (exchange)"
+
+
+# ---------------------------------------------------------------------------
+# NEW: Principles — crystallized rules from confirmed insights
+# ---------------------------------------------------------------------------
+
+def get_relevant_principles(query: str, query_embedding=None) -> list:
+    """Search principles by semantic similarity."""
+    try:
+        from daemon.principles import search_principles
+        results = search_principles(query, n=3, query_embedding=query_embedding)
+        return [p for p in results if p.get("relevance", 0) > 0.30]
+    except Exception:
+        return []
+
+
+# ---------------------------------------------------------------------------
+# NEW: Reasoning trails — similar problems already solved
+# ---------------------------------------------------------------------------
+
+def get_relevant_reasoning(query: str, query_embedding=None) -> list:
+    """Search past reasoning trails for similar problems."""
+    try:
+        from daemon.reasoning import search_trails
+        results = search_trails(query, n=2, query_embedding=query_embedding)
+        return [r for r in results if r.get("relevance", 0) > 0.30]
+    except Exception:
+        return []
+
+
+# ---------------------------------------------------------------------------
+# NEW: Milestones — past decisions and breakthroughs
+# ---------------------------------------------------------------------------
+
+def get_relevant_milestones(query: str, query_embedding=None) -> list:
+    """Search episode milestones by semantic similarity."""
+    try:
+        from memory.episodic import get_episodic
+        episodic = get_episodic()
+        results = episodic.search_milestones(query, n_results=3, query_embedding=query_embedding)
+        return [m for m in results if m.get("relevance", 0) > 0.30]
+    except Exception:
+        return []
+
+
+# ---------------------------------------------------------------------------
+# NEW: Mood — current emotional state (cached, ~5ms)
+# ---------------------------------------------------------------------------
+
+def get_current_mood() -> dict:
+    """Get current mood state."""
+    try:
+        from daemon.mood import get_mood
+        return get_mood()
+    except Exception:
+        return {}
+
+
+# ---------------------------------------------------------------------------
+# NEW: Intention — current growth goal (~10ms)
+# ---------------------------------------------------------------------------
+
+def get_current_intention() -> str:
+    """Get current growth intention.
+
+    Skips stale intentions (>24h old) from proactive injection.
+    Data stays in file + memories for on-demand recall via semantic search.
+    """
+    try:
+        from daemon.awareness.intention import get_intention
+        intention = get_intention()
+        if not intention:
+            return ""
+        # Check staleness — only inject if fresh (<24h)
+        set_at = intention.get("set_at", "")
+        if set_at:
+            try:
+                set_dt = datetime.fromisoformat(set_at)
+                if set_dt.tzinfo is None:
+                    set_dt = set_dt.replace(tzinfo=timezone.utc)
+                age_hours = (datetime.now(timezone.utc) - set_dt).total_seconds() / 3600
+                if age_hours > 24:
+                    return ""
+            except (ValueError, TypeError):
+                pass
+        return intention.get("what", "")
+    except Exception:
+        pass
+    return ""
+
+
+# ---------------------------------------------------------------------------
+# Section fan-out — independent lookups on a shared pool, one deadline
+# ---------------------------------------------------------------------------
+
+class _SectionPool:
+    """Fixed set of daemon worker threads returning concurrent.futures.Future.
+
+    Not a ThreadPoolExecutor: its workers are joined at interpreter exit,
+    so one hung lookup would hold the in-process hook open past its
+    deadline. Daemon workers are simply abandoned.
+    """
+
+    def __init__(self, workers: int):
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"enrich-{i}", daemon=True).start()
+
+    def _work(self):
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_last_report: dict = {"late": [], "ms": {}}
+
+
+def _section_pool() -> _SectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _SectionPool(SECTION_WORKERS)
+        return _pool
+
+
+def _timed(name: str, timings: dict, fn, *args):
+    started = time.monotonic()
+    try:
+        return fn(*args)
+    finally:
+        timings[name] = round((time.monotonic() - started) * 1000, 1)
+
+
+def submit_sections(specs: dict) -> tuple:
+    """Start every lookup in specs ({name: (fn, *args)}) on the section pool.
+
+    Returns (futures, timings); timings fills in per-section ms as each finishes.
+    """
+    pool = _section_pool()
+    timings: dict = {}
+    futures = {
+        name: pool.submit(_timed, name, timings, spec[0], *spec[1:])
+        for name, spec in specs.items()
+    }
+    return futures, timings
+
+
+def collect_sections(futures: dict, deadline: float) -> tuple:
+    """Wait until the monotonic deadline; return (results, late section names).
+
+    A late lookup keeps running in the background but its result is
+    dropped. A lookup that raised counts as empty, like the getters'
+    own fail-silent fallbacks.
+    """
+    wait(list(futures.values()), timeout=max(0.0, deadline - time.monotonic()))
+    results, late = {}, []
+    for name, future in futures.items():
+        if not future.done():
+            future.cancel()  # no-op once running; drops it if still queued
+            late.append(name)
+        elif future.exception() is None:
+            results[name] = future.result()
+    return results, late
+
+
+def last_report() -> dict:
+    """Late sections and per-section ms from the most recent build_enrichment."""
+    return _last_report
+
+
+def build_boot_enrichment(prompt: str) -> str:
+    """Build enrichment for the FIRST message of a new session.
+
+    Boot is different from normal prompts:
+    - Skip semantic search (greeting queries like 'hello' return garbage)
+    - Use chronological recall (what we actually did recently)
+    - Show next concrete action instead of abstract goals
+    - Suppress stale carry-forward items (carried >14 days)
+    - Keep it focused: last session + recent work + next step + mood
+    """
+    sections = []
+
+    # 1. Boot header + last-session summary from handoff
+    handoff_summary = get_handoff_summary()
+    boot_lines = [
+        "[BOOT] New session. Hook data below is your real-time awareness.",
+        "Greet naturally based on what we did last session. Never list goals or carry-forward.",
+    ]
+    if handoff_summary:
+        boot_lines.append(f"[LAST-SESSION] {handoff_summary}")
+    sections.append("\n".join(boot_lines))
+
+    # 2. Recent work — chronological, not semantic (~100ms)
+    #    This is the key fix: instead of searching 'hello', get what
+    #    we actually did in the last session(s) by pure recency
+    recent = get_recent_exchanges(n=5)
+    if recent:
+        recent_lines = []
+        for r in recent:
+            preview = r.get("user_text_preview", "")
+            if not preview:
+                content = r.get("content", "")
+                if content.startswith("User: "):
+                    preview = content[6:].split("\n")[0]
+            preview = " ".join(preview.split())[:70]
+            date = r.get("date", "?")[:10]
+            if preview:
+                recent_lines.append(f"{date}: \"{preview}\"")
+        if recent_lines:
+            sections.append("[RECENT-WORK] " + " | ".join(recent_lines))
+
+    # 3. Mood — always useful
+    mood = get_current_mood()
+    if mood:
+        v = mood.get("valence", 0)
+        e = mood.get("energy", 0)
+        o = mood.get("openness", 0)
+        desc = mood.get("description", "") or mood_description_from_values(v, e, o)
+        sections.append(f"[MOOD] {desc} (v:{v:.1f} e:{e:.1f} o:{o:.1f})")
+
+    # 4. Next concrete action (instead of abstract goals)
+    next_action = get_next_action()
+    if next_action:
+        sections.append(f"[NEXT] {next_action}")
+
+    # 5. Carry-forward — only fresh items (carried <= 14)
+    items = get_handoff_items(max_carried=14)
+    if items:
+        sections.append("[CARRY-FORWARD] " + " | ".join(items))
+
+    # 6. Overwatch (always check — daemon may have queued alerts)
+    overwatch = get_overwatch_injection()
+    if overwatch:
+        sections.append(f"[OVERWATCH]\n{overwatch}")
+
+    # 7. Frustration detection (unlikely on boot, but check anyway)
+    if detect_frustration(prompt):
+        sections.append("[FRUSTRATION DETECTED] Pay extra attention to completion criteria.")
+
+    return "\n".join(sections)
+
+
+def build_enrichment(prompt: str, is_new_session: bool = False,
+                     deadline: float = SECTION_DEADLINE) -> str:
+    """Build the compact enrichment output from all sources.
+
+    On new sessions: delegates to build_boot_enrichment() which uses
+    chronological recall and next-action instead of semantic search
+    and abstract goals.
+
+    On normal prompts: full-spectrum awareness with semantic search
+    against the actual prompt content. The independent lookups run
+    concurrently; any still running `deadline` seconds after the start
+    are dropped and named in a trailing [LATE] line.
+    """
+    _last_report.update(late=[], ms={})
+
+    # Boot path — completely different strategy
+    if is_new_session:
+        return build_boot_enrichment(prompt)
+
+    # Normal prompt path — semantic search makes sense here
+    sections = []
+    due = time.monotonic() + deadline
+
+    # 0. Build compound query from rolling buffer for better recall,
+    #    embedded once and shared by every semantic section
+    compound_query = get_compound_query(prompt)
+    query_vec = get_query_embedding(compound_query)
+
+    # Sections 4-12 are independent lookups: start them all now and
+    # collect after the cheap file-backed sections 1-3
+    futures, timings = submit_sections({
+        "memories": (get_relevant_memories, compound_query, query_vec),
+        "conversations": (get_relevant_conversations, compound_query, query_vec),
+        "principles": (get_relevant_principles, compound_query, query_vec),
+        "reasoning": (get_relevant_reasoning, compound_query, query_vec),
+        "milestones": (get_relevant_milestones, compound_query, query_vec),
+        "goals": (get_active_goals,),
+        "corrections": (get_corrections, compound_query, query_vec),
+        "decisions": (get_decision_checks, compound_query),
+        "workflows": (get_workflows, compound_query, query_vec),
+        "carry_forward": (get_handoff_items,),
+    })
+
+    # 1. Context (always if available — sets the frame)
+    context = get_current_context()
+    if context:
+        sections.append(f"[CONTEXT] {context}")
+
+    # 2. Mood — current emotional state (~5ms, cached)
+    mood = get_current_mood()
+    if mood:
+        v = mood.get("valence", 0)
+        e = mood.get("energy", 0)
+        o = mood.get("openness", 0)
+        desc = mood.get("description", "") or mood_description_from_values(v, e, o)
+        sections.append(f"[MOOD] {desc} (v:{v:.1f} e:{e:.1f} o:{o:.1f})")
+
+    # 3. Intention — current growth goal (~10ms)
+    intention = get_current_intention()
+    if intention:
+        sections.append(f"[INTENTION] {intention[:80]}")
+
+    found, late = collect_sections(futures, due)
+
+    # 4. Semantic memory recall — the hippocampus
+    memories = found.get("memories")
+    if memories:
+        cache = get_injection_cache()
+        fresh_memories = [
+            m for m in memories
+            if m.get("memory_id", "") not in cache
+        ]
+        if fresh_memories:
+            mem_lines = [format_memory_for_injection(m) for m in fresh_memories[:3]]
+            sections.append("[RECALL] " + " | ".join(mem_lines))
+            update_injection_cache([m.get("memory_id", "") for m in fresh_memories[:3]])
+
+    # 5. Conversation recall — past dialogue about this topic (~100ms)
+    #    Show up to 5 exchanges for richer same-day context
+    conversations = found.get("conversations")
+    if conversations:
+        conv_lines = [format_conversation_for_injection(c) for c in conversations[:5]]
+        sections.append("[CONV-RECALL] " + " | ".join(conv_lines))
+
+    # 6. Principles — crystallized rules from confirmed insights (~100ms)
+    principles = found.get("principles")
+    if principles:
+        princ_lines = []
+        for p in principles[:2]:
+            stmt = p.get("statement", "")
+            stmt = " ".join(stmt.split())[:80]
+            conf = p.get("confidence", 0)
+            princ_lines.append(f"{stmt} (conf:{conf:.1f})")
+        sections.append("[PRINCIPLES] " + " | ".join(princ_lines))
+
+    # 7. Reasoning trails — similar problems already solved (~100ms)
+    trails = found.get("reasoning")
+    if trails:
+        trail_lines = []
+        for t in trails[:2]:
+            context_str = t.get("context", "")[:60]
+            status = t.get("status", "open")
+            solution = t.get("solution", "")[:40]
+            if solution:
+                trail_lines.append(f"{context_str} → solved: {solution}")
+            else:
+                trail_lines.append(f"{context_str} ({status})")
+        sections.append("[REASONING] " + " | ".join(trail_lines))
+
+    # 8. Milestones — past decisions and breakthroughs (~100ms)
+    milestones = found.get("milestones")
+    if milestones:
+        ms_lines = []
+        for m in milestones[:2]:
+            event = m.get("event", "")
+            event = " ".join(event.split())[:60]
+            note_type = m.get("note_type", "milestone")
+            ms_lines.append(f"[{note_type}] {event}")
+        sections.append("[MILESTONES] " + " | ".join(ms_lines))
+
+    # 9. Active goals (with decision context + build order)
+    goals = found.get("goals")
+    if goals:
+        lines = []
+        for i, g in enumerate(goals, 1):
+            order = g.get("build_order") or i
+            decision = g.get("decision") or g.get("notes", "")
+            if decision:
+                lines.append(f"  {order}. {g['title']} — {decision[:60]}")
+            else:
+                lines.append(f"  {order}. {g['title']}")
+        sections.append("[GOALS] Active build order:\n" + "\n".join(lines))
+
+    # 10. Corrections (self-check — past mistakes to avoid)
+    corrections = found.get("corrections")
+    if corrections:
+        lines = []
+        for c in corrections[:2]:
+            mistake = c.get("mistake", "")[:60]
+            fix = c.get("correction", "")[:60]
+            lines.append(f"  {mistake} -> {fix}")
+        sections.append("[SELF-CHECK]\n" + "\n".join(lines))
+
+    # 10b. Decision checks (UDR — rejected entities in prompt)
+    decision_hits = found.get("decisions")
+    if decision_hits:
+        lines = []
+        for d in decision_hits[:2]:
+            lines.append(
+                f"  {d.get('domain','')}:{d.get('entity','')} "
+                f"[{d.get('verdict','')}] — {d.get('reason','')[:60]}"
+            )
+        sections.append("[DECISION-CHECK] Previously decided:\n" + "\n".join(lines))
+
+    # 11. Matching workflow
+    workflows = found.get("workflows")
+    if workflows:
+        wf = workflows[0]
+        steps = [s.get("action", "")[:40] for s in wf.get("steps", [])]
+        if steps:
+            chain = " -> ".join(steps)
+            sections.append(f"[WORKFLOW] {wf.get('name', 'unnamed')}: {chain}")
+
+    # 12. Carry-forward from handoff (with decay filter)
+    items = found.get("carry_forward")
+    if items:
+        sections.append("[CARRY-FORWARD] " + " | ".join(items))
+
+    # 13. Overwatch daemon injection (if pending) — consumes the file, so
+    #     it runs here rather than on the pool where it could be dropped
+    overwatch = get_overwatch_injection()
+    if overwatch:
+        sections.append(f"[OVERWATCH]\n{overwatch}")
+
+    # 14. Frustration detection (side-effect: logs pattern, adds self-check)
+    if detect_frustration(prompt):
+        sections.append("[FRUSTRATION DETECTED] Pay extra attention to completion criteria.")
+
+    # 15. Sections dropped for missing the budget — keeps slow subsystems visible
+    if late:
+        sections.append(f"[LATE] {', '.join(late)} (>{deadline * 1000:.0f}ms, skipped)")
+    _last_report.update(late=late, ms=dict(timings))
+
+    return "\n".join(sections)
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+
+def enrich(prompt: str, deadline: float = SECTION_DEADLINE) -> str:
+    """Full per-prompt pass: session detection, buffer, enrichment.
+
+    Same sequence the hook has always run — callers only print the result.
+    """
+    if not prompt.strip():
+        return ""
+
+    # Detect session boundary — clear stale caches if >5min gap
+    is_new_session = detect_and_handle_new_session()
+
+    # Append to rolling buffer BEFORE building enrichment
+    # (so compound query includes this message)
+    append_to_buffer(prompt)
+
+    return build_enrichment(prompt, is_new_session=is_new_session, deadline=deadline)
+
+
+# A ChromaDB client only sees its own writes to the HNSW index, so when
+# another process (MCP server, Overwatch ingest) writes to a store, the
+# registry (memory.chroma) reopens its clients and these singletons, which
+# hold collection handles, are dropped.
+# (module, singleton globals to clear)
+_CHROMA_HOLDERS = [
+    ("memory.vector", ("_memory",)),
+    ("memory.conversations", ("_conversations",)),
+    ("memory.episodic", ("_episodic",)),
+    ("memory.knowledge.store", ("_instance",)),
+]
+
+_store_stamps: dict = {}
+_store_writes = threading.Lock()  # held while this process writes to a store
+
+
+def _stamp(path: Path) -> float:
+    """Latest mtime of a store (SQLite file plus WAL, if any)."""
+    latest = 0.0
+    for f in (path, path.with_name(path.name + "-wal")):
+        try:
+            latest = max(latest, f.stat().st_mtime)
+        except OSError:
+            pass
+    return latest
+
+
+def _current_stamps() -> dict:
+    from core.paths import get_paths
+
+    from memory.chroma import COLLECTIONS
+
+    paths = get_paths()
+    stores = {"chroma_db"} | {attr for attr, _ in COLLECTIONS.values()}
+    stamps = {
+        attr: _stamp(getattr(paths, attr) / "chroma.sqlite3")
+        for attr in sorted(stores)
+    }
+    stamps["udr_file"] = _stamp(paths.udr_file)
+    return stamps
+
+
+def mark_stores_fresh():
+    """Record current store stamps — call after our own writes (e.g. a reopen)."""
+    _store_stamps.update(_current_stamps())
+
+
+def refresh_stale_stores() -> list:
+    """Drop cached store handles that another process has written to since.
+
+    Cheap when nothing changed (a handful of stat calls). Returns the names
+    of the stores that were reset; the next lookup reopens them, while the
+    chromadb import and the embedding model stay warm.
+    """
+    import sys
+
+    if not _store_writes.acquire(blocking=False):
+        return []  # our own ingest is mid-write; its clients are current
+    try:
+        stamps = _current_stamps()
+    finally:
+        _store_writes.release()
+    changed = [
+        name for name, stamp in stamps.items()
+        if _store_stamps.get(name, stamp) != stamp
+    ]
+    _store_stamps.update(stamps)
+
+    if any(name != "udr_file" for name in changed):
+        try:
+            from memory.chroma import get_chroma
+            get_chroma().reopen()
+        except Exception:
+            pass
+        for module, names in _CHROMA_HOLDERS:
+            mod = sys.modules.get(module)
+            for name in names:
+                if mod is not None and hasattr(mod, name):
+                    setattr(mod, name, None)
+    if "udr_file" in changed:
+        try:
+            from daemon.udr import reset_registry
+            reset_registry()
+        except Exception:
+            pass
+    return changed
+
+
+def ingest_conversations_in_process():
+    """Background ingest for the resident server's IngestWorker.
+
+    Writes made through this process's own clients are visible to them, so
+    the new stamps are recorded rather than triggering a reopen — and no
+    reopen can pull the client out from under the ingest mid-write.
+    """
+    from memory.conversations import get_conversations
+
+    with _store_writes:
+        try:
+            return get_conversations().ingest_all()
+        finally:
+            mark_stores_fresh()
+
+
+def warm_up() -> list:
+    """Open every store enrichment reads from, without side effects.
+
+    Loads the embedding model and the ChromaDB clients/collections the
+    semantic sources use, so the first real prompt doesn't pay for them.
+    Returns the names of the stores that came up.
+    """
+    warmed = []
+
+    def _try(name, fn):
+        try:
+            if fn() is not None:
+                warmed.append(name)
+        except Exception:
+            pass
+
+    def _embeddings():
+        from memory.embeddings import embed_documents
+        return embed_documents(["warm up"])
+
+    def _memories():
+        from memory.vector import get_memory
+        return get_memory().collection
+
+    def _conversations():
+        from memory.conversations import get_conversations
+        return get_conversations().collection
+
+    def _milestones():
+        from memory.episodic import get_episodic
+        return get_episodic()
+
+    def _collection(module):
+        def load():
+            import importlib
+            return importlib.import_module(module)._get_collection()
+        return load
+
+    def _decisions():
+        from daemon.udr import get_registry
+        return get_registry()
+
+    _try("embeddings", _embeddings)
+    _try("memories", _memories)
+    _try("conversations", _conversations)
+    _try("milestones", _milestones)
+    _try("principles", _collection("daemon.principles"))
+    _try("reasoning", _collection("daemon.reasoning"))
+    _try("corrections", _collection("daemon.corrections"))
+    _try("workflows", _collection("daemon.workflows"))
+    _try("decisions", _decisions)
+    mark_stores_fresh()  # opening may create collections — not a foreign write
+    return warmed
@@ -8,12 +8,16 @@ Intention Resolver v2 — Claude Code UserPromptSubmit hook.
 Runs before every user prompt. Enriches context by injecting a compact
 system message from ALL cognitive subsystems. Full-spectrum awareness.
 
+This file is a thin stdlib-only client. The work happens in
+hooks/enrichment.py, served warm by hooks/enrich_server.py over a Unix
+socket; when no server is listening the hook imports hooks.enrichment and
+runs it in-process (the pre-server behaviour, cold imports and all).
+
 Design principles:
   - Zero LLM calls — only ChromaDB semantic search + file reads
   - Target output: 150-300 tokens (< 5% of context window)
   - Fail silent — any error = no injection, never block the prompt
-  - Detect frustration signals for CompletionPattern learning
-  - Rolling message buffer for compound queries (better recall quality)
+  - Server path: no imports beyond the stdlib, one socket round-trip
 
 Output format (only non-empty sections appear):
   [CONTEXT] project | episode type
@@ -35,825 +39,68 @@ Output format (only non-empty sections appear):
 import sys
 import json
 import os
-import re
-from datetime import datetime, timezone
+import socket
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
 # Bootstrap: add elara-core to path, set data dir
 # ---------------------------------------------------------------------------
-ELARA_ROOT = Path("/home/neboo/elara-core")
+ELARA_ROOT = Path(os.environ.get("ELARA_ROOT", "/home/neboo/elara-core"))
 sys.path.insert(0, str(ELARA_ROOT))
 os.environ.setdefault("ELARA_DATA_DIR", str(Path.home() / ".claude"))
 
-# Completion patterns file (accumulated frustration-derived learning)
-PATTERNS_FILE = Path.home() / ".claude" / "elara-completion-patterns.json"
-
-# Rolling message buffer — compound queries for better semantic recall
-BUFFER_FILE = Path("/tmp/elara-msg-buffer.jsonl")
-MAX_BUFFER_MESSAGES = 5
-
-# Recent injection cache — dedup to avoid repeating same memories
-INJECTION_CACHE_FILE = Path("/tmp/elara-injection-cache.json")
-MAX_INJECTION_CACHE = 10
-
-# Session boundary detection — clear caches on new session
-SESSION_MARKER_FILE = Path("/tmp/elara-session-marker")
-SESSION_GAP_SECONDS = 300  # 5 min gap = new session
+# Enrichment server socket (core.paths: enrich_socket) — resolved here
+# without importing core so the fast path stays stdlib-only
+ENRICH_SOCKET = Path(os.environ.get(
+    "ELARA_ENRICH_SOCKET",
+    Path(os.environ["ELARA_DATA_DIR"]).expanduser() / "elara-enrich.sock",
+))
+CONNECT_TIMEOUT = 0.1   # seconds — a live server accepts immediately
+REPLY_TIMEOUT = 10.0    # seconds — boot enrichment + store reopen, worst case
 
-# Frustration signal regexes (compiled once)
-FRUSTRATION_SIGNALS = [
-    re.compile(r"\bbut you didn'?t\b", re.IGNORECASE),
-    re.compile(r"\byou forgot\b", re.IGNORECASE),
-    re.compile(r"\bi told you to\b", re.IGNORECASE),
-    re.compile(r"\bwhy didn'?t you\b", re.IGNORECASE),
-    re.compile(r"\byou missed\b", re.IGNORECASE),
-    re.compile(r"\byou were supposed to\b", re.IGNORECASE),
-    re.compile(r"\bthat'?s not what i asked\b", re.IGNORECASE),
-    re.compile(r"\byou skipped\b", re.IGNORECASE),
-    re.compile(r"\byou left out\b", re.IGNORECASE),
-    re.compile(r"\byou ignored\b", re.IGNORECASE),
-]
 
+def request_enrichment(prompt: str):
+    """Ask the resident server to enrich this prompt.
 
-# ---------------------------------------------------------------------------
-# Rolling message buffer — builds compound queries for better recall
-# ---------------------------------------------------------------------------
-
-def detect_and_handle_new_session():
-    """Clear caches if this looks like a new session (>5min gap).
-
-    Returns True if this is the first message of a new session.
-    Also runs incremental conversation ingest on new sessions so
-    semantic recall can see all prior sessions from today.
+    Returns the enrichment text, or None if no server is listening (the
+    caller then runs the in-process path). Once the server has the prompt
+    any failure returns "" — retrying in-process could double-apply side
+    effects such as consuming the Overwatch injection.
     """
-    is_new = False
+    if not ENRICH_SOCKET.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        now = datetime.now(timezone.utc).timestamp()
-        if SESSION_MARKER_FILE.exists():
-            last_ts = float(SESSION_MARKER_FILE.read_text().strip())
-            gap = now - last_ts
-            if gap > SESSION_GAP_SECONDS:
-                # New session — clear stale caches
-                is_new = True
-                if INJECTION_CACHE_FILE.exists():
-                    INJECTION_CACHE_FILE.unlink()
-                if BUFFER_FILE.exists():
-                    BUFFER_FILE.unlink()
-        else:
-            is_new = True  # No marker = first ever message
-        SESSION_MARKER_FILE.write_text(str(now))
-    except Exception:
-        pass
-
-    # Ingest new conversations on session boundary so recall sees today's work
-    if is_new:
+        sock.settimeout(CONNECT_TIMEOUT)
         try:
-            from memory.conversations import ingest_conversations
-            ingest_conversations()
-        except Exception:
-            pass  # Never block on ingest failure
-
-    return is_new
-
-
-def mood_description_from_values(valence: float, energy: float, openness: float) -> str:
-    """Generate a compact mood description from raw values.
-
-    Valence: -1 (negative) to +1 (positive)
-    Energy: 0 (low) to 1 (high)
-    Openness: 0 (guarded) to 1 (open/vulnerable)
-    """
-    # Valence bucket
-    if valence > 0.5:
-        v_word = "warm"
-    elif valence > 0.2:
-        v_word = "steady"
-    elif valence > -0.2:
-        v_word = "neutral"
-    elif valence > -0.5:
-        v_word = "flat"
-    else:
-        v_word = "low"
-
-    # Energy bucket
-    if energy > 0.7:
-        e_word = "energized"
-    elif energy > 0.4:
-        e_word = "calm"
-    else:
-        e_word = "tired"
-
-    # Openness bucket
-    if openness > 0.7:
-        o_word = "open"
-    elif openness > 0.4:
-        o_word = "present"
-    else:
-        o_word = "guarded"
-
-    return f"{v_word}, {e_word}, {o_word}"
-
-
-def append_to_buffer(prompt: str):
-    """Add this message to the rolling buffer."""
-    try:
-        lines = []
-        if BUFFER_FILE.exists():
-            lines = [l for l in BUFFER_FILE.read_text().strip().split("\n") if l]
-        lines.append(json.dumps({
-            "t": datetime.now(timezone.utc).isoformat(),
-            "p": prompt[:200],
-        }))
-        lines = lines[-MAX_BUFFER_MESSAGES:]
-        BUFFER_FILE.write_text("\n".join(lines) + "\n")
-    except Exception:
-        pass
-
-
-def get_compound_query(prompt: str) -> str:
-    """Build a richer query from recent messages + current context.
-
-    Instead of querying ChromaDB with just the current message (which may
-    be vague like "do it" or "hello"), we concatenate recent messages and
-    the current working context for much better semantic matching.
-    """
-    parts = []
-
-    # Prepend current context topic (anchors the search)
-    context = get_current_context()
-    if context:
-        parts.append(context)
-
-    # Add last few messages from buffer
-    try:
-        if BUFFER_FILE.exists():
-            for line in BUFFER_FILE.read_text().strip().split("\n")[-3:]:
-                if line:
-                    entry = json.loads(line)
-                    parts.append(entry.get("p", ""))
-    except Exception:
-        pass
-
-    # Always include current prompt
-    parts.append(prompt[:200])
-
-    return " ".join(parts)
-
-
-# ---------------------------------------------------------------------------
-# Semantic memory recall — the hippocampus
-# ---------------------------------------------------------------------------
-
-def get_relevant_memories(query: str) -> list:
-    """Semantic recall from the memories collection.
-
-    Returns top memories above relevance threshold, truncated for
-    compact injection. This is the core "reflexive memory" feature.
-    """
-    try:
-        from memory.vector import recall
-        results = recall(query, n_results=3, mood_weight=0.1)
-        # Filter by relevance — inject matches above threshold
-        # Note: cosine similarity in our corpus peaks around 0.40-0.45,
-        # so 0.30 captures meaningful matches without noise
-        return [
-            m for m in results
-            if m.get("relevance", 0) > 0.30
-        ]
-    except Exception:
-        return []
-
-
-def get_injection_cache() -> set:
-    """Load recently injected memory IDs to avoid repeating."""
-    try:
-        if INJECTION_CACHE_FILE.exists():
-            data = json.loads(INJECTION_CACHE_FILE.read_text())
-            return set(data.get("ids", []))
-    except Exception:
-        pass
-    return set()
-
-
-def update_injection_cache(memory_ids: list):
-    """Track which memories were just injected."""
-    try:
-        existing = list(get_injection_cache())
-        combined = existing + memory_ids
-        # Keep only last N to prevent unbounded growth
-        combined = combined[-MAX_INJECTION_CACHE:]
-        INJECTION_CACHE_FILE.write_text(json.dumps({"ids": combined}))
-    except Exception:
-        pass
-
-
-def format_memory_for_injection(mem: dict) -> str:
-    """Format a memory compactly for context injection (~30-80 chars)."""
-    content = mem.get("content", "")
-    # Collapse newlines and extra whitespace
-    content = " ".join(content.split())
-    # Strip common prefixes
-    for prefix in ("[Feeling: ", "[Decision: "):
-        if content.startswith(prefix):
-            content = content[len(prefix):]
-    # Truncate to keep injection compact
-    if len(content) > 80:
-        content = content[:77] + "..."
-    return content
-
-
-# ---------------------------------------------------------------------------
-# Frustration detection
-# ---------------------------------------------------------------------------
-
-def detect_frustration(prompt: str) -> bool:
-    """Check if prompt contains frustration signals and log if found."""
-    for pattern in FRUSTRATION_SIGNALS:
-        match = pattern.search(prompt)
-        if match:
-            _log_frustration(prompt, match.group())
-            return True
-    return False
-
-
-def _log_frustration(prompt: str, signal: str):
-    """Append frustration event to completion patterns file."""
-    try:
-        if PATTERNS_FILE.exists():
-            patterns = json.loads(PATTERNS_FILE.read_text())
-        else:
-            patterns = []
-
-        # Truncate prompt for storage (first 200 chars)
-        snippet = prompt[:200].strip()
-
-        patterns.append({
-            "signal": signal,
-            "prompt_snippet": snippet,
-            "detected": datetime.now(timezone.utc).isoformat(),
-            "resolved": False,
-        })
-
-        # Keep last 50 patterns max
-        patterns = patterns[-50:]
-        PATTERNS_FILE.write_text(json.dumps(patterns, indent=2))
-    except Exception:
-        pass  # Never fail on logging
-
-
-def get_overwatch_injection() -> str:
-    """Read and consume Overwatch injection file (replaces overwatch-inject.sh)."""
-    inject_file = Path.home() / ".claude" / "elara-overwatch-inject.md"
-    if inject_file.exists():
+            sock.connect(str(ENRICH_SOCKET))
+        except OSError:
+            return None
+        sock.settimeout(REPLY_TIMEOUT)
         try:
-            content = inject_file.read_text().strip()
-            inject_file.unlink()
-            return content
-        except Exception:
-            pass
-    return ""
-
-
-def get_corrections(prompt: str) -> list:
-    """Find corrections relevant to this prompt."""
-    try:
-        from daemon.corrections import check_corrections
-        matches = check_corrections(prompt, n_results=2)
-        return [
-            c for c in matches
-            if not c.get("_error") and c.get("relevance", 0) > 0.35
-        ]
-    except Exception:
-        return []
-
-
-def get_decision_checks(prompt: str) -> list:
-    """Check UDR for rejected entities mentioned in this prompt.
-    Zero LLM calls — keyword scan against entity set. Fail-silent."""
-    try:
-        from daemon.udr import get_registry
-        reg = get_registry()
-        return reg.check_entities(prompt)
-    except Exception:
-        return []
-
-
-def get_workflows(prompt: str) -> list:
-    """Find workflow patterns matching this prompt."""
-    try:
-        from daemon.workflows import check_workflows
-        return check_workflows(prompt, n=1)
-    except Exception:
-        return []
-
-
-def get_active_goals() -> list:
-    """Get active goals (max 5), sorted by build_order."""
-    try:
-        from daemon.goals import list_goals
-        goals = list_goals(status="active")[:5]
-        return sorted(goals, key=lambda g: g.get("build_order") or 999)
-    except Exception:
-        return []
-
-
-def get_handoff_items(max_carried: int = 14) -> list:
-    """Get carry-forward items from last handoff.
-
-    Items carried for more than max_carried sessions are suppressed
-    from automatic injection (still available for on-demand recall).
-    This prevents 'Gmail OAuth setup' from appearing for the 45th time.
-    """
-    try:
-        from daemon.handoff import load_handoff
-        handoff = load_handoff()
-        if not handoff:
-            return []
-
-        items = []
-        for key in ("unfinished", "promises", "reminders"):
-            for item in handoff.get(key, [])[:2]:
-                text = item.get("text", "").strip()
-                carried = item.get("carried", 0)
-                if text and carried <= max_carried:
-                    items.append(text)
-        return items[:3]
-    except Exception:
-        return []
-
-
-def get_handoff_summary() -> str:
-    """Build a detailed last-session summary from the handoff.
-
-    Injected as [LAST-SESSION] on new sessions so the model knows
-    what just happened. Includes session summary, files changed,
-    commits, mood, and top plans.
-    """
-    try:
-        from daemon.handoff import load_handoff
-        handoff = load_handoff()
-        if not handoff:
-            return ""
-
-        session_num = handoff.get("session_number", "?")
-        mood = handoff.get("mood_and_mode", "").strip()
-        ts = handoff.get("timestamp", "")[:16]
-
-        lines = [f"Session {session_num} ({ts})"]
-
-        # What we actually did (the new mandatory field)
-        summary = handoff.get("session_summary", [])
-        if summary:
-            lines.append("Done: " + " | ".join(s[:80] for s in summary[:5]))
-
-        # Key files changed
-        files = handoff.get("files_changed", [])
-        if files:
-            lines.append("Files: " + ", ".join(f[:50] for f in files[:5]))
-
-        # Commits from the session
-        commits = handoff.get("commits", [])
-        if commits:
-            commit_strs = [
-                f"{c.get('hash', '?')[:7]} ({c.get('repo', '?')})"
-                for c in commits[:4]
-            ]
-            lines.append("Commits: " + ", ".join(commit_strs))
-
-        # Mood/energy context
-        if mood:
-            lines.append(mood[:120])
-
-        # Top 3 next_plans (what was planned next)
-        plans = handoff.get("next_plans", [])
-        plan_texts = [p.get("text", "")[:70] for p in plans[:3] if p.get("text")]
-        if plan_texts:
-            lines.append("Next: " + " | ".join(plan_texts))
-
-        return " — ".join(lines)
-    except Exception:
-        return ""
-
-
-def get_current_context() -> str:
-    """Get current working context (project + episode type).
-
-    Skips stale context (>24h old) to avoid injecting irrelevant frames.
-    """
-    try:
-        ctx_file = Path.home() / ".claude" / "elara-context.json"
-        if ctx_file.exists():
-            ctx = json.loads(ctx_file.read_text())
-            topic = ctx.get("topic", "")
-            if not topic:
-                return ""
-            # Check staleness — skip if >24h old
-            updated_ts = ctx.get("updated_ts", 0)
-            if updated_ts:
-                age_hours = (datetime.now(timezone.utc).timestamp() - updated_ts) / 3600
-                if age_hours > 24:
-                    return ""
-            return topic
-    except Exception:
-        pass
-    return ""
-
-
-# ---------------------------------------------------------------------------
-# NEW: Conversation recall — past dialogue about this topic
-# ---------------------------------------------------------------------------
-
-def get_relevant_conversations(query: str) -> list:
-    """Search past conversation exchanges for relevant context.
-
-    Fetches 8 results to ensure enough survive relevance filtering.
-    Today's exchanges get a recency boost from the scoring model,
-    so they naturally rise to the top.
-    """
-    try:
-        from memory.conversations import recall_conversation
-        results = recall_conversation(query, n_results=8)
-        return [c for c in results if c.get("relevance", 0) > 0.30]
-    except Exception:
-        return []
-
-
-def get_recent_exchanges(n: int = 5) -> list:
-    """Get the most recent conversation exchanges by pure recency.
-
-    Used on new session boot instead of semantic search (which fails
-    on vague greetings like 'hello'). Returns the last N exchanges
-    from the most recent session(s), giving real context about what
-    we actually did.
-    """
-    try:
-        from memory.conversations import get_conversations
-        conv = get_conversations()
-        if not conv.collection:
-            return []
-        # Use a maximally generic query with near-pure recency weighting
-        # so results sort by time, not semantic match
-        results = conv.recall(
-            "session work build implement",
-            n_results=n,
-            recency_weight=0.95,
-        )
-        return results
-    except Exception:
-        return []
-
-
-def get_next_action() -> str:
-    """Get the first incomplete item from handoff next_plans.
-
-    Returns a concrete 'what to do next' instead of abstract goals.
-    """
-    try:
-        from daemon.handoff import load_handoff
-        handoff = load_handoff()
-        if not handoff:
+            sock.sendall(json.dumps({"prompt": prompt}).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+            reply = json.loads(b"".join(chunks) or b"{}")
+        except (OSError, ValueError):
             return ""
-        plans = handoff.get("next_plans", [])
-        for p in plans:
-            text = p.get("text", "").strip()
-            if text:
-                return text[:100]
-    except Exception:
-        pass
-    return ""
-
-
-def format_conversation_for_injection(conv: dict) -> str:
-    """Format a conversation exchange compactly."""
-    date = conv.get("date", "?")[:10]
-    # Try user_text_preview first, fall back to content
-    preview = conv.get("user_text_preview", "")
-    if not preview:
-        content = conv.get("content", "")
-        # Content format is "User: ...\n\nElara: ..."
-        if content.startswith("User: "):
-            preview = content[6:].split("\n")[0]
-    preview = " ".join(preview.split())[:70]
-    if preview:
-        return f"{date}: \"{preview}\""
-    return f"{date}: (exchange)"
-
-
-# ---------------------------------------------------------------------------
-# NEW: Principles — crystallized rules from confirmed insights
-# ---------------------------------------------------------------------------
-
-def get_relevant_principles(query: str) -> list:
-    """Search principles by semantic similarity."""
-    try:
-        from daemon.principles import search_principles
-        results = search_principles(query, n=3)
-        return [p for p in results if p.get("relevance", 0) > 0.30]
-    except Exception:
-        return []
-
-
-# ---------------------------------------------------------------------------
-# NEW: Reasoning trails — similar problems already solved
-# ---------------------------------------------------------------------------
-
-def get_relevant_reasoning(query: str) -> list:
-    """Search past reasoning trails for similar problems."""
-    try:
-        from daemon.reasoning import search_trails
-        results = search_trails(query, n=2)
-        return [r for r in results if r.get("relevance", 0) > 0.30]
-    except Exception:
-        return []
-
-
-# ---------------------------------------------------------------------------
-# NEW: Milestones — past decisions and breakthroughs
-# ---------------------------------------------------------------------------
-
-def get_relevant_milestones(query: str) -> list:
-    """Search episode milestones by semantic similarity."""
-    try:
-        from memory.episodic import get_episodic
-        episodic = get_episodic()
-        results = episodic.search_milestones(query, n_results=3)
-        return [m for m in results if m.get("relevance", 0) > 0.30]
-    except Exception:
-        return []
-
-
-# ---------------------------------------------------------------------------
-# NEW: Mood — current emotional state (cached, ~5ms)
-# ---------------------------------------------------------------------------
-
-def get_current_mood() -> dict:
-    """Get current mood state."""
-    try:
-        from daemon.mood import get_mood
-        return get_mood()
-    except Exception:
-        return {}
-
-
-# ---------------------------------------------------------------------------
-# NEW: Intention — current growth goal (~10ms)
-# ---------------------------------------------------------------------------
-
-def get_current_intention() -> str:
-    """Get current growth intention.
-
-    Skips stale intentions (>24h old) from proactive injection.
-    Data stays in file + memories for on-demand recall via semantic search.
-    """
-    try:
-        from daemon.awareness.intention import get_intention
-        intention = get_intention()
-        if not intention:
+        if not reply.get("ok"):
             return ""
-        # Check staleness — only inject if fresh (<24h)
-        set_at = intention.get("set_at", "")
-        if set_at:
-            try:
-                set_dt = datetime.fromisoformat(set_at)
-                if set_dt.tzinfo is None:
-                    set_dt = set_dt.replace(tzinfo=timezone.utc)
-                age_hours = (datetime.now(timezone.utc) - set_dt).total_seconds() / 3600
-                if age_hours > 24:
-                    return ""
-            except (ValueError, TypeError):
-                pass
-        return intention.get("what", "")
-    except Exception:
-        pass
-    return ""
-
-
-def build_boot_enrichment(prompt: str) -> str:
-    """Build enrichment for the FIRST message of a new session.
-
-    Boot is different from normal prompts:
-    - Skip semantic search (greeting queries like 'hello' return garbage)
-    - Use chronological recall (what we actually did recently)
-    - Show next concrete action instead of abstract goals
-    - Suppress stale carry-forward items (carried >14 days)
-    - Keep it focused: last session + recent work + next step + mood
-    """
-    sections = []
-
-    # 1. Boot header + last-session summary from handoff
-    handoff_summary = get_handoff_summary()
-    boot_lines = [
-        "[BOOT] New session. Hook data below is your real-time awareness.",
-        "Greet naturally based on what we did last session. Never list goals or carry-forward.",
-    ]
-    if handoff_summary:
-        boot_lines.append(f"[LAST-SESSION] {handoff_summary}")
-    sections.append("\n".join(boot_lines))
-
-    # 2. Recent work — chronological, not semantic (~100ms)
-    #    This is the key fix: instead of searching 'hello', get what
-    #    we actually did in the last session(s) by pure recency
-    recent = get_recent_exchanges(n=5)
-    if recent:
-        recent_lines = []
-        for r in recent:
-            preview = r.get("user_text_preview", "")
-            if not preview:
-                content = r.get("content", "")
-                if content.startswith("User: "):
-                    preview = content[6:].split("\n")[0]
-            preview = " ".join(preview.split())[:70]
-            date = r.get("date", "?")[:10]
-            if preview:
-                recent_lines.append(f"{date}: \"{preview}\"")
-        if recent_lines:
-            sections.append("[RECENT-WORK] " + " | ".join(recent_lines))
-
-    # 3. Mood — always useful
-    mood = get_current_mood()
-    if mood:
-        v = mood.get("valence", 0)
-        e = mood.get("energy", 0)
-        o = mood.get("openness", 0)
-        desc = mood.get("description", "") or mood_description_from_values(v, e, o)
-        sections.append(f"[MOOD] {desc} (v:{v:.1f} e:{e:.1f} o:{o:.1f})")
-
-    # 4. Next concrete action (instead of abstract goals)
-    next_action = get_next_action()
-    if next_action:
-        sections.append(f"[NEXT] {next_action}")
-
-    # 5. Carry-forward — only fresh items (carried <= 14)
-    items = get_handoff_items(max_carried=14)
-    if items:
-        sections.append("[CARRY-FORWARD] " + " | ".join(items))
-
-    # 6. Overwatch (always check — daemon may have queued alerts)
-    overwatch = get_overwatch_injection()
-    if overwatch:
-        sections.append(f"[OVERWATCH]\n{overwatch}")
+        return reply.get("enrichment", "")
+    finally:
+        sock.close()
 
-    # 7. Frustration detection (unlikely on boot, but check anyway)
-    if detect_frustration(prompt):
-        sections.append("[FRUSTRATION DETECTED] Pay extra attention to completion criteria.")
 
-    return "\n".join(sections)
-
-
-def build_enrichment(prompt: str, is_new_session: bool = False) -> str:
-    """Build the compact enrichment output from all sources.
-
-    On new sessions: delegates to build_boot_enrichment() which uses
-    chronological recall and next-action instead of semantic search
-    and abstract goals.
-
-    On normal prompts: full-spectrum awareness with semantic search
-    against the actual prompt content.
-    """
-    # Boot path — completely different strategy
-    if is_new_session:
-        return build_boot_enrichment(prompt)
-
-    # Normal prompt path — semantic search makes sense here
-    sections = []
-
-    # 0. Build compound query from rolling buffer for better recall
-    compound_query = get_compound_query(prompt)
-
-    # 1. Context (always if available — sets the frame)
-    context = get_current_context()
-    if context:
-        sections.append(f"[CONTEXT] {context}")
-
-    # 2. Mood — current emotional state (~5ms, cached)
-    mood = get_current_mood()
-    if mood:
-        v = mood.get("valence", 0)
-        e = mood.get("energy", 0)
-        o = mood.get("openness", 0)
-        desc = mood.get("description", "") or mood_description_from_values(v, e, o)
-        sections.append(f"[MOOD] {desc} (v:{v:.1f} e:{e:.1f} o:{o:.1f})")
-
-    # 3. Intention — current growth goal (~10ms)
-    intention = get_current_intention()
-    if intention:
-        sections.append(f"[INTENTION] {intention[:80]}")
-
-    # 4. Semantic memory recall — the hippocampus
-    memories = get_relevant_memories(compound_query)
-    if memories:
-        cache = get_injection_cache()
-        fresh_memories = [
-            m for m in memories
-            if m.get("memory_id", "") not in cache
-        ]
-        if fresh_memories:
-            mem_lines = [format_memory_for_injection(m) for m in fresh_memories[:3]]
-            sections.append("[RECALL] " + " | ".join(mem_lines))
-            update_injection_cache([m.get("memory_id", "") for m in fresh_memories[:3]])
-
-    # 5. Conversation recall — past dialogue about this topic (~100ms)
-    #    Show up to 5 exchanges for richer same-day context
-    conversations = get_relevant_conversations(compound_query)
-    if conversations:
-        conv_lines = [format_conversation_for_injection(c) for c in conversations[:5]]
-        sections.append("[CONV-RECALL] " + " | ".join(conv_lines))
-
-    # 6. Principles — crystallized rules from confirmed insights (~100ms)
-    principles = get_relevant_principles(compound_query)
-    if principles:
-        princ_lines = []
-        for p in principles[:2]:
-            stmt = p.get("statement", "")
-            stmt = " ".join(stmt.split())[:80]
-            conf = p.get("confidence", 0)
-            princ_lines.append(f"{stmt} (conf:{conf:.1f})")
-        sections.append("[PRINCIPLES] " + " | ".join(princ_lines))
-
-    # 7. Reasoning trails — similar problems already solved (~100ms)
-    trails = get_relevant_reasoning(compound_query)
-    if trails:
-        trail_lines = []
-        for t in trails[:2]:
-            context_str = t.get("context", "")[:60]
-            status = t.get("status", "open")
-            solution = t.get("solution", "")[:40]
-            if solution:
-                trail_lines.append(f"{context_str} → solved: {solution}")
-            else:
-                trail_lines.append(f"{context_str} ({status})")
-        sections.append("[REASONING] " + " | ".join(trail_lines))
-
-    # 8. Milestones — past decisions and breakthroughs (~100ms)
-    milestones = get_relevant_milestones(compound_query)
-    if milestones:
-        ms_lines = []
-        for m in milestones[:2]:
-            event = m.get("event", "")
-            event = " ".join(event.split())[:60]
-            note_type = m.get("note_type", "milestone")
-            ms_lines.append(f"[{note_type}] {event}")
-        sections.append("[MILESTONES] " + " | ".join(ms_lines))
-
-    # 9. Active goals (with decision context + build order)
-    goals = get_active_goals()
-    if goals:
-        lines = []
-        for i, g in enumerate(goals, 1):
-            order = g.get("build_order") or i
-            decision = g.get("decision") or g.get("notes", "")
-            if decision:
-                lines.append(f"  {order}. {g['title']} — {decision[:60]}")
-            else:
-                lines.append(f"  {order}. {g['title']}")
-        sections.append("[GOALS] Active build order:\n" + "\n".join(lines))
-
-    # 10. Corrections (self-check — past mistakes to avoid)
-    corrections = get_corrections(compound_query)
-    if corrections:
-        lines = []
-        for c in corrections[:2]:
-            mistake = c.get("mistake", "")[:60]
-            fix = c.get("correction", "")[:60]
-            lines.append(f"  {mistake} -> {fix}")
-        sections.append("[SELF-CHECK]\n" + "\n".join(lines))
-
-    # 10b. Decision checks (UDR — rejected entities in prompt)
-    decision_hits = get_decision_checks(compound_query)
-    if decision_hits:
-        lines = []
-        for d in decision_hits[:2]:
-            lines.append(
-                f"  {d.get('domain','')}:{d.get('entity','')} "
-                f"[{d.get('verdict','')}] — {d.get('reason','')[:60]}"
-            )
-        sections.append("[DECISION-CHECK] Previously decided:\n" + "\n".join(lines))
-
-    # 11. Matching workflow
-    workflows = get_workflows(compound_query)
-    if workflows:
-        wf = workflows[0]
-        steps = [s.get("action", "")[:40] for s in wf.get("steps", [])]
-        if steps:
-            chain = " -> ".join(steps)
-            sections.append(f"[WORKFLOW] {wf.get('name', 'unnamed')}: {chain}")
-
-    # 12. Carry-forward from handoff (with decay filter)
-    items = get_handoff_items()
-    if items:
-        sections.append("[CARRY-FORWARD] " + " | ".join(items))
-
-    # 13. Overwatch daemon injection (if pending)
-    overwatch = get_overwatch_injection()
-    if overwatch:
-        sections.append(f"[OVERWATCH]\n{overwatch}")
-
-    # 14. Frustration detection (side-effect: logs pattern, adds self-check)
-    if detect_frustration(prompt):
-        sections.append("[FRUSTRATION DETECTED] Pay extra attention to completion criteria.")
-
-    return "\n".join(sections)
+def enrich_in_process(prompt: str) -> str:
+    """Fallback — build the enrichment in this process (cold imports)."""
+    from hooks.enrichment import COLD_SECTION_DEADLINE, enrich
+    return enrich(prompt, deadline=COLD_SECTION_DEADLINE)
 
 
 def main():
@@ -869,14 +116,9 @@ def main():
         if not prompt.strip():
             sys.exit(0)
 
-        # Detect session boundary — clear stale caches if >5min gap
-        is_new_session = detect_and_handle_new_session()
-
-        # Append to rolling buffer BEFORE building enrichment
-        # (so compound query includes this message)
-        append_to_buffer(prompt)
-
-        enrichment = build_enrichment(prompt, is_new_session=is_new_session)
+        enrichment = request_enrichment(prompt)
+        if enrichment is None:
+            enrichment = enrich_in_process(prompt)
 
         if enrichment:
             print(enrichment)
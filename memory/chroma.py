@@ -0,0 +1,279 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+ChromaDB client registry — one client, one store, every collection.
+
+Problem: fourteen collections lived in thirteen directories, each opened
+by its own chromadb.PersistentClient. A process that touched them all
+carried a dozen SQLite connections and segment managers, and every
+collection built its own default embedding function.
+
+Solution: modules ask the registry for a collection by name.
+  - Consolidated layout — one PersistentClient on paths.chroma_db serves
+    every collection in COLLECTIONS. New data dirs start out this way.
+  - Legacy layout — data dirs that still have per-module stores keep
+    working: one client per legacy directory, shared by everything in
+    the process, until `elara chroma migrate` copies them over.
+  - Every collection gets memory.embeddings.shared_embedding_fn(), so the
+    embedding model is loaded once per process.
+
+Usage:
+    from memory.chroma import get_chroma
+    coll = get_chroma().collection("elara_principles")
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import chromadb
+    from chromadb.config import Settings
+    CHROMA_AVAILABLE = True
+except ImportError:
+    CHROMA_AVAILABLE = False
+
+from core.paths import ElaraPaths, get_paths
+
+logger = logging.getLogger("elara.memory.chroma")
+
+_COSINE = {"hnsw:space": "cosine"}
+
+# name -> (legacy store: ElaraPaths attribute, collection metadata)
+COLLECTIONS: Dict[str, tuple] = {
+    "elara_memories": ("memory_db", {
+        "description": "Elara's long-term semantic memory",
+        "hnsw:space": "cosine",
+    }),
+    "elara_conversations_v2": ("conversations_db", {
+        "description": "Elara's conversation memory — cosine similarity",
+        "hnsw:space": "cosine",
+    }),
+    "elara_milestones": ("episodes_db", {
+        "description": "Searchable milestones from episodes",
+        "hnsw:space": "cosine",
+    }),
+    "elara_corrections": ("corrections_db", {
+        "description": "Elara's corrections — semantic mistake matching",
+        "hnsw:space": "cosine",
+    }),
+    "elara_principles": ("principles_db", _COSINE),
+    "elara_reasoning": ("reasoning_db", _COSINE),
+    "elara_workflows": ("workflows_db", _COSINE),
+    "elara_models": ("models_db", _COSINE),
+    "elara_predictions": ("predictions_db", _COSINE),
+    "elara_synthesis": ("synthesis_db", _COSINE),
+    "elara_synthesis_seeds": ("synthesis_db", _COSINE),
+    "elara_briefing": ("briefing_db", _COSINE),
+    "elara_gmail": ("gmail_db", _COSINE),
+    "elara_knowledge": ("knowledge_vector_db", _COSINE),
+}
+
+LAYOUT_MARKER = "elara-layout.json"
+MIGRATE_BATCH = 500
+
+
+def _settings():
+    return Settings(anonymized_telemetry=False)
+
+
+def _write_marker(store: Path, migrated: List[str]):
+    store.mkdir(parents=True, exist_ok=True)
+    (store / LAYOUT_MARKER).write_text(json.dumps({
+        "layout": "consolidated",
+        "created": datetime.now().isoformat(),
+        "migrated": migrated,
+    }, indent=2))
+
+
+def legacy_stores(paths: Optional[ElaraPaths] = None) -> Dict[str, Path]:
+    """Per-module store directories that hold data (attr -> path)."""
+    paths = paths or get_paths()
+    found = {}
+    for attr, _ in COLLECTIONS.values():
+        path = getattr(paths, attr)
+        if (path / "chroma.sqlite3").exists():
+            found[attr] = path
+    return found
+
+
+class ChromaRegistry:
+    """Process-wide cache of ChromaDB clients and collections."""
+
+    def __init__(self, paths: Optional[ElaraPaths] = None):
+        self.paths = paths or get_paths()
+        self._lock = threading.RLock()
+        self._clients: Dict[str, Any] = {}
+        self._collections: Dict[str, Any] = {}
+        self._consolidated: Optional[bool] = None
+
+    @property
+    def consolidated(self) -> bool:
+        """True if every collection lives in paths.chroma_db."""
+        with self._lock:
+            if self._consolidated is None:
+                self._consolidated = self._detect_layout()
+            return self._consolidated
+
+    def _detect_layout(self) -> bool:
+        store = self.paths.chroma_db
+        if (store / LAYOUT_MARKER).exists():
+            return True
+        legacy = legacy_stores(self.paths)
+        if legacy:
+            logger.info("Legacy ChromaDB layout (%d stores) — run `elara chroma migrate` "
+                        "to consolidate", len(legacy))
+            return False
+        _write_marker(store, migrated=[])  # fresh data dir
+        return True
+
+    def path_for(self, name: str) -> Path:
+        if self.consolidated:
+            return self.paths.chroma_db
+        return getattr(self.paths, COLLECTIONS[name][0])
+
+    def client(self, path: Optional[Path] = None):
+        """The cached PersistentClient for a store (default: the shared one)."""
+        path = Path(path or self.paths.chroma_db)
+        with self._lock:
+            client = self._clients.get(str(path))
+            if client is None:
+                if not CHROMA_AVAILABLE:
+                    raise RuntimeError("chromadb is not installed")
+                path.mkdir(parents=True, exist_ok=True)
+                client = chromadb.PersistentClient(path=str(path), settings=_settings())
+                self._clients[str(path)] = client
+            return client
+
+    def collection(self, name: str):
+        """Get or create a registered collection. Raises on failure."""
+        with self._lock:
+            coll = self._collections.get(name)
+            if coll is None:
+                from memory.embeddings import shared_embedding_fn
+
+                kwargs = {}
+                fn = shared_embedding_fn()
+                if fn is not None:
+                    kwargs["embedding_function"] = fn
+                coll = self.client(self.path_for(name)).get_or_create_collection(
+                    name=name, metadata=COLLECTIONS[name][1], **kwargs,
+                )
+                self._collections[name] = coll
+            return coll
+
+    def store_paths(self) -> List[Path]:
+        """Directories of the clients opened so far."""
+        with self._lock:
+            return [Path(p) for p in self._clients]
+
+    def reopen(self):
+        """Drop every client and collection; the next lookup reopens them.
+
+        A client only sees its own writes to the HNSW index. Clients for a
+        path share one cached chromadb System, so clearing that cache is
+        the only way to pick up another process's writes.
+        """
+        with self._lock:
+            self._clients.clear()
+            self._collections.clear()
+            if CHROMA_AVAILABLE:
+                try:
+                    from chromadb.api.client import SharedSystemClient
+                    SharedSystemClient.clear_system_cache()
+                except Exception as e:
+                    logger.debug("Could not clear chromadb system cache: %s", e)
+
+
+# ============================================================================
+# Migration (offline)
+# ============================================================================
+
+def migrate_to_shared_store(paths: Optional[ElaraPaths] = None, dry_run: bool = False,
+                            batch_size: int = MIGRATE_BATCH) -> Dict[str, Any]:
+    """Copy every registered collection from the per-module stores into paths.chroma_db.
+
+    Run with Overwatch, the enrichment server and the MCP server stopped.
+    Ids, documents, metadata and embeddings are copied as they are (nothing
+    is re-embedded) and writes are upserts, so re-running is safe. Legacy
+    directories are left in place as a backup.
+    """
+    paths = paths or get_paths()
+    if not CHROMA_AVAILABLE:
+        raise RuntimeError("chromadb is not installed")
+
+    store = paths.chroma_db
+    report: Dict[str, Any] = {"store": str(store), "dry_run": dry_run, "collections": {}}
+    started = time.monotonic()
+    target = None if dry_run else chromadb.PersistentClient(path=str(store), settings=_settings())
+    sources: Dict[str, Any] = {}
+
+    for name, (attr, metadata) in COLLECTIONS.items():
+        src_path = getattr(paths, attr)
+        if not (src_path / "chroma.sqlite3").exists():
+            continue
+        if attr not in sources:
+            sources[attr] = chromadb.PersistentClient(path=str(src_path), settings=_settings())
+        try:
+            src = sources[attr].get_collection(name)
+        except Exception:
+            continue  # store exists but never held this collection
+
+        total = src.count()
+        entry = {"from": str(src_path), "count": total, "copied": 0}
+        report["collections"][name] = entry
+        if dry_run:
+            continue
+
+        dst = target.get_or_create_collection(name=name, metadata=metadata)
+        for offset in range(0, total, batch_size):
+            page = src.get(limit=batch_size, offset=offset,
+                           include=["documents", "metadatas", "embeddings"])
+            if not page["ids"]:
+                break
+            dst.upsert(
+                ids=page["ids"],
+                documents=page["documents"],
+                metadatas=[m or None for m in page["metadatas"]],
+                embeddings=page["embeddings"],
+            )
+            entry["copied"] += len(page["ids"])
+        entry["verified"] = dst.count() >= total
+        logger.info("Migrated %s: %d/%d from %s", name, entry["copied"], total, src_path)
+
+    if not dry_run:
+        _write_marker(store, migrated=sorted(report["collections"]))
+        reset_chroma()
+    report["elapsed_s"] = round(time.monotonic() - started, 2)
+    return report
+
+
+# ============================================================================
+# Singleton
+# ============================================================================
+
+_registry: Optional[ChromaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_chroma() -> ChromaRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is not None and _registry.paths.data_dir != get_paths().data_dir:
+            _registry = None  # data dir was reconfigured
+        if _registry is None:
+            _registry = ChromaRegistry()
+        return _registry
+
+
+def reset_chroma():
+    """Drop the singleton (used by tests and after a migration)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
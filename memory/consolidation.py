@@ -18,7 +18,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from core.paths import get_paths
+from memory.embeddings import query_args
+from memory.recall_log import get_recall_logger
 
 logger = logging.getLogger("elara.memory.consolidation")
 
@@ -34,6 +42,11 @@ MAX_IMPORTANCE = 1.0
 PROTECTED_FLOOR = 0.3           # Decay floor for decisions / high-importance
 CONTRADICTION_LOW = 0.50        # Minimum similarity to check for contradictions
 CONTRADICTION_HIGH = 0.85       # Maximum (above this = duplicate, not contradiction)
+DUPLICATE_NEIGHBORS = 5         # Neighbours per memory checked for duplicates
+CONTRADICTION_NEIGHBORS = 9     # Neighbours per memory checked for contradictions
+NEIGHBOR_BLOCK_CELLS = 1 << 24  # Similarity cells per matrix-multiply block (~64 MB)
+ANN_MIN_MEMORIES = 50_000       # Above this, neighbours come from the HNSW index
+ANN_QUERY_BATCH = 256           # Query embeddings per HNSW request
 
 
 # ---------------------------------------------------------------------------
@@ -41,17 +54,9 @@ CONTRADICTION_HIGH = 0.85       # Maximum (above this = duplicate, not contradic
 # ---------------------------------------------------------------------------
 
 def log_recall(memory_id: str, query: str, relevance: float = 0.0) -> None:
-    """Append a recall event to the recall log. Fire-and-forget."""
+    """Buffer a recall event for the recall log and counts index. Fire-and-forget."""
     try:
-        p = get_paths()
-        entry = {
-            "memory_id": memory_id,
-            "query": query,
-            "relevance": round(relevance, 4),
-            "timestamp": datetime.now().isoformat(),
-        }
-        with open(p.recall_log, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        get_recall_logger().log(memory_id, query, relevance)
     except Exception as e:
         logger.debug("Recall log write failed: %s", e)
 
@@ -97,41 +102,12 @@ class MemoryConsolidator:
     # ------------------------------------------------------------------
 
     def get_recall_counts(self, since: Optional[str] = None) -> Dict[str, int]:
-        """Count recalls per memory_id, optionally since a timestamp."""
-        counts: Dict[str, int] = {}
-        log_path = self._paths.recall_log
-        if not log_path.exists():
-            return counts
-
-        cutoff = None
-        if since:
-            try:
-                cutoff = datetime.fromisoformat(since)
-            except ValueError:
-                pass
-
+        """Count recalls per memory_id, optionally since a timestamp (hour resolution)."""
         try:
-            for line in log_path.read_text().splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if cutoff:
-                    try:
-                        ts = datetime.fromisoformat(entry["timestamp"])
-                        if ts < cutoff:
-                            continue
-                    except (KeyError, ValueError):
-                        continue
-                mid = entry.get("memory_id", "")
-                if mid:
-                    counts[mid] = counts.get(mid, 0) + 1
-        except OSError:
-            pass
-
-        return counts
+            return get_recall_logger().counts(since=since)
+        except Exception as e:
+            logger.warning("Recall index unavailable: %s", e)
+            return {}
 
     # ------------------------------------------------------------------
     # Archive helpers
@@ -156,121 +132,193 @@ class MemoryConsolidator:
             logger.warning("Archive write failed for %s: %s", memory_id, e)
 
     # ------------------------------------------------------------------
-    # Core operations
+    # Neighbour search (one pass for duplicates + contradictions)
     # ------------------------------------------------------------------
 
-    def find_duplicates(self, threshold: float = SIMILARITY_THRESHOLD
-                        ) -> List[Tuple[str, str, float]]:
+    def _load_embedding_matrix(self) -> Tuple[List[str], List[str], Optional["np.ndarray"]]:
         """
-        Find duplicate memory pairs above the similarity threshold.
-        Returns list of (id_a, id_b, similarity).
+        Pull every stored memory with its embedding in one call.
+        Returns (ids, documents, unit-normalised float32 matrix or None).
         """
-        if not self.vm.collection:
-            return []
-
-        all_data = self.vm.collection.get(include=["documents", "metadatas"])
-        if not all_data["ids"]:
-            return []
-
-        ids = all_data["ids"]
-        docs = all_data["documents"]
-
-        seen_pairs = set()
-        duplicates = []
-
-        for i, doc in enumerate(docs):
-            if not doc or not doc.strip():
+        try:
+            data = self.vm.collection.get(include=["documents", "embeddings"])
+        except Exception:
+            data = self.vm.collection.get(include=["documents"])
+        ids = data["ids"] or []
+        docs = data["documents"] or []
+        embeddings = data.get("embeddings")
+
+        if not NUMPY_AVAILABLE or embeddings is None or len(embeddings) != len(ids):
+            return ids, docs, None
+
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2:
+            return ids, docs, None
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return ids, docs, matrix / norms
+
+    def _exact_neighbors(self, matrix: "np.ndarray", k: int) -> List[List[Tuple[int, float]]]:
+        """Top-k cosine neighbours per row via blocked matrix multiplies."""
+        n = matrix.shape[0]
+        block = max(1, NEIGHBOR_BLOCK_CELLS // n)
+        neighbors: List[List[Tuple[int, float]]] = []
+
+        for start in range(0, n, block):
+            end = min(n, start + block)
+            sims = matrix[start:end] @ matrix.T
+            rows = np.arange(end - start)
+            sims[rows, rows + start] = -np.inf  # never your own neighbour
+
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            top_sims = np.take_along_axis(sims, top, axis=1)
+            order = np.argsort(-top_sims, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_sims = np.take_along_axis(top_sims, order, axis=1)
+
+            for idx_row, sim_row in zip(top.tolist(), top_sims.tolist()):
+                neighbors.append(list(zip(idx_row, sim_row)))
+
+        return neighbors
+
+    def _index_neighbors(self, ids: List[str], docs: List[str],
+                         matrix: Optional["np.ndarray"], k: int) -> List[List[Tuple[int, float]]]:
+        """
+        Top-k neighbours from the collection's HNSW index (approximate).
+        Queries go out in batches with stored embeddings when available.
+        """
+        position = {mid: i for i, mid in enumerate(ids)}
+        neighbors: List[List[Tuple[int, float]]] = [[] for _ in ids]
+
+        for start in range(0, len(ids), ANN_QUERY_BATCH):
+            rows = [
+                i for i in range(start, min(len(ids), start + ANN_QUERY_BATCH))
+                if docs[i] and docs[i].strip()
+            ]
+            if not rows:
                 continue
+            if matrix is not None:
+                args = {"query_embeddings": matrix[rows].tolist()}
+            else:
+                args = query_args([docs[i] for i in rows])
             try:
                 results = self.vm.collection.query(
-                    query_texts=[doc],
-                    n_results=min(6, len(ids)),  # self + 5 neighbors
+                    n_results=min(k + 1, len(ids)),
                     include=["distances"],
+                    **args,
                 )
             except Exception:
                 continue
 
-            if not results["ids"] or not results["ids"][0]:
-                continue
-
-            for j, neighbor_id in enumerate(results["ids"][0]):
-                if neighbor_id == ids[i]:
-                    continue  # Skip self-match
+            for r, i in enumerate(rows):
+                for neighbor_id, distance in zip(results["ids"][r], results["distances"][r]):
+                    j = position.get(neighbor_id)
+                    if j is None or j == i:
+                        continue
+                    neighbors[i].append((j, 1.0 - distance))
+                neighbors[i] = neighbors[i][:k]
 
-                distance = results["distances"][0][j]
-                similarity = max(0.0, 1.0 - distance)
+        return neighbors
 
-                if similarity >= threshold:
-                    pair = tuple(sorted([ids[i], neighbor_id]))
-                    if pair not in seen_pairs:
-                        seen_pairs.add(pair)
-                        duplicates.append((pair[0], pair[1], round(similarity, 4)))
+    def find_candidate_pairs(self, threshold: float = SIMILARITY_THRESHOLD,
+                             use_index: Optional[bool] = None) -> Dict[str, List]:
+        """
+        One neighbour pass over all memories producing both candidate sets.
 
-        # Sort by similarity descending
-        duplicates.sort(key=lambda x: x[2], reverse=True)
-        return duplicates
+        Each memory's nearest neighbours are computed once: exactly, with
+        blocked matrix multiplies over stored embeddings, or through the
+        collection's approximate HNSW index for stores larger than
+        ANN_MIN_MEMORIES (or when use_index=True). Duplicates are pairs
+        above `threshold` among the top DUPLICATE_NEIGHBORS; contradiction
+        candidates fall in [CONTRADICTION_LOW, CONTRADICTION_HIGH) among the
+        top CONTRADICTION_NEIGHBORS.
 
-    def find_contradictions(self) -> List[Dict[str, Any]]:
-        """
-        Find memory pairs that cover the same topic but say conflicting things.
-        Uses semantic similarity (0.50-0.85 range) + LLM classification.
-        Falls back to heuristic if Ollama is unavailable.
+        Returns {"duplicates": [(id_a, id_b, sim)], "contradiction_candidates": [...]}.
         """
+        empty = {"duplicates": [], "contradiction_candidates": []}
         if not self.vm.collection:
-            return []
+            return empty
 
-        all_data = self.vm.collection.get(include=["documents", "metadatas"])
-        if not all_data["ids"]:
-            return []
+        ids, docs, matrix = self._load_embedding_matrix()
+        if len(ids) < 2:
+            return empty
 
-        ids = all_data["ids"]
-        docs = all_data["documents"]
+        k = min(max(DUPLICATE_NEIGHBORS, CONTRADICTION_NEIGHBORS), len(ids) - 1)
+        if use_index is None:
+            use_index = matrix is None or len(ids) > ANN_MIN_MEMORIES
+        if use_index:
+            neighbors = self._index_neighbors(ids, docs, matrix, k)
+        else:
+            neighbors = self._exact_neighbors(matrix, k)
 
-        # Find pairs in the contradiction similarity range
+        dup_seen = set()
+        contra_seen = set()
+        duplicates = []
         candidates = []
-        seen_pairs = set()
 
-        for i, doc in enumerate(docs):
+        for i, ranked in enumerate(neighbors):
+            doc = docs[i]
             if not doc or not doc.strip():
                 continue
-            try:
-                results = self.vm.collection.query(
-                    query_texts=[doc],
-                    n_results=min(10, len(ids)),
-                    include=["distances", "documents"],
-                )
-            except Exception:
-                continue
-
-            if not results["ids"] or not results["ids"][0]:
-                continue
-
-            for j, neighbor_id in enumerate(results["ids"][0]):
-                if neighbor_id == ids[i]:
-                    continue
+            for rank, (j, raw_sim) in enumerate(ranked):
+                similarity = max(0.0, raw_sim)
+                pair = tuple(sorted([ids[i], ids[j]]))
 
-                distance = results["distances"][0][j]
-                similarity = max(0.0, 1.0 - distance)
+                if rank < DUPLICATE_NEIGHBORS and similarity >= threshold:
+                    if pair not in dup_seen:
+                        dup_seen.add(pair)
+                        duplicates.append((pair[0], pair[1], round(similarity, 4)))
 
-                if CONTRADICTION_LOW <= similarity < CONTRADICTION_HIGH:
-                    pair = tuple(sorted([ids[i], neighbor_id]))
-                    if pair not in seen_pairs:
-                        seen_pairs.add(pair)
+                if (rank < CONTRADICTION_NEIGHBORS
+                        and CONTRADICTION_LOW <= similarity < CONTRADICTION_HIGH):
+                    if pair not in contra_seen:
+                        contra_seen.add(pair)
                         candidates.append({
                             "id_a": ids[i],
-                            "id_b": neighbor_id,
+                            "id_b": ids[j],
                             "doc_a": doc,
-                            "doc_b": results["documents"][0][j],
+                            "doc_b": docs[j] or "",
                             "similarity": round(similarity, 4),
                         })
 
+        # Sort by similarity descending
+        duplicates.sort(key=lambda x: x[2], reverse=True)
+        return {"duplicates": duplicates, "contradiction_candidates": candidates}
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def find_duplicates(self, threshold: float = SIMILARITY_THRESHOLD
+                        ) -> List[Tuple[str, str, float]]:
+        """
+        Find duplicate memory pairs above the similarity threshold.
+        Returns list of (id_a, id_b, similarity).
+        """
+        return self.find_candidate_pairs(threshold)["duplicates"]
+
+    def find_contradictions(self, candidates: Optional[List[Dict[str, Any]]] = None
+                            ) -> List[Dict[str, Any]]:
+        """
+        Find memory pairs that cover the same topic but say conflicting things.
+        Uses semantic similarity (0.50-0.85 range) + LLM classification.
+        Falls back to heuristic if Ollama is unavailable.
+
+        Pass `candidates` from find_candidate_pairs() to skip the neighbour pass.
+        """
+        if not self.vm.collection:
+            return []
+
+        if candidates is None:
+            candidates = self.find_candidate_pairs()["contradiction_candidates"]
+
         if not candidates:
             return []
 
-        # Classify each candidate pair using LLM
+        # Classify all candidate pairs in one LLM batch
+        verdicts = self._classify_pairs([(c["doc_a"], c["doc_b"]) for c in candidates])
         contradictions = []
-        for cand in candidates:
-            verdict = self._classify_pair(cand["doc_a"], cand["doc_b"])
+        for cand, verdict in zip(candidates, verdicts):
             if verdict == "contradicting":
                 meta_a = {}
                 meta_b = {}
@@ -309,35 +357,62 @@ class MemoryConsolidator:
         Uses local LLM, falls back to 'unknown' if unavailable.
         'contradicting' means they make CONFLICTING FACTUAL CLAIMS about the same topic.
         """
-        # Skip short memories — test messages, greetings, noise
-        if len(doc_a.strip()) < 80 or len(doc_b.strip()) < 80:
-            return "same"
+        return self._classify_pairs([(doc_a, doc_b)])[0]
+
+    def _classify_pairs(self, pairs: List[Tuple[str, str]]) -> List[str]:
+        """
+        Batched _classify_pair(): every LLM-worthy pair goes to Ollama in one
+        concurrent batch. Verdicts are returned in input order.
+        """
+        verdicts = ["same"] * len(pairs)
+        pending = []
+        for i, (doc_a, doc_b) in enumerate(pairs):
+            # Skip short memories — test messages, greetings, noise
+            if len(doc_a.strip()) < 80 or len(doc_b.strip()) < 80:
+                continue
+            pending.append(i)
+
+        if not pending:
+            return verdicts
 
         try:
-            from daemon.llm import query, is_available
+            from daemon.llm import query_batch, is_available
             if not is_available():
-                return "unknown"
-
-            prompt = (
-                f"Two memories from a knowledge base:\n\n"
-                f"A: {doc_a[:300]}\n\n"
-                f"B: {doc_b[:300]}\n\n"
-                f"Do these make CONFLICTING FACTUAL CLAIMS about the same topic? "
-                f"For example: one says a project uses dark theme, the other says light theme. "
-                f"Or one says a task is done, the other says it's pending.\n\n"
-                f"Answer ONLY one word: contradicting, complementary, or same"
-            )
-            result = query(prompt, temperature=0.1, max_tokens=5)
+                for i in pending:
+                    verdicts[i] = "unknown"
+                return verdicts
+
+            prompts = []
+            for i in pending:
+                doc_a, doc_b = pairs[i]
+                prompts.append(
+                    f"Two memories from a knowledge base:\n\n"
+                    f"A: {doc_a[:300]}\n\n"
+                    f"B: {doc_b[:300]}\n\n"
+                    f"Do these make CONFLICTING FACTUAL CLAIMS about the same topic? "
+                    f"For example: one says a project uses dark theme, the other says light theme. "
+                    f"Or one says a task is done, the other says it's pending.\n\n"
+                    f"Answer ONLY one word: contradicting, complementary, or same"
+                )
+            results = query_batch(prompts, temperature=0.1, max_tokens=5,
+                                  label="contradictions", cache="contradiction")
+        except Exception:
+            for i in pending:
+                verdicts[i] = "unknown"
+            return verdicts
+
+        for i, result in zip(pending, results):
             if result:
                 r = result.lower().strip().rstrip(".")
                 if "contradict" in r:
-                    return "contradicting"
-                if "complement" in r:
-                    return "complementary"
-                return "same"
-            return "unknown"
-        except Exception:
-            return "unknown"
+                    verdicts[i] = "contradicting"
+                elif "complement" in r:
+                    verdicts[i] = "complementary"
+                else:
+                    verdicts[i] = "same"
+            else:
+                verdicts[i] = "unknown"
+        return verdicts
 
     def _save_contradictions(self, contradictions: List[Dict[str, Any]]) -> None:
         """Save detected contradictions to file for boot review."""
@@ -766,12 +841,12 @@ class MemoryConsolidator:
 
             to_archive.append((mid, all_data["documents"][i], meta))
 
-        archived_count = 0
+        archived_ids = []
         for mid, doc, meta in to_archive:
             self._archive_memory(mid, doc, meta, reason="weak")
             try:
                 self.vm.collection.delete(ids=[mid])
-                archived_count += 1
+                archived_ids.append(mid)
 
                 # Emit event
                 try:
@@ -787,7 +862,7 @@ class MemoryConsolidator:
             except Exception as e:
                 logger.warning("Archive delete failed for %s: %s", mid, e)
 
-        return {"archived": archived_count}
+        return {"archived": len(archived_ids), "archived_ids": archived_ids}
 
     def get_at_risk(self, threshold: float = 0.2) -> List[Dict[str, Any]]:
         """Return memories with importance below threshold (at risk of archival)."""
@@ -848,14 +923,23 @@ class MemoryConsolidator:
             logger.warning("Decay phase failed: %s", e)
             result["decayed"] = 0
 
-        # 3. Find and merge duplicates
+        # One neighbour pass feeds both the merge and contradiction phases
+        try:
+            pairs = self.find_candidate_pairs()
+        except Exception as e:
+            logger.warning("Neighbour pass failed: %s", e)
+            pairs = {"duplicates": [], "contradiction_candidates": []}
+
+        # 3. Merge duplicates
+        touched = set()
         try:
-            duplicates = self.find_duplicates()
+            duplicates = pairs["duplicates"]
             merged_count = 0
             for id_a, id_b, sim in duplicates:
                 survivor = self.merge_memories(id_a, id_b)
                 if survivor:
                     merged_count += 1
+                    touched.update((id_a, id_b))
             result["merged"] = merged_count
             result["duplicate_pairs_found"] = len(duplicates)
         except Exception as e:
@@ -866,13 +950,18 @@ class MemoryConsolidator:
         try:
             archive_result = self.archive_weak()
             result["archived"] = archive_result.get("archived", 0)
+            touched.update(archive_result.get("archived_ids", []))
         except Exception as e:
             logger.warning("Archive phase failed: %s", e)
             result["archived"] = 0
 
-        # 5. Contradiction detection
+        # 5. Contradiction detection — skip pairs whose content changed above
         try:
-            contradictions = self.find_contradictions()
+            candidates = [
+                c for c in pairs["contradiction_candidates"]
+                if c["id_a"] not in touched and c["id_b"] not in touched
+            ]
+            contradictions = self.find_contradictions(candidates=candidates)
             result["contradictions_found"] = len(contradictions)
         except Exception as e:
             logger.warning("Contradiction detection failed: %s", e)
@@ -884,6 +973,12 @@ class MemoryConsolidator:
         except Exception:
             result["memories_after"] = -1
 
+        # Drop hourly recall buckets no "since last run" query will reach
+        try:
+            get_recall_logger().compact()
+        except Exception as e:
+            logger.debug("Recall index compaction failed: %s", e)
+
         # 6. Save state
         state["last_run"] = result["timestamp"]
         state["runs"] = state.get("runs", 0) + 1
@@ -910,12 +1005,10 @@ class MemoryConsolidator:
             pass
 
         recall_log_size = 0
-        recall_log_path = self._paths.recall_log
-        if recall_log_path.exists():
-            try:
-                recall_log_size = sum(1 for _ in recall_log_path.read_text().splitlines() if _.strip())
-            except OSError:
-                pass
+        try:
+            recall_log_size = get_recall_logger().total()
+        except Exception:
+            pass
 
         archive_size = 0
         archive_path = self._paths.memory_archive
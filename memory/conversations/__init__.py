@@ -39,8 +39,13 @@ def get_conversations() -> ConversationMemory:
     return _conversations
 
 
-def recall_conversation(query: str, n_results: int = 5, project: Optional[str] = None) -> List[Dict[str, Any]]:
-    return get_conversations().recall(query, n_results=n_results, project=project)
+def recall_conversation(
+    query: str, n_results: int = 5, project: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
+) -> List[Dict[str, Any]]:
+    return get_conversations().recall(
+        query, n_results=n_results, project=project, query_embedding=query_embedding,
+    )
 
 
 def recall_conversation_with_context(
@@ -51,8 +56,8 @@ def recall_conversation_with_context(
     )
 
 
-def ingest_conversations(force: bool = False) -> Dict[str, Any]:
-    return get_conversations().ingest_all(force=force)
+def ingest_conversations(force: bool = False, workers: int = 0) -> Dict[str, Any]:
+    return get_conversations().ingest_all(force=force, workers=workers)
 
 
 def get_conversations_for_episode(episode_id: str, n_results: int = 20) -> List[Dict[str, Any]]:
@@ -15,10 +15,25 @@ from pathlib import Path
 from memory.conversations.core import PROJECTS_DIR
 
 
+def print_ingest_stats(stats: dict):
+    """Print an ingest_all() result, including throughput."""
+    print(f"Scanned: {stats['files_scanned']} files")
+    print(f"Ingested: {stats['files_ingested']} files ({stats['exchanges_total']} exchanges)")
+    print(f"Skipped: {stats['files_skipped']} (unchanged)")
+    if "elapsed_s" in stats:
+        mb_per_s = stats["bytes_per_s"] / (1024 * 1024)
+        print(f"Throughput: {stats['exchanges_per_s']} exchanges/s, {mb_per_s:.2f} MB/s "
+              f"({stats['elapsed_s']}s, {stats['workers']} worker(s))")
+    if stats["errors"]:
+        print(f"Errors: {len(stats['errors'])}")
+        for err in stats["errors"][:5]:
+            print(f"  - {err}")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python -m memory.conversations [ingest|search|context|stats|test|episode]")
-        print("  ingest [--force]       — Index all session files")
+        print("  ingest [--force] [--workers N] — Index all session files")
         print("  search <query>         — Search past conversations")
         print("  context <query>        — Search with surrounding context")
         print("  episode <episode_id>   — Get conversations for an episode")
@@ -50,16 +65,17 @@ def main():
 
     elif cmd == "ingest":
         force = "--force" in sys.argv
+        workers = 0
+        if "--workers" in sys.argv:
+            try:
+                workers = int(sys.argv[sys.argv.index("--workers") + 1])
+            except (IndexError, ValueError):
+                print("Usage: ingest [--force] [--workers N]")
+                sys.exit(1)
         print("Ingesting conversations...")
         cm = ConversationMemory()
-        stats = cm.ingest_all(force=force)
-        print(f"Scanned: {stats['files_scanned']} files")
-        print(f"Ingested: {stats['files_ingested']} files ({stats['exchanges_total']} exchanges)")
-        print(f"Skipped: {stats['files_skipped']} (unchanged)")
-        if stats["errors"]:
-            print(f"Errors: {len(stats['errors'])}")
-            for err in stats["errors"][:5]:
-                print(f"  - {err}")
+        stats = cm.ingest_all(force=force, workers=workers)
+        print_ingest_stats(stats)
         print(f"Total indexed: {cm.count()}")
 
     elif cmd == "search":
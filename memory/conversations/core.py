@@ -19,14 +19,8 @@ from typing import Optional, Dict, Any
 
 logger = logging.getLogger("elara.memory.conversations")
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
 
 _p = get_paths()
 CONVERSATIONS_DIR = _p.conversations_db
@@ -57,19 +51,10 @@ class ConversationBase:
             self._init_db()
 
     def _init_db(self):
-        CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
-        self.client = chromadb.PersistentClient(
-            path=str(CONVERSATIONS_DIR),
-            settings=Settings(anonymized_telemetry=False)
-        )
-
-        self.collection = self.client.get_or_create_collection(
-            name="elara_conversations_v2",
-            metadata={
-                "description": "Elara's conversation memory — cosine similarity",
-                "hnsw:space": "cosine",
-            }
-        )
+        CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)  # manifest lives here
+        chroma = get_chroma()
+        self.collection = chroma.collection("elara_conversations_v2")
+        self.client = chroma.client(chroma.path_for("elara_conversations_v2"))
 
     def _load_manifest(self) -> Dict[str, Any]:
         if not MANIFEST_PATH.exists():
@@ -0,0 +1,218 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Background conversation ingest — request file, debounce, watermark.
+
+Problem: the prompt hook called ingest_conversations() inline on the
+first prompt after a >5 minute gap, so that prompt blocked on a walk of
+every project dir plus embedding whatever had changed.
+
+Solution: the prompt path only files a request; resident processes do
+the work.
+  - request_ingest(reason) — any process, one small JSON write. A pending
+    request absorbs later ones (N requests = one job).
+  - IngestWorker — a daemon thread in Overwatch and the enrichment server.
+    A request runs once it has been quiet for INGEST_DEBOUNCE_SECONDS (or
+    pending INGEST_MAX_DELAY_SECONDS at most), under an exclusive file lock
+    so two resident processes never ingest at once.
+  - Watermark — every ingest_all() records when it finished and what it
+    did; the hook reads it to decide whether a request is worth filing.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from core.paths import get_paths
+from daemon.schemas import atomic_write_json
+
+logger = logging.getLogger("elara.memory.conversations.ingest_queue")
+
+INGEST_DEBOUNCE_SECONDS = 10.0    # run once requests have been quiet this long
+INGEST_MAX_DELAY_SECONDS = 120.0  # ... but never leave a request waiting longer
+INGEST_POLL_SECONDS = 2.0
+
+
+def _read_json(path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+# ============================================================================
+# Requests + watermark (cheap — safe on the prompt path)
+# ============================================================================
+
+def request_ingest(reason: str = "") -> Dict[str, Any]:
+    """File (or refresh) the pending ingest request. Returns the request."""
+    path = get_paths().ingest_request
+    now = time.time()
+    request = _read_json(path)
+    request.setdefault("first_requested_at", now)
+    request["requested_at"] = now
+    request["count"] = request.get("count", 0) + 1
+    if reason:
+        request["reason"] = reason
+    try:
+        atomic_write_json(path, request)
+    except OSError as e:
+        logger.debug("Could not file ingest request: %s", e)
+    return request
+
+
+def pending_request() -> Optional[Dict[str, Any]]:
+    return _read_json(get_paths().ingest_request) or None
+
+
+def _refile_request(request: Dict[str, Any]) -> None:
+    """Put back a request whose ingest failed, merged with any filed meanwhile."""
+    path = get_paths().ingest_request
+    now = time.time()
+    newer = _read_json(path)
+    merged = {**request, **newer}
+    merged["first_requested_at"] = min(request.get("first_requested_at", now),
+                                       newer.get("first_requested_at", now))
+    merged["count"] = request.get("count", 1) + newer.get("count", 0)
+    merged["failed_at"] = now
+    try:
+        atomic_write_json(path, merged)
+    except OSError as e:
+        logger.debug("Could not re-file ingest request: %s", e)
+
+
+def read_watermark() -> Dict[str, Any]:
+    """Last completed ingest: {"ingested_at": epoch, "timestamp", stats...} or {}."""
+    return _read_json(get_paths().ingest_watermark)
+
+
+def ingest_age() -> float:
+    """Seconds since the last completed ingest (inf if never)."""
+    at = read_watermark().get("ingested_at")
+    return time.time() - at if at else float("inf")
+
+
+def record_watermark(stats: Dict[str, Any], source: str = "") -> None:
+    """Called at the end of every ingest_all()."""
+    now = time.time()
+    mark = {
+        "ingested_at": now,
+        "timestamp": datetime.fromtimestamp(now).isoformat(),
+        "source": source or f"pid {os.getpid()}",
+        "files_ingested": stats.get("files_ingested", 0),
+        "exchanges_total": stats.get("exchanges_total", 0),
+        "elapsed_s": stats.get("elapsed_s", 0),
+        "errors": len(stats.get("errors", [])),
+    }
+    try:
+        atomic_write_json(get_paths().ingest_watermark, mark)
+    except OSError as e:
+        logger.debug("Could not write ingest watermark: %s", e)
+
+
+# ============================================================================
+# Worker (resident processes only)
+# ============================================================================
+
+def _default_ingest() -> Dict[str, Any]:
+    from memory.conversations import get_conversations
+    return get_conversations().ingest_all()
+
+
+class IngestWorker:
+    """Runs filed ingest requests in the background, debounced and deduplicated."""
+
+    def __init__(self, ingest_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+                 name: str = "worker"):
+        self._ingest = ingest_fn or _default_ingest
+        self.name = name
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.runs = 0
+        self.last_error: Optional[str] = None
+
+    @staticmethod
+    def _due(request: Dict[str, Any], now: float) -> bool:
+        if now - request.get("failed_at", 0) < INGEST_DEBOUNCE_SECONDS:
+            return False  # back off after a failed run
+        quiet = now - request.get("requested_at", 0) >= INGEST_DEBOUNCE_SECONDS
+        overdue = now - request.get("first_requested_at", now) >= INGEST_MAX_DELAY_SECONDS
+        return quiet or overdue
+
+    def run_pending(self) -> Optional[Dict[str, Any]]:
+        """Run the pending request if it is due. Returns ingest stats, or None."""
+        request = pending_request()
+        if not request or not self._due(request, time.time()):
+            return None
+
+        paths = get_paths()
+        paths.ingest_lock.parent.mkdir(parents=True, exist_ok=True)
+        with open(paths.ingest_lock, "a") as lock:
+            if FCNTL_AVAILABLE:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return None  # another process is ingesting; its run covers this request
+
+            # Re-check under the lock, then consume: requests filed while we
+            # ingest start a fresh pending request rather than being lost.
+            # A failed run files its request again.
+            request = pending_request()
+            if request is None:
+                return None
+            try:
+                paths.ingest_request.unlink()
+            except OSError:
+                pass
+
+            started = time.monotonic()
+            try:
+                stats = self._ingest()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Background ingest failed (%s): %s", request.get("reason", "?"), e)
+                _refile_request(request)
+                return None
+            self.runs += 1
+            self.last_error = None
+            logger.info(
+                "Background ingest (%s, %d requests): %d files, %d exchanges in %.1fs",
+                request.get("reason", "?"), request.get("count", 1),
+                stats.get("files_ingested", 0), stats.get("exchanges_total", 0),
+                time.monotonic() - started,
+            )
+            return stats
+
+    def _loop(self):
+        while not self._stop.wait(INGEST_POLL_SECONDS):
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.debug("Ingest worker tick failed: %s", e)
+
+    def start(self) -> "IngestWorker":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name=f"elara-ingest-{self.name}", daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
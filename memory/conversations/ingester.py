@@ -6,130 +6,199 @@
 Elara Conversation Memory — Ingestion mixin.
 
 Extracts exchanges from JSONL session files and indexes them in ChromaDB.
+
+Session logs are append-only, so ingestion is incremental: the manifest
+records the byte offset where parsing stopped and the next exchange index.
+A file that grew is read from that offset and only the new exchanges are
+embedded. Truncation or rotation (inode change, shrink, different head
+bytes) falls back to a full rebuild of the session.
 """
 
+import hashlib
 import json
+import multiprocessing
 import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import BinaryIO, List, Optional, Dict, Any, Tuple
 
 from memory.conversations.core import PROJECTS_DIR, SCHEMA_VERSION
+from memory.conversations.ingest_queue import record_watermark
+from memory.embeddings import embed_documents
+
+# Bytes from the start of a file hashed to detect rotation/rewrite
+HEAD_HASH_BYTES = 4096
+
+# Rows per collection.upsert() call in parallel ingest
+INGEST_BATCH_SIZE = 512
+
+# Episode ranges shared by every parse worker (set by the pool initializer)
+_worker_episode_ranges: Optional[List[Dict]] = None
+
+
+def _init_parse_worker(episode_ranges: List[Dict]):
+    global _worker_episode_ranges
+    _worker_episode_ranges = episode_ranges
+
+
+def _parse_file_job(file_path: str, prev: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: parse one file without touching ChromaDB."""
+    from memory.conversations import ConversationMemory
+    parser = ConversationMemory.__new__(ConversationMemory)  # no DB init
+    return parser._prepare_file(file_path, prev, _worker_episode_ranges)
 
 
 class IngesterMixin:
     """Mixin providing extraction and ingestion capabilities."""
 
-    def extract_exchanges(self, file_path: str) -> List[Dict[str, Any]]:
+    def _scan_exchanges(
+        self,
+        f: BinaryIO,
+        start_offset: int = 0,
+        start_index: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int, str]:
         """
-        Parse a JSONL session file into exchange pairs.
-        Each exchange = user text + next assistant text response.
+        Parse exchange pairs from an open binary JSONL stream.
+
+        Each exchange = user text + next assistant text response (before
+        any further user entry). Reading starts at start_offset.
+
+        Returns (exchanges, resume_offset, project_cwd). resume_offset is
+        where the next incremental pass should start: the end of the last
+        complete line, or the start of a trailing user message that is
+        still waiting for its assistant reply.
         """
         exchanges = []
-        entries = []
+        project_cwd = ""
+        pending = None  # (line_offset, user_text, user_ts)
+
+        pos = start_offset
+        resume = start_offset
+        f.seek(start_offset)
 
-        with open(file_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        for raw in f:
+            line_start = pos
+            line = raw.strip()
+            if not raw.endswith(b"\n"):
+                # Unterminated tail: only consume it if it is already valid JSON
                 try:
-                    entry = json.loads(line)
-                    entries.append(entry)
+                    entry = json.loads(line) if line else None
                 except json.JSONDecodeError:
-                    continue
+                    break
+            else:
+                entry = None
+                if line:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        entry = None
+            pos += len(raw)
+            resume = pos
+
+            if not isinstance(entry, dict):
+                continue
 
-        # Filter to user and assistant messages only
-        messages = []
-        for entry in entries:
             entry_type = entry.get("type")
+            if entry_type == "user" and not project_cwd and entry.get("cwd"):
+                project_cwd = entry["cwd"]
+
+            # User and assistant messages only
             if entry_type not in ("user", "assistant"):
                 continue
             if entry.get("isSidechain"):
                 continue
-            messages.append(entry)
-
-        # Pair: user text + following assistant text
-        i = 0
-        while i < len(messages):
-            msg = messages[i]
-
-            if msg.get("type") == "user":
-                user_text = self._extract_user_text(msg)
-                user_ts = msg.get("timestamp", "")
 
+            if entry_type == "user":
+                # Any user entry closes the previous exchange window
+                pending = None
+                user_text = self._extract_user_text(entry)
                 if user_text:
-                    assistant_text = None
-                    assistant_ts = ""
-                    j = i + 1
-                    while j < len(messages):
-                        next_msg = messages[j]
-                        if next_msg.get("type") == "assistant":
-                            text = self._extract_assistant_text(next_msg)
-                            if text:
-                                assistant_text = text
-                                assistant_ts = next_msg.get("timestamp", "")
-                                break
-                            j += 1
-                        elif next_msg.get("type") == "user":
-                            break
-                        else:
-                            j += 1
+                    pending = (line_start, user_text, entry.get("timestamp", ""))
+            elif pending is not None:
+                text = self._extract_assistant_text(entry)
+                if text:
+                    _, user_text, user_ts = pending
+                    exchanges.append({
+                        "user_text": user_text,
+                        "assistant_text": text,
+                        "timestamp": user_ts or entry.get("timestamp", ""),
+                        "exchange_index": start_index + len(exchanges),
+                    })
+                    pending = None
+
+        if pending is not None:
+            # Re-read the unanswered user message next time
+            resume = pending[0]
+
+        return exchanges, resume, project_cwd
 
-                    if assistant_text:
-                        exchanges.append({
-                            "user_text": user_text,
-                            "assistant_text": assistant_text,
-                            "timestamp": user_ts or assistant_ts,
-                            "exchange_index": len(exchanges),
-                        })
+    def extract_exchanges(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Parse a JSONL session file into exchange pairs.
+        Each exchange = user text + next assistant text response.
+        """
+        with open(file_path, "rb") as f:
+            exchanges, _, _ = self._scan_exchanges(f)
+        return exchanges
 
-            i += 1
+    def _head_hash(self, f: BinaryIO, length: int) -> str:
+        """Hash the first `length` bytes (capped) of a file."""
+        f.seek(0)
+        head = f.read(min(length, HEAD_HASH_BYTES))
+        return hashlib.sha256(head).hexdigest()[:16]
 
-        return exchanges
+    def _resume_point(self, f: BinaryIO, prev: Dict[str, Any], stat: os.stat_result) -> Optional[Tuple[int, int]]:
+        """
+        Decide whether a previously ingested file can be continued.
 
-    def ingest_file(
+        Returns (offset, next_index) for an incremental pass, or None when
+        the file was truncated, rotated or ingested by an older version.
+        """
+        if "offset" not in prev or "next_index" not in prev:
+            return None
+        offset = prev["offset"]
+        if prev.get("inode") != stat.st_ino:
+            return None
+        if stat.st_size < offset or stat.st_size < prev.get("size_bytes", 0):
+            return None
+        if self._head_hash(f, offset) != prev.get("head_hash"):
+            return None
+        return offset, prev["next_index"]
+
+    def _prepare_file(
         self,
         file_path: str,
-        manifest: Dict[str, Any],
+        prev: Dict[str, Any],
         episode_ranges: Optional[List[Dict]] = None,
-    ) -> int:
-        """
-        Ingest a single JSONL file into ChromaDB.
-        Now with episode cross-referencing.
+    ) -> Dict[str, Any]:
         """
-        if not self.collection:
-            return 0
+        Parse a session file into ready-to-write ChromaDB rows.
 
+        Pure with respect to the database, so it can run in a worker
+        process. Continues from prev's byte offset when the file has only
+        grown; otherwise marks the session for a full rebuild.
+        """
         path = Path(file_path)
         session_id = path.stem
         project_dir = path.parent.name
 
-        # Get project cwd from first user entry
-        project_cwd = ""
-        with open(file_path) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    if entry.get("type") == "user" and entry.get("cwd"):
-                        project_cwd = entry["cwd"]
-                        break
-                except json.JSONDecodeError:
-                    continue
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            resume = self._resume_point(f, prev, stat)
+            if resume is None:
+                start_offset, start_index = 0, 0
+            else:
+                start_offset, start_index = resume
 
-        exchanges = self.extract_exchanges(file_path)
-        if not exchanges:
-            return 0
+            exchanges, new_offset, scanned_cwd = self._scan_exchanges(f, start_offset, start_index)
+            head_hash = self._head_hash(f, new_offset)
 
-        # Delete old entries for this session
-        try:
-            existing = self.collection.get(where={"session_id": session_id})
-            if existing and existing["ids"]:
-                self.collection.delete(ids=existing["ids"])
-        except Exception:
-            pass
+        project_cwd = (prev.get("project_cwd") if resume else "") or scanned_cwd
+        next_index = start_index + len(exchanges)
 
-        # Prepare batch
         ids = []
         documents = []
         metadatas = []
@@ -170,7 +239,7 @@ class IngesterMixin:
                 "hour": hour,
                 "epoch": epoch,
                 "exchange_index": ex["exchange_index"],
-                "total_exchanges": len(exchanges),
+                "total_exchanges": next_index,
                 "user_text_preview": ex["user_text"][:100],
                 "episode_id": episode_id,
             }
@@ -179,46 +248,86 @@ class IngesterMixin:
             documents.append(doc)
             metadatas.append(meta)
 
-        # Batch add
-        if documents:
-            self.collection.add(ids=ids, documents=documents, metadatas=metadatas)
-
-        # Update manifest
-        stat = os.stat(file_path)
-        manifest[file_path] = {
-            "last_modified": stat.st_mtime,
-            "size_bytes": stat.st_size,
-            "exchanges_ingested": len(exchanges),
+        return {
+            "file_path": file_path,
             "session_id": session_id,
+            "rebuild": resume is None,
+            "ids": ids,
+            "documents": documents,
+            "metadatas": metadatas,
+            "bytes_read": new_offset - start_offset,
+            "manifest_entry": {
+                "last_modified": stat.st_mtime,
+                "size_bytes": stat.st_size,
+                "exchanges_ingested": next_index,
+                "session_id": session_id,
+                "project_cwd": project_cwd,
+                "offset": new_offset,
+                "next_index": next_index,
+                "inode": stat.st_ino,
+                "head_hash": head_hash,
+            },
         }
 
-        return len(exchanges)
+    def _clear_superseded(self, prepared: Dict[str, Any]):
+        """Delete rows that a prepared file is about to replace."""
+        session_id = prepared["session_id"]
+        if prepared["rebuild"]:
+            # Full rebuild — drop everything previously indexed for this session
+            try:
+                existing = self.collection.get(where={"session_id": session_id})
+                if existing and existing["ids"]:
+                    self.collection.delete(ids=existing["ids"])
+            except Exception:
+                pass
+        elif prepared["ids"]:
+            # Overwatch micro-ingested rows are superseded by the canonical ones
+            try:
+                self.collection.delete(where={"$and": [
+                    {"session_id": session_id},
+                    {"total_exchanges": -1},
+                ]})
+            except Exception:
+                pass
 
-    def ingest_all(self, force: bool = False) -> Dict[str, Any]:
+    def ingest_file(
+        self,
+        file_path: str,
+        manifest: Dict[str, Any],
+        episode_ranges: Optional[List[Dict]] = None,
+    ) -> int:
         """
-        Walk all project dirs, find JSONL files, ingest new/modified ones.
-        Now loads episode ranges for cross-referencing.
+        Ingest a single JSONL file into ChromaDB.
+
+        Continues from the manifest's byte offset when the file has only
+        grown, so just the newly appended exchanges are embedded. Otherwise
+        the session is rebuilt from scratch. Returns exchanges added.
         """
-        manifest = {} if force else self._load_manifest()
-        # Preserve schema version
-        schema = manifest.pop("_schema_version", SCHEMA_VERSION)
+        if not self.collection:
+            return 0
 
-        stats = {
-            "files_scanned": 0,
-            "files_ingested": 0,
-            "files_skipped": 0,
-            "exchanges_total": 0,
-            "errors": [],
-        }
+        prepared = self._prepare_file(file_path, manifest.get(file_path) or {}, episode_ranges)
+        return self._write_prepared(prepared, manifest)
 
-        if not PROJECTS_DIR.exists():
-            manifest["_schema_version"] = schema
-            self._save_manifest(manifest)
-            return stats
+    def _write_prepared(self, prepared: Dict[str, Any], manifest: Dict[str, Any]) -> int:
+        """Write one prepared file to ChromaDB and record it in the manifest."""
+        self._clear_superseded(prepared)
 
-        # Load episode ranges once for cross-referencing
-        episode_ranges = self._load_episode_ranges()
+        # Batch upsert (ids are deterministic, so a retried pass is harmless)
+        if prepared["ids"]:
+            self.collection.upsert(
+                ids=prepared["ids"],
+                documents=prepared["documents"],
+                embeddings=embed_documents(prepared["documents"]),
+                metadatas=prepared["metadatas"],
+            )
 
+        manifest[prepared["file_path"]] = prepared["manifest_entry"]
+        return len(prepared["ids"])
+
+    def _changed_files(self, manifest: Dict[str, Any], force: bool, stats: Dict[str, Any]) -> List[str]:
+        """Walk project dirs and return JSONL files that are new or modified."""
+        changed = []
         for project_dir in PROJECTS_DIR.iterdir():
             if not project_dir.is_dir():
                 continue
@@ -241,17 +350,172 @@ class IngesterMixin:
                         stats["files_skipped"] += 1
                         continue
 
-                # Ingest
+                changed.append(file_str)
+        return changed
+
+    def ingest_all(self, force: bool = False, workers: int = 0) -> Dict[str, Any]:
+        """
+        Walk all project dirs, find JSONL files, ingest new/modified ones.
+        Now loads episode ranges for cross-referencing.
+
+        With workers > 1, files are parsed and cleaned in a process pool
+        and a single writer embeds the rows in INGEST_BATCH_SIZE batches.
+        Throughput (exchanges/s, bytes/s) is included in the stats, and
+        completion is recorded in the ingest watermark (see ingest_queue).
+        """
+        started = time.monotonic()
+        manifest = {} if force else self._load_manifest()
+        # Preserve schema version
+        schema = manifest.pop("_schema_version", SCHEMA_VERSION)
+
+        stats = {
+            "files_scanned": 0,
+            "files_ingested": 0,
+            "files_skipped": 0,
+            "exchanges_total": 0,
+            "bytes_read": 0,
+            "workers": max(1, workers),
+            "errors": [],
+        }
+
+        if not PROJECTS_DIR.exists():
+            manifest["_schema_version"] = schema
+            self._save_manifest(manifest)
+            record_watermark(stats)
+            return stats
+
+        # Load episode ranges once for cross-referencing
+        episode_ranges = self._load_episode_ranges()
+
+        changed = self._changed_files(manifest, force, stats)
+
+        if workers > 1 and len(changed) > 1 and self.collection:
+            self._ingest_parallel(changed, manifest, episode_ranges, workers, stats)
+        else:
+            for file_str in changed:
                 try:
-                    count = self.ingest_file(file_str, manifest, episode_ranges)
+                    prepared = self._prepare_file(file_str, manifest.get(file_str) or {}, episode_ranges)
+                    count = self._write_prepared(prepared, manifest) if self.collection else 0
                     stats["files_ingested"] += 1
                     stats["exchanges_total"] += count
+                    stats["bytes_read"] += prepared["bytes_read"]
                 except Exception as e:
-                    stats["errors"].append(f"{jsonl_file.name}: {e}")
+                    stats["errors"].append(f"{Path(file_str).name}: {e}")
 
         self._save_manifest(manifest)
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        stats["elapsed_s"] = round(elapsed, 3)
+        stats["exchanges_per_s"] = round(stats["exchanges_total"] / elapsed, 1)
+        stats["bytes_per_s"] = round(stats["bytes_read"] / elapsed, 1)
+        record_watermark(stats)
         return stats
 
+    def _ingest_parallel(
+        self,
+        files: List[str],
+        manifest: Dict[str, Any],
+        episode_ranges: List[Dict],
+        workers: int,
+        stats: Dict[str, Any],
+    ):
+        """
+        Parse files in a process pool; embed and write from this process.
+
+        Rows from many files are pooled and written in fixed-size batches.
+        A file's manifest entry is committed only once all of its rows are
+        flushed, so a failed batch leaves those files to be retried.
+        """
+        ids, documents, metadatas = [], [], []
+        waiting = deque()  # (file_path, manifest_entry, row_start, row_end)
+        state = {"flushed": 0, "buffered": 0}
+
+        def flush(final: bool = False):
+            while len(ids) >= INGEST_BATCH_SIZE or (final and ids):
+                n = min(INGEST_BATCH_SIZE, len(ids))
+                chunk_end = state["flushed"] + n
+                try:
+                    self.collection.upsert(
+                        ids=ids[:n], documents=documents[:n], metadatas=metadatas[:n],
+                        embeddings=embed_documents(documents[:n]),
+                    )
+                    failed = False
+                except Exception as e:
+                    failed = True
+                    error = e
+                del ids[:n], documents[:n], metadatas[:n]
+
+                if failed:
+                    # Every file with rows in this chunk stays un-manifested
+                    kept = deque()
+                    for item in waiting:
+                        fp, _, row_start, row_end = item
+                        if row_start < chunk_end and row_end > state["flushed"]:
+                            stats["errors"].append(f"{Path(fp).name}: {error}")
+                            stats["files_ingested"] -= 1
+                            stats["exchanges_total"] -= row_end - row_start
+                        else:
+                            kept.append(item)
+                    waiting.clear()
+                    waiting.extend(kept)
+                state["flushed"] = chunk_end
+
+            # Commit files whose rows are now all written (zero-row files included)
+            while waiting and waiting[0][3] <= state["flushed"]:
+                fp, entry, _, _ = waiting.popleft()
+                manifest[fp] = entry
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_parse_worker,
+            initargs=(episode_ranges,),
+        ) as pool:
+            pending = {}  # future -> file path
+            queue = iter(files)
+            exhausted = False
+
+            while pending or not exhausted:
+                # Keep a bounded number of parsed files in flight
+                while not exhausted and len(pending) < workers * 2:
+                    try:
+                        fp = next(queue)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[pool.submit(_parse_file_job, fp, manifest.get(fp) or {})] = fp
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    fp = pending.pop(fut)
+                    try:
+                        prepared = fut.result()
+                    except Exception as e:
+                        stats["errors"].append(f"{Path(fp).name}: {e}")
+                        continue
+
+                    self._clear_superseded(prepared)
+                    row_start = state["buffered"]
+                    ids.extend(prepared["ids"])
+                    documents.extend(prepared["documents"])
+                    metadatas.extend(prepared["metadatas"])
+                    state["buffered"] += len(prepared["ids"])
+                    waiting.append((
+                        prepared["file_path"], prepared["manifest_entry"],
+                        row_start, state["buffered"],
+                    ))
+
+                    stats["files_ingested"] += 1
+                    stats["exchanges_total"] += len(prepared["ids"])
+                    stats["bytes_read"] += prepared["bytes_read"]
+                    flush()
+
+        flush(final=True)
+
     def ingest_exchange(
         self,
         user_text: str,
@@ -300,7 +564,10 @@ class IngesterMixin:
         }
 
         try:
-            self.collection.add(ids=[ex_id], documents=[doc], metadatas=[meta])
+            self.collection.add(
+                ids=[ex_id], documents=[doc], metadatas=[meta],
+                embeddings=embed_documents([doc]),
+            )
             return True
         except Exception:
             return False
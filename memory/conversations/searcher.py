@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from memory.conversations.core import RECENCY_HALF_LIFE_DAYS, RECENCY_WEIGHT
+from memory.embeddings import query_args_for
 
 
 class SearcherMixin:
@@ -39,6 +40,7 @@ class SearcherMixin:
         n_results: int = 5,
         project: Optional[str] = None,
         recency_weight: float = RECENCY_WEIGHT,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantic search with cosine similarity and recency weighting.
@@ -59,9 +61,9 @@ class SearcherMixin:
             where_filter = {"project_dir": project}
 
         results = self.collection.query(
-            query_texts=[query],
             n_results=fetch_count,
             where=where_filter,
+            **query_args_for(query, query_embedding),
         )
 
         matches = []
@@ -123,11 +125,11 @@ class SearcherMixin:
         for match in matches:
             session_id = match["session_id"]
             exchange_idx = match["exchange_index"]
-            total = match["total_exchanges"]
 
-            # Calculate range
+            # Calculate range — the upper bound is left open because
+            # total_exchanges on older rows lags behind incremental ingests
             start_idx = max(0, exchange_idx - context_size)
-            end_idx = min(total - 1, exchange_idx + context_size)
+            end_idx = exchange_idx + context_size
 
             if start_idx == end_idx == exchange_idx:
                 match["context_before"] = []
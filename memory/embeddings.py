@@ -0,0 +1,288 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Embedding Cache — content-hash keyed vectors shared by every ChromaDB store.
+
+Problem: VectorMemory, conversation memory and the knowledge graph hand raw
+text to ChromaDB, which runs the embedding model on every add, upsert and
+query. The same text is embedded again and again: dedup probes, reindex_all,
+conversation re-ingest, repeated recall queries.
+
+Solution: One SQLite table of float32 vectors keyed on sha256(model, text).
+Stores compute embeddings through this cache and pass them to ChromaDB
+explicitly (embeddings= / query_embeddings=), so identical text is never
+embedded twice. The model is ChromaDB's default embedding function, so the
+vectors are the same ones the collections would have computed themselves.
+
+Usage:
+    from memory.embeddings import embed_documents, query_args
+    coll.upsert(ids=ids, documents=docs, embeddings=embed_documents(docs))
+    coll.query(n_results=5, **query_args([query]))
+
+One query, many collections — embed once and pass the vector along:
+    vec = embed_query(query)
+    recall(query, query_embedding=vec); search_principles(query, query_embedding=vec)
+
+If the embedding model is unavailable, embed_documents() returns None and
+ChromaDB falls back to embedding the documents itself.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from core.paths import get_paths
+
+logger = logging.getLogger("elara.memory.embeddings")
+
+# Identifies the vector space; part of every cache key
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vec BLOB NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+# SQLite caps bound parameters per statement; stay well under it
+_LOOKUP_CHUNK = 500
+
+
+def _default_embedding_fn() -> Optional[Callable[[List[str]], Any]]:
+    try:
+        from chromadb.utils import embedding_functions
+        return embedding_functions.DefaultEmbeddingFunction()
+    except Exception as e:
+        logger.debug("Default embedding function unavailable: %s", e)
+        return None
+
+
+class EmbeddingCache:
+    """SQLite-backed float32 embedding cache keyed on (model, text) hash."""
+
+    def __init__(
+        self,
+        path=None,
+        embedding_fn: Optional[Callable[[List[str]], Any]] = None,
+        model: str = DEFAULT_MODEL,
+    ):
+        self.path = path or get_paths().embedding_cache
+        self.model = model
+        self._embedding_fn = embedding_fn
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _fn(self):
+        if self._embedding_fn is None:
+            self._embedding_fn = shared_embedding_fn()
+        return self._embedding_fn
+
+    def close(self):
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Lookup / compute
+    # ------------------------------------------------------------------
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\0{text}".encode()).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the given texts, keyed by cache key."""
+        keys = list({self.key(t) for t in texts})
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            db = self._db()
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = db.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({marks})", chunk,
+                ).fetchall()
+                for k, blob in rows:
+                    found[k] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        """Store vectors keyed by cache key."""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (k, self.model, int(v.shape[0]), np.asarray(v, dtype=np.float32).tobytes(), now)
+            for k, v in items.items()
+        ]
+        with self._lock:
+            db = self._db()
+            db.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, model, dim, vec, created) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            db.commit()
+
+    def embed(self, texts: Sequence[str]) -> Optional[List[List[float]]]:
+        """
+        Embed texts, computing only those not already cached.
+
+        Returns one vector per input (in order), or None when the
+        embedding model is unavailable.
+        """
+        if not texts:
+            return []
+
+        keys = [self.key(t) for t in texts]
+        cached = self.get_many(texts)
+
+        missing: Dict[str, str] = {}
+        for k, t in zip(keys, texts):
+            if k not in cached and k not in missing:
+                missing[k] = t
+
+        self.hits += sum(1 for k in keys if k in cached)
+        if missing:
+            fn = self._fn()
+            if fn is None:
+                return None
+            try:
+                vectors = fn(list(missing.values()))
+            except Exception as e:
+                logger.warning("Embedding failed: %s", e)
+                return None
+            self.misses += len(missing)
+            fresh = {
+                k: np.asarray(v, dtype=np.float32)
+                for k, v in zip(missing.keys(), vectors)
+            }
+            self.put_many(fresh)
+            cached.update(fresh)
+
+        return [cached[k].tolist() for k in keys]
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            db = self._db()
+            count, size = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(vec)), 0) FROM embeddings"
+            ).fetchone()
+        return {
+            "entries": count,
+            "bytes": size,
+            "model": self.model,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# ============================================================================
+# Singleton + helpers
+# ============================================================================
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+_shared_fn = None
+_shared_fn_lock = threading.Lock()
+
+
+def shared_embedding_fn() -> Optional[Callable[[List[str]], Any]]:
+    """The process-wide embedding function, or None if unavailable.
+
+    The cache and every ChromaDB collection (memory.chroma) use this one
+    instance, so the model is loaded once per process rather than once
+    per collection.
+    """
+    global _shared_fn
+    with _shared_fn_lock:
+        if _shared_fn is None:
+            _shared_fn = _default_embedding_fn()
+        return _shared_fn
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
+
+
+def reset_embedding_cache():
+    """Drop the singleton (used by tests after reconfiguring paths)."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+
+
+def embed_documents(texts: Sequence[str]) -> Optional[List[List[float]]]:
+    """Cached embeddings for texts, or None to let ChromaDB embed them."""
+    if not NUMPY_AVAILABLE:
+        return None
+    try:
+        return get_embedding_cache().embed(texts)
+    except Exception as e:
+        logger.warning("Embedding cache unavailable: %s", e)
+        return None
+
+
+def query_args(texts: Sequence[str]) -> Dict[str, Any]:
+    """collection.query() kwargs: query_embeddings when cached, else query_texts."""
+    vectors = embed_documents(texts)
+    if vectors is None:
+        return {"query_texts": list(texts)}
+    return {"query_embeddings": vectors}
+
+
+def embed_query(text: str) -> Optional[List[float]]:
+    """Embed one query for fanning out to several collections (None = no model).
+
+    Every store shares the same model and vector space, so one vector can
+    be handed to each search via its query_embedding argument.
+    """
+    vectors = embed_documents([text])
+    return vectors[0] if vectors else None
+
+
+def query_args_for(query: str, embedding: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """query_args() for a single query, reusing a precomputed vector if given."""
+    if embedding is not None:
+        return {"query_embeddings": [list(embedding)]}
+    return query_args([query])
@@ -12,13 +12,6 @@ from typing import Optional
 
 from daemon.schemas import atomic_write_json
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 try:
     from daemon.state import get_mood
     STATE_AVAILABLE = True
@@ -32,11 +25,11 @@ except ImportError:
     LLM_AVAILABLE = False
 
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
 
 _p = get_paths()
 EPISODES_DIR = _p.episodes_dir
 EPISODES_INDEX = EPISODES_DIR / "index.json"
-CHROMA_DIR = _p.episodes_db
 
 
 class CoreMixin:
@@ -52,19 +45,10 @@ class CoreMixin:
             self._init_chroma()
 
     def _init_chroma(self):
-        """Initialize ChromaDB for milestone search."""
-        CHROMA_DIR.mkdir(parents=True, exist_ok=True)
-        self.chroma_client = chromadb.PersistentClient(
-            path=str(CHROMA_DIR),
-            settings=Settings(anonymized_telemetry=False)
-        )
-        self.milestones_collection = self.chroma_client.get_or_create_collection(
-            name="elara_milestones",
-            metadata={
-                "description": "Searchable milestones from episodes",
-                "hnsw:space": "cosine",
-            }
-        )
+        """Open the milestone collection from the shared ChromaDB registry."""
+        chroma = get_chroma()
+        self.milestones_collection = chroma.collection("elara_milestones")
+        self.chroma_client = chroma.client(chroma.path_for("elara_milestones"))
 
     def _load_index(self) -> dict:
         """Load episodes index."""
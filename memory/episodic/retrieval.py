@@ -8,6 +8,8 @@ Episodic retrieval — get, search, project queries.
 
 from typing import List, Optional
 
+from memory.embeddings import query_args_for
+
 
 class RetrievalMixin:
     """Mixin for episode retrieval operations."""
@@ -44,8 +46,9 @@ class RetrievalMixin:
         query: str,
         n_results: int = 10,
         project: str = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[dict]:
-        """Search milestones by semantic similarity."""
+        """Search milestones by semantic similarity (query_embedding: precomputed vector)."""
         if not self.milestones_collection:
             return []
 
@@ -54,7 +57,7 @@ class RetrievalMixin:
             where_filter = {"projects": {"$contains": project}}
 
         results = self.milestones_collection.query(
-            query_texts=[query],
+            **query_args_for(query, query_embedding),
             n_results=n_results,
             where=where_filter,
         )
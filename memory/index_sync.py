@@ -0,0 +1,242 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Change-tracked ChromaDB sync — push only what changed since the last sync.
+
+Problem: JSON-backed modules (corrections, principles, models, predictions,
+reasoning, workflows) kept their index current by upserting every entry.
+Each upsert re-embeds the document, and check_corrections did it for the
+whole corrections file on every user prompt. Entries removed from the JSON
+(or re-keyed by an edit) were never deleted from the collection.
+
+Solution: a manifest next to the collection records, per id, a hash of the
+indexed document and a hash of its metadata. sync_collection() diffs the
+entries it is given against the manifest and:
+  - upserts new entries and entries whose document changed (re-embedded)
+  - update()s entries where only the metadata changed (no embedding)
+  - deletes ids that are in the manifest but no longer in the entries
+  - does nothing at all when nothing changed
+
+The manifest is trusted only while it matches the live collection: same
+collection id, same embedding model, same count. Anything else (first run,
+collection recreated, a writer that bypassed the manifest) triggers one
+full resync, which also prunes ids the manifest never knew about.
+
+Usage:
+    from memory.index_sync import build_items, delete_items, sync_collection, upsert_items
+    sync_collection(coll, build_items(principles, "principle_id", _index_entry))
+    upsert_items(coll, {pid: (text, metadata)})   # single-entry write paths
+    delete_items(coll, [pid])
+"""
+
+import hashlib
+import json
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from daemon.schemas import atomic_write_json
+from memory.chroma import get_chroma
+from memory.embeddings import DEFAULT_MODEL
+
+logger = logging.getLogger("elara.memory.index_sync")
+
+MANIFEST_VERSION = 1
+SYNC_BATCH = 500
+
+# id -> (document, metadata)
+Items = Dict[str, Tuple[str, Dict[str, Any]]]
+
+
+def _hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _fingerprint(document: str, metadata: Dict[str, Any]) -> list:
+    return [_hash(document), _hash(json.dumps(metadata, sort_keys=True, default=str))]
+
+
+def build_items(entries: Iterable[Dict[str, Any]], id_key: str,
+                index_entry: Callable[[Dict[str, Any]], Optional[tuple]]) -> Items:
+    """Items from JSON entries. Entries without an id or indexable text are skipped."""
+    items: Items = {}
+    for entry in entries:
+        item_id = entry.get(id_key)
+        indexed = index_entry(entry) if item_id else None
+        if indexed is not None:
+            items[item_id] = indexed
+    return items
+
+
+def manifest_path(collection) -> Path:
+    """Manifest file for a registered collection, next to its store."""
+    return get_chroma().path_for(collection.name) / f"{collection.name}.manifest.json"
+
+
+@contextmanager
+def _locked(path: Path):
+    """Serialize manifest read-modify-write across processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "a") as lock:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _load_manifest(path: Path, collection) -> Optional[Dict[str, list]]:
+    """Manifest entries, or None if missing or out of step with the collection."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    entries = data.get("entries")
+    if (data.get("version") != MANIFEST_VERSION
+            or data.get("collection_id") != str(collection.id)
+            or data.get("model") != DEFAULT_MODEL
+            or not isinstance(entries, dict)
+            or collection.count() != len(entries)):
+        return None
+    return entries
+
+
+def _save_manifest(path: Path, collection, entries: Dict[str, list]):
+    atomic_write_json(path, {
+        "version": MANIFEST_VERSION,
+        "collection_id": str(collection.id),
+        "model": DEFAULT_MODEL,
+        "entries": entries,
+    })
+
+
+def _batches(ids: list) -> Iterable[list]:
+    for i in range(0, len(ids), SYNC_BATCH):
+        yield ids[i:i + SYNC_BATCH]
+
+
+def _apply(collection, items: Items, known: Dict[str, list], ids: Iterable[str],
+           report: Dict[str, int]):
+    """Push `ids` from items, comparing against `known`. Updates `known` in place."""
+    upserts, updates = [], []
+    for item_id in ids:
+        document, metadata = items[item_id]
+        fp = _fingerprint(document, metadata)
+        old = known.get(item_id)
+        if old == fp:
+            report["unchanged"] += 1
+        elif old is not None and old[0] == fp[0]:
+            updates.append((item_id, fp))
+        else:
+            upserts.append((item_id, fp))
+
+    for chunk in _batches(upserts):
+        collection.upsert(
+            ids=[i for i, _ in chunk],
+            documents=[items[i][0] for i, _ in chunk],
+            metadatas=[items[i][1] for i, _ in chunk],
+        )
+        for item_id, fp in chunk:
+            report["changed" if item_id in known else "added"] += 1
+            known[item_id] = fp
+
+    for chunk in _batches(updates):
+        collection.update(
+            ids=[i for i, _ in chunk],
+            metadatas=[items[i][1] for i, _ in chunk],
+        )
+        for item_id, fp in chunk:
+            known[item_id] = fp
+        report["metadata_only"] += len(chunk)
+
+
+def _delete(collection, ids: list, known: Dict[str, list], report: Dict[str, int]):
+    for chunk in _batches(ids):
+        collection.delete(ids=chunk)
+        for item_id in chunk:
+            known.pop(item_id, None)
+        report["deleted"] += len(chunk)
+
+
+def _report() -> Dict[str, int]:
+    return {"added": 0, "changed": 0, "metadata_only": 0, "deleted": 0,
+            "unchanged": 0, "full_resync": False}
+
+
+def sync_collection(collection, items: Items) -> Dict[str, Any]:
+    """Make the collection hold exactly `items`, pushing only the differences.
+
+    Returns counts of added / changed / metadata_only / deleted / unchanged
+    entries, and whether the manifest had to be rebuilt (full_resync).
+    """
+    report = _report()
+    path = manifest_path(collection)
+    with _locked(path):
+        known = _load_manifest(path, collection)
+        if known is None:
+            report["full_resync"] = True
+            existing = collection.get(include=[])["ids"]
+            known = {}
+            stale = [i for i in existing if i not in items]
+        else:
+            stale = [i for i in known if i not in items]
+
+        try:
+            if stale:
+                _delete(collection, stale, known, report)
+            _apply(collection, items, known, list(items), report)
+        finally:
+            # Whatever was pushed before a failure is recorded; the count
+            # check catches anything half-applied inside a batch.
+            _save_manifest(path, collection, known)
+
+    if report["added"] or report["changed"] or report["metadata_only"] or report["deleted"]:
+        logger.debug("Synced %s: %s", collection.name, report)
+    return report
+
+
+def upsert_items(collection, items: Items) -> Dict[str, Any]:
+    """Push a few entries without touching the rest of the collection.
+
+    Used on the single-entry write paths (create, update) so the manifest
+    stays in step and the next full sync has nothing left to do.
+    """
+    report = _report()
+    path = manifest_path(collection)
+    with _locked(path):
+        known = _load_manifest(path, collection)
+        if known is None:
+            # Untracked collection: write through and leave the rebuild
+            # to the next sync_collection().
+            _apply(collection, items, {}, list(items), report)
+            return report
+        try:
+            _apply(collection, items, known, list(items), report)
+        finally:
+            _save_manifest(path, collection, known)
+    return report
+
+
+def delete_items(collection, ids: Iterable[str]) -> Dict[str, Any]:
+    """Remove entries from the collection and its manifest."""
+    report = _report()
+    ids = list(ids)
+    path = manifest_path(collection)
+    with _locked(path):
+        known = _load_manifest(path, collection)
+        if known is None:
+            _delete(collection, ids, {}, report)
+            return report
+        present = [i for i in ids if i in known]
+        try:
+            _delete(collection, present, known, report)
+        finally:
+            _save_manifest(path, collection, known)
+    return report
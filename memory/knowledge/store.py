@@ -24,14 +24,9 @@ import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
-except ImportError:
-    CHROMA_AVAILABLE = False
-
 from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import embed_documents, query_args
 
 logger = logging.getLogger("elara.knowledge")
 
@@ -103,7 +98,6 @@ class KnowledgeStore:
     def __init__(self):
         self._p = get_paths()
         self._conn: Optional[sqlite3.Connection] = None
-        self._chroma_client = None
         self._chroma_collection = None
 
     # ------------------------------------------------------------------
@@ -131,16 +125,7 @@ class KnowledgeStore:
             return None
 
         try:
-            db_dir = self._p.knowledge_vector_db
-            db_dir.mkdir(parents=True, exist_ok=True)
-            self._chroma_client = chromadb.PersistentClient(
-                path=str(db_dir),
-                settings=Settings(anonymized_telemetry=False),
-            )
-            self._chroma_collection = self._chroma_client.get_or_create_collection(
-                name="elara_knowledge",
-                metadata={"hnsw:space": "cosine"},
-            )
+            self._chroma_collection = get_chroma().collection("elara_knowledge")
             return self._chroma_collection
         except (OSError, ValueError, RuntimeError) as e:
             logger.warning("Failed to init knowledge ChromaDB: %s", e)
@@ -203,6 +188,7 @@ class KnowledgeStore:
                 coll.upsert(
                     ids=[node_id],
                     documents=[content],
+                    embeddings=embed_documents([content]),
                     metadatas=[metadata],
                 )
             except Exception as e:
@@ -267,7 +253,10 @@ class KnowledgeStore:
 
         if ids:
             try:
-                coll.upsert(ids=ids, documents=documents, metadatas=metadatas)
+                coll.upsert(
+                    ids=ids, documents=documents, metadatas=metadatas,
+                    embeddings=embed_documents(documents),
+                )
             except Exception as e:
                 logger.warning("Batch ChromaDB upsert failed: %s", e)
 
@@ -502,9 +491,9 @@ class KnowledgeStore:
 
         try:
             results = coll.query(
-                query_texts=[query],
                 n_results=min(n, coll.count() or 1),
                 where=where if where else None,
+                **query_args([query]),
             )
         except Exception as e:
             logger.warning("ChromaDB search failed: %s", e)
@@ -584,28 +573,36 @@ class KnowledgeStore:
         rows = db.execute("SELECT * FROM nodes WHERE content IS NOT NULL AND content != ''").fetchall()
         indexed = 0
 
-        for row in rows:
-            row = dict(row)
-            metadata = {
-                "semantic_id": row["semantic_id"],
-                "type": row["type"],
-                "granularity": row["granularity"],
-                "confidence": row["confidence"],
-            }
-            if row.get("source_doc"):
-                metadata["source_doc"] = row["source_doc"]
-            if row.get("time"):
-                metadata["time"] = row["time"]
+        # Batched so unchanged content is served from the embedding cache
+        batch_size = 256
+        for start in range(0, len(rows), batch_size):
+            ids = []
+            documents = []
+            metadatas = []
+            for row in rows[start:start + batch_size]:
+                row = dict(row)
+                metadata = {
+                    "semantic_id": row["semantic_id"],
+                    "type": row["type"],
+                    "granularity": row["granularity"],
+                    "confidence": row["confidence"],
+                }
+                if row.get("source_doc"):
+                    metadata["source_doc"] = row["source_doc"]
+                if row.get("time"):
+                    metadata["time"] = row["time"]
+                ids.append(row["id"])
+                documents.append(row["content"])
+                metadatas.append(metadata)
 
             try:
                 coll.upsert(
-                    ids=[row["id"]],
-                    documents=[row["content"]],
-                    metadatas=[metadata],
+                    ids=ids, documents=documents, metadatas=metadatas,
+                    embeddings=embed_documents(documents),
                 )
-                indexed += 1
+                indexed += len(ids)
             except Exception as e:
-                logger.warning("Failed to reindex node %s: %s", row["id"], e)
+                logger.warning("Failed to reindex nodes %s..%s: %s", ids[0], ids[-1], e)
 
         return {"indexed": indexed, "total_nodes": len(rows)}
 
@@ -0,0 +1,307 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Recall log — buffered writer plus a rolled-up counts index.
+
+Problem: log_recall() opened and appended to one unbounded JSONL per
+returned memory, and consolidation re-read and re-parsed the whole file
+(every recall ever) to count recalls per memory.
+
+Solution:
+  - Recall events are buffered in memory and flushed in one write when the
+    buffer reaches RECALL_FLUSH_EVENTS, after RECALL_FLUSH_SECONDS, or at exit.
+  - Each flush also updates a SQLite counts index in the same pass:
+      recall_counts(memory_id → total, last_recalled)
+      recall_hourly(memory_id, hour → count)   # for "since last run" queries
+  - The raw JSONL is kept for auditing but rotates into numbered segments
+    at RECALL_SEGMENT_BYTES; only RECALL_SEGMENTS_KEPT are retained.
+
+Consolidation reads the index: O(memories recalled), not O(all recalls).
+"since" queries have hour resolution; hourly buckets older than
+RECALL_BUCKET_DAYS are dropped (all-time totals are kept).
+
+An existing pre-index log is folded into the index once, on first open.
+"""
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.paths import get_paths
+
+logger = logging.getLogger("elara.memory.recall_log")
+
+RECALL_FLUSH_EVENTS = 64            # flush when this many events are buffered
+RECALL_FLUSH_SECONDS = 5.0          # ... or this long after the first buffered event
+RECALL_SEGMENT_BYTES = 4 * 1024 * 1024
+RECALL_SEGMENTS_KEPT = 4
+RECALL_BUCKET_DAYS = 90
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recall_counts (
+    memory_id TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    last_recalled REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS recall_hourly (
+    memory_id TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (memory_id, hour)
+);
+
+CREATE INDEX IF NOT EXISTS idx_recall_hourly_hour ON recall_hourly(hour);
+
+CREATE TABLE IF NOT EXISTS recall_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _to_epoch(since: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(since).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class RecallLogger:
+    """Buffered recall event writer with an incrementally maintained counts index."""
+
+    def __init__(self, log_path: Optional[Path] = None, index_path: Optional[Path] = None):
+        p = get_paths()
+        self.log_path = log_path or p.recall_log
+        self.index_path = index_path or p.recall_index
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.flushes = 0
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._backfill_legacy()
+        return self._conn
+
+    def _backfill_legacy(self):
+        """Fold a pre-index recall log into the index once, then rotate it away."""
+        db = self._conn
+        done = db.execute("SELECT value FROM recall_meta WHERE key = 'backfilled'").fetchone()
+        if done:
+            return
+        events = []
+        if self.log_path.exists():
+            try:
+                with open(self.log_path) as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        ts = _to_epoch(entry.get("timestamp", ""))
+                        if entry.get("memory_id") and ts is not None:
+                            events.append((entry["memory_id"], ts))
+            except OSError as e:
+                logger.warning("Recall log backfill failed: %s", e)
+                return
+        self._index_events(db, events)
+        db.execute("INSERT OR REPLACE INTO recall_meta (key, value) VALUES ('backfilled', ?)",
+                   (str(len(events)),))
+        db.commit()
+        if events:
+            logger.info("Recall index backfilled from %d logged recalls", len(events))
+            self._rotate()
+
+    @staticmethod
+    def _index_events(db: sqlite3.Connection, events: List[tuple]):
+        totals: Dict[str, List[float]] = {}
+        hourly: Dict[tuple, int] = {}
+        for memory_id, ts in events:
+            t = totals.setdefault(memory_id, [0, 0.0])
+            t[0] += 1
+            t[1] = max(t[1], ts)
+            key = (memory_id, int(ts // 3600))
+            hourly[key] = hourly.get(key, 0) + 1
+
+        db.executemany(
+            """INSERT INTO recall_counts (memory_id, total, last_recalled) VALUES (?, ?, ?)
+               ON CONFLICT(memory_id) DO UPDATE SET
+                   total = total + excluded.total,
+                   last_recalled = MAX(last_recalled, excluded.last_recalled)""",
+            [(mid, n, last) for mid, (n, last) in totals.items()],
+        )
+        db.executemany(
+            """INSERT INTO recall_hourly (memory_id, hour, count) VALUES (?, ?, ?)
+               ON CONFLICT(memory_id, hour) DO UPDATE SET count = count + excluded.count""",
+            [(mid, hour, n) for (mid, hour), n in hourly.items()],
+        )
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def log(self, memory_id: str, query: str, relevance: float = 0.0) -> None:
+        """Buffer one recall event; flushes on size or after RECALL_FLUSH_SECONDS."""
+        now = time.time()
+        entry = {
+            "memory_id": memory_id,
+            "query": query,
+            "relevance": round(relevance, 4),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
+            "_ts": now,
+        }
+        with self._lock:
+            self._buffer.append(entry)
+            full = len(self._buffer) >= RECALL_FLUSH_EVENTS
+            if not full and self._timer is None:
+                self._timer = threading.Timer(RECALL_FLUSH_SECONDS, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered events to the log segment and the index. Returns events flushed."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._buffer = self._buffer, []
+            if not pending:
+                return 0
+            try:
+                db = self._db()  # before appending, so a first-open backfill can't see these
+                lines = "".join(
+                    json.dumps({k: v for k, v in e.items() if k != "_ts"}) + "\n" for e in pending
+                )
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.log_path, "a") as f:
+                    f.write(lines)
+
+                self._index_events(db, [(e["memory_id"], e["_ts"]) for e in pending])
+                db.commit()
+                self.flushes += 1
+
+                if self.log_path.stat().st_size >= RECALL_SEGMENT_BYTES:
+                    self._rotate()
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Recall log flush failed: %s", e)
+            return len(pending)
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.log_path.parent.glob(f"{self.log_path.stem}.*{self.log_path.suffix}"))
+
+    def _rotate(self):
+        """Move the active log to a timestamped segment; keep the newest few."""
+        if not self.log_path.exists():
+            return
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.log_path.rename(self.log_path.with_name(
+            f"{self.log_path.stem}.{stamp}{self.log_path.suffix}"))
+        for old in self._segments()[:-RECALL_SEGMENTS_KEPT]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def counts(self, since: Optional[str] = None) -> Dict[str, int]:
+        """Recalls per memory_id — all time, or since an ISO timestamp (hour resolution)."""
+        self.flush()
+        with self._lock:
+            db = self._db()
+            cutoff = _to_epoch(since) if since else None
+            if cutoff is None:
+                rows = db.execute("SELECT memory_id, total FROM recall_counts").fetchall()
+            else:
+                rows = db.execute(
+                    "SELECT memory_id, SUM(count) FROM recall_hourly WHERE hour >= ? GROUP BY memory_id",
+                    (int(cutoff // 3600),),
+                ).fetchall()
+        return dict(rows)
+
+    def last_recalled(self) -> Dict[str, float]:
+        """memory_id → epoch of most recent recall."""
+        self.flush()
+        with self._lock:
+            return dict(self._db().execute(
+                "SELECT memory_id, last_recalled FROM recall_counts").fetchall())
+
+    def total(self) -> int:
+        """Total recall events ever indexed."""
+        self.flush()
+        with self._lock:
+            return self._db().execute(
+                "SELECT COALESCE(SUM(total), 0) FROM recall_counts").fetchone()[0]
+
+    def compact(self, keep_days: int = RECALL_BUCKET_DAYS) -> int:
+        """Drop hourly buckets older than keep_days. Returns rows removed."""
+        cutoff_hour = int((time.time() - keep_days * 86400) // 3600)
+        with self._lock:
+            db = self._db()
+            cur = db.execute("DELETE FROM recall_hourly WHERE hour < ?", (cutoff_hour,))
+            db.commit()
+            return cur.rowcount
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+
+# Singleton
+_logger_instance: Optional[RecallLogger] = None
+_instance_lock = threading.Lock()
+
+
+def get_recall_logger() -> RecallLogger:
+    global _logger_instance
+    with _instance_lock:
+        if _logger_instance is not None and _logger_instance.log_path != get_paths().recall_log:
+            _logger_instance.close()  # data dir was reconfigured
+            _logger_instance = None
+        if _logger_instance is None:
+            _logger_instance = RecallLogger()
+        return _logger_instance
+
+
+def reset_recall_logger():
+    """Flush and drop the singleton (used by tests after reconfiguring paths)."""
+    global _logger_instance
+    with _instance_lock:
+        if _logger_instance is not None:
+            _logger_instance.close()
+        _logger_instance = None
+
+
+def _flush_at_exit():
+    if _logger_instance is not None:
+        _logger_instance.flush()
+
+
+atexit.register(_flush_at_exit)
@@ -11,6 +11,11 @@ And my current mood affects what surfaces first.
 
 Now with: discrete emotion tagging, emotion-similarity matching,
 and emotional coloring on recall.
+
+Re-ranking is vectorized: encoded valence/energy/openness/importance of
+every candidate go into NumPy arrays and are scored in one pass, so the
+candidate window (RECALL_WINDOW / window=) can grow without a per-hit
+Python cost. Result dicts are only built for the hits that are returned.
 """
 
 import logging
@@ -21,14 +26,11 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 import hashlib
 
-# ChromaDB import
 try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMA_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    CHROMA_AVAILABLE = False
-    print("ChromaDB not installed. Run: pip install chromadb")
+    NUMPY_AVAILABLE = False
 
 # Import state for mood-congruent retrieval
 try:
@@ -44,11 +46,67 @@ try:
 except ImportError:
     EMOTIONS_AVAILABLE = False
 
-from core.paths import get_paths
+from memory.chroma import CHROMA_AVAILABLE, get_chroma
+from memory.embeddings import embed_documents, query_args_for
+
+if not CHROMA_AVAILABLE:
+    print("ChromaDB not installed. Run: pip install chromadb")
 
 logger = logging.getLogger("elara.memory.vector")
 
-MEMORY_DIR = get_paths().memory_db
+# Candidates fetched from ChromaDB for recall() re-ranking (override with window=)
+RECALL_WINDOW = 20
+# Memories scanned by recall_mood_congruent() (override with window=)
+MOOD_SCAN_WINDOW = 50
+
+# Resonance weights: valence, energy, openness, importance
+_RESONANCE_WEIGHTS = (0.45, 0.2, 0.1, 0.1)
+_SAME_EMOTION_BONUS = 0.15
+_SAME_QUADRANT_BONUS = 0.08
+
+
+def resonance_scores(metas: List[Dict[str, Any]], current_mood: Dict[str, Any]) -> "np.ndarray":
+    """
+    Vectorized VectorMemory._calculate_resonance() over many memories.
+
+    Returns one resonance per metadata dict, capped at 1.0.
+    """
+    n = len(metas)
+    encoded = np.array(
+        [
+            (
+                m.get("encoded_valence", 0.5),
+                m.get("encoded_energy", 0.5),
+                m.get("encoded_openness", 0.5),
+                m.get("importance", 0.5),
+            )
+            for m in metas
+        ],
+        dtype=np.float64,
+    ).reshape(n, 4)
+    current = np.array([
+        current_mood.get("valence", 0.5),
+        current_mood.get("energy", 0.5),
+        current_mood.get("openness", 0.5),
+    ])
+    w_valence, w_energy, w_openness, w_importance = _RESONANCE_WEIGHTS
+
+    match = 1 - np.abs(encoded[:, :3] - current)
+    resonance = match @ np.array([w_valence, w_energy, w_openness]) + encoded[:, 3] * w_importance
+
+    current_emotion = current_mood.get("emotion", "")
+    if current_emotion and n:
+        emotions = np.array([m.get("encoded_emotion", "") for m in metas], dtype=object)
+        same_emotion = emotions == current_emotion
+        bonus = np.where(same_emotion, _SAME_EMOTION_BONUS, 0.0)
+        current_quadrant = current_mood.get("quadrant", "")
+        if current_quadrant:
+            quadrants = np.array([m.get("encoded_quadrant", "") for m in metas], dtype=object)
+            same_quadrant = (emotions != "") & (quadrants == current_quadrant)
+            bonus = np.where(~same_emotion & same_quadrant, _SAME_QUADRANT_BONUS, bonus)
+        resonance = resonance + bonus
+
+    return np.minimum(resonance, 1.0)
 
 
 class VectorMemory:
@@ -65,22 +123,10 @@ class VectorMemory:
             self._init_db()
 
     def _init_db(self):
-        """Initialize ChromaDB."""
-        MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-
-        self.client = chromadb.PersistentClient(
-            path=str(MEMORY_DIR),
-            settings=Settings(anonymized_telemetry=False)
-        )
-
-        # Main memory collection — cosine similarity
-        self.collection = self.client.get_or_create_collection(
-            name="elara_memories",
-            metadata={
-                "description": "Elara's long-term semantic memory",
-                "hnsw:space": "cosine",
-            }
-        )
+        """Open the memory collection (cosine) from the shared registry."""
+        chroma = get_chroma()
+        self.collection = chroma.collection("elara_memories")
+        self.client = chroma.client(chroma.path_for("elara_memories"))
 
     def _generate_id(self, text: str, timestamp: str) -> str:
         """Generate unique ID for a memory."""
@@ -150,6 +196,7 @@ class VectorMemory:
 
         self.collection.add(
             documents=[content],
+            embeddings=embed_documents([content]),
             metadatas=[meta],
             ids=[memory_id]
         )
@@ -162,7 +209,9 @@ class VectorMemory:
         n_results: int = 5,
         memory_type: Optional[str] = None,
         min_importance: float = 0,
-        mood_weight: float = 0.3
+        mood_weight: float = 0.3,
+        window: Optional[int] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search memories by semantic similarity with mood-congruent boosting.
@@ -174,6 +223,9 @@ class VectorMemory:
             min_importance: Minimum importance threshold
             mood_weight: How much current mood affects ranking (0-1)
                         0 = pure semantic, 1 = heavily mood-biased
+            window: Candidates fetched for re-ranking
+                    (default: 3x n_results, capped at RECALL_WINDOW)
+            query_embedding: Precomputed vector for query (see embed_query)
 
         Returns:
             List of matching memories with metadata and resonance scores
@@ -182,7 +234,10 @@ class VectorMemory:
             return []
 
         # Get more results than needed so we can re-rank
-        fetch_count = min(n_results * 3, 20)
+        if window:
+            fetch_count = max(n_results, window)
+        else:
+            fetch_count = min(n_results * 3, RECALL_WINDOW)
 
         # Build filter
         where_filter = None
@@ -190,57 +245,27 @@ class VectorMemory:
             where_filter = {"type": memory_type}
 
         results = self.collection.query(
-            query_texts=[query],
             n_results=fetch_count,
-            where=where_filter
+            where=where_filter,
+            **query_args_for(query, query_embedding),
         )
 
         # Get current mood for congruent boosting
         current_mood = self._get_current_emotional_context()
 
-        # Format and score results
-        memories = []
+        final = []
         if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                distance = results["distances"][0][i] if results["distances"] else 0
-
-                # Filter by importance
-                if meta.get("importance", 0) < min_importance:
-                    continue
-
-                # Base semantic relevance (convert distance to similarity)
-                semantic_score = max(0, 1 - distance)
-
-                # Calculate emotional resonance
-                resonance = self._calculate_resonance(meta, current_mood)
-
-                # Combined score
-                combined_score = (
-                    semantic_score * (1 - mood_weight) +
-                    resonance * mood_weight
-                )
-
-                memories.append({
-                    "content": doc,
-                    "memory_id": results["ids"][0][i],
-                    "relevance": semantic_score,
-                    "resonance": resonance,
-                    "combined_score": combined_score,
-                    "type": meta.get("type"),
-                    "importance": meta.get("importance"),
-                    "date": meta.get("date"),
-                    "timestamp": meta.get("timestamp"),
-                    "encoded_valence": meta.get("encoded_valence"),
-                    "encoded_emotion": meta.get("encoded_emotion"),
-                    "encoded_blend": meta.get("encoded_blend"),
-                    "encoded_quadrant": meta.get("encoded_quadrant"),
-                })
-
-        # Sort by combined score
-        memories.sort(key=lambda x: x["combined_score"], reverse=True)
-
-        final = memories[:n_results]
+            docs = results["documents"][0]
+            final = self._rank_hits(
+                ids=results["ids"][0],
+                docs=docs,
+                metas=results["metadatas"][0] if results["metadatas"] else [{}] * len(docs),
+                distances=results["distances"][0] if results["distances"] else [0] * len(docs),
+                current_mood=current_mood,
+                mood_weight=mood_weight,
+                min_importance=min_importance,
+                n_results=n_results,
+            )
 
         # Log recall events for consolidation tracking
         try:
@@ -253,6 +278,81 @@ class VectorMemory:
 
         return final
 
+    def _rank_hits(self, **kwargs) -> List[Dict[str, Any]]:
+        """Score and order ChromaDB hits; vectorized when NumPy is available."""
+        if NUMPY_AVAILABLE:
+            return self._rank_hits_vectorized(**kwargs)
+        return self._rank_hits_scalar(**kwargs)
+
+    def _rank_hits_vectorized(
+        self, ids, docs, metas, distances, current_mood,
+        mood_weight: float, min_importance: float, n_results: int,
+    ) -> List[Dict[str, Any]]:
+        semantic = np.maximum(0, 1 - np.asarray(distances, dtype=np.float64))
+        resonance = resonance_scores(metas, current_mood)
+        combined = semantic * (1 - mood_weight) + resonance * mood_weight
+
+        if min_importance > 0:
+            importance = np.array([m.get("importance", 0) for m in metas], dtype=np.float64)
+            candidates = np.flatnonzero(importance >= min_importance)
+        else:
+            candidates = np.arange(len(docs))
+
+        # Stable descending order (ties keep ChromaDB order, like list.sort)
+        order = candidates[np.argsort(-combined[candidates], kind="stable")][:n_results]
+        return [
+            self._hit(ids[i], docs[i], metas[i], float(semantic[i]),
+                      float(resonance[i]), float(combined[i]))
+            for i in order
+        ]
+
+    def _rank_hits_scalar(
+        self, ids, docs, metas, distances, current_mood,
+        mood_weight: float, min_importance: float, n_results: int,
+    ) -> List[Dict[str, Any]]:
+        memories = []
+        for i, doc in enumerate(docs):
+            meta = metas[i]
+
+            # Filter by importance
+            if meta.get("importance", 0) < min_importance:
+                continue
+
+            # Base semantic relevance (convert distance to similarity)
+            semantic_score = max(0, 1 - distances[i])
+
+            # Calculate emotional resonance
+            resonance = self._calculate_resonance(meta, current_mood)
+
+            # Combined score
+            combined_score = (
+                semantic_score * (1 - mood_weight) +
+                resonance * mood_weight
+            )
+            memories.append(self._hit(ids[i], doc, meta, semantic_score, resonance, combined_score))
+
+        # Sort by combined score
+        memories.sort(key=lambda x: x["combined_score"], reverse=True)
+        return memories[:n_results]
+
+    @staticmethod
+    def _hit(memory_id, doc, meta, semantic_score, resonance, combined_score) -> Dict[str, Any]:
+        return {
+            "content": doc,
+            "memory_id": memory_id,
+            "relevance": semantic_score,
+            "resonance": resonance,
+            "combined_score": combined_score,
+            "type": meta.get("type"),
+            "importance": meta.get("importance"),
+            "date": meta.get("date"),
+            "timestamp": meta.get("timestamp"),
+            "encoded_valence": meta.get("encoded_valence"),
+            "encoded_emotion": meta.get("encoded_emotion"),
+            "encoded_blend": meta.get("encoded_blend"),
+            "encoded_quadrant": meta.get("encoded_quadrant"),
+        }
+
     def _calculate_resonance(self, memory_meta: dict, current_mood: dict) -> float:
         """
         Calculate how much a memory resonates with current mood.
@@ -352,10 +452,16 @@ class VectorMemory:
         memories.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
         return memories[:n_results]
 
-    def recall_mood_congruent(self, n_results: int = 5) -> List[Dict[str, Any]]:
+    def recall_mood_congruent(
+        self,
+        n_results: int = 5,
+        window: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Get memories that match current mood (without specific query).
         Used for spontaneous recall, nostalgia, rumination.
+
+        window: how many memories to scan (default MOOD_SCAN_WINDOW).
         """
         if not CHROMA_AVAILABLE or not self.collection:
             return []
@@ -364,32 +470,38 @@ class VectorMemory:
 
         # Get a batch of recent/important memories
         results = self.collection.get(
-            limit=50,
+            limit=window or MOOD_SCAN_WINDOW,
             include=["documents", "metadatas"]
         )
 
-        memories = []
-        if results["documents"]:
-            for i, doc in enumerate(results["documents"]):
-                meta = results["metadatas"][i] if results["metadatas"] else {}
+        docs = results["documents"] or []
+        if not docs:
+            return []
+        metas = results["metadatas"] or [{}] * len(docs)
 
-                resonance = self._calculate_resonance(meta, current_mood)
-
-                memories.append({
-                    "content": doc,
-                    "resonance": resonance,
-                    "type": meta.get("type"),
-                    "importance": meta.get("importance"),
-                    "date": meta.get("date"),
-                    "timestamp": meta.get("timestamp"),
-                    "encoded_valence": meta.get("encoded_valence"),
-                    "encoded_emotion": meta.get("encoded_emotion"),
-                    "encoded_blend": meta.get("encoded_blend"),
-                })
-
-        # Sort by resonance
-        memories.sort(key=lambda x: x["resonance"], reverse=True)
-        return memories[:n_results]
+        if NUMPY_AVAILABLE:
+            scores = resonance_scores(metas, current_mood)
+            order = np.argsort(-scores, kind="stable")[:n_results]
+            ranked = [(i, float(scores[i])) for i in order]
+        else:
+            scores = [self._calculate_resonance(meta, current_mood) for meta in metas]
+            ranked = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)[:n_results]
+
+        memories = []
+        for i, resonance in ranked:
+            meta = metas[i]
+            memories.append({
+                "content": docs[i],
+                "resonance": resonance,
+                "type": meta.get("type"),
+                "importance": meta.get("importance"),
+                "date": meta.get("date"),
+                "timestamp": meta.get("timestamp"),
+                "encoded_valence": meta.get("encoded_valence"),
+                "encoded_emotion": meta.get("encoded_emotion"),
+                "encoded_blend": meta.get("encoded_blend"),
+            })
+        return memories
 
     def create_imprint_memory(
         self,
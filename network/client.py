@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 logger = logging.getLogger("elara.network.client")
 
 DEFAULT_TIMEOUT = 10.0
+BATCH_TIMEOUT = 120.0  # a full batch is up to MAX_BATCH_BYTES
 
 
 class NetworkClient:
@@ -58,6 +59,101 @@ class NetworkClient:
             logger.error("Failed to query records from %s:%d — %s", host, port, e)
             return []
 
+    async def push_records(self, host: str, port: int, wires: List[bytes]) -> dict:
+        """Submit many records in one request as length-prefixed frames.
+
+        Returns the server's counts (accepted, duplicates, rejected, ...).
+        Callers split larger sets into chunks of network.sync.MAX_BATCH_RECORDS.
+        """
+        from aiohttp import ClientTimeout
+        from network.sync import RECORDS_CONTENT_TYPE, encode_frames
+
+        session = await self._get_session()
+        url = f"http://{host}:{port}/records/batch"
+        try:
+            async with session.post(
+                url, data=encode_frames(wires),
+                headers={"Content-Type": RECORDS_CONTENT_TYPE},
+                timeout=ClientTimeout(total=BATCH_TIMEOUT),
+            ) as resp:
+                return await resp.json()
+        except Exception as e:
+            logger.error("Failed to push %d records to %s:%d — %s", len(wires), host, port, e)
+            return {"error": str(e)}
+
+    async def pull_records(
+        self, host: str, port: int, cursor: Optional[str] = None,
+        limit: int = 500, since: float = 0,
+    ) -> dict:
+        """Fetch one page of records from a remote node.
+
+        Returns {"records": [wire bytes], "cursor": str|None, "count": int}.
+        Pass the returned cursor back to get the next page; None means done.
+        """
+        from aiohttp import ClientTimeout
+        from network.sync import read_frames, read_trailer
+
+        session = await self._get_session()
+        url = f"http://{host}:{port}/records/pull"
+        body = {"cursor": cursor, "limit": limit, "since": since}
+        try:
+            async with session.post(url, json=body,
+                                    timeout=ClientTimeout(total=BATCH_TIMEOUT)) as resp:
+                if resp.status != 200:
+                    data = await resp.json()
+                    return {"error": data.get("error", f"HTTP {resp.status}")}
+                records = [wire async for wire in read_frames(resp.content, max_frames=limit)]
+                trailer = await read_trailer(resp.content)
+            return {
+                "records": records,
+                "cursor": trailer.get("cursor"),
+                "count": len(records),
+            }
+        except Exception as e:
+            logger.error("Failed to pull records from %s:%d — %s", host, port, e)
+            return {"error": str(e)}
+
+    async def fetch_records(self, host: str, port: int, ids: List[str]) -> dict:
+        """Fetch specific records by id. Returns {"records": [wire bytes], "missing": [ids]}."""
+        from aiohttp import ClientTimeout
+        from network.sync import read_frames, read_trailer
+
+        session = await self._get_session()
+        url = f"http://{host}:{port}/records/fetch"
+        try:
+            async with session.post(url, json={"ids": ids},
+                                    timeout=ClientTimeout(total=BATCH_TIMEOUT)) as resp:
+                if resp.status != 200:
+                    data = await resp.json()
+                    return {"error": data.get("error", f"HTTP {resp.status}")}
+                records = [wire async for wire in read_frames(resp.content, max_frames=len(ids))]
+                trailer = await read_trailer(resp.content)
+            return {"records": records, "missing": trailer.get("missing", [])}
+        except Exception as e:
+            logger.error("Failed to fetch records from %s:%d — %s", host, port, e)
+            return {"error": str(e)}
+
+    async def reconcile_summary(self, host: str, port: int, prefixes: List[str]) -> dict:
+        """Bucket fingerprints for anti-entropy (see network.reconcile)."""
+        return await self._post_json(host, port, "/reconcile/summary", {"prefixes": prefixes})
+
+    async def reconcile_ids(self, host: str, port: int, prefixes: List[str]) -> dict:
+        """Record ids held under each bucket prefix (see network.reconcile)."""
+        return await self._post_json(host, port, "/reconcile/ids", {"prefixes": prefixes})
+
+    async def _post_json(self, host: str, port: int, path: str, body: dict) -> dict:
+        session = await self._get_session()
+        url = f"http://{host}:{port}{path}"
+        try:
+            async with session.post(url, json=body) as resp:
+                data = await resp.json()
+                if resp.status != 200 and "error" not in data:
+                    data["error"] = f"HTTP {resp.status}"
+                return data
+        except Exception as e:
+            logger.error("Failed POST %s to %s:%d — %s", path, host, port, e)
+            return {"error": str(e)}
+
     async def request_witness(
         self, host: str, port: int, wire_bytes: bytes,
         verify_key: Optional[bytes] = None, signable: Optional[bytes] = None,
@@ -87,6 +183,29 @@ class NetworkClient:
             logger.error("Failed to request witness from %s:%d — %s", host, port, e)
             return {"error": str(e)}
 
+    async def request_witness_batch(self, host: str, port: int, wires: List[bytes]) -> dict:
+        """Ask a peer to counter-sign many records in one request.
+
+        Returns {"witness": identity_hash, "attestations": [{"record_id",
+        "signature" (hex), "timestamp"}], "rejected": [...]} or {"error"}.
+        Signatures are not checked here; network.collect verifies them.
+        """
+        from network.sync import RECORDS_CONTENT_TYPE, encode_frames
+
+        session = await self._get_session()
+        url = f"http://{host}:{port}/witness/batch"
+        try:
+            async with session.post(url, data=encode_frames(wires),
+                                    headers={"Content-Type": RECORDS_CONTENT_TYPE}) as resp:
+                data = await resp.json()
+                if resp.status != 200 and "error" not in data:
+                    data["error"] = f"HTTP {resp.status}"
+                return data
+        except Exception as e:
+            logger.error("Failed to request %d witnesses from %s:%d — %s",
+                         len(wires), host, port, e)
+            return {"error": str(e)}
+
     async def get_status(self, host: str, port: int) -> dict:
         """Get status from a remote node."""
         session = await self._get_session()
@@ -0,0 +1,147 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Witness collection — fan batched witness requests out to peers until quorum.
+
+    report = await collect_witnesses(client, peers, records, quorum=2, manager=wm)
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from network.signing import verify_signature
+from network.sync import MAX_WITNESS_BATCH
+from network.types import WitnessAttestation
+
+logger = logging.getLogger("elara.network.collect")
+
+DEFAULT_QUORUM = 2
+DEFAULT_DEADLINE = 10.0
+
+
+def _check(items):
+    return [verify_signature(signable, sig, pk) for signable, sig, pk in items]
+
+
+async def collect_witnesses(client, peers, records, quorum: int = DEFAULT_QUORUM,
+                            deadline: float = DEFAULT_DEADLINE, manager=None) -> dict:
+    """Fan witness requests for `records` out to `peers` until quorum or deadline.
+
+    `peers` are PeerInfo objects (usually PeerDiscovery.connected_peers);
+    `records` are ValidationRecords. A counter-signature that fails
+    verification is discarded. One that can't be checked because liboqs is
+    missing counts toward quorum and is reported as unverified.
+    """
+    started = time.monotonic()
+    signables = {r.id: r.signable_bytes() for r in records}
+    wires = {r.id: r.to_bytes() for r in records}
+    collected: Dict[str, Dict[str, WitnessAttestation]] = {rid: {} for rid in signables}
+    peer_report: Dict[str, dict] = {}
+    done = asyncio.Event()
+
+    def _needed() -> List[str]:
+        return [rid for rid, got in collected.items() if len(got) < quorum]
+
+    async def ask(peer):
+        entry = peer_report[peer.identity_hash] = {
+            "attested": 0, "invalid": 0, "unverified": 0, "error": None, "ms": None,
+        }
+        t0 = time.monotonic()
+        try:
+            if not peer.public_key:
+                status = await client.get_status(peer.host, peer.port)
+                if status.get("public_key"):
+                    peer.public_key = bytes.fromhex(status["public_key"])
+            if not peer.public_key:
+                entry["error"] = "no public key"
+                return
+
+            pending = list(signables)
+            while pending:
+                needed = set(_needed())
+                chunk = [rid for rid in pending[:MAX_WITNESS_BATCH] if rid in needed]
+                pending = pending[MAX_WITNESS_BATCH:]
+                if not chunk:
+                    continue
+                result = await client.request_witness_batch(
+                    peer.host, peer.port, [wires[rid] for rid in chunk])
+                if "error" in result:
+                    entry["error"] = result["error"]
+                    return
+
+                returned = [a for a in result.get("attestations", [])
+                            if a.get("record_id") in signables]
+                sigs = [bytes.fromhex(a["signature"]) for a in returned]
+                verdicts = await asyncio.to_thread(_check, [
+                    (signables[a["record_id"]], sig, peer.public_key)
+                    for a, sig in zip(returned, sigs)
+                ])
+                # Signatures were checked against this peer's key, so they
+                # are filed under this peer's identity, whatever it claims.
+                claimed = result.get("witness")
+                if claimed and claimed != peer.identity_hash:
+                    entry["error"] = f"answered as witness {claimed[:16]}..."
+                    entry["invalid"] += len(returned)
+                    return
+                witness = peer.identity_hash
+                for a, sig, valid in zip(returned, sigs, verdicts):
+                    if valid is False:
+                        entry["invalid"] += 1
+                        continue
+                    entry["attested"] += 1
+                    if valid is None:
+                        entry["unverified"] += 1
+                    collected[a["record_id"]].setdefault(witness, WitnessAttestation(
+                        record_id=a["record_id"],
+                        witness_identity_hash=witness,
+                        witness_signature=sig,
+                        timestamp=a.get("timestamp", time.time()),
+                    ))
+                if not _needed():
+                    done.set()
+        except asyncio.CancelledError:
+            entry["error"] = entry["error"] or "cancelled at quorum/deadline"
+            raise
+        except Exception as e:
+            entry["error"] = str(e)
+        finally:
+            entry["ms"] = round((time.monotonic() - t0) * 1000, 1)
+
+    tasks = {asyncio.create_task(ask(p)) for p in peers}
+    waiter = asyncio.create_task(done.wait())
+    timed_out = False
+    try:
+        remaining = set(tasks)
+        end = asyncio.get_running_loop().time() + deadline
+        while remaining and not done.is_set():
+            timeout = end - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                timed_out = True
+                break
+            finished, _ = await asyncio.wait(remaining | {waiter}, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+            remaining -= finished
+    finally:
+        for task in tasks | {waiter}:
+            task.cancel()
+        await asyncio.gather(*tasks, waiter, return_exceptions=True)
+
+    attestations = [a for got in collected.values() for a in got.values()]
+    if manager is not None and attestations:
+        manager.add_attestations(attestations)
+
+    short = {rid: len(got) for rid, got in collected.items() if len(got) < quorum}
+    if short:
+        logger.info("Witness quorum %d missed for %d/%d records", quorum, len(short), len(collected))
+    return {
+        "quorum": quorum,
+        "reached": [rid for rid in collected if rid not in short],
+        "short": short,
+        "attestations": {rid: list(got.values()) for rid, got in collected.items()},
+        "peers": peer_report,
+        "timed_out": timed_out,
+        "elapsed_s": round(time.monotonic() - started, 3),
+    }
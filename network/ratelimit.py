@@ -2,46 +2,91 @@
 # Licensed under the Business Source License 1.1 (BSL-1.1)
 # See LICENSE file in the project root for full license text.
 
-"""Sliding-window rate limiter for network endpoints."""
+"""Sliding-window-counter rate limiter with bounded, self-evicting per-key state.
 
+    limiter = SlidingWindowLimiter(max_requests=60, window_seconds=60.0)
+    if not limiter.allow(peer_ip): ...
+"""
+
+import threading
 import time
-from collections import defaultdict
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Callable
 
+DEFAULT_MAX_KEYS = 10_000
 
-class PeerRateLimiter:
-    """Per-peer sliding window rate limiter.
 
-    Tracks request timestamps per peer IP. Denies requests
-    exceeding max_requests within window_seconds.
-    """
+class SlidingWindowLimiter:
+    """Per-key sliding-window-counter limiter. O(1) time and memory per key."""
 
-    def __init__(self, max_requests: int = 60, window_seconds: float = 60.0):
+    def __init__(self, max_requests: int = 60, window_seconds: float = 60.0,
+                 max_keys: int = DEFAULT_MAX_KEYS,
+                 clock: Callable[[], float] = time.monotonic):
         self._max_requests = max_requests
         self._window = window_seconds
-        self._requests: Dict[str, List[float]] = defaultdict(list)
+        self._max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> [window_start, previous_count, current_count, last_seen]
+        self._keys: "OrderedDict[str, list]" = OrderedDict()
+        self.denied = 0
+        self.evicted = 0
+
+    def allow(self, key: str) -> bool:
+        """Count a request for key. Returns True if under limit, False if limited."""
+        now = self._clock()
+        window = self._window
+        with self._lock:
+            self._evict_idle(now)
+            state = self._keys.get(key)
+            if state is None:
+                if len(self._keys) >= self._max_keys:
+                    self._keys.popitem(last=False)
+                    self.evicted += 1
+                state = self._keys[key] = [now, 0, 0, now]
+            else:
+                self._keys.move_to_end(key)
+                elapsed = now - state[0]
+                if elapsed >= window:
+                    windows = int(elapsed // window)
+                    state[1] = state[2] if windows == 1 else 0
+                    state[2] = 0
+                    state[0] += windows * window
+            state[3] = now
+
+            weight = 1.0 - (now - state[0]) / window
+            if state[1] * weight + state[2] >= self._max_requests:
+                self.denied += 1
+                return False
+            state[2] += 1
+            return True
 
-    def allow(self, peer_ip: str) -> bool:
-        """Check if a request from peer_ip is allowed.
+    def _evict_idle(self, now: float):
+        horizon = now - 2 * self._window
+        keys = self._keys
+        while keys:
+            key = next(iter(keys))
+            if keys[key][3] > horizon:
+                break
+            del keys[key]
+            self.evicted += 1
 
-        Returns True if under limit, False if rate-limited.
-        """
-        now = time.time()
-        cutoff = now - self._window
+    def reset(self, key: str = "") -> None:
+        """Reset rate limit state. If key given, reset only that key."""
+        with self._lock:
+            if key:
+                self._keys.pop(key, None)
+            else:
+                self._keys.clear()
 
-        # Prune old entries
-        timestamps = self._requests[peer_ip]
-        self._requests[peer_ip] = [t for t in timestamps if t > cutoff]
+    def __len__(self) -> int:
+        return len(self._keys)
 
-        if len(self._requests[peer_ip]) >= self._max_requests:
-            return False
+    def stats(self) -> dict:
+        with self._lock:
+            return {"keys": len(self._keys), "max_keys": self._max_keys,
+                    "denied": self.denied, "evicted": self.evicted}
 
-        self._requests[peer_ip].append(now)
-        return True
 
-    def reset(self, peer_ip: str = "") -> None:
-        """Reset rate limit state. If peer_ip given, reset only that peer."""
-        if peer_ip:
-            self._requests.pop(peer_ip, None)
-        else:
-            self._requests.clear()
+# The network server's name for it (one key per peer IP)
+PeerRateLimiter = SlidingWindowLimiter
@@ -0,0 +1,313 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Anti-entropy reconciliation — exchange only the records two peers differ on.
+
+    report = await reconcile(client, host, port, dag, push=True)
+    index_for(dag).children(prefix)     # what the peer serves per bucket
+"""
+
+import bisect
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from network.sync import MAX_BATCH_RECORDS, get_record
+
+logger = logging.getLogger("elara.network.reconcile")
+
+HEX = "0123456789abcdef"
+DIGEST_BYTES = 16
+CACHED_DEPTH = 3              # fingerprints for prefixes up to 3 hex chars are kept
+LEAF_SIZE = 64                # list a differing bucket once both sides hold <= this
+MAX_DEPTH = 2 * DIGEST_BYTES
+MAX_PREFIXES = 4096           # per summary / ids request
+MAX_IDS = 20_000              # per ids response
+
+Fingerprint = Tuple[int, int]  # (count, xor of digests)
+
+
+def _digest(record_id: str) -> str:
+    return hashlib.blake2b(record_id.encode(), digest_size=DIGEST_BYTES).hexdigest()
+
+
+def _record_count(dag) -> int:
+    try:
+        return len(dag)
+    except TypeError:
+        return int(dag.stats().get("total_records", 0))
+
+
+def _encode(fp: Fingerprint) -> list:
+    return [fp[0], format(fp[1], "x")]
+
+
+def _decode(raw) -> Fingerprint:
+    return int(raw[0]), int(raw[1], 16)
+
+
+class ReconcileIndex:
+    """Sorted id digests plus cached bucket fingerprints for one DAG."""
+
+    def __init__(self, dag):
+        self._dag = weakref.ref(dag)  # index_for() keys on the DAG weakly
+        self._lock = threading.RLock()
+        self._keys: List[str] = []              # sorted digests
+        self._ids: Dict[str, str] = {}          # digest -> record id
+        self._members: Set[str] = set()
+        self._missing: Set[str] = set()         # parent ids not held when walked
+        self._levels: List[Dict[str, list]] = [dict() for _ in range(CACHED_DEPTH + 1)]
+        self.refreshed = 0.0
+
+    def __len__(self):
+        return len(self._members)
+
+    @property
+    def dag(self):
+        return self._dag()
+
+    # -- maintenance --------------------------------------------------------
+
+    def _add(self, record_id: str, new_keys: List[str]):
+        key = _digest(record_id)
+        new_keys.append(key)
+        self._ids[key] = record_id
+        self._members.add(record_id)
+        value = int(key, 16)
+        for depth, level in enumerate(self._levels):
+            slot = level.setdefault(key[:depth], [0, 0])
+            slot[0] += 1
+            slot[1] ^= value
+
+    def _merge(self, new_keys: List[str]):
+        if len(new_keys) > 256:
+            self._keys.extend(new_keys)
+            self._keys.sort()  # timsort reuses the existing sorted run
+        else:
+            for key in new_keys:
+                bisect.insort(self._keys, key)
+
+    def refresh(self) -> int:
+        """Index records added since the last refresh. Returns how many."""
+        with self._lock:
+            if _record_count(self.dag) == len(self._members):
+                return 0
+            new_keys: List[str] = []
+            stack = [t for t in self.dag.tips() if t not in self._members]
+            stack.extend(self._missing)
+            while stack:
+                record_id = stack.pop()
+                if record_id in self._members:
+                    continue
+                record = get_record(self.dag, record_id)
+                if record is None:
+                    self._missing.add(record_id)
+                    continue
+                self._missing.discard(record_id)
+                self._add(record_id, new_keys)
+                for parent in getattr(record, "parents", None) or []:
+                    if parent not in self._members:
+                        stack.append(parent)
+            self._merge(new_keys)
+            self.refreshed = time.time()
+            if new_keys:
+                logger.debug("Reconcile index +%d records (%d total)",
+                             len(new_keys), len(self._members))
+            return len(new_keys)
+
+    def add(self, record_ids: Iterable[str]):
+        """Index records this process just inserted, without a DAG walk."""
+        with self._lock:
+            new_keys: List[str] = []
+            for record_id in record_ids:
+                if record_id not in self._members:
+                    self._missing.discard(record_id)
+                    self._add(record_id, new_keys)
+            self._merge(new_keys)
+
+    # -- queries ------------------------------------------------------------
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        return (bisect.bisect_left(self._keys, prefix),
+                bisect.bisect_left(self._keys, prefix + "g"))  # 'g' sorts after every hex digit
+
+    def fingerprint(self, prefix: str) -> Fingerprint:
+        """(count, XOR of member digests) of the bucket under a hex prefix."""
+        with self._lock:
+            if len(prefix) <= CACHED_DEPTH:
+                slot = self._levels[len(prefix)].get(prefix)
+                return (slot[0], slot[1]) if slot else (0, 0)
+            lo, hi = self._range(prefix)
+            xor = 0
+            for key in self._keys[lo:hi]:
+                xor ^= int(key, 16)
+            return hi - lo, xor
+
+    def children(self, prefix: str) -> Dict[str, Fingerprint]:
+        """Fingerprints of the non-empty child buckets of a prefix."""
+        with self._lock:
+            if len(prefix) < CACHED_DEPTH:
+                level = self._levels[len(prefix) + 1]
+                return {c: (level[prefix + c][0], level[prefix + c][1])
+                        for c in HEX if prefix + c in level}
+            lo, hi = self._range(prefix)
+            out: Dict[str, list] = {}
+            for key in self._keys[lo:hi]:
+                slot = out.setdefault(key[len(prefix)], [0, 0])
+                slot[0] += 1
+                slot[1] ^= int(key, 16)
+            return {c: (n, x) for c, (n, x) in out.items()}
+
+    def ids_under(self, prefix: str) -> List[str]:
+        with self._lock:
+            lo, hi = self._range(prefix)
+            return [self._ids[key] for key in self._keys[lo:hi]]
+
+    def summaries(self, prefixes: Iterable[str]) -> dict:
+        """Wire form of each prefix's fingerprint and its children's."""
+        return {p: {"fp": _encode(self.fingerprint(p)),
+                    "children": {c: _encode(fp) for c, fp in self.children(p).items()}}
+                for p in prefixes}
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def index_for(dag) -> ReconcileIndex:
+    """The process-wide index for a DAG object (server and tools share it)."""
+    with _indexes_lock:
+        index = _indexes.get(dag)
+        if index is None:
+            index = _indexes[dag] = ReconcileIndex(dag)
+        return index
+
+
+def valid_prefix(prefix) -> bool:
+    return isinstance(prefix, str) and len(prefix) <= MAX_DEPTH and all(c in HEX for c in prefix)
+
+
+# ============================================================================
+# Initiator
+# ============================================================================
+
+def _chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _leaf_batches(leaves: List[Tuple[str, int]]):
+    """Group (prefix, remote count) so each ids response stays under the caps."""
+    batch, total = [], 0
+    for prefix, count in leaves:
+        if batch and (len(batch) >= MAX_PREFIXES or total + count > MAX_IDS):
+            yield batch
+            batch, total = [], 0
+        batch.append(prefix)
+        total += count
+    if batch:
+        yield batch
+
+
+async def reconcile(client, host: str, port: int, dag, push: bool = False,
+                    decode: Optional[Callable[[bytes], object]] = None) -> dict:
+    """Bring `dag` level with a peer's; with push=True, the peer with ours too.
+
+    `client` is a network.client.NetworkClient. Returns a report with the
+    records fetched/pushed, round trips and buckets compared, or
+    {"error": ...} if the peer stopped answering.
+    """
+    if decode is None:
+        from elara_protocol.record import ValidationRecord
+        decode = ValidationRecord.from_bytes
+
+    started = time.monotonic()
+    index = index_for(dag)
+    index.refresh()
+    report = {"round_trips": 0, "buckets_compared": 0, "ids_listed": 0,
+              "fetched": 0, "pushed": 0, "failed": 0}
+
+    # 1. Walk down the tree to the small buckets that differ
+    frontier, leaves = [""], []
+    while frontier:
+        remote = {}
+        for chunk in _chunks(frontier, MAX_PREFIXES):
+            result = await client.reconcile_summary(host, port, chunk)
+            report["round_trips"] += 1
+            if "error" in result:
+                return {"error": result["error"], **report}
+            remote.update(result["nodes"])
+
+        next_frontier = []
+        for prefix in frontier:
+            node = remote.get(prefix) or {"fp": [0, "0"], "children": {}}
+            report["buckets_compared"] += 1
+            if _decode(node["fp"]) == index.fingerprint(prefix):
+                continue
+            if len(prefix) >= MAX_DEPTH:
+                leaves.append((prefix, _decode(node["fp"])[0]))
+                continue
+            theirs = {c: _decode(fp) for c, fp in node["children"].items()}
+            ours = index.children(prefix)
+            for c in HEX:
+                remote_fp, local_fp = theirs.get(c, (0, 0)), ours.get(c, (0, 0))
+                if remote_fp == local_fp:
+                    continue
+                if max(remote_fp[0], local_fp[0]) <= LEAF_SIZE:
+                    leaves.append((prefix + c, remote_fp[0]))
+                else:
+                    next_frontier.append(prefix + c)
+        frontier = next_frontier
+
+    # 2. List the differing buckets on both sides and diff them
+    want, give = [], []
+    for batch in _leaf_batches(leaves):
+        result = await client.reconcile_ids(host, port, batch)
+        report["round_trips"] += 1
+        if "error" in result:
+            return {"error": result["error"], **report}
+        for p in batch:
+            theirs = set(result["ids"].get(p, []))
+            ours = set(index.ids_under(p))
+            report["ids_listed"] += len(theirs)
+            want.extend(theirs - ours)
+            give.extend(ours - theirs)
+
+    # 3. Move only the difference
+    fetched = []
+    for chunk in _chunks(want, MAX_BATCH_RECORDS):
+        result = await client.fetch_records(host, port, chunk)
+        report["round_trips"] += 1
+        if "error" in result:
+            return {"error": result["error"], **report}
+        for wire in result["records"]:
+            try:
+                fetched.append(decode(wire))
+            except Exception:
+                report["failed"] += 1
+    inserted = []
+    for record in sorted(fetched, key=lambda r: r.timestamp):  # parents first
+        try:
+            if get_record(dag, record.id) is None:
+                dag.insert(record, verify_signature=False)
+                inserted.append(record.id)
+        except Exception:
+            report["failed"] += 1
+    index.add(inserted)
+    report["fetched"] = len(inserted)
+
+    if push and give:
+        for chunk in _chunks(give, MAX_BATCH_RECORDS):
+            wires = [r.to_bytes() for r in (get_record(dag, i) for i in chunk) if r is not None]
+            result = await client.push_records(host, port, wires)
+            report["round_trips"] += 1
+            if "error" in result and "received" not in result:
+                return {"error": result["error"], **report}
+            report["pushed"] += result.get("accepted", 0)
+    report["peer_missing"] = len(give)
+    report["elapsed_s"] = round(time.monotonic() - started, 3)
+    return report
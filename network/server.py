@@ -10,6 +10,8 @@ import re
 import time
 from typing import Optional
 
+from network.signing import PoolBusy
+
 logger = logging.getLogger("elara.network.server")
 
 # Max body size for POST endpoints (1 MB)
@@ -23,9 +25,15 @@ class NetworkServer:
     HTTP server for Layer 2 record exchange.
 
     Endpoints:
-        POST /records     — receive record wire bytes
-        GET  /records     — query recent records
+        POST /records       — receive record wire bytes
+        GET  /records       — query recent records
+        POST /records/batch — receive length-prefixed frames of records
+        POST /records/pull  — stream a page of records (cursor-based)
+        POST /records/fetch — stream specific records by id
+        POST /reconcile/summary — bucket fingerprints for anti-entropy
+        POST /reconcile/ids     — record ids in small differing buckets
         POST /witness     — request witness attestation
+        POST /witness/batch — counter-sign many framed records in one request
         GET  /status      — node identity and DAG info
     """
 
@@ -39,6 +47,7 @@ class NetworkServer:
         self._runner = None
         self._witness_manager = None
         self._rate_limiter = None
+        self._signatures = None
 
     async def start(self) -> None:
         """Start the aiohttp server."""
@@ -54,10 +63,19 @@ class NetworkServer:
         from network.ratelimit import PeerRateLimiter
         self._rate_limiter = PeerRateLimiter()
 
+        from network.signing import SignaturePool
+        self._signatures = SignaturePool()
+
         self._app = web.Application()
         self._app.router.add_post("/records", self._handle_submit_record)
         self._app.router.add_get("/records", self._handle_query_records)
+        self._app.router.add_post("/records/batch", self._handle_submit_batch)
+        self._app.router.add_post("/records/pull", self._handle_pull_records)
+        self._app.router.add_post("/records/fetch", self._handle_fetch_records)
+        self._app.router.add_post("/reconcile/summary", self._handle_reconcile_summary)
+        self._app.router.add_post("/reconcile/ids", self._handle_reconcile_ids)
         self._app.router.add_post("/witness", self._handle_witness)
+        self._app.router.add_post("/witness/batch", self._handle_witness_batch)
         self._app.router.add_get("/status", self._handle_status)
         self._app.router.add_get("/ping", self._handle_ping)
         self._app.router.add_get("/attestations", self._handle_attestations)
@@ -85,6 +103,9 @@ class NetworkServer:
             self._runner = None
             self._app = None
             logger.info("Network server stopped")
+        if self._signatures:
+            self._signatures.shutdown()
+            self._signatures = None
 
     def _check_rate_limit(self, request) -> bool:
         """Check if request is rate-limited. Returns True if allowed."""
@@ -93,6 +114,11 @@ class NetworkServer:
         peer_ip = request.remote or "unknown"
         return self._rate_limiter.allow(peer_ip)
 
+    def _busy_response(self, error) -> "web.Response":
+        from aiohttp import web
+        return web.json_response({"error": f"busy: {error}"}, status=503,
+                                 headers={"Retry-After": "1"})
+
     async def _handle_submit_record(self, request) -> "web.Response":
         """POST /records — receive and validate a remote record."""
         from aiohttp import web
@@ -119,15 +145,11 @@ class NetworkServer:
             from elara_protocol.record import ValidationRecord
             record = ValidationRecord.from_bytes(body)
 
-            # Verify signature
-            signable = record.signable_bytes()
-            try:
-                import oqs
-                verifier = oqs.Signature("Dilithium3")
-                if not verifier.verify(signable, record.signature, record.creator_public_key):
-                    return web.json_response({"error": "invalid signature"}, status=403)
-            except ImportError:
-                logger.warning("liboqs not available — accepting without signature verification")
+            # Verify signature (off the event loop)
+            valid = await self._signatures.verify(
+                record.signable_bytes(), record.signature, record.creator_public_key)
+            if valid is False:
+                return web.json_response({"error": "invalid signature"}, status=403)
 
             # Insert into DAG (skip parent check for foreign records)
             record_hash = self._dag.insert(record, verify_signature=False)
@@ -145,10 +167,229 @@ class NetworkServer:
                 "accepted": True,
             })
 
+        except PoolBusy as e:
+            return self._busy_response(e)
         except Exception as e:
             logger.exception("Error receiving record")
             return web.json_response({"error": str(e)}, status=500)
 
+    async def _handle_submit_batch(self, request) -> "web.Response":
+        """POST /records/batch — receive many records as length-prefixed frames.
+
+        The whole batch is read and decoded first, then every new record's
+        signature is verified in parallel on the signature pool, then the
+        valid ones are inserted in the order sent. Each record is judged on
+        its own: a bad one is rejected without failing the batch, and one
+        already in the DAG counts as a duplicate.
+        """
+        from aiohttp import web
+        from network.sync import MAX_BATCH_RECORDS, RECORDS_CONTENT_TYPE, FrameError, read_frames
+
+        if not self._check_rate_limit(request):
+            from daemon.events import bus, Events
+            bus.emit(Events.PEER_RATE_LIMITED, {
+                "peer_ip": request.remote, "endpoint": "/records/batch",
+            }, source="network.server")
+            return web.json_response({"error": "rate limited"}, status=429)
+
+        if request.content_type != RECORDS_CONTENT_TYPE:
+            return web.json_response({"error": "unsupported content type"}, status=415)
+
+        from daemon.events import bus, Events
+        from elara_protocol.record import ValidationRecord
+        from network.sync import get_record
+
+        started = time.monotonic()
+        try:
+            wires = [w async for w in read_frames(request.content, max_frames=MAX_BATCH_RECORDS)]
+        except FrameError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        duplicates = accepted = 0
+        errors = []
+        fresh = []  # (index, record) not yet in the DAG
+        seen = set()
+        for index, wire in enumerate(wires):
+            try:
+                record = ValidationRecord.from_bytes(wire)
+            except Exception as e:
+                errors.append({"index": index, "error": str(e)})
+                continue
+            if record.id in seen or get_record(self._dag, record.id) is not None:
+                duplicates += 1
+                continue
+            seen.add(record.id)
+            fresh.append((index, record))
+
+        try:
+            verdicts = await self._signatures.verify_many([
+                (r.signable_bytes(), r.signature, r.creator_public_key) for _, r in fresh
+            ])
+        except PoolBusy as e:
+            return self._busy_response(e)
+
+        try:
+            for (index, record), valid in zip(fresh, verdicts):
+                if valid is False:
+                    errors.append({"index": index, "record_id": record.id,
+                                   "error": "invalid signature"})
+                    continue
+                try:
+                    record_hash = self._dag.insert(record, verify_signature=False)
+                except Exception as e:
+                    errors.append({"index": index, "record_id": record.id, "error": str(e)})
+                    continue
+                accepted += 1
+                bus.emit(Events.RECORD_RECEIVED, {
+                    "record_id": record.id,
+                    "record_hash": record_hash,
+                    "creator": record.creator_public_key[:16].hex(),
+                }, source="network.server")
+        except Exception as e:
+            logger.exception("Error receiving record batch")
+            return web.json_response({"error": str(e)}, status=500)
+
+        elapsed = time.monotonic() - started
+        return web.json_response({
+            "received": len(wires),
+            "accepted": accepted,
+            "duplicates": duplicates,
+            "rejected": len(errors),
+            "errors": errors[:20],
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "records_per_s": round(len(wires) / elapsed, 1) if elapsed > 0 else None,
+        })
+
+    async def _handle_pull_records(self, request) -> "web.StreamResponse":
+        """POST /records/pull — one page of records as frames, then a JSON trailer.
+
+        Body: {"cursor": str|null, "limit": int, "since": float}. The trailer
+        carries the cursor for the next page (null when the walk is done).
+        """
+        from aiohttp import web
+        from network.sync import (
+            DEFAULT_PAGE_SIZE, MAX_BATCH_RECORDS, RECORDS_CONTENT_TYPE,
+            SyncCursor, encode_frame, encode_trailer, walk_page,
+        )
+
+        if not self._check_rate_limit(request):
+            from daemon.events import bus, Events
+            bus.emit(Events.PEER_RATE_LIMITED, {
+                "peer_ip": request.remote, "endpoint": "/records/pull",
+            }, source="network.server")
+            return web.json_response({"error": "rate limited"}, status=429)
+
+        try:
+            body = await request.json() if request.can_read_body else {}
+            if not isinstance(body, dict):
+                raise ValueError("body must be a JSON object")
+            limit = max(1, min(int(body.get("limit") or DEFAULT_PAGE_SIZE), MAX_BATCH_RECORDS))
+            since = float(body.get("since") or 0)
+            cursor = SyncCursor.decode(body["cursor"]) if body.get("cursor") else None
+        except (ValueError, TypeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        try:
+            records, next_cursor = walk_page(self._dag, cursor, limit=limit, since=since)
+        except Exception as e:
+            logger.exception("Error paging records")
+            return web.json_response({"error": str(e)}, status=500)
+
+        response = web.StreamResponse(headers={"Content-Type": RECORDS_CONTENT_TYPE})
+        await response.prepare(request)
+        for record in records:
+            await response.write(encode_frame(record.to_bytes()))
+        await response.write(encode_trailer({
+            "cursor": next_cursor.encode() if next_cursor else None,
+            "count": len(records),
+        }))
+        await response.write_eof()
+        return response
+
+    async def _handle_fetch_records(self, request) -> "web.StreamResponse":
+        """POST /records/fetch — {"ids": [...]} as frames, then a trailer naming the missing."""
+        from aiohttp import web
+        from network.sync import (
+            MAX_BATCH_RECORDS, RECORDS_CONTENT_TYPE, encode_frame, encode_trailer, get_record,
+        )
+
+        if not self._check_rate_limit(request):
+            from daemon.events import bus, Events
+            bus.emit(Events.PEER_RATE_LIMITED, {
+                "peer_ip": request.remote, "endpoint": "/records/fetch",
+            }, source="network.server")
+            return web.json_response({"error": "rate limited"}, status=429)
+
+        try:
+            ids = (await request.json()).get("ids")
+            if not isinstance(ids, list) or len(ids) > MAX_BATCH_RECORDS \
+                    or not all(isinstance(i, str) and RECORD_ID_RE.match(i) for i in ids):
+                raise ValueError(f"ids must be a list of at most {MAX_BATCH_RECORDS} record ids")
+        except (ValueError, AttributeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        response = web.StreamResponse(headers={"Content-Type": RECORDS_CONTENT_TYPE})
+        await response.prepare(request)
+        missing = []
+        for record_id in ids:
+            record = get_record(self._dag, record_id)
+            if record is None:
+                missing.append(record_id)
+                continue
+            await response.write(encode_frame(record.to_bytes()))
+        await response.write(encode_trailer({"count": len(ids) - len(missing), "missing": missing}))
+        await response.write_eof()
+        return response
+
+    async def _reconcile_request(self, request, endpoint: str):
+        """Rate limit + parse {"prefixes": [...]}; returns (index, prefixes) or a Response."""
+        import asyncio
+        from aiohttp import web
+        from network.reconcile import MAX_PREFIXES, index_for, valid_prefix
+
+        if not self._check_rate_limit(request):
+            from daemon.events import bus, Events
+            bus.emit(Events.PEER_RATE_LIMITED, {
+                "peer_ip": request.remote, "endpoint": endpoint,
+            }, source="network.server")
+            return web.json_response({"error": "rate limited"}, status=429)
+        try:
+            prefixes = (await request.json()).get("prefixes")
+            if not isinstance(prefixes, list) or len(prefixes) > MAX_PREFIXES \
+                    or not all(valid_prefix(p) for p in prefixes):
+                raise ValueError(f"prefixes must be a list of at most {MAX_PREFIXES} hex prefixes")
+        except (ValueError, AttributeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        index = index_for(self._dag)
+        await asyncio.to_thread(index.refresh)  # first call walks the whole DAG
+        return index, prefixes
+
+    async def _handle_reconcile_summary(self, request) -> "web.Response":
+        """POST /reconcile/summary — fingerprint of each prefix and of its children."""
+        from aiohttp import web
+
+        parsed = await self._reconcile_request(request, "/reconcile/summary")
+        if isinstance(parsed, web.StreamResponse):
+            return parsed
+        index, prefixes = parsed
+        return web.json_response({"nodes": index.summaries(prefixes), "records": len(index)})
+
+    async def _handle_reconcile_ids(self, request) -> "web.Response":
+        """POST /reconcile/ids — every record id under each prefix."""
+        from aiohttp import web
+        from network.reconcile import MAX_IDS
+
+        parsed = await self._reconcile_request(request, "/reconcile/ids")
+        if isinstance(parsed, web.StreamResponse):
+            return parsed
+        index, prefixes = parsed
+        ids = {p: index.ids_under(p) for p in prefixes}
+        if sum(len(v) for v in ids.values()) > MAX_IDS:
+            return web.json_response({"error": f"more than {MAX_IDS} ids; ask for deeper prefixes"},
+                                     status=413)
+        return web.json_response({"ids": ids})
+
     async def _handle_query_records(self, request) -> "web.Response":
         """GET /records?since=<ts>&limit=<n> — return recent records."""
         from aiohttp import web
@@ -158,11 +399,12 @@ class NetworkServer:
             limit = min(limit, 100)
             since = float(request.query.get("since", "0"))
 
-            records = self._dag.query(limit=limit)
-
-            # Filter by timestamp if requested
             if since > 0:
-                records = [r for r in records if r.timestamp > since]
+                # Walk back from the tips so `since` applies before the limit
+                from network.sync import walk_page
+                records, _ = walk_page(self._dag, limit=limit, since=since)
+            else:
+                records = self._dag.query(limit=limit)
 
             result = []
             for r in records:
@@ -204,16 +446,13 @@ class NetworkServer:
 
             # Verify the record's original signature first
             signable = record.signable_bytes()
-            try:
-                import oqs
-                verifier = oqs.Signature("Dilithium3")
-                if not verifier.verify(signable, record.signature, record.creator_public_key):
-                    return web.json_response({"error": "original signature invalid"}, status=403)
-            except ImportError:
-                pass
+            valid = await self._signatures.verify(
+                signable, record.signature, record.creator_public_key)
+            if valid is False:
+                return web.json_response({"error": "original signature invalid"}, status=403)
 
             # Counter-sign with our identity
-            witness_sig = self._identity.sign(signable)
+            witness_sig = await self._signatures.sign(self._identity.sign, signable)
 
             from network.types import WitnessAttestation
             attestation = WitnessAttestation(
@@ -238,12 +477,100 @@ class NetworkServer:
                 "timestamp": attestation.timestamp,
             })
 
+        except PoolBusy as e:
+            return self._busy_response(e)
         except Exception as e:
             logger.exception("Error witnessing record")
             return web.json_response({"error": str(e)}, status=500)
 
+    async def _handle_witness_batch(self, request) -> "web.Response":
+        """POST /witness/batch — counter-sign many records sent as frames.
+
+        Original signatures are verified in parallel, the valid records are
+        counter-signed in one hop to the signing thread, and every new
+        attestation is stored in a single transaction.
+        """
+        from aiohttp import web
+        from network.sync import MAX_WITNESS_BATCH, RECORDS_CONTENT_TYPE, FrameError, read_frames
+
+        if not self._check_rate_limit(request):
+            from daemon.events import bus, Events
+            bus.emit(Events.PEER_RATE_LIMITED, {
+                "peer_ip": request.remote, "endpoint": "/witness/batch",
+            }, source="network.server")
+            return web.json_response({"error": "rate limited"}, status=429)
+
+        if request.content_type != RECORDS_CONTENT_TYPE:
+            return web.json_response({"error": "unsupported content type"}, status=415)
+
+        try:
+            wires = [w async for w in read_frames(request.content, max_frames=MAX_WITNESS_BATCH)]
+        except FrameError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        try:
+            from elara_protocol.record import ValidationRecord
+            from network.types import WitnessAttestation
+
+            rejected, records = [], []
+            for index, wire in enumerate(wires):
+                try:
+                    records.append((index, ValidationRecord.from_bytes(wire)))
+                except Exception as e:
+                    rejected.append({"index": index, "error": str(e)})
+
+            signables = [r.signable_bytes() for _, r in records]
+            verdicts = await self._signatures.verify_many([
+                (signable, r.signature, r.creator_public_key)
+                for signable, (_, r) in zip(signables, records)
+            ])
+            to_sign = []
+            for (index, record), signable, valid in zip(records, signables, verdicts):
+                if valid is False:
+                    rejected.append({"index": index, "record_id": record.id,
+                                     "error": "original signature invalid"})
+                else:
+                    to_sign.append((record, signable))
+
+            signatures = await self._signatures.sign_many(
+                self._identity.sign, [signable for _, signable in to_sign])
+            now = time.time()
+            attestations = [
+                WitnessAttestation(
+                    record_id=record.id,
+                    witness_identity_hash=self._identity.identity_hash,
+                    witness_signature=sig,
+                    timestamp=now,
+                )
+                for (record, _), sig in zip(to_sign, signatures)
+            ]
+            self._witness_manager.add_attestations(attestations)
+
+            from daemon.events import bus, Events
+            for a in attestations:
+                bus.emit(Events.RECORD_WITNESSED, {
+                    "record_id": a.record_id,
+                    "witness": self._identity.identity_hash[:16],
+                }, source="network.server")
+
+            return web.json_response({
+                "witness": self._identity.identity_hash,
+                "attestations": [
+                    {"record_id": a.record_id, "signature": a.witness_signature.hex(),
+                     "timestamp": a.timestamp}
+                    for a in attestations
+                ],
+                "rejected": rejected,
+            })
+
+        except PoolBusy as e:
+            return self._busy_response(e)
+        except Exception as e:
+            logger.exception("Error witnessing record batch")
+            return web.json_response({"error": str(e)}, status=500)
+
     async def _handle_status(self, request) -> "web.Response":
-        """GET /status — identity and DAG info."""
+        """GET /status — identity, DAG info and signature pool load."""
         from aiohttp import web
 
         stats = self._dag.stats()
@@ -254,6 +581,7 @@ class NetworkServer:
             "port": self._port,
             "public_key": self._identity.public_key.hex(),
             "node_type": self._node_type,
+            "signatures": self._signatures.stats() if self._signatures else None,
         })
 
     async def _handle_ping(self, request) -> "web.Response":
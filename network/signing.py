@@ -0,0 +1,191 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Signature pool — Dilithium3 verify and sign on worker threads, off the event loop.
+
+    pool = SignaturePool()
+    verdicts = await pool.verify_many([(signable, signature, public_key), ...])
+    signature = await pool.sign(identity.sign, data)   # raises PoolBusy when saturated
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+try:
+    import oqs
+    OQS_AVAILABLE = True
+except ImportError:
+    OQS_AVAILABLE = False
+
+logger = logging.getLogger("elara.network.signing")
+
+ALGORITHM = "Dilithium3"
+LATENCY_WINDOW = 512          # recent samples kept for the latency figures
+
+_local = threading.local()
+
+
+class PoolBusy(RuntimeError):
+    """The pool already has work queued and this batch would exceed max_pending."""
+
+
+def verify_signature(signable: bytes, signature: bytes, public_key: bytes) -> Optional[bool]:
+    """Verify a Dilithium3 signature with this thread's cached verifier.
+
+    Returns None when liboqs is not installed (signature unchecked).
+    """
+    if not OQS_AVAILABLE:
+        return None
+    verifier = getattr(_local, "verifier", None)
+    if verifier is None:
+        verifier = _local.verifier = oqs.Signature(ALGORITHM)
+    try:
+        return bool(verifier.verify(signable, signature, public_key))
+    except Exception:
+        return False
+
+
+class SignaturePool:
+    """Thread pools for signature verification and signing, with stats."""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 verify_fn: Callable[[bytes, bytes, bytes], Optional[bool]] = verify_signature):
+        self.workers = workers or os.cpu_count() or 2
+        self.max_pending = max_pending or self.workers * 64
+        self._verify_fn = verify_fn
+        self._verifiers = ThreadPoolExecutor(self.workers, thread_name_prefix="elara-verify")
+        self._signer = ThreadPoolExecutor(1, thread_name_prefix="elara-sign")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._peak = 0
+        self._verified = 0
+        self._signed = 0
+        self._rejected = 0
+        self._busy = 0
+        self._verify_ms: deque = deque(maxlen=LATENCY_WINDOW)
+        self._sign_ms: deque = deque(maxlen=LATENCY_WINDOW)
+        if not OQS_AVAILABLE and verify_fn is verify_signature:
+            logger.warning("liboqs not available — accepting without signature verification")
+
+    def _reserve(self, n: int):
+        # An idle pool admits any batch, however large: refusing it would
+        # answer a full-size push with 503 forever on a small machine.
+        with self._lock:
+            if self._pending and self._pending + n > self.max_pending:
+                self._busy += 1
+                raise PoolBusy(f"{self._pending} signature operations already queued")
+            self._pending += n
+            self._peak = max(self._peak, self._pending)
+
+    def _release(self, n: int):
+        with self._lock:
+            self._pending -= n
+
+    async def _run(self, executor, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+    async def verify(self, signable: bytes, signature: bytes,
+                     public_key: bytes) -> Optional[bool]:
+        """True/False, or None when signatures can't be checked. Raises PoolBusy."""
+        return (await self.verify_many([(signable, signature, public_key)]))[0]
+
+    async def verify_many(self, items: Sequence[Tuple[bytes, bytes, bytes]]) -> List[Optional[bool]]:
+        """Verify a batch in parallel across the pool; results keep input order.
+
+        Admission is all-or-nothing, so a batch is never half-verified.
+        A batch larger than max_pending is admitted only by an idle pool and
+        is handed to the workers max_pending items at a time.
+        """
+        if not items:
+            return []
+        self._reserve(len(items))
+        started = time.monotonic()
+        results: List[Optional[bool]] = []
+
+        async def one(item):
+            try:
+                result = await self._run(self._verifiers, self._verify_fn, *item)
+            finally:
+                self._release(1)
+            with self._lock:
+                self._verified += 1
+                if result is False:
+                    self._rejected += 1
+                self._verify_ms.append((time.monotonic() - started) * 1000)
+            return result
+
+        for i in range(0, len(items), self.max_pending):
+            chunk = items[i:i + self.max_pending]
+            try:
+                results.extend(await asyncio.gather(*(one(item) for item in chunk)))
+            except BaseException:
+                # Items of later chunks never started: give their slots back
+                self._release(len(items) - i - len(chunk))
+                raise
+        return results
+
+    async def sign(self, sign_fn: Callable[[bytes], bytes], data: bytes) -> bytes:
+        """Run sign_fn(data) (e.g. identity.sign) on the signing thread."""
+        self._reserve(1)
+        started = time.monotonic()
+        try:
+            signature = await self._run(self._signer, sign_fn, data)
+        finally:
+            self._release(1)
+        with self._lock:
+            self._signed += 1
+            self._sign_ms.append((time.monotonic() - started) * 1000)
+        return signature
+
+    async def sign_many(self, sign_fn: Callable[[bytes], bytes],
+                        items: Sequence[bytes]) -> List[bytes]:
+        """Sign a batch in one hop to the signing thread; results keep input order."""
+        if not items:
+            return []
+        self._reserve(len(items))
+        started = time.monotonic()
+        try:
+            signatures = await self._run(self._signer, lambda: [sign_fn(d) for d in items])
+        finally:
+            self._release(len(items))
+        with self._lock:
+            self._signed += len(items)
+            self._sign_ms.append((time.monotonic() - started) * 1000)
+        return signatures
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._pending,
+                "queue_peak": self._peak,
+                "max_pending": self.max_pending,
+                "verified": self._verified,
+                "rejected": self._rejected,
+                "signed": self._signed,
+                "busy_refusals": self._busy,
+                "verify_ms": _latency(self._verify_ms),
+                "sign_ms": _latency(self._sign_ms),
+                "liboqs": OQS_AVAILABLE,
+            }
+
+    def shutdown(self):
+        self._verifiers.shutdown(wait=False, cancel_futures=True)
+        self._signer.shutdown(wait=False, cancel_futures=True)
+
+
+def _latency(samples) -> dict:
+    if not samples:
+        return {"avg": None, "p95": None}
+    ordered = sorted(samples)
+    return {
+        "avg": round(sum(ordered) / len(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+    }
@@ -0,0 +1,243 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Batched record exchange — length-prefixed wire frames and resumable DAG cursors.
+
+    records, cursor = walk_page(dag, cursor, limit=500, since=since)
+    body = encode_frames(r.to_bytes() for r in records) + encode_trailer({"cursor": ...})
+    wires = [w async for w in read_frames(stream)]
+"""
+
+import asyncio
+import base64
+import heapq
+import json
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from core.paths import get_paths
+from daemon.schemas import atomic_write_json
+
+RECORDS_CONTENT_TYPE = "application/x-elara-records"
+FRAME_HEADER = struct.Struct(">I")
+CURSOR_VERSION = 1
+
+MAX_FRAME_SIZE = 1024 * 1024          # one record (matches MAX_BODY_SIZE)
+MAX_BATCH_RECORDS = 1000              # per push request / pull page
+MAX_WITNESS_BATCH = 256               # per /witness/batch request (one signature each)
+MAX_BATCH_BYTES = 32 * 1024 * 1024
+DEFAULT_PAGE_SIZE = 500
+SYNC_OVERLAP_SECONDS = 300.0          # re-scan this far behind the high-water mark (clock skew)
+
+
+class FrameError(ValueError):
+    """Malformed or oversized frame stream."""
+
+
+# ============================================================================
+# Frames
+# ============================================================================
+
+def encode_frame(payload: bytes) -> bytes:
+    """4-byte big-endian length, then the payload."""
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def encode_frames(payloads: Iterable[bytes]) -> bytes:
+    return b"".join(encode_frame(p) for p in payloads)
+
+
+def encode_trailer(trailer: dict) -> bytes:
+    """End-of-records marker plus the JSON trailer frame."""
+    return encode_frame(b"") + encode_frame(json.dumps(trailer).encode())
+
+
+async def read_frames(
+    stream,
+    max_frames: int = MAX_BATCH_RECORDS,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> AsyncIterator[bytes]:
+    """Yield frame payloads from an aiohttp StreamReader (or anything with readexactly).
+
+    Stops at a clean EOF or a zero-length frame. Raises FrameError on a
+    truncated stream or when a limit is exceeded.
+    """
+    frames = 0
+    total = 0
+    while True:
+        try:
+            header = await stream.readexactly(FRAME_HEADER.size)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise FrameError("truncated frame header")
+            return
+        (size,) = FRAME_HEADER.unpack(header)
+        if size == 0:
+            return
+        if size > MAX_FRAME_SIZE:
+            raise FrameError(f"frame of {size} bytes exceeds {MAX_FRAME_SIZE}")
+        frames += 1
+        total += size
+        if frames > max_frames or total > max_bytes:
+            raise FrameError("batch too large")
+        try:
+            yield await stream.readexactly(size)
+        except asyncio.IncompleteReadError:
+            raise FrameError("truncated frame")
+
+
+async def read_trailer(stream) -> dict:
+    """Read the JSON trailer frame that follows the end-of-records marker."""
+    try:
+        (size,) = FRAME_HEADER.unpack(await stream.readexactly(FRAME_HEADER.size))
+        if size > MAX_FRAME_SIZE:
+            raise FrameError("trailer too large")
+        return json.loads(await stream.readexactly(size))
+    except asyncio.IncompleteReadError:
+        raise FrameError("missing trailer")
+
+
+# ============================================================================
+# Cursor + DAG walk
+# ============================================================================
+
+@dataclass
+class SyncCursor:
+    """Where a newest-first walk of the DAG stands."""
+    frontier: List[Tuple[float, str]] = field(default_factory=list)
+    since: float = 0.0
+    started: bool = False
+    sent: int = 0
+
+    def encode(self) -> str:
+        raw = json.dumps({
+            "v": CURSOR_VERSION,
+            "f": [[ts, rid] for ts, rid in self.frontier],
+            "s": self.since,
+            "n": self.sent,
+        }, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(zlib.compress(raw)).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncCursor":
+        try:
+            data = json.loads(zlib.decompress(base64.urlsafe_b64decode(token.encode())))
+            if data.get("v") != CURSOR_VERSION:
+                raise ValueError(f"unsupported cursor version {data.get('v')}")
+            return cls(
+                frontier=[(float(ts), str(rid)) for ts, rid in data["f"]],
+                since=float(data.get("s", 0.0)),
+                started=True,
+                sent=int(data.get("n", 0)),
+            )
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            raise ValueError(f"invalid cursor: {e}")
+
+
+def get_record(dag, record_id: str):
+    """dag.get() that returns None for a missing record instead of raising."""
+    try:
+        return dag.get(record_id)
+    except Exception:
+        return None
+
+
+def walk_page(dag, cursor: Optional[SyncCursor] = None, limit: int = DEFAULT_PAGE_SIZE,
+              since: float = 0.0) -> Tuple[list, Optional[SyncCursor]]:
+    """Next page of records, newest first, and the cursor for the page after.
+
+    Uses only dag.tips() and dag.get(). Returns (records, None) once the
+    walk is complete. `since` applies when starting a walk; a resumed
+    cursor keeps the value it started with.
+    """
+    cursor = cursor or SyncCursor(since=since)
+    loaded: Dict[str, object] = {}
+
+    def _load(record_id):
+        if record_id not in loaded:
+            loaded[record_id] = get_record(dag, record_id)
+        return loaded[record_id]
+
+    # Max-heap on (timestamp, id) via negated timestamps
+    heap: List[Tuple[float, str]] = []
+    queued = set()
+
+    def _queue(record_id):
+        if record_id in queued:
+            return
+        record = _load(record_id)
+        if record is None or record.timestamp <= cursor.since:
+            return  # not held locally, or older than the caller needs
+        queued.add(record_id)
+        heapq.heappush(heap, (-record.timestamp, record_id))
+
+    if not cursor.started:
+        for tip in dag.tips():
+            _queue(tip)
+        cursor.started = True
+    else:
+        for ts, record_id in cursor.frontier:
+            queued.add(record_id)
+            heapq.heappush(heap, (-ts, record_id))
+
+    records = []
+    while heap and len(records) < limit:
+        _, record_id = heapq.heappop(heap)
+        record = _load(record_id)
+        if record is None:
+            continue
+        records.append(record)
+        for parent in getattr(record, "parents", None) or []:
+            _queue(parent)
+
+    cursor.sent += len(records)
+    if not heap:
+        return records, None
+    cursor.frontier = sorted(((-neg_ts, rid) for neg_ts, rid in heap), reverse=True)
+    return records, cursor
+
+
+# ============================================================================
+# Per-peer sync state (resume + incremental)
+# ============================================================================
+
+def _peer_key(host: str, port: int) -> str:
+    return f"{host}:{port}"
+
+
+def load_sync_state(host: str, port: int) -> dict:
+    """{"cursor": str|None, "since": float, "high_water": float, ...} for a peer, or {}."""
+    try:
+        data = json.loads(get_paths().network_sync_state.read_text())
+        return data.get(_peer_key(host, port), {}) if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(host: str, port: int, state: dict) -> None:
+    path = get_paths().network_sync_state
+    try:
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[_peer_key(host, port)] = dict(state, updated=time.time())
+    atomic_write_json(path, data)
+
+
+def resume_since(state: dict) -> float:
+    """Where an incremental sync should start, given a peer's saved state.
+
+    An interrupted sync keeps the floor it started with: its high_water
+    already includes the newest records from the pages it got, and
+    walking from there would skip the older ones it has not reached yet.
+    """
+    if state.get("cursor") and "since" in state:
+        return state["since"]
+    high_water = state.get("high_water", 0.0)
+    return max(0.0, high_water - SYNC_OVERLAP_SECONDS) if high_water else 0.0
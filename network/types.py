@@ -76,11 +76,5 @@ class WitnessAttestation:
 
         Returns True if valid, False if invalid or liboqs unavailable.
         """
-        try:
-            import oqs
-            verifier = oqs.Signature("Dilithium3")
-            return verifier.verify(signable, signature, public_key)
-        except ImportError:
-            return False
-        except Exception:
-            return False
+        from network.signing import verify_signature
+        return verify_signature(signable, signature, public_key) is True
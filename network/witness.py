@@ -6,8 +6,9 @@
 
 import logging
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from network.types import WitnessAttestation
 
@@ -32,16 +33,21 @@ class WitnessManager:
 
     Maps record_id → list of WitnessAttestation.
     Falls back to in-memory if no db_path provided.
+
+    Shared between the network server thread and tool calls on other
+    threads, so the connection is opened without sqlite3's same-thread
+    check and every access goes through one lock.
     """
 
     def __init__(self, db_path: Optional[Path] = None):
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         # In-memory fallback when no db_path
         self._memory: Dict[str, List[WitnessAttestation]] = {}
 
         if db_path:
-            self._conn = sqlite3.connect(str(db_path))
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
             self._conn.executescript(_SCHEMA)
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
@@ -49,41 +55,56 @@ class WitnessManager:
 
     def add_attestation(self, attestation: WitnessAttestation) -> None:
         """Store an attestation. Deduplicates by (record_id, witness_identity)."""
+        self.add_attestations([attestation])
+
+    def add_attestations(self, attestations: Iterable[WitnessAttestation]) -> int:
+        """Store many attestations in one transaction. Returns how many were new."""
+        attestations = list(attestations)
+        if not attestations:
+            return 0
+        with self._lock:
+            return self._add_locked(attestations)
+
+    def _add_locked(self, attestations: List[WitnessAttestation]) -> int:
         if self._conn:
             try:
-                self._conn.execute(
-                    "INSERT OR IGNORE INTO attestations "
-                    "(record_id, witness_identity, witness_signature, timestamp) "
-                    "VALUES (?, ?, ?, ?)",
-                    (
-                        attestation.record_id,
-                        attestation.witness_identity_hash,
-                        attestation.witness_signature,
-                        attestation.timestamp,
-                    ),
-                )
-                self._conn.commit()
+                before = self._conn.total_changes
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO attestations "
+                        "(record_id, witness_identity, witness_signature, timestamp) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(a.record_id, a.witness_identity_hash, a.witness_signature, a.timestamp)
+                         for a in attestations],
+                    )
+                added = self._conn.total_changes - before
             except sqlite3.Error:
-                logger.exception("Failed to persist attestation")
-                return
+                logger.exception("Failed to persist %d attestations", len(attestations))
+                return 0
         else:
             # In-memory fallback
-            rid = attestation.record_id
-            if rid not in self._memory:
-                self._memory[rid] = []
-            existing = {a.witness_identity_hash for a in self._memory[rid]}
-            if attestation.witness_identity_hash in existing:
-                return
-            self._memory[rid].append(attestation)
+            added = 0
+            for attestation in attestations:
+                held = self._memory.setdefault(attestation.record_id, [])
+                if any(a.witness_identity_hash == attestation.witness_identity_hash for a in held):
+                    continue
+                held.append(attestation)
+                added += 1
 
         logger.debug(
-            "Attestation stored: record=%s witness=%s",
-            attestation.record_id[:12],
-            attestation.witness_identity_hash[:12],
+            "Attestations stored: %d new of %d (first record=%s witness=%s)",
+            added, len(attestations),
+            attestations[0].record_id[:12],
+            attestations[0].witness_identity_hash[:12],
         )
+        return added
 
     def get_attestations(self, record_id: str) -> List[WitnessAttestation]:
         """Get all attestations for a record."""
+        with self._lock:
+            return self._get_locked(record_id)
+
+    def _get_locked(self, record_id: str) -> List[WitnessAttestation]:
         if self._conn:
             rows = self._conn.execute(
                 "SELECT record_id, witness_identity, witness_signature, timestamp "
@@ -99,36 +120,39 @@ class WitnessManager:
                 )
                 for r in rows
             ]
-        return self._memory.get(record_id, [])
+        return list(self._memory.get(record_id, []))
 
     def witness_count(self, record_id: str) -> int:
         """Count unique witnesses for a record."""
-        if self._conn:
-            row = self._conn.execute(
-                "SELECT COUNT(*) FROM attestations WHERE record_id = ?",
-                (record_id,),
-            ).fetchone()
-            return row[0] if row else 0
-        return len(self._memory.get(record_id, []))
+        with self._lock:
+            if self._conn:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM attestations WHERE record_id = ?",
+                    (record_id,),
+                ).fetchone()
+                return row[0] if row else 0
+            return len(self._memory.get(record_id, []))
 
     def stats(self) -> dict:
         """Summary statistics."""
-        if self._conn:
-            records = self._conn.execute(
-                "SELECT COUNT(DISTINCT record_id) FROM attestations"
-            ).fetchone()[0]
-            total = self._conn.execute(
-                "SELECT COUNT(*) FROM attestations"
-            ).fetchone()[0]
-            return {"records_witnessed": records, "total_attestations": total}
-        total = sum(len(v) for v in self._memory.values())
-        return {
-            "records_witnessed": len(self._memory),
-            "total_attestations": total,
-        }
+        with self._lock:
+            if self._conn:
+                records = self._conn.execute(
+                    "SELECT COUNT(DISTINCT record_id) FROM attestations"
+                ).fetchone()[0]
+                total = self._conn.execute(
+                    "SELECT COUNT(*) FROM attestations"
+                ).fetchone()[0]
+                return {"records_witnessed": records, "total_attestations": total}
+            total = sum(len(v) for v in self._memory.values())
+            return {
+                "records_witnessed": len(self._memory),
+                "total_attestations": total,
+            }
 
     def close(self) -> None:
         """Close the database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+ChromaDB layout benchmark — per-module stores vs the shared store.
+
+Builds a throwaway data dir with every registered collection populated
+(explicit embeddings, so no model download), then opens all of them in a
+fresh interpreter, as a resident process does at startup:
+  legacy   one PersistentClient per store directory (the old layout)
+  shared   memory.chroma registry on the migrated store
+
+Reports time to open every collection, RSS growth over a bare
+`import chromadb`, and open file descriptors.
+
+Usage:
+    python scripts/bench_chroma_stores.py
+    python scripts/bench_chroma_stores.py --docs 2000 --runs 5
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(mode: str, data_dir: Path):
+    import chromadb
+    from chromadb.config import Settings
+
+    from core.paths import configure
+    from memory.chroma import COLLECTIONS, get_chroma
+
+    paths = configure(data_dir)
+    base_rss = _rss_kb()
+    started = time.perf_counter()
+    if mode == "legacy":
+        clients = {}
+        for name, (attr, metadata) in COLLECTIONS.items():
+            path = str(getattr(paths, attr))
+            if path not in clients:
+                clients[path] = chromadb.PersistentClient(
+                    path=path, settings=Settings(anonymized_telemetry=False))
+            clients[path].get_or_create_collection(name=name, metadata=metadata).count()
+    else:
+        chroma = get_chroma()
+        for name in COLLECTIONS:
+            chroma.collection(name).count()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(json.dumps({
+        "ms": elapsed,
+        "rss_mb": (_rss_kb() - base_rss) / 1024,
+        "fds": len(os.listdir("/proc/self/fd")),
+    }))
+
+
+def populate(data_dir: Path, docs: int):
+    import random
+
+    import chromadb
+    from chromadb.config import Settings
+
+    from core.paths import configure
+    from memory.chroma import COLLECTIONS, migrate_to_shared_store
+
+    paths = configure(data_dir)
+    rng = random.Random(7)
+    for name, (attr, metadata) in COLLECTIONS.items():
+        client = chromadb.PersistentClient(path=str(getattr(paths, attr)),
+                                           settings=Settings(anonymized_telemetry=False))
+        coll = client.get_or_create_collection(name=name, metadata=metadata)
+        for start in range(0, docs, 500):
+            n = min(500, docs - start)
+            coll.add(
+                ids=[f"{name}-{i}" for i in range(start, start + n)],
+                documents=[f"{name} document {i}" for i in range(start, start + n)],
+                embeddings=[[rng.random() for _ in range(384)] for _ in range(n)],
+            )
+    migrate_to_shared_store(paths)
+    (paths.chroma_db / "elara-layout.json").rename(paths.chroma_db / "layout.bench")
+
+
+def run(mode: str, data_dir: Path) -> dict:
+    marker = data_dir / "elara-chroma-db" / "elara-layout.json"
+    parked = data_dir / "elara-chroma-db" / "layout.bench"
+    if mode == "shared":
+        parked.rename(marker)
+    try:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--data-dir", str(data_dir)],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+        ).stdout
+    finally:
+        if mode == "shared":
+            marker.rename(parked)
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChromaDB layout benchmark")
+    parser.add_argument("--docs", type=int, default=500, help="documents per collection")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", choices=["legacy", "shared"], help=argparse.SUPPRESS)
+    parser.add_argument("--data-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.data_dir)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="elara-chroma-bench-") as tmp:
+        data_dir = Path(tmp)
+        populate(data_dir, args.docs)
+        print(f"{'layout':>8} {'open ms':>9} {'RSS MB':>8} {'fds':>5}   "
+              f"(14 collections x {args.docs} docs, best of {args.runs})")
+        for mode in ("legacy", "shared"):
+            results = [run(mode, data_dir) for _ in range(args.runs)]
+            best = min(results, key=lambda r: r["ms"])
+            print(f"{mode:>8} {best['ms']:>9.1f} {best['rss_mb']:>8.1f} {best['fds']:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Prompt-hook latency benchmark — in-process vs resident enrichment server.
+
+Runs hooks/intention-hook.py as Claude Code does (fresh process, JSON on
+stdin) and reports wall-clock p50/p99 for:
+  in-process  no server listening — the hook imports and builds everything
+  server      hooks.enrich_server running — the hook is a socket client
+
+By default uses a throwaway data dir so your real stores, buffers and
+Overwatch injection are left alone; pass --data-dir to measure against
+real data (the hook's /tmp message buffer is shared either way).
+
+Usage:
+    python scripts/bench_hook_latency.py
+    python scripts/bench_hook_latency.py --runs 50 --data-dir ~/.claude
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HOOK = PROJECT_ROOT / "hooks" / "intention-hook.py"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def run_hook(env, prompt):
+    payload = json.dumps({"prompt": prompt})
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(HOOK)], input=payload, env=env,
+        capture_output=True, text=True, timeout=120,
+    )
+    return (time.perf_counter() - started) * 1000, result.stdout
+
+
+def measure(label, env, runs, prompt):
+    run_hook(env, prompt)  # warm the page cache, not the process
+    timings = [run_hook(env, prompt)[0] for _ in range(runs)]
+    print(f"{label:>11} {percentile(timings, 50):>9.1f} {percentile(timings, 99):>9.1f} "
+          f"{sum(timings) / len(timings):>9.1f}")
+    return timings
+
+
+def start_server(env, socket_path, wait=120.0):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "hooks.enrich_server"], cwd=PROJECT_ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + wait
+    while not socket_path.exists():
+        if proc.poll() is not None or time.time() > deadline:
+            proc.kill()
+            raise SystemExit("enrichment server failed to start")
+        time.sleep(0.1)
+    return proc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt-hook latency benchmark")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--prompt", default="how is the overwatch pipeline deadline handled?")
+    parser.add_argument("--data-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    tmp = None
+    if args.data_dir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="elara-bench-")
+        data_dir = Path(tmp.name)
+    else:
+        data_dir = args.data_dir.expanduser()
+    socket_path = data_dir / "elara-enrich.sock"
+
+    env = dict(os.environ, ELARA_ROOT=str(PROJECT_ROOT), ELARA_DATA_DIR=str(data_dir),
+               ELARA_ENRICH_SOCKET=str(socket_path))
+
+    print(f"{'mode':>11} {'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9}   ({args.runs} runs)")
+    if socket_path.exists():
+        raise SystemExit(f"a server is already listening on {socket_path}; stop it first")
+    before = measure("in-process", env, args.runs, args.prompt)
+
+    server = start_server(env, socket_path)
+    try:
+        after = measure("server", env, args.runs, args.prompt)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        if tmp is not None:
+            tmp.cleanup()
+
+    print(f"{'speedup':>11} {percentile(before, 50) / percentile(after, 50):>8.1f}x "
+          f"{percentile(before, 99) / percentile(after, 99):>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Rate limiter benchmark — timestamp lists vs the sliding-window counter.
+
+Simulates a flood from many distinct peer addresses (plus a few noisy
+repeat offenders) against:
+  lists     the old per-IP list of timestamps, rebuilt on every allow()
+  counter   network.ratelimit.SlidingWindowLimiter
+
+Reports time per allow() call, keys held afterwards and memory growth
+(tracemalloc). Time is simulated, so the window can roll over without
+sleeping.
+
+Usage:
+    python scripts/bench_ratelimit.py
+    python scripts/bench_ratelimit.py --peers 200000 --requests 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+# Ensure project root is on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from network.ratelimit import SlidingWindowLimiter  # noqa: E402
+
+
+class ListLimiter:
+    """The previous implementation, kept here for comparison."""
+
+    def __init__(self, max_requests, window_seconds, clock):
+        self._max_requests = max_requests
+        self._window = window_seconds
+        self._clock = clock
+        self._requests = defaultdict(list)
+
+    def allow(self, peer_ip):
+        now = self._clock()
+        cutoff = now - self._window
+        timestamps = self._requests[peer_ip]
+        self._requests[peer_ip] = [t for t in timestamps if t > cutoff]
+        if len(self._requests[peer_ip]) >= self._max_requests:
+            return False
+        self._requests[peer_ip].append(now)
+        return True
+
+    def __len__(self):
+        return len(self._requests)
+
+
+def traffic(peers: int, requests: int, seed: int = 7):
+    """(peer_ip, simulated time) pairs: 80% spread over `peers`, 20% from 10 hot IPs."""
+    rng = random.Random(seed)
+    hot = [f"10.0.0.{i}" for i in range(10)]
+    out = []
+    for i in range(requests):
+        if rng.random() < 0.2:
+            ip = rng.choice(hot)
+        else:
+            n = rng.randrange(peers)
+            ip = f"172.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+        out.append((ip, i * 0.001))  # 1000 requests/s of simulated time
+    return out
+
+
+def _replay(limiter, now, stream):
+    allowed = 0
+    for ip, t in stream:
+        now[0] = t
+        allowed += limiter.allow(ip)
+    return allowed
+
+
+def run(name, make, stream):
+    now = [0.0]
+    started = time.perf_counter()
+    allowed = _replay(make(lambda: now[0]), now, stream)
+    elapsed = time.perf_counter() - started
+
+    # Second pass under tracemalloc for memory (it slows every call down)
+    now = [0.0]
+    limiter = make(lambda: now[0])
+    tracemalloc.start()
+    _replay(limiter, now, stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>8} {elapsed / len(stream) * 1e6:>9.2f} {len(limiter):>9} "
+          f"{peak / 1e6:>9.1f} {allowed:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate limiter benchmark")
+    parser.add_argument("--peers", type=int, default=100_000, help="distinct addresses")
+    parser.add_argument("--requests", type=int, default=500_000)
+    parser.add_argument("--max-requests", type=int, default=60)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--max-keys", type=int, default=10_000)
+    args = parser.parse_args()
+
+    stream = traffic(args.peers, args.requests)
+    print(f"{args.requests} requests from ~{args.peers} peers, "
+          f"{args.max_requests}/{args.window:.0f}s per peer")
+    print(f"{'limiter':>8} {'us/call':>9} {'keys':>9} {'peak MB':>9} {'allowed':>9}")
+    run("lists", lambda clock: ListLimiter(args.max_requests, args.window, clock), stream)
+    run("counter", lambda clock: SlidingWindowLimiter(
+        args.max_requests, args.window, max_keys=args.max_keys, clock=clock), stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Recall re-ranking microbenchmark — scalar vs NumPy scoring.
+
+Scores synthetic ChromaDB hits (distances + emotional metadata) through
+VectorMemory's per-hit Python path and the vectorized path, checks they
+agree, and prints per-call timings for several candidate windows.
+
+No ChromaDB or embedding model needed.
+
+Usage:
+    python scripts/bench_recall_rerank.py
+    python scripts/bench_recall_rerank.py --windows 20 100 500 2000 --repeat 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from memory.vector import VectorMemory  # noqa: E402
+
+EMOTIONS = ["joy", "calm", "curious", "tired", "focused", "neutral"]
+QUADRANTS = ["positive-calm", "positive-energetic", "negative-calm", "neutral-calm"]
+
+
+def synthetic_hits(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    metas = [
+        {
+            "type": "conversation",
+            "importance": rng.random(),
+            "date": "2026-01-01",
+            "timestamp": "2026-01-01T00:00:00",
+            "encoded_valence": rng.random(),
+            "encoded_energy": rng.random(),
+            "encoded_openness": rng.random(),
+            "encoded_emotion": rng.choice(EMOTIONS),
+            "encoded_blend": "neutral",
+            "encoded_quadrant": rng.choice(QUADRANTS),
+        }
+        for _ in range(n)
+    ]
+    return {
+        "ids": [f"m{i}" for i in range(n)],
+        "docs": [f"memory {i}" for i in range(n)],
+        "metas": metas,
+        "distances": [rng.uniform(0.1, 0.9) for _ in range(n)],
+    }
+
+
+def bench(fn, repeat: int, **kwargs) -> float:
+    fn(**kwargs)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(**kwargs)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recall re-ranking microbenchmark")
+    parser.add_argument("--windows", type=int, nargs="+", default=[20, 100, 500, 2000])
+    parser.add_argument("--n-results", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    mem = VectorMemory.__new__(VectorMemory)
+    mood = {"valence": 0.7, "energy": 0.4, "openness": 0.6,
+            "emotion": "curious", "quadrant": "positive-calm"}
+
+    print(f"{'window':>8} {'scalar ms':>11} {'numpy ms':>10} {'speedup':>8}")
+    for window in args.windows:
+        kwargs = dict(
+            synthetic_hits(window), current_mood=mood, mood_weight=0.3,
+            min_importance=0, n_results=args.n_results,
+        )
+        scalar = mem._rank_hits_scalar(**kwargs)
+        vectorized = mem._rank_hits_vectorized(**kwargs)
+        assert [h["memory_id"] for h in scalar] == [h["memory_id"] for h in vectorized], \
+            "scalar and vectorized rankings disagree"
+
+        t_scalar = bench(mem._rank_hits_scalar, args.repeat, **kwargs)
+        t_vector = bench(mem._rank_hits_vectorized, args.repeat, **kwargs)
+        print(f"{window:>8} {t_scalar * 1000:>11.3f} {t_vector * 1000:>10.3f} "
+              f"{t_scalar / t_vector:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Start the Elara enrichment server (resident backend for intention-hook.py).
+
+SCRIPT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+PID_FILE="$HOME/.claude/elara-enrich.pid"
+
+# Check if already running
+if [ -f "$PID_FILE" ]; then
+    PID=$(cat "$PID_FILE")
+    if kill -0 "$PID" 2>/dev/null; then
+        echo "[Enrich] Already running (PID $PID)"
+        exit 0
+    else
+        rm -f "$PID_FILE"
+    fi
+fi
+
+# Start server using venv python directly (same data dir the hook uses)
+cd "$SCRIPT_DIR"
+ELARA_DATA_DIR="${ELARA_DATA_DIR:-$HOME/.claude}" \
+    nohup "$SCRIPT_DIR/venv/bin/python3" -m hooks.enrich_server >> "$HOME/.claude/elara-enrich.log" 2>&1 &
+echo "[Enrich] Started (PID $!) — hook runs in-process until warm-up finishes"
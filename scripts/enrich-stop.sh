@@ -0,0 +1,18 @@
+#!/bin/bash
+# Stop the Elara enrichment server. The hook falls back to in-process enrichment.
+
+PID_FILE="$HOME/.claude/elara-enrich.pid"
+
+if [ -f "$PID_FILE" ]; then
+    PID=$(cat "$PID_FILE")
+    if kill -0 "$PID" 2>/dev/null; then
+        kill "$PID"
+        echo "[Enrich] Stopped (PID $PID)"
+    else
+        echo "[Enrich] Not running (stale PID file)"
+        rm -f "$PID_FILE"
+        rm -f "$HOME/.claude/elara-enrich.sock"
+    fi
+else
+    echo "[Enrich] Not running"
+fi
@@ -124,7 +124,8 @@ async def run_testnet(
     5. Node B syncs records from Node A
     6. Node B requests witness from Node A
     7. Verify attestation + trust score
-    8. Clean up
+    8. Both nodes diverge; anti-entropy moves only the difference
+    9. Clean up
     """
     from network.client import NetworkClient
     from network.trust import TrustScore
@@ -219,6 +220,24 @@ async def run_testnet(
         assert wcount == 1, f"Expected 1 witness, got {wcount}"
         assert abs(score - 0.5) < 0.01, f"Expected trust 0.50, got {score}"
 
+        # --- Step 6: Anti-entropy reconciliation ---
+        from network.reconcile import reconcile
+        for i in range(5):
+            node_a.create_record(f"only on A #{i}".encode())
+        for i in range(2):
+            node_b.create_record(f"only on B #{i}".encode())
+
+        report = await reconcile(client, "127.0.0.1", node_a.port, node_b.dag, push=True)
+        assert "error" not in report, f"Reconcile failed: {report}"
+        count_a = node_a.dag.stats()["total_records"]
+        count_b = node_b.dag.stats()["total_records"]
+        print(f"  [6] Reconciled: B fetched {report['fetched']}, pushed {report['pushed']} "
+              f"({report['round_trips']} round trips)")
+        print(f"      Node A DAG: {count_a}, Node B DAG: {count_b}")
+        assert report["fetched"] == 5, f"Expected 5 records fetched, got {report['fetched']}"
+        assert report["pushed"] == 2, f"Expected 2 records pushed, got {report['pushed']}"
+        assert count_a == count_b == 8, f"DAGs did not converge: {count_a} vs {count_b}"
+
         # --- Multi-node bonus: if >2 nodes, do more exchanges ---
         if num_nodes > 2:
             for i in range(2, num_nodes):
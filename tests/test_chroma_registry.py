@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the shared ChromaDB registry and the legacy-store migration."""
+
+import json
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+from chromadb.config import Settings
+
+from memory.chroma import (
+    LAYOUT_MARKER,
+    ChromaRegistry,
+    get_chroma,
+    legacy_stores,
+    migrate_to_shared_store,
+    reset_chroma,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_chroma()
+    yield
+    reset_chroma()
+
+
+def _legacy(paths, attr, name, n=3):
+    """Populate a per-module store the way the old code laid it out."""
+    client = chromadb.PersistentClient(path=str(getattr(paths, attr)),
+                                       settings=Settings(anonymized_telemetry=False))
+    coll = client.get_or_create_collection(name, metadata={"hnsw:space": "cosine"})
+    coll.add(
+        ids=[f"{name}-{i}" for i in range(n)],
+        documents=[f"doc {i}" for i in range(n)],
+        metadatas=[{"i": i} for i in range(n)],
+        embeddings=[[float(i + 1), 1.0, 0.0] for i in range(n)],
+    )
+
+
+class TestLayout:
+    def test_fresh_data_dir_uses_one_store(self, isolated_paths):
+        chroma = get_chroma()
+        assert chroma.consolidated
+        assert (isolated_paths.chroma_db / LAYOUT_MARKER).exists()
+        chroma.collection("elara_principles")
+        chroma.collection("elara_reasoning")
+        chroma.collection("elara_memories")
+        assert chroma.store_paths() == [isolated_paths.chroma_db]
+        assert chroma.collection("elara_principles") is chroma.collection("elara_principles")
+
+    def test_legacy_stores_still_served(self, isolated_paths):
+        _legacy(isolated_paths, "principles_db", "elara_principles")
+        chroma = get_chroma()
+        assert not chroma.consolidated
+        assert chroma.path_for("elara_principles") == isolated_paths.principles_db
+        assert chroma.collection("elara_principles").count() == 3
+        assert not (isolated_paths.chroma_db / LAYOUT_MARKER).exists()
+
+    def test_singleton_follows_data_dir(self, isolated_paths, tmp_path):
+        from core.paths import configure
+
+        first = get_chroma()
+        configure(tmp_path / "other")
+        assert get_chroma() is not first
+        assert get_chroma().paths.data_dir == tmp_path / "other"
+
+    def test_module_getters_use_registry(self, isolated_paths):
+        from daemon import principles, synthesis
+
+        assert principles._get_collection() is get_chroma().collection("elara_principles")
+        assert synthesis._get_seed_collection().name == "elara_synthesis_seeds"
+        assert get_chroma().store_paths() == [isolated_paths.chroma_db]
+
+
+class TestMigration:
+    def test_copies_everything_and_switches_layout(self, isolated_paths):
+        _legacy(isolated_paths, "principles_db", "elara_principles", n=3)
+        _legacy(isolated_paths, "synthesis_db", "elara_synthesis", n=2)
+        _legacy(isolated_paths, "synthesis_db", "elara_synthesis_seeds", n=4)
+        assert set(legacy_stores(isolated_paths)) == {"principles_db", "synthesis_db"}
+
+        report = migrate_to_shared_store(isolated_paths, batch_size=2)
+        assert {k: v["copied"] for k, v in report["collections"].items()} == {
+            "elara_principles": 3, "elara_synthesis": 2, "elara_synthesis_seeds": 4,
+        }
+        marker = json.loads((isolated_paths.chroma_db / LAYOUT_MARKER).read_text())
+        assert marker["migrated"] == ["elara_principles", "elara_synthesis",
+                                      "elara_synthesis_seeds"]
+
+        chroma = get_chroma()
+        assert chroma.consolidated
+        coll = chroma.collection("elara_principles")
+        got = coll.get(ids=["elara_principles-2"], include=["metadatas", "embeddings"])
+        assert got["metadatas"] == [{"i": 2}]
+        assert list(got["embeddings"][0]) == pytest.approx([3.0, 1.0, 0.0])
+        hit = coll.query(query_embeddings=[[1.0, 1.0, 0.0]], n_results=1)
+        assert hit["ids"] == [["elara_principles-0"]]
+
+    def test_rerun_is_idempotent(self, isolated_paths):
+        _legacy(isolated_paths, "memory_db", "elara_memories")
+        migrate_to_shared_store(isolated_paths)
+        migrate_to_shared_store(isolated_paths)
+        assert get_chroma().collection("elara_memories").count() == 3
+
+    def test_dry_run_writes_nothing(self, isolated_paths):
+        _legacy(isolated_paths, "memory_db", "elara_memories")
+        report = migrate_to_shared_store(isolated_paths, dry_run=True)
+        assert report["collections"]["elara_memories"]["count"] == 3
+        assert not (isolated_paths.chroma_db / LAYOUT_MARKER).exists()
+        assert not ChromaRegistry(isolated_paths).consolidated
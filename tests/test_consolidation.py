@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for vectorized duplicate/contradiction detection in MemoryConsolidator."""
+
+import numpy as np
+import pytest
+
+from memory.consolidation import MemoryConsolidator
+
+
+class EmbeddingCollection:
+    """In-memory collection with fixed embeddings and exact cosine query."""
+
+    def __init__(self, ids, docs, vectors):
+        self.ids = list(ids)
+        self.docs = list(docs)
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self.query_calls = 0
+
+    def get(self, include=None, ids=None, **kwargs):
+        out = {"ids": self.ids, "documents": self.docs, "metadatas": [{} for _ in self.ids]}
+        if include and "embeddings" in include:
+            out["embeddings"] = self.vectors
+        return out
+
+    def query(self, query_embeddings=None, n_results=10, include=None, **kwargs):
+        self.query_calls += 1
+        unit = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        out_ids, out_dist = [], []
+        for q in query_embeddings:
+            q = np.asarray(q) / np.linalg.norm(q)
+            sims = unit @ q
+            order = np.argsort(-sims, kind="stable")[:n_results]
+            out_ids.append([self.ids[i] for i in order])
+            out_dist.append([float(1 - sims[i]) for i in order])
+        return {"ids": out_ids, "distances": out_dist}
+
+    def count(self):
+        return len(self.ids)
+
+
+def _unit(angle_deg):
+    a = np.radians(angle_deg)
+    return [np.cos(a), np.sin(a), 0.0]
+
+
+@pytest.fixture
+def consolidator():
+    # cos(10°)≈0.98 → duplicate, cos(50°)≈0.64 → contradiction range, 90° → unrelated
+    ids = ["m0", "m1", "m2", "m3"]
+    docs = ["alpha fact", "alpha fact again", "alpha opposite", "unrelated"]
+    vectors = [_unit(0), _unit(10), _unit(50), [0.0, 0.0, 1.0]]
+    c = MemoryConsolidator()
+    c._vm = type("VM", (), {"collection": EmbeddingCollection(ids, docs, vectors)})()
+    return c
+
+
+class TestCandidatePairs:
+    def test_duplicates_found(self, consolidator):
+        dupes = consolidator.find_duplicates()
+        assert dupes == [("m0", "m1", pytest.approx(0.9848, abs=1e-3))]
+
+    def test_contradiction_candidates_in_range(self, consolidator):
+        pairs = consolidator.find_candidate_pairs()
+        found = {tuple(sorted((c["id_a"], c["id_b"]))) for c in pairs["contradiction_candidates"]}
+        assert found == {("m0", "m2"), ("m1", "m2")}
+        for c in pairs["contradiction_candidates"]:
+            assert 0.50 <= c["similarity"] < 0.85
+
+    def test_exact_path_makes_no_queries(self, consolidator):
+        consolidator.find_candidate_pairs(use_index=False)
+        assert consolidator.vm.collection.query_calls == 0
+
+    def test_index_path_matches_exact(self, consolidator):
+        exact = consolidator.find_candidate_pairs(use_index=False)
+        approx = consolidator.find_candidate_pairs(use_index=True)
+        assert exact["duplicates"] == approx["duplicates"]
+        key = lambda c: (c["id_a"], c["id_b"])
+        assert sorted(map(key, exact["contradiction_candidates"])) == \
+            sorted(map(key, approx["contradiction_candidates"]))
+        assert consolidator.vm.collection.query_calls == 1
+
+    def test_blocked_multiply_matches_single_block(self, consolidator, monkeypatch):
+        import memory.consolidation as mod
+        whole = consolidator.find_candidate_pairs(use_index=False)
+        monkeypatch.setattr(mod, "NEIGHBOR_BLOCK_CELLS", 1)
+        blocked = consolidator.find_candidate_pairs(use_index=False)
+        assert whole == blocked
+
+    def test_find_contradictions_uses_given_candidates(self, consolidator, monkeypatch):
+        monkeypatch.setattr(consolidator, "_classify_pairs", lambda pairs: ["contradicting"] * len(pairs))
+        monkeypatch.setattr(consolidator, "_save_contradictions", lambda c: None)
+        cands = [{"id_a": "m0", "id_b": "m2", "doc_a": "x", "doc_b": "y", "similarity": 0.6}]
+        result = consolidator.find_contradictions(candidates=cands)
+        assert [(r["id_a"], r["id_b"]) for r in result] == [("m0", "m2")]
@@ -0,0 +1,240 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for incremental conversation ingestion (byte-offset manifest)."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from memory.conversations import ConversationMemory
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for a ChromaDB collection."""
+
+    def __init__(self):
+        self.rows = {}
+        self.upserted = 0
+
+    def _match(self, meta, where):
+        if "$and" in where:
+            return all(self._match(meta, w) for w in where["$and"])
+        return all(meta.get(k) == v for k, v in where.items())
+
+    def get(self, where=None, **kwargs):
+        ids = [i for i, (_, m) in self.rows.items() if where is None or self._match(m, where)]
+        return {"ids": ids}
+
+    def delete(self, ids=None, where=None):
+        if where is not None:
+            ids = self.get(where=where)["ids"]
+        for i in ids or []:
+            self.rows.pop(i, None)
+
+    def upsert(self, ids, documents, metadatas, embeddings=None):
+        self.upserted += len(ids)
+        for i, d, m in zip(ids, documents, metadatas):
+            self.rows[i] = (d, m)
+
+    def add(self, ids, documents, metadatas, embeddings=None):
+        self.upsert(ids, documents, metadatas)
+
+    def count(self):
+        return len(self.rows)
+
+
+def _user(text, ts="2026-02-01T10:00:00Z"):
+    return {"type": "user", "cwd": "/work", "timestamp": ts,
+            "message": {"content": text}}
+
+
+def _assistant(text, ts="2026-02-01T10:00:05Z"):
+    return {"type": "assistant", "timestamp": ts,
+            "message": {"content": [{"type": "text", "text": text}]}}
+
+
+def _append(path, *entries, newline=True):
+    with open(path, "a") as f:
+        for i, e in enumerate(entries):
+            f.write(json.dumps(e))
+            if newline or i < len(entries) - 1:
+                f.write("\n")
+
+
+@pytest.fixture(autouse=True)
+def no_embedder(monkeypatch):
+    """Let the fake collection take raw documents; no embedding model needed."""
+    import memory.conversations.ingester as ingester
+    monkeypatch.setattr(ingester, "embed_documents", lambda texts: None)
+
+
+@pytest.fixture
+def cm():
+    mem = ConversationMemory.__new__(ConversationMemory)
+    mem.client = None
+    mem.collection = FakeCollection()
+    return mem
+
+
+@pytest.fixture
+def session(tmp_path):
+    d = tmp_path / "proj"
+    d.mkdir()
+    return str(d / "abc123.jsonl")
+
+
+class TestIncrementalIngest:
+    def test_full_ingest_records_offset(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"), _user("q2"), _assistant("a2"))
+        manifest = {}
+        assert cm.ingest_file(session, manifest) == 2
+        entry = manifest[session]
+        assert entry["offset"] == os.path.getsize(session)
+        assert entry["next_index"] == 2
+        assert entry["project_cwd"] == "/work"
+
+    def test_append_only_embeds_new_exchanges(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"), _user("q2"), _assistant("a2"))
+        manifest = {}
+        cm.ingest_file(session, manifest)
+        cm.collection.upserted = 0
+
+        _append(session, _user("q3"), _assistant("a3"))
+        assert cm.ingest_file(session, manifest) == 1
+        assert cm.collection.upserted == 1
+        assert cm.collection.count() == 3
+        indexes = sorted(m["exchange_index"] for _, m in cm.collection.rows.values())
+        assert indexes == [0, 1, 2]
+
+    def test_pending_user_message_is_reread(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"), _user("waiting"))
+        manifest = {}
+        assert cm.ingest_file(session, manifest) == 1
+
+        _append(session, _assistant("answer"))
+        assert cm.ingest_file(session, manifest) == 1
+        docs = [d for d, _ in cm.collection.rows.values()]
+        assert any("waiting" in d and "answer" in d for d in docs)
+
+    def test_partial_trailing_line_not_consumed(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"))
+        with open(session, "a") as f:
+            f.write('{"type": "user", "mess')
+        manifest = {}
+        cm.ingest_file(session, manifest)
+        assert manifest[session]["offset"] < os.path.getsize(session)
+
+        with open(session, "a") as f:
+            f.write('age": {"content": "late"}}\n')
+        _append(session, _assistant("reply"))
+        assert cm.ingest_file(session, manifest) == 1
+
+    def test_truncation_triggers_rebuild(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"), _user("q2"), _assistant("a2"))
+        manifest = {}
+        cm.ingest_file(session, manifest)
+
+        Path(session).write_text("")
+        _append(session, _user("new"), _assistant("start"))
+        assert cm.ingest_file(session, manifest) == 1
+        assert cm.collection.count() == 1
+
+    def test_rewritten_head_triggers_rebuild(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"))
+        manifest = {}
+        cm.ingest_file(session, manifest)
+
+        Path(session).write_text("")
+        _append(session, _user("HI"), _assistant("HELLO"), _user("more"), _assistant("text"))
+        assert cm.ingest_file(session, manifest) == 2
+        assert cm.collection.count() == 2
+
+    def test_legacy_manifest_entry_rebuilds(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"))
+        manifest = {session: {"last_modified": 0, "size_bytes": 1, "exchanges_ingested": 1}}
+        assert cm.ingest_file(session, manifest) == 1
+        assert "offset" in manifest[session]
+
+    def test_micro_ingested_rows_replaced(self, cm, session):
+        _append(session, _user("hi"), _assistant("hello"))
+        manifest = {}
+        cm.ingest_file(session, manifest)
+        cm.ingest_exchange("q2", "a2", "2026-02-01T10:01:00Z", "abc123", exchange_index=7)
+        assert cm.collection.count() == 2
+
+        _append(session, _user("q2"), _assistant("a2"))
+        cm.ingest_file(session, manifest)
+        metas = [m for _, m in cm.collection.rows.values()]
+        assert all(m["total_exchanges"] != -1 for m in metas)
+        assert cm.collection.count() == 2
+
+    def test_extract_exchanges_matches_scan(self, cm, session):
+        _append(session, _user("a"), _assistant("b"), _user("lonely"), _user("c"), _assistant("d"))
+        exchanges = cm.extract_exchanges(session)
+        assert [e["user_text"] for e in exchanges] == ["a", "c"]
+        assert [e["exchange_index"] for e in exchanges] == [0, 1]
+
+
+class TestIngestAll:
+    @pytest.fixture
+    def projects(self, tmp_path, monkeypatch):
+        import memory.conversations.core as core
+        import memory.conversations.crossref as crossref
+        import memory.conversations.ingester as ingester
+        root = tmp_path / "projects"
+        root.mkdir()
+        monkeypatch.setattr(ingester, "PROJECTS_DIR", root)
+        monkeypatch.setattr(core, "MANIFEST_PATH", tmp_path / "ingested.json")
+        monkeypatch.setattr(crossref, "EPISODES_INDEX", tmp_path / "no-index.json")
+        monkeypatch.setattr(ingester, "INGEST_BATCH_SIZE", 3)
+        for p in range(2):
+            d = root / f"proj{p}"
+            d.mkdir()
+            for s in range(3):
+                path = d / f"s{p}{s}.jsonl"
+                for i in range(s + 1):
+                    _append(str(path), _user(f"q{p}{s}{i}"), _assistant(f"a{p}{s}{i}"))
+        return root
+
+    def test_serial_reports_throughput(self, cm, projects):
+        stats = cm.ingest_all()
+        assert stats["files_ingested"] == 6
+        assert stats["exchanges_total"] == 12
+        assert stats["bytes_read"] > 0
+        assert "exchanges_per_s" in stats and "bytes_per_s" in stats
+
+    def test_parallel_matches_serial(self, cm, projects):
+        stats = cm.ingest_all(workers=2)
+        assert stats["errors"] == []
+        assert stats["files_ingested"] == 6
+        assert cm.collection.count() == 12
+        assert stats["workers"] == 2
+
+        manifest = cm._load_manifest()
+        assert len([k for k in manifest if not k.startswith("_")]) == 6
+
+        again = cm.ingest_all(workers=2)
+        assert again["files_skipped"] == 6
+        assert again["exchanges_total"] == 0
+
+    def test_parallel_failed_batch_not_manifested(self, cm, projects, monkeypatch):
+        calls = {"n": 0}
+        real_upsert = cm.collection.upsert
+
+        def flaky(ids, documents, metadatas, embeddings=None):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("embedder down")
+            real_upsert(ids, documents, metadatas)
+
+        monkeypatch.setattr(cm.collection, "upsert", flaky)
+        stats = cm.ingest_all(workers=2)
+        assert stats["errors"]
+
+        retry = cm.ingest_all(workers=2)
+        assert retry["errors"] == []
+        assert cm.collection.count() == 12
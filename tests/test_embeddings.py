@@ -0,0 +1,104 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the shared content-hash embedding cache."""
+
+import pytest
+
+from memory.embeddings import EmbeddingCache
+
+
+class CountingEmbedder:
+    """Deterministic fake embedding function that records its inputs."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def cache(tmp_path, embedder):
+    c = EmbeddingCache(path=tmp_path / "emb.db", embedding_fn=embedder)
+    yield c
+    c.close()
+
+
+class TestEmbeddingCache:
+    def test_embed_returns_vector_per_input(self, cache):
+        vecs = cache.embed(["alpha", "beta"])
+        assert len(vecs) == 2
+        assert vecs[0] == [5.0, float(sum(map(ord, "alpha")) % 97), 1.0]
+
+    def test_identical_text_embedded_once(self, cache, embedder):
+        cache.embed(["alpha", "beta"])
+        cache.embed(["beta", "alpha", "gamma"])
+        assert embedder.calls == [["alpha", "beta"], ["gamma"]]
+        assert cache.hits == 2
+        assert cache.misses == 3
+
+    def test_duplicates_within_batch_computed_once(self, cache, embedder):
+        vecs = cache.embed(["same", "same", "other"])
+        assert embedder.calls == [["same", "other"]]
+        assert vecs[0] == vecs[1]
+
+    def test_persists_across_instances(self, tmp_path, cache, embedder):
+        cache.embed(["persist me"])
+        cache.close()
+        other_embedder = CountingEmbedder()
+        reopened = EmbeddingCache(path=tmp_path / "emb.db", embedding_fn=other_embedder)
+        assert reopened.embed(["persist me"]) is not None
+        assert other_embedder.calls == []
+        reopened.close()
+
+    def test_model_is_part_of_key(self, tmp_path, embedder):
+        a = EmbeddingCache(path=tmp_path / "emb.db", embedding_fn=embedder, model="m1")
+        b = EmbeddingCache(path=tmp_path / "emb.db", embedding_fn=embedder, model="m2")
+        a.embed(["text"])
+        b.embed(["text"])
+        assert len(embedder.calls) == 2
+        a.close()
+        b.close()
+
+    def test_failing_embedder_returns_none(self, tmp_path):
+        def broken(texts):
+            raise RuntimeError("no model")
+        c = EmbeddingCache(path=tmp_path / "emb.db", embedding_fn=broken)
+        assert c.embed(["x"]) is None
+        c.close()
+
+    def test_stats(self, cache):
+        cache.embed(["a", "b"])
+        s = cache.stats()
+        assert s["entries"] == 2
+        assert s["bytes"] == 2 * 3 * 4
+
+
+class TestQueryFanOut:
+    def test_precomputed_vector_used_as_is(self, monkeypatch):
+        from memory import embeddings
+
+        monkeypatch.setattr(embeddings, "embed_documents",
+                            lambda texts: pytest.fail("should not embed"))
+        assert embeddings.query_args_for("q", (0.5, 1.0)) == {"query_embeddings": [[0.5, 1.0]]}
+
+    def test_falls_back_to_query_texts_without_model(self, monkeypatch):
+        from memory import embeddings
+
+        monkeypatch.setattr(embeddings, "embed_documents", lambda texts: None)
+        assert embeddings.embed_query("q") is None
+        assert embeddings.query_args_for("q", None) == {"query_texts": ["q"]}
+
+    def test_embed_query_single_vector(self, monkeypatch, embedder):
+        from memory import embeddings
+
+        monkeypatch.setattr(embeddings, "embed_documents", lambda texts: embedder(texts))
+        assert embeddings.embed_query("alpha") == embedder(["alpha"])[0]
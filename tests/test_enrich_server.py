@@ -0,0 +1,292 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the resident enrichment server and the prompt hook's socket client."""
+
+import importlib.util
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from hooks import enrichment
+from hooks.enrich_server import EnrichmentServer
+
+HOOK_PATH = Path(__file__).resolve().parent.parent / "hooks" / "intention-hook.py"
+
+
+@pytest.fixture
+def hook(monkeypatch, tmp_path):
+    monkeypatch.setenv("ELARA_DATA_DIR", str(tmp_path))
+    spec = importlib.util.spec_from_file_location("intention_hook", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.ENRICH_SOCKET = tmp_path / "enrich.sock"
+    return module
+
+
+@pytest.fixture
+def server(tmp_path):
+    started = []
+
+    def start(build=lambda prompt: f"[CONTEXT] {prompt}"):
+        srv = EnrichmentServer(
+            tmp_path / "enrich.sock", build=build,
+            refresh=lambda: [], mark_fresh=lambda: None, report=dict,
+        )
+        srv.bind()
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        started.append((srv, thread))
+        return srv
+
+    yield start
+    for srv, thread in started:
+        srv.shutdown()
+        thread.join(timeout=5)
+
+
+def _run_main(hook, monkeypatch, capsys, prompt):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"prompt": prompt})))
+    with pytest.raises(SystemExit):
+        hook.main()
+    return capsys.readouterr().out
+
+
+class TestHookClient:
+    def test_round_trip(self, hook, server):
+        srv = server()
+        assert hook.request_enrichment("hello there") == "[CONTEXT] hello there"
+        assert srv.requests == 1
+        assert len(srv._latencies) == 1
+
+    def test_no_server_falls_back_in_process(self, hook, monkeypatch, capsys):
+        monkeypatch.setattr(hook, "enrich_in_process", lambda p: f"[LOCAL] {p}")
+        assert hook.request_enrichment("anything") is None
+        assert _run_main(hook, monkeypatch, capsys, "anything").strip() == "[LOCAL] anything"
+
+    def test_server_error_is_silent_without_fallback(self, hook, server, monkeypatch, capsys):
+        def boom(prompt):
+            raise RuntimeError("store exploded")
+
+        server(build=boom)
+        fallback = []
+        monkeypatch.setattr(hook, "enrich_in_process", lambda p: fallback.append(p) or "x")
+        assert _run_main(hook, monkeypatch, capsys, "hello") == ""
+        assert fallback == []  # server already saw the prompt — never run it twice
+
+    def test_stale_socket_file_falls_back(self, hook, monkeypatch):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(hook.ENRICH_SOCKET))
+        stale.close()  # path exists, nobody listening
+        assert hook.request_enrichment("hello") is None
+
+
+class TestServerLifecycle:
+    def test_bind_clears_stale_socket(self, tmp_path):
+        path = tmp_path / "enrich.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+        srv = EnrichmentServer(path, build=str, refresh=list, mark_fresh=list, report=dict)
+        srv.bind()
+        assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+        srv._server.server_close()
+
+    def test_refuses_second_server(self, server, tmp_path):
+        server()
+        second = EnrichmentServer(tmp_path / "enrich.sock", build=str, refresh=list,
+                                  mark_fresh=list, report=dict)
+        with pytest.raises(RuntimeError):
+            second.bind()
+
+    def test_stats_op(self, server):
+        srv = server()
+        assert srv.dispatch({"op": "ping"}) == {"ok": True}
+        assert srv.dispatch({"op": "stats"})["stats"]["requests"] == 0
+        assert not srv.dispatch({"op": "nope"})["ok"]
+
+
+class TestStoreRefresh:
+    def test_foreign_write_resets_cached_clients(self, isolated_paths, monkeypatch):
+        import memory.vector as vector
+        from memory.chroma import ChromaRegistry
+
+        reopened = []
+        monkeypatch.setattr(ChromaRegistry, "reopen", lambda self: reopened.append(1))
+        monkeypatch.setattr(enrichment, "_store_stamps", {})
+        db = isolated_paths.chroma_db / "chroma.sqlite3"
+        db.parent.mkdir(parents=True, exist_ok=True)
+        db.write_text("")
+        assert enrichment.refresh_stale_stores() == []  # first call records a baseline
+
+        monkeypatch.setattr(vector, "_memory", object())
+        assert enrichment.refresh_stale_stores() == []
+        assert vector._memory is not None and reopened == []
+
+        os.utime(db, (db.stat().st_atime, db.stat().st_mtime + 5))
+        assert enrichment.refresh_stale_stores() == ["chroma_db"]
+        assert vector._memory is None
+        assert reopened == [1]
+
+    def test_mark_fresh_absorbs_own_writes(self, isolated_paths, monkeypatch):
+        monkeypatch.setattr(enrichment, "_store_stamps", {})
+        db = isolated_paths.conversations_db / "chroma.sqlite3"
+        db.parent.mkdir(parents=True, exist_ok=True)
+        db.write_text("")
+        enrichment.refresh_stale_stores()
+        os.utime(db, (db.stat().st_atime, db.stat().st_mtime + 5))
+        enrichment.mark_stores_fresh()
+        assert enrichment.refresh_stale_stores() == []
+
+    def test_in_process_ingest_never_triggers_reopen(self, isolated_paths, monkeypatch):
+        import memory.conversations
+
+        monkeypatch.setattr(enrichment, "_store_stamps", {})
+        db = isolated_paths.conversations_db / "chroma.sqlite3"
+        db.parent.mkdir(parents=True, exist_ok=True)
+        db.write_text("")
+        enrichment.refresh_stale_stores()
+
+        during = []
+
+        class Conversations:
+            def ingest_all(self):
+                os.utime(db, (db.stat().st_atime, db.stat().st_mtime + 5))
+                during.append(enrichment.refresh_stale_stores())
+                return {"files_ingested": 1}
+
+        monkeypatch.setattr(memory.conversations, "get_conversations", Conversations)
+        assert enrichment.ingest_conversations_in_process() == {"files_ingested": 1}
+        assert during == [[]]
+        assert enrichment.refresh_stale_stores() == []
+
+
+class TestSharedQueryEmbedding:
+    def test_compound_query_embedded_once_for_all_sections(self, tmp_path, monkeypatch):
+        import daemon.corrections
+        import daemon.principles
+        import daemon.reasoning
+        import daemon.workflows
+        import memory.conversations
+        import memory.embeddings
+        import memory.episodic
+        import memory.vector
+
+        monkeypatch.setattr(enrichment, "BUFFER_FILE", tmp_path / "buffer.jsonl")
+        monkeypatch.setattr(enrichment, "INJECTION_CACHE_FILE", tmp_path / "cache.json")
+        monkeypatch.setattr(enrichment, "get_overwatch_injection", lambda: "")
+
+        vec = [0.1, 0.2, 0.3]
+        embedded, seen = [], {}
+        monkeypatch.setattr(memory.embeddings, "embed_query",
+                            lambda q: embedded.append(q) or vec)
+
+        def capture(name):
+            def search(query, *args, query_embedding=None, **kwargs):
+                seen[name] = query_embedding
+                return []
+            return search
+
+        class Episodic:
+            search_milestones = staticmethod(capture("milestones"))
+
+        monkeypatch.setattr(memory.vector, "recall", capture("memories"))
+        monkeypatch.setattr(memory.conversations, "recall_conversation", capture("conversations"))
+        monkeypatch.setattr(memory.episodic, "get_episodic", lambda: Episodic())
+        monkeypatch.setattr(daemon.principles, "search_principles", capture("principles"))
+        monkeypatch.setattr(daemon.reasoning, "search_trails", capture("reasoning"))
+        monkeypatch.setattr(daemon.corrections, "check_corrections", capture("corrections"))
+        monkeypatch.setattr(daemon.workflows, "check_workflows", capture("workflows"))
+
+        enrichment.build_enrichment("how does the pipeline deadline work")
+        assert len(embedded) == 1
+        assert set(seen) == {"memories", "conversations", "milestones", "principles",
+                             "reasoning", "corrections", "workflows"}
+        assert all(v is vec for v in seen.values())
+
+
+class TestSectionFanOut:
+    @pytest.fixture
+    def quiet(self, tmp_path, monkeypatch):
+        """Stub every source so only the lookups under test do anything."""
+        monkeypatch.setattr(enrichment, "BUFFER_FILE", tmp_path / "buffer.jsonl")
+        monkeypatch.setattr(enrichment, "INJECTION_CACHE_FILE", tmp_path / "cache.json")
+        monkeypatch.setattr(enrichment, "get_overwatch_injection", lambda: "")
+        monkeypatch.setattr(enrichment, "get_query_embedding", lambda q: None)
+        for name in ("get_current_context", "get_current_intention"):
+            monkeypatch.setattr(enrichment, name, lambda: "")
+        monkeypatch.setattr(enrichment, "get_current_mood", lambda: {})
+        for name in ("get_relevant_memories", "get_relevant_conversations",
+                     "get_relevant_principles", "get_relevant_reasoning",
+                     "get_relevant_milestones", "get_corrections", "get_workflows",
+                     "get_decision_checks"):
+            monkeypatch.setattr(enrichment, name, lambda q, v=None: [])
+        monkeypatch.setattr(enrichment, "get_active_goals", lambda: [])
+        monkeypatch.setattr(enrichment, "get_handoff_items", lambda: [])
+        return monkeypatch
+
+    def test_lookups_run_concurrently(self, quiet):
+        def slow(result):
+            def lookup(*args):
+                time.sleep(0.2)
+                return result
+            return lookup
+
+        quiet.setattr(enrichment, "get_relevant_conversations",
+                      slow([{"date": "2026-10-01", "user_text_preview": "earlier chat"}]))
+        quiet.setattr(enrichment, "get_handoff_items", slow(["finish the pipeline"]))
+        quiet.setattr(enrichment, "get_active_goals", slow([{"title": "Ship it"}]))
+        quiet.setattr(enrichment, "get_decision_checks", slow([]))
+
+        started = time.monotonic()
+        out = enrichment.build_enrichment("tell me more", deadline=2.0)
+        assert time.monotonic() - started < 0.6  # four 200ms lookups, not 800ms
+        assert '[CONV-RECALL] 2026-10-01: "earlier chat"' in out
+        assert "[CARRY-FORWARD] finish the pipeline" in out
+        assert "1. Ship it" in out
+        assert "[LATE]" not in out
+        assert enrichment.last_report()["late"] == []
+
+    def test_late_sections_dropped_and_named(self, quiet):
+        release = threading.Event()
+
+        def stuck(*args):
+            release.wait(5)
+            return [{"statement": "never shown", "confidence": 1.0}]
+
+        quiet.setattr(enrichment, "get_relevant_principles", stuck)
+        quiet.setattr(enrichment, "get_handoff_items", lambda: ["carry me"])
+        try:
+            started = time.monotonic()
+            out = enrichment.build_enrichment("tell me more", deadline=0.2)
+            assert time.monotonic() - started < 1.0
+        finally:
+            release.set()
+        assert "[CARRY-FORWARD] carry me" in out
+        assert "never shown" not in out
+        assert out.splitlines()[-1] == "[LATE] principles (>200ms, skipped)"
+        assert enrichment.last_report()["late"] == ["principles"]
+
+    def test_failing_lookup_counts_as_empty(self, quiet):
+        def boom(*args):
+            raise RuntimeError("chroma down")
+
+        quiet.setattr(enrichment, "get_workflows", boom)
+        quiet.setattr(enrichment, "get_handoff_items", lambda: ["still here"])
+        out = enrichment.build_enrichment("tell me more")
+        assert out == "[CARRY-FORWARD] still here"
+
+    def test_server_counts_late_sections(self, tmp_path):
+        srv = EnrichmentServer(tmp_path / "s.sock", build=lambda p: "x", refresh=list,
+                               mark_fresh=list, report=lambda: {"late": ["milestones"]})
+        srv.dispatch({"prompt": "a"})
+        srv.dispatch({"prompt": "b"})
+        assert srv.stats()["late_sections"] == {"milestones": 2}
@@ -0,0 +1,148 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for change-tracked ChromaDB sync (manifest diffing)."""
+
+import uuid
+
+import pytest
+
+from memory.chroma import reset_chroma
+from memory.index_sync import (
+    build_items,
+    delete_items,
+    manifest_path,
+    sync_collection,
+    upsert_items,
+)
+
+
+class FakeCollection:
+    """The slice of the chromadb Collection API the sync layer uses."""
+
+    def __init__(self, name="elara_principles"):
+        self.name = name
+        self.id = uuid.uuid4()
+        self.rows = {}
+        self.calls = []
+
+    def count(self):
+        return len(self.rows)
+
+    def get(self, include=None):
+        return {"ids": list(self.rows)}
+
+    def upsert(self, ids, documents, metadatas):
+        self.calls.append(("upsert", list(ids)))
+        for i, d, m in zip(ids, documents, metadatas):
+            self.rows[i] = (d, m)
+
+    def update(self, ids, metadatas):
+        self.calls.append(("update", list(ids)))
+        for i, m in zip(ids, metadatas):
+            self.rows[i] = (self.rows[i][0], m)
+
+    def delete(self, ids):
+        self.calls.append(("delete", list(ids)))
+        for i in ids:
+            self.rows.pop(i, None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_chroma()
+    yield
+    reset_chroma()
+
+
+def _items(n, **meta):
+    return {f"id{i}": (f"doc {i}", {"i": i, **meta}) for i in range(n)}
+
+
+class TestSync:
+    def test_first_sync_then_nothing_to_do(self):
+        coll = FakeCollection()
+        report = sync_collection(coll, _items(5))
+        assert report["added"] == 5 and report["full_resync"]
+        assert manifest_path(coll).exists()
+
+        coll.calls.clear()
+        report = sync_collection(coll, _items(5))
+        assert coll.calls == []
+        assert report["unchanged"] == 5 and not report["full_resync"]
+
+    def test_only_differences_pushed(self):
+        coll = FakeCollection()
+        sync_collection(coll, _items(4))
+        coll.calls.clear()
+
+        items = _items(3)  # id3 removed
+        items["id0"] = ("doc 0 edited", {"i": 0})
+        items["id1"] = ("doc 1", {"i": 1, "times_surfaced": 2})
+        items["new"] = ("brand new", {"i": 9})
+        report = sync_collection(coll, items)
+
+        assert ("delete", ["id3"]) in coll.calls
+        assert ("update", ["id1"]) in coll.calls  # metadata only: no re-embed
+        assert ("upsert", ["id0", "new"]) in coll.calls
+        assert (report["added"], report["changed"], report["metadata_only"],
+                report["deleted"], report["unchanged"]) == (1, 1, 1, 1, 1)
+        assert coll.rows["id1"][1]["times_surfaced"] == 2
+
+    def test_drift_triggers_full_resync_and_prunes_unknown_ids(self):
+        coll = FakeCollection()
+        sync_collection(coll, _items(3))
+        coll.rows["orphan"] = ("written behind our back", {})
+        coll.calls.clear()
+
+        report = sync_collection(coll, _items(3))
+        assert report["full_resync"]
+        assert "orphan" not in coll.rows
+        assert coll.count() == 3
+
+        # Recreated collection (new id, same name) is not trusted either
+        fresh = FakeCollection()
+        assert sync_collection(fresh, _items(3))["added"] == 3
+
+
+class TestSingleEntryWrites:
+    def test_upsert_and_delete_keep_manifest_in_step(self):
+        coll = FakeCollection()
+        sync_collection(coll, _items(2))
+        upsert_items(coll, {"id5": ("doc 5", {"i": 5})})
+        delete_items(coll, ["id0"])
+        coll.calls.clear()
+
+        report = sync_collection(coll, {"id1": ("doc 1", {"i": 1}), "id5": ("doc 5", {"i": 5})})
+        assert coll.calls == []
+        assert not report["full_resync"]
+
+    def test_build_items_skips_unindexable(self):
+        entries = [{"pid": "a", "text": "x"}, {"pid": "", "text": "y"}, {"pid": "c", "text": ""}]
+        items = build_items(entries, "pid",
+                            lambda e: (e["text"], {}) if e["text"] else None)
+        assert items == {"a": ("x", {})}
+
+
+class TestCorrections:
+    def test_check_does_not_resync_unchanged(self, monkeypatch):
+        from daemon import corrections
+
+        coll = FakeCollection("elara_corrections")
+        coll.query = lambda **kw: {"documents": [[]], "metadatas": [[]], "distances": [[]]}
+        monkeypatch.setattr(corrections, "_get_collection", lambda: coll)
+        monkeypatch.setattr(corrections, "query_args_for", lambda q, e=None: {"query_texts": [q]})
+        monkeypatch.setattr(corrections, "CORRECTIONS_FILE",
+                            manifest_path(coll).parent / "corrections.json")
+
+        entry = corrections.add_correction("used tabs", "use spaces")
+        assert coll.count() == 1
+        coll.calls.clear()
+
+        corrections.check_corrections("formatting a file")
+        assert coll.calls == []
+
+        corrections.record_activation(entry["id"])
+        corrections.check_corrections("formatting a file")
+        assert [c[0] for c in coll.calls] == ["update"]
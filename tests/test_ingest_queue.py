@@ -0,0 +1,162 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for background conversation ingest — requests, debounce, lock, watermark."""
+
+import fcntl
+import time
+
+import pytest
+
+from memory.conversations import ingest_queue
+from memory.conversations.ingest_queue import (
+    IngestWorker,
+    ingest_age,
+    pending_request,
+    read_watermark,
+    record_watermark,
+    request_ingest,
+)
+
+
+@pytest.fixture
+def no_debounce(monkeypatch):
+    monkeypatch.setattr(ingest_queue, "INGEST_DEBOUNCE_SECONDS", 0)
+    return monkeypatch
+
+
+def _worker(calls):
+    return IngestWorker(lambda: calls.append(1) or {"files_ingested": 1}, name="test")
+
+
+class TestRequests:
+    def test_requests_coalesce(self, isolated_paths):
+        first = request_ingest("new-session")
+        request_ingest("new-session")
+        pending = pending_request()
+        assert pending["count"] == 2
+        assert pending["first_requested_at"] == first["first_requested_at"]
+        assert list(isolated_paths.ingest_request.parent.glob("elara-ingest-request*")) \
+            == [isolated_paths.ingest_request]
+
+    def test_watermark_age(self):
+        assert ingest_age() == float("inf")
+        record_watermark({"files_ingested": 3, "errors": ["x"]}, source="test")
+        assert ingest_age() < 5
+        mark = read_watermark()
+        assert mark["files_ingested"] == 3 and mark["errors"] == 1
+
+    def test_ingest_all_records_watermark(self, tmp_path, monkeypatch):
+        import memory.conversations.ingester as ingester
+        from memory.conversations import ConversationMemory
+
+        monkeypatch.setattr(ingester, "PROJECTS_DIR", tmp_path / "missing")
+        mem = ConversationMemory.__new__(ConversationMemory)
+        mem.client = mem.collection = None
+        monkeypatch.setattr(mem, "_load_manifest", lambda: {}, raising=False)
+        monkeypatch.setattr(mem, "_save_manifest", lambda m: None, raising=False)
+        mem.ingest_all()
+        assert ingest_age() < 5
+
+
+class TestWorker:
+    def test_debounced_until_quiet(self, monkeypatch):
+        monkeypatch.setattr(ingest_queue, "INGEST_DEBOUNCE_SECONDS", 60)
+        calls = []
+        request_ingest("new-session")
+        assert _worker(calls).run_pending() is None
+        assert calls == [] and pending_request() is not None
+
+    def test_runs_once_and_consumes(self, no_debounce):
+        calls = []
+        for _ in range(3):
+            request_ingest("new-session")
+        worker = _worker(calls)
+        assert worker.run_pending() == {"files_ingested": 1}
+        assert worker.run_pending() is None
+        assert calls == [1] and worker.runs == 1
+        assert pending_request() is None
+
+    def test_max_delay_overrides_debounce(self, monkeypatch):
+        monkeypatch.setattr(ingest_queue, "INGEST_DEBOUNCE_SECONDS", 60)
+        monkeypatch.setattr(ingest_queue, "INGEST_MAX_DELAY_SECONDS", 0)
+        calls = []
+        request_ingest("new-session")
+        _worker(calls).run_pending()
+        assert calls == [1]
+
+    def test_held_lock_defers_request(self, isolated_paths, no_debounce):
+        calls = []
+        request_ingest("new-session")
+        with open(isolated_paths.ingest_lock, "a") as held:
+            fcntl.flock(held, fcntl.LOCK_EX)
+            assert _worker(calls).run_pending() is None
+        assert calls == [] and pending_request() is not None
+        _worker(calls).run_pending()
+        assert calls == [1]
+
+    def test_failed_ingest_recorded(self, no_debounce):
+        def boom():
+            raise RuntimeError("chroma down")
+
+        worker = IngestWorker(boom)
+        first = request_ingest("new-session")
+        assert worker.run_pending() is None
+        assert worker.last_error == "chroma down" and worker.runs == 0
+
+        # The request survives the failure for the next run, still dated from the first ask
+        pending = pending_request()
+        assert pending["first_requested_at"] == first["first_requested_at"]
+        assert pending["reason"] == "new-session" and pending["failed_at"]
+        calls = []
+        assert _worker(calls).run_pending() == {"files_ingested": 1}
+        assert pending_request() is None
+
+    def test_failed_ingest_backs_off(self, monkeypatch):
+        monkeypatch.setattr(ingest_queue, "INGEST_DEBOUNCE_SECONDS", 60)
+        monkeypatch.setattr(ingest_queue, "INGEST_MAX_DELAY_SECONDS", 0)
+        request_ingest()
+        ingest_queue._refile_request(pending_request())
+        calls = []
+        assert _worker(calls).run_pending() is None  # overdue, but just failed
+        assert calls == []
+
+    def test_thread_picks_up_requests(self, no_debounce):
+        no_debounce.setattr(ingest_queue, "INGEST_POLL_SECONDS", 0.02)
+        calls = []
+        worker = _worker(calls).start()
+        try:
+            request_ingest("new-session")
+            deadline = time.time() + 2
+            while not calls and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            worker.stop()
+        assert calls == [1]
+
+
+class TestPromptHook:
+    @pytest.fixture
+    def hook_files(self, tmp_path, monkeypatch):
+        from hooks import enrichment
+        monkeypatch.setattr(enrichment, "SESSION_MARKER_FILE", tmp_path / "marker")
+        monkeypatch.setattr(enrichment, "BUFFER_FILE", tmp_path / "buffer.jsonl")
+        monkeypatch.setattr(enrichment, "INJECTION_CACHE_FILE", tmp_path / "cache.json")
+        return enrichment
+
+    def test_new_session_files_request_without_ingesting(self, hook_files, monkeypatch):
+        import memory.conversations
+
+        def inline(*args, **kwargs):
+            raise AssertionError("ingest ran on the prompt path")
+
+        monkeypatch.setattr(memory.conversations, "ingest_conversations", inline, raising=False)
+        monkeypatch.setattr(memory.conversations, "get_conversations", inline)
+        assert hook_files.detect_and_handle_new_session() is True
+        assert pending_request()["reason"] == "new-session"
+
+    def test_recent_watermark_skips_request(self, hook_files):
+        record_watermark({}, source="boot")
+        assert hook_files.detect_and_handle_new_session() is True
+        assert pending_request() is None
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for tail-seeking JSONL logs and their sparse time/key index."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from daemon import jsonl_log
+from daemon.jsonl_log import JsonlLog
+
+BASE = datetime(2026, 1, 1)
+
+
+def _entry(i, episode=None):
+    return {"ts": (BASE + timedelta(minutes=i)).isoformat(), "i": i, "episode": episode}
+
+
+def _filled(tmp_path, n, stride=8, episode_len=10):
+    log = JsonlLog(tmp_path / "journal.jsonl", key_field="episode", stride=stride)
+    for i in range(n):
+        log.append(_entry(i, f"ep{i // episode_len}"))
+    return log
+
+
+class TestTail:
+    def test_last_n_across_blocks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(jsonl_log, "TAIL_BLOCK", 50)  # lines straddle blocks
+        log = _filled(tmp_path, 100)
+        assert [e["i"] for e in log.tail(7)] == list(range(93, 100))
+        assert [e["i"] for e in log.tail(500)] == list(range(100))
+        assert log.tail(0) == []
+
+    def test_skips_garbage_and_missing_file(self, tmp_path):
+        log = _filled(tmp_path, 3)
+        with open(log.path, "a") as f:
+            f.write("{broken\n\n")
+        assert [e["i"] for e in log.tail(2)] == [1, 2]
+        assert JsonlLog(tmp_path / "absent.jsonl").tail(5) == []
+
+
+class TestIndex:
+    def test_time_window_reads_from_nearest_mark(self, tmp_path, monkeypatch):
+        log = _filled(tmp_path, 200)
+        read_from = []
+        original = log._read_from
+        monkeypatch.setattr(log, "_read_from",
+                            lambda offset: (read_from.append(offset), original(offset))[1])
+
+        window = log.between(BASE + timedelta(minutes=150), BASE + timedelta(minutes=155))
+        assert [e["i"] for e in window] == list(range(150, 155))
+        # Started at most one stride before the window, not at the top of the file
+        line = len(json.dumps(_entry(150, "ep15"))) + 1
+        assert 150 * line - read_from[0] <= 10 * line
+        assert [e["i"] for e in log.between(start=(BASE + timedelta(minutes=198)).isoformat())] == [198, 199]
+
+    def test_for_key_reads_only_its_runs(self, tmp_path):
+        log = _filled(tmp_path, 50)
+        log.append(_entry(50, "ep1"))  # episode resumed later
+        assert [e["i"] for e in log.for_key("ep1")] == list(range(10, 20)) + [50]
+        assert log.for_key("nope") == []
+
+    def test_index_persists_and_catches_up(self, tmp_path):
+        log = _filled(tmp_path, 40)
+        marks = log.stats()["marks"]
+        assert log.index_path.exists()
+
+        # A new reader (another process) loads the sidecar, then sees new lines
+        other = JsonlLog(log.path, key_field="episode", stride=8)
+        log.append(_entry(40, "ep9"))
+        assert other.stats()["marks"] == marks + 1
+        assert [e["i"] for e in other.for_key("ep9")] == [40]
+
+    def test_truncated_log_rebuilds(self, tmp_path):
+        log = _filled(tmp_path, 40)
+        log.stats()
+        log.path.write_text("")
+        log.append(_entry(0, "fresh"))
+        assert [e["i"] for e in log.for_key("fresh")] == [0]
+        assert log.for_key("ep1") == []
+
+    def test_partial_last_line_not_indexed(self, tmp_path):
+        log = _filled(tmp_path, 5)
+        with open(log.path, "a") as f:
+            f.write('{"ts": "2026-01-01T00:05:00", "i": 5, "epi')
+        assert len(log.between()) == 5
+        with open(log.path, "a") as f:
+            f.write('sode": "ep0"}\n')
+        assert [e["i"] for e in log.for_key("ep0")] == list(range(6))
+
+    def test_for_key_requires_key_field(self, tmp_path):
+        with pytest.raises(ValueError):
+            JsonlLog(tmp_path / "x.jsonl").for_key("a")
+
+
+class TestMoodJournal:
+    def test_readers_use_the_log(self, monkeypatch, tmp_path):
+        from daemon import mood, state_core
+
+        monkeypatch.setattr(state_core, "MOOD_JOURNAL_FILE", tmp_path / "mood.jsonl")
+        jsonl_log.reset_logs()
+        journal = state_core._mood_journal()
+        now = datetime.now()
+        for i in range(30):
+            journal.append({"ts": (now - timedelta(days=30 - i)).isoformat(),
+                            "v": 0.5, "e": 0.5, "o": 0.5, "episode": "a" if i < 25 else "b"})
+
+        assert len(mood.read_mood_journal(n=4)) == 4
+        assert len(mood.read_mood_journal_since(now - timedelta(days=7))) == 7
+        monkeypatch.setattr(mood, "_load_state", lambda: {"current_session": {"id": "b"}})
+        assert mood.get_session_arc()["pattern"] != "no_session"
+        jsonl_log.reset_logs()
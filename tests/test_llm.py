@@ -0,0 +1,173 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for batched Ollama execution and the response cache in daemon.llm."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from daemon import llm, llm_cache
+from daemon.llm_cache import LLMResponseCache
+
+
+class FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = []
+    ports = set()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, obj):
+        body = json.dumps(obj).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply({"models": []})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            self.calls.append(payload["prompt"])
+            self.ports.add(self.client_address[1])
+        if payload["prompt"].startswith("slow"):
+            time.sleep(1.0)
+        self._reply({"response": payload["prompt"].upper()})
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    llm_cache.reset_llm_cache()
+    yield
+    llm_cache.reset_llm_cache()
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    FakeOllama.calls = []
+    FakeOllama.ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllama)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(llm, "OLLAMA_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(llm, "_last_check", 0)
+    yield FakeOllama
+    server.shutdown()
+    server.server_close()
+
+
+class TestQueryBatch:
+    def test_results_in_input_order(self, ollama):
+        prompts = [f"p{i}" for i in range(10)]
+        assert llm.query_batch(prompts) == [p.upper() for p in prompts]
+
+    def test_identical_prompts_coalesced(self, ollama):
+        results = llm.query_batch(["same", "same", "other", "same"])
+        assert results == ["SAME", "SAME", "OTHER", "SAME"]
+        assert sorted(ollama.calls) == ["other", "same"]
+
+    def test_connections_are_reused(self, ollama):
+        llm.query_batch([f"a{i}" for i in range(20)])
+        llm.query_batch([f"b{i}" for i in range(20)])
+        assert len(ollama.calls) == 40
+        assert len(ollama.ports) <= llm.BATCH_CONCURRENCY
+
+    def test_per_call_timeout(self, ollama):
+        results = llm.query_batch([{"prompt": "slow one", "timeout": 0.2}, "fast"])
+        assert results == [None, "FAST"]
+
+    def test_batch_latency_recorded(self, ollama):
+        llm.query_batch(["x", "y", "x"], label="unit")
+        record = llm.batch_stats()[-1]
+        assert record["label"] == "unit"
+        assert record["size"] == 3
+        assert record["unique"] == 2
+        assert record["total_ms"] >= 0
+
+    def test_unavailable_returns_nones(self, monkeypatch):
+        monkeypatch.setattr(llm, "is_available", lambda: False)
+        assert llm.query_batch(["a", "b"]) == [None, None]
+
+    def test_single_query_uses_keepalive(self, ollama):
+        assert llm.query("hello") == "HELLO"
+        assert llm.query("again") == "AGAIN"
+
+
+class TestResponseCache:
+    def test_uncached_kind_always_calls(self, ollama):
+        llm.query("plain")
+        llm.query("plain")
+        assert ollama.calls == ["plain", "plain"]
+
+    def test_cached_query_skips_ollama(self, ollama):
+        assert llm.query("judge me", cache="triage") == "JUDGE ME"
+        assert llm.query("judge me", cache="triage") == "JUDGE ME"
+        assert ollama.calls == ["judge me"]
+        stats = llm.cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_sampling_params_are_part_of_key(self, ollama):
+        llm.query("p", cache="triage", temperature=0.1)
+        llm.query("p", cache="triage", temperature=0.2)
+        llm.query("p", cache="triage", max_tokens=7)
+        assert len(ollama.calls) == 3
+
+    def test_batch_only_sends_misses(self, ollama):
+        llm.query_batch(["a", "b"], cache="relevance")
+        results = llm.query_batch(["a", "b", "c"], cache="relevance", label="cached")
+        assert results == ["A", "B", "C"]
+        assert sorted(ollama.calls) == ["a", "b", "c"]
+        assert llm.batch_stats()[-1]["cached"] == 2
+
+    def test_hits_served_while_ollama_down(self, ollama, monkeypatch):
+        llm.query("offline", cache="classify")
+        monkeypatch.setattr(llm, "is_available", lambda: False)
+        assert llm.query("offline", cache="classify") == "OFFLINE"
+        assert llm.query_batch(["offline", "new"], cache="classify") == ["OFFLINE", None]
+
+    def test_expired_entry_is_a_miss(self, tmp_path, monkeypatch):
+        cache = LLMResponseCache(path=tmp_path / "c.db")
+        payload = llm._generate_payload("x", None, "m", 0.1, 5)
+        cache.put("triage", payload, "old")
+        monkeypatch.setitem(llm_cache.LLM_CACHE_TTLS, "triage", 1)
+        monkeypatch.setattr(llm_cache.time, "time", lambda: time.monotonic() + 10 ** 10)
+        assert cache.get("triage", payload) is None
+
+    def test_lru_eviction_respects_byte_cap(self, tmp_path):
+        cache = LLMResponseCache(path=tmp_path / "c.db", max_bytes=1000)
+        payloads = [llm._generate_payload(f"p{i}", None, "m", 0.1, 5) for i in range(10)]
+        for p in payloads:
+            cache.put("triage", p, "x" * 200)
+        stats = cache.stats()
+        assert stats["bytes"] <= 1000
+        assert stats["evictions"] > 0
+        assert cache.get("triage", payloads[-1]) == "x" * 200
+        assert cache.get("triage", payloads[0]) is None
+
+    def test_clear(self, ollama):
+        llm.query("gone", cache="triage")
+        assert llm.clear_cache() == 1
+        llm.query("gone", cache="triage")
+        assert ollama.calls == ["gone", "gone"]
+
+
+class TestParseJsonReply:
+    def test_code_fence(self):
+        assert llm._parse_json_reply('```json\n{"a": 1}\n```') == {"a": 1}
+
+    def test_mixed_text(self):
+        assert llm._parse_json_reply('Sure:\n{"relevant": true}\nthanks') == {"relevant": True}
+
+    def test_garbage(self):
+        assert llm._parse_json_reply("no json here") is None
+        assert llm._parse_json_reply(None) is None
@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for batched record framing, sync cursors and per-peer sync state."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from network.sync import (
+    MAX_FRAME_SIZE,
+    FRAME_HEADER,
+    SYNC_OVERLAP_SECONDS,
+    FrameError,
+    SyncCursor,
+    encode_frame,
+    encode_frames,
+    encode_trailer,
+    load_sync_state,
+    read_frames,
+    read_trailer,
+    resume_since,
+    save_sync_state,
+    walk_page,
+)
+
+
+def _read(data: bytes, **kwargs):
+    """Frames and trailer (or the error) from a byte string, via a real StreamReader."""
+    async def run():
+        stream = asyncio.StreamReader()
+        stream.feed_data(data)
+        stream.feed_eof()
+        frames = [f async for f in read_frames(stream, **kwargs)]
+        return frames, stream
+
+    return asyncio.run(run())
+
+
+class FakeDAG:
+    """tips() / get() over records linked by parent ids."""
+
+    def __init__(self):
+        self.records = {}
+
+    def add(self, rid, ts, parents=()):
+        self.records[rid] = SimpleNamespace(id=rid, timestamp=ts, parents=list(parents))
+
+    def tips(self):
+        referenced = {p for r in self.records.values() for p in r.parents}
+        return [rid for rid in self.records if rid not in referenced]
+
+    def get(self, rid):
+        return self.records.get(rid)
+
+
+def _chain_dag(n=30):
+    """Two interleaved branches that merge every few records."""
+    dag = FakeDAG()
+    dag.add("r0", 1.0)
+    for i in range(1, n):
+        parents = [f"r{i - 1}"] + ([f"r{i - 3}"] if i >= 3 and i % 4 == 0 else [])
+        dag.add(f"r{i}", 1.0 + i, parents)
+    return dag
+
+
+class TestFraming:
+    def test_round_trip(self):
+        payloads = [b"one", b"\x00" * 300, b"three"]
+        frames, _ = _read(encode_frames(payloads))
+        assert frames == payloads
+
+    def test_trailer_follows_end_marker(self):
+        data = encode_frames([b"a", b"b"]) + encode_trailer({"cursor": "xyz", "count": 2})
+
+        async def run():
+            stream = asyncio.StreamReader()
+            stream.feed_data(data)
+            stream.feed_eof()
+            frames = [f async for f in read_frames(stream)]
+            return frames, await read_trailer(stream)
+
+        frames, trailer = asyncio.run(run())
+        assert frames == [b"a", b"b"]
+        assert trailer == {"cursor": "xyz", "count": 2}
+
+    def test_truncated_frame(self):
+        with pytest.raises(FrameError):
+            _read(encode_frame(b"hello")[:-2])
+        with pytest.raises(FrameError):
+            _read(b"\x00\x00")
+
+    def test_limits(self):
+        with pytest.raises(FrameError):
+            _read(FRAME_HEADER.pack(MAX_FRAME_SIZE + 1))
+        with pytest.raises(FrameError):
+            _read(encode_frames([b"x"] * 4), max_frames=3)
+        with pytest.raises(FrameError):
+            _read(encode_frames([b"x" * 10] * 3), max_bytes=25)
+
+
+class TestCursor:
+    def test_encode_decode(self):
+        cursor = SyncCursor(frontier=[(5.0, "b"), (3.0, "a")], since=1.5, started=True, sent=7)
+        back = SyncCursor.decode(cursor.encode())
+        assert back == cursor
+
+    def test_garbage_rejected(self):
+        with pytest.raises(ValueError):
+            SyncCursor.decode("not-a-cursor")
+
+    def test_pages_cover_dag_once_newest_first(self):
+        dag = _chain_dag(30)
+        seen, cursor = [], None
+        while True:
+            records, cursor = walk_page(dag, cursor, limit=7)
+            seen.extend(records)
+            if cursor is None:
+                break
+            cursor = SyncCursor.decode(cursor.encode())  # as if sent over the wire
+        assert len(seen) == 30
+        assert len({r.id for r in seen}) == 30
+        stamps = [r.timestamp for r in seen]
+        assert stamps == sorted(stamps, reverse=True)
+
+    def test_since_prunes_walk(self):
+        dag = _chain_dag(30)
+        loads = []
+        original = dag.get
+        dag.get = lambda rid: loads.append(rid) or original(rid)
+        records, cursor = walk_page(dag, limit=100, since=25.0)
+        assert cursor is None
+        assert [r.id for r in records] == ["r29", "r28", "r27", "r26", "r25"]
+        assert len(set(loads)) < 10  # never walked into old history
+
+    def test_missing_parent_skipped(self):
+        dag = FakeDAG()
+        dag.add("orphan", 2.0, parents=["not-held"])
+        records, cursor = walk_page(dag)
+        assert [r.id for r in records] == ["orphan"]
+        assert cursor is None
+
+
+class TestSyncState:
+    def test_per_peer_state(self, isolated_paths):
+        assert load_sync_state("10.0.0.1", 9473) == {}
+        save_sync_state("10.0.0.1", 9473, {"cursor": "abc", "high_water": 0.0})
+        save_sync_state("10.0.0.2", 9473, {"cursor": None, "high_water": 1000.0})
+        assert load_sync_state("10.0.0.1", 9473)["cursor"] == "abc"
+        assert load_sync_state("10.0.0.2", 9473)["high_water"] == 1000.0
+
+    def test_resume_since_overlaps(self):
+        assert resume_since({}) == 0.0
+        assert resume_since({"high_water": 1000.0}) == 1000.0 - SYNC_OVERLAP_SECONDS
+
+    def test_interrupted_sync_keeps_its_floor(self, isolated_paths):
+        # Pages already pulled raised high_water; the unfinished walk must
+        # still go back to where it started, and the next sync starts late.
+        save_sync_state("10.0.0.1", 9473, {"cursor": "abc", "since": 400.0, "high_water": 5000.0})
+        state = load_sync_state("10.0.0.1", 9473)
+        assert resume_since(state) == 400.0
+        save_sync_state("10.0.0.1", 9473, {"cursor": None, "high_water": state["high_water"]})
+        assert resume_since(load_sync_state("10.0.0.1", 9473)) == 5000.0 - SYNC_OVERLAP_SECONDS
@@ -0,0 +1,197 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the Overwatch asyncio pipeline — deadline injection, ordering, session switch."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import daemon.overwatch as ow
+from daemon import llm
+from daemon.overwatch import pipeline, search
+from daemon.overwatch.watcher import PollingSessionWatcher
+
+
+class FakeConversations:
+    def __init__(self):
+        self.ingested = []
+
+    def count(self):
+        return 0
+
+    def recall(self, text, n_results=10):
+        word = text.split()[0]
+        return [{
+            "score": 0.9,
+            "session_id": "older",
+            "content": f"User: history about {word}\n\nElara: noted",
+            "epoch": 0,
+            "exchange_index": 1,
+        }]
+
+    def ingest_exchange(self, **kwargs):
+        self.ingested.append(kwargs)
+        return True
+
+
+def _line(kind, text):
+    role = "user" if kind == "user" else "assistant"
+    return json.dumps({"type": kind, "message": {"role": role, "content": text}}) + "\n"
+
+
+def _append(path, *lines):
+    with open(path, "a") as f:
+        f.writelines(lines)
+
+
+@pytest.fixture
+def overwatch(tmp_path, monkeypatch):
+    projects = tmp_path / "projects"
+    (projects / "proj").mkdir(parents=True)
+    session = projects / "proj" / "sess-1.jsonl"
+    session.write_text("")
+
+    inject = tmp_path / "inject.md"
+    monkeypatch.setattr(search, "INJECT_PATH", inject)
+    monkeypatch.setattr(search, "INJECT_TMP_PATH", tmp_path / "inject.tmp")
+    monkeypatch.setattr(search, "SESSION_STATE_PATH", tmp_path / "state.json")
+    monkeypatch.setattr(pipeline, "INJECT_PATH", inject)
+    monkeypatch.setattr(pipeline, "WATCH_IDLE_TIMEOUT", 0.05)
+    monkeypatch.setattr(ow, "STATS_PATH", tmp_path / "stats.json")
+    monkeypatch.setattr(ow, "get_conversations", FakeConversations)
+    monkeypatch.setattr(ow, "make_session_watcher",
+                        lambda d, i: PollingSessionWatcher(projects, 0.01))
+    monkeypatch.setattr(llm, "is_available", lambda: True)
+    monkeypatch.setattr(llm, "triage_memories", lambda exs, **kw: [None] * len(exs))
+
+    watcher = ow.Overwatch()
+    watcher.session = session
+    watcher.inject = inject
+    return watcher
+
+
+async def _run_until(watcher, condition, timeout=5.0):
+    task = asyncio.ensure_future(watcher._run_pipeline())
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.02)
+    watcher.running = False
+    await asyncio.wait_for(task, timeout=5)
+
+
+class TestDeadlineInjection:
+    def test_injects_unfiltered_at_deadline_then_withdraws(self, overwatch, monkeypatch):
+        monkeypatch.setattr(pipeline, "INJECT_DEADLINE", 0.1)
+
+        def slow_reject(current, historical, **kw):
+            time.sleep(0.5)
+            return [{"relevant": False, "reason": "nope"} for _ in historical]
+
+        monkeypatch.setattr(llm, "judge_relevance_batch", slow_reject)
+        seen = {}
+
+        async def scenario():
+            async def feed():
+                await asyncio.sleep(0.1)
+                _append(overwatch.session,
+                        _line("user", "alpha question here"),
+                        _line("assistant", "alpha answer"),
+                        _line("user", "beta follow up"))
+                started = time.monotonic()
+                while not overwatch.inject.exists():
+                    await asyncio.sleep(0.01)
+                seen["latency"] = time.monotonic() - started
+                seen["content"] = overwatch.inject.read_text()
+            asyncio.ensure_future(feed())
+            await _run_until(
+                overwatch, lambda: "content" in seen and not overwatch.inject.exists(),
+            )
+
+        asyncio.run(scenario())
+        assert seen["latency"] < 0.45
+        assert "history about alpha" in seen["content"]
+        assert not overwatch.inject.exists()  # late verdict withdrew it
+        assert overwatch.metrics.summary()["wake_to_inject"]["count"] == 1
+
+    def test_fast_judgment_used_directly(self, overwatch, monkeypatch):
+        monkeypatch.setattr(
+            llm, "judge_relevance_batch",
+            lambda current, historical, **kw: [
+                {"relevant": True, "reason": "judged", "importance": 1.0} for _ in historical
+            ],
+        )
+
+        async def scenario():
+            async def feed():
+                await asyncio.sleep(0.1)
+                _append(overwatch.session,
+                        _line("user", "gamma question"),
+                        _line("assistant", "gamma answer"),
+                        _line("user", "next"))
+            asyncio.ensure_future(feed())
+            await _run_until(overwatch, lambda: overwatch.inject.exists())
+
+        asyncio.run(scenario())
+        assert "history about gamma" in overwatch.inject.read_text()
+        assert overwatch.injection_count == 1
+
+
+class TestPipelineFlow:
+    def test_slow_llm_does_not_stall_ingest_order(self, overwatch, monkeypatch):
+        monkeypatch.setattr(pipeline, "INJECT_DEADLINE", 0.05)
+
+        def slow(current, historical, **kw):
+            time.sleep(0.3)
+            return [None for _ in historical]
+
+        monkeypatch.setattr(llm, "judge_relevance_batch", slow)
+
+        async def scenario():
+            async def feed():
+                await asyncio.sleep(0.1)
+                lines = []
+                for word in ("one", "two", "three", "four"):
+                    lines += [_line("user", f"{word} asks"), _line("assistant", f"{word} replies")]
+                lines.append(_line("user", "tail"))
+                _append(overwatch.session, *lines)
+            asyncio.ensure_future(feed())
+            await _run_until(overwatch, lambda: len(overwatch.recent_exchanges) == 4)
+
+        started = time.monotonic()
+        asyncio.run(scenario())
+        assert [ex["exchange_index"] for ex in overwatch.recent_exchanges] == [1, 2, 3, 4]
+        # Four serial judgments would take 1.2s before the last exchange was queued
+        assert time.monotonic() - started < 1.5
+        # Final flush ingested everything under the session it came from
+        assert {i["session_id"] for i in overwatch.conv.ingested} == {"sess-1"}
+        assert len(overwatch.conv.ingested) == 4
+
+    def test_session_switch_flushes_old_session(self, overwatch, monkeypatch):
+        monkeypatch.setattr(llm, "judge_relevance_batch",
+                            lambda current, historical, **kw: [None for _ in historical])
+        second = overwatch.session.parent / "sess-2.jsonl"
+
+        async def scenario():
+            async def feed():
+                await asyncio.sleep(0.1)
+                _append(overwatch.session, _line("user", "first asks"),
+                        _line("assistant", "first replies"), _line("user", "next one"))
+                while len(overwatch.recent_exchanges) < 1:
+                    await asyncio.sleep(0.01)
+                second.write_text("")
+                await asyncio.sleep(0.1)
+                _append(second, _line("user", "second asks"),
+                        _line("assistant", "second replies"), _line("user", "next two"))
+            asyncio.ensure_future(feed())
+            await _run_until(
+                overwatch,
+                lambda: any(ex.get("session_id") == "sess-2" for ex in overwatch.recent_exchanges),
+            )
+
+        asyncio.run(scenario())
+        sessions = [i["session_id"] for i in overwatch.conv.ingested]
+        assert sessions == ["sess-1", "sess-2"]
@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for Overwatch session watchers — inotify tracking and polling fallback."""
+
+import os
+import time
+
+import pytest
+
+from daemon.overwatch import watcher as w
+
+
+def _write(path, text="{}\n"):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    (root / "proj-a").mkdir(parents=True)
+    old = root / "proj-a" / "old.jsonl"
+    _write(old)
+    os.utime(old, (time.time() - 100, time.time() - 100))
+    _write(root / "proj-a" / "new.jsonl")
+    return root
+
+
+class TestScan:
+    def test_newest_by_mtime(self, projects):
+        assert w.scan_newest_session(projects).name == "new.jsonl"
+
+    def test_missing_dir(self, tmp_path):
+        assert w.scan_newest_session(tmp_path / "nope") is None
+
+    def test_hidden_dirs_ignored(self, projects):
+        (projects / ".cache").mkdir()
+        _write(projects / ".cache" / "x.jsonl")
+        assert w.scan_newest_session(projects).name == "new.jsonl"
+
+
+class TestPollingWatcher:
+    def test_rescans_each_call(self, projects):
+        watcher = w.PollingSessionWatcher(projects, poll_interval=0.01)
+        assert watcher.active_session().name == "new.jsonl"
+        assert watcher.wait(5) is True
+        assert watcher.stats()["rescans"] == 1
+
+
+@pytest.mark.skipif(not w.INOTIFY_AVAILABLE, reason="inotify not available")
+class TestInotifyWatcher:
+    @pytest.fixture
+    def watcher(self, projects):
+        watcher = w.InotifySessionWatcher(projects, poll_interval=0.01)
+        yield watcher
+        watcher.close()
+
+    def test_seeded_from_initial_scan(self, watcher):
+        assert watcher.active_session().name == "new.jsonl"
+
+    def test_write_wakes_and_switches_session(self, watcher, projects):
+        _write(projects / "proj-a" / "old.jsonl")
+        started = time.monotonic()
+        assert watcher.wait(5) is True
+        assert time.monotonic() - started < 1
+        assert watcher.active_session().name == "old.jsonl"
+        assert watcher.stats()["rescans"] == 1
+
+    def test_timeout_without_writes(self, watcher):
+        assert watcher.wait(0.05) is False
+
+    def test_non_session_files_ignored(self, watcher, projects):
+        _write(projects / "proj-a" / "notes.txt")
+        assert watcher.wait(0.1) is False
+        assert watcher.active_session().name == "new.jsonl"
+
+    def test_new_project_dir_is_watched(self, watcher, projects):
+        (projects / "proj-b").mkdir()
+        assert watcher.wait(0.1) is False
+        _write(projects / "proj-b" / "fresh.jsonl")
+        assert watcher.wait(5) is True
+        assert watcher.active_session() == projects / "proj-b" / "fresh.jsonl"
+
+    def test_factory_prefers_inotify(self, projects):
+        watcher = w.make_session_watcher(projects, 0.01)
+        try:
+            assert watcher.mode == "inotify"
+        finally:
+            watcher.close()
+
+
+class TestFactory:
+    def test_falls_back_to_polling(self, tmp_path):
+        watcher = w.make_session_watcher(tmp_path / "missing", 0.01)
+        assert watcher.mode == "poll"
+
+
+class TestWatchMetrics:
+    def test_summary(self):
+        metrics = w.WatchMetrics()
+        for ms in (10, 20, 30, 40):
+            metrics.record("wake_to_inject", ms / 1000)
+        summary = metrics.summary()["wake_to_inject"]
+        assert summary["count"] == 4
+        assert summary["p50_ms"] == 30.0
+        assert summary["max_ms"] == 40.0
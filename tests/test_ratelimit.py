@@ -0,0 +1,73 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the sliding-window-counter rate limiter."""
+
+from network.ratelimit import PeerRateLimiter, SlidingWindowLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(max_requests=5, window=60.0, **kwargs):
+    clock = Clock()
+    return SlidingWindowLimiter(max_requests, window, clock=clock, **kwargs), clock
+
+
+class TestWindow:
+    def test_burst_limited_then_recovers(self):
+        limiter, clock = _limiter(5)
+        assert all(limiter.allow("a") for _ in range(5))
+        assert not limiter.allow("a")
+        assert limiter.denied == 1
+
+        clock.now += 30
+        assert limiter.allow("a") is False  # still in the first window
+        clock.now += 45  # 15s into the next window: 5 * 0.75 = 3.75
+        assert limiter.allow("a")      # 3.75 + 0 < 5
+        assert limiter.allow("a")      # 3.75 + 1 < 5
+        assert not limiter.allow("a")  # 3.75 + 2 >= 5
+        clock.now += 120  # two idle windows: fully reset
+        assert all(limiter.allow("a") for _ in range(5))
+
+    def test_keys_independent_and_reset(self):
+        limiter, _ = _limiter(1)
+        assert limiter.allow("a")
+        assert not limiter.allow("a")
+        assert limiter.allow("b")
+        limiter.reset("a")
+        assert limiter.allow("a")
+        limiter.reset()
+        assert len(limiter) == 0
+
+    def test_peer_rate_limiter_name_kept(self):
+        assert PeerRateLimiter is SlidingWindowLimiter
+
+
+class TestEviction:
+    def test_idle_keys_evicted(self):
+        limiter, clock = _limiter(5)
+        for i in range(100):
+            limiter.allow(f"10.0.0.{i}")
+        clock.now += 121
+        limiter.allow("fresh")
+        assert len(limiter) == 1
+        assert limiter.evicted == 100
+
+    def test_key_count_bounded_lru(self):
+        limiter, clock = _limiter(1, max_keys=3)
+        limiter.allow("a")
+        limiter.allow("b")
+        limiter.allow("c")
+        assert not limiter.allow("a")  # touches a: b is now least recent
+        limiter.allow("d")
+        assert len(limiter) == 3
+        assert not limiter.allow("a")  # a survived, still limited
+        assert limiter.allow("b")      # b was evicted: fresh budget
+        assert limiter.stats()["keys"] == 3
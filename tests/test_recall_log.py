@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the buffered recall log, its counts index and segment rotation."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from memory import recall_log
+from memory.consolidation import MemoryConsolidator, log_recall
+from memory.recall_log import RecallLogger, get_recall_logger, reset_recall_logger
+
+
+@pytest.fixture
+def rl(tmp_path):
+    logger = RecallLogger(tmp_path / "recall.jsonl", tmp_path / "index.db")
+    yield logger
+    logger.close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_singleton():
+    reset_recall_logger()
+    yield
+    reset_recall_logger()
+
+
+class TestBuffering:
+    def test_events_buffered_until_flush(self, rl):
+        rl.log("m1", "q")
+        rl.log("m2", "q")
+        assert not rl.log_path.exists()
+        assert rl.flush() == 2
+        lines = rl.log_path.read_text().splitlines()
+        assert [json.loads(l)["memory_id"] for l in lines] == ["m1", "m2"]
+        assert "_ts" not in json.loads(lines[0])
+
+    def test_flush_on_size(self, rl, monkeypatch):
+        monkeypatch.setattr(recall_log, "RECALL_FLUSH_EVENTS", 3)
+        for i in range(3):
+            rl.log(f"m{i}", "q")
+        assert rl.flushes == 1
+        assert len(rl.log_path.read_text().splitlines()) == 3
+
+    def test_flush_on_interval(self, rl, monkeypatch):
+        monkeypatch.setattr(recall_log, "RECALL_FLUSH_SECONDS", 0.05)
+        rl.log("m1", "q")
+        deadline = time.time() + 2
+        while rl.flushes == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert rl.flushes == 1
+
+    def test_reads_see_buffered_events(self, rl):
+        rl.log("m1", "q")
+        assert rl.counts() == {"m1": 1}
+
+
+class TestCountsIndex:
+    def test_counts_accumulate_across_flushes(self, rl):
+        for mid in ("a", "b", "a"):
+            rl.log(mid, "q")
+        rl.flush()
+        rl.log("a", "q")
+        assert rl.counts() == {"a": 3, "b": 1}
+        assert rl.total() == 4
+        assert rl.last_recalled()["a"] <= time.time()
+
+    def test_since_uses_hour_buckets(self, rl):
+        rl.log("a", "q")
+        future = (datetime.now() + timedelta(hours=2)).isoformat()
+        past = (datetime.now() - timedelta(hours=2)).isoformat()
+        assert rl.counts(since=future) == {}
+        assert rl.counts(since=past) == {"a": 1}
+
+    def test_compact_keeps_totals(self, rl):
+        rl.log("a", "q")
+        rl.flush()
+        assert rl.compact(keep_days=-1) == 1
+        assert rl.counts() == {"a": 1}
+        assert rl.counts(since=datetime.now().isoformat()) == {}
+
+    def test_legacy_log_backfilled_once(self, tmp_path):
+        log_path = tmp_path / "recall.jsonl"
+        ts = datetime.now().isoformat()
+        log_path.write_text(
+            json.dumps({"memory_id": "old", "query": "q", "timestamp": ts}) + "\n"
+            + "not json\n"
+            + json.dumps({"memory_id": "old", "query": "q", "timestamp": ts}) + "\n"
+        )
+        first = RecallLogger(log_path, tmp_path / "index.db")
+        first.log("new", "q")
+        assert first.counts() == {"old": 2, "new": 1}
+        first.close()
+
+        second = RecallLogger(log_path, tmp_path / "index.db")
+        assert second.counts() == {"old": 2, "new": 1}
+        second.close()
+
+
+class TestRotation:
+    def test_segments_rotate_and_are_pruned(self, rl, monkeypatch):
+        monkeypatch.setattr(recall_log, "RECALL_SEGMENT_BYTES", 200)
+        monkeypatch.setattr(recall_log, "RECALL_SEGMENTS_KEPT", 2)
+        for i in range(8):
+            rl.log(f"m{i}", "a fairly long query string to fill the segment quickly")
+            rl.flush()
+        segments = rl._segments()
+        assert len(segments) == 2
+        assert rl.total() == 8  # counts survive rotation
+
+
+class TestConsolidatorIntegration:
+    def test_log_recall_feeds_consolidator(self):
+        log_recall("m1", "query", 0.8)
+        log_recall("m1", "query", 0.7)
+        log_recall("m2", "query", 0.5)
+        c = MemoryConsolidator()
+        assert c.get_recall_counts() == {"m1": 2, "m2": 1}
+        since = (datetime.now() - timedelta(days=1)).isoformat()
+        assert c.get_recall_counts(since=since) == {"m1": 2, "m2": 1}
+
+    def test_singleton_follows_data_dir(self, isolated_paths):
+        assert get_recall_logger().log_path == isolated_paths.recall_log
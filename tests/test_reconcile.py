@@ -0,0 +1,159 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for anti-entropy reconciliation between two DAGs."""
+
+import asyncio
+import hashlib
+import json
+
+from network.reconcile import LEAF_SIZE, ReconcileIndex, index_for, reconcile
+
+
+class Record:
+    def __init__(self, rid, timestamp, parents=()):
+        self.id = rid
+        self.timestamp = timestamp
+        self.parents = list(parents)
+
+    def to_bytes(self):
+        return json.dumps([self.id, self.timestamp, self.parents]).encode()
+
+    @classmethod
+    def from_bytes(cls, wire):
+        return cls(*json.loads(wire))
+
+
+class FakeDAG:
+    def __init__(self):
+        self.records = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def insert(self, record, verify_signature=True):
+        self.records[record.id] = record
+        return record.id
+
+    def get(self, rid):
+        return self.records.get(rid)
+
+    def tips(self):
+        referenced = {p for r in self.records.values() for p in r.parents}
+        return [rid for rid in self.records if rid not in referenced]
+
+
+def _rid(label) -> str:
+    return hashlib.sha256(str(label).encode()).hexdigest()
+
+
+def _grow(dag, labels, start_ts=0.0):
+    """Chain new records onto the newest tip."""
+    for i, label in enumerate(labels):
+        tips = sorted(dag.tips(), key=lambda t: dag.get(t).timestamp)
+        dag.insert(Record(_rid(label), start_ts + i, tips[-1:]))
+
+
+class LocalClient:
+    """NetworkClient stand-in that answers from another DAG's index in-process."""
+
+    def __init__(self, dag):
+        self.dag = dag
+        self.calls = []
+
+    async def reconcile_summary(self, host, port, prefixes):
+        self.calls.append(("summary", len(prefixes)))
+        index = index_for(self.dag)
+        index.refresh()
+        return {"nodes": index.summaries(prefixes)}
+
+    async def reconcile_ids(self, host, port, prefixes):
+        self.calls.append(("ids", len(prefixes)))
+        return {"ids": {p: index_for(self.dag).ids_under(p) for p in prefixes}}
+
+    async def fetch_records(self, host, port, ids):
+        self.calls.append(("fetch", len(ids)))
+        return {"records": [self.dag.get(i).to_bytes() for i in ids], "missing": []}
+
+    async def push_records(self, host, port, wires):
+        self.calls.append(("push", len(wires)))
+        for wire in wires:
+            self.dag.insert(Record.from_bytes(wire))
+        return {"accepted": len(wires)}
+
+
+def _run(local, remote, push=False):
+    client = LocalClient(remote)
+    report = asyncio.run(reconcile(client, "peer", 1, local, push=push,
+                                   decode=Record.from_bytes))
+    return report, client
+
+
+class TestIndex:
+    def test_fingerprints_match_for_equal_sets(self):
+        a, b = FakeDAG(), FakeDAG()
+        _grow(a, range(300))
+        for rid in reversed(list(a.records)):  # same set, different insert order
+            b.insert(a.records[rid])
+        ia, ib = ReconcileIndex(a), ReconcileIndex(b)
+        ia.refresh()
+        ib.refresh()
+        assert len(ia) == 300
+        for prefix in ("", "a", "3f", "3f0", "3f0c"):
+            assert ia.fingerprint(prefix) == ib.fingerprint(prefix)
+            assert ia.children(prefix) == ib.children(prefix)
+        assert sum(n for n, _ in ia.children("").values()) == 300
+
+    def test_refresh_is_incremental_and_catches_late_parents(self):
+        dag = FakeDAG()
+        _grow(dag, range(10))
+        index = ReconcileIndex(dag)
+        assert index.refresh() == 10
+        assert index.refresh() == 0
+
+        # Child arrives before its parent (out-of-order sync)
+        dag.insert(Record(_rid("child"), 20.0, [_rid("parent")]))
+        assert index.refresh() == 1
+        dag.insert(Record(_rid("parent"), 19.0, [_rid(9)]))
+        assert index.refresh() == 1
+        assert len(index) == len(dag) == 12
+        assert _rid("parent") in index.ids_under("")
+
+
+class TestReconcile:
+    def test_equal_dags_one_round_trip(self):
+        a, b = FakeDAG(), FakeDAG()
+        _grow(a, range(200))
+        for r in a.records.values():
+            b.insert(r)
+        report, client = _run(a, b)
+        assert client.calls == [("summary", 1)]
+        assert report["fetched"] == report["peer_missing"] == 0
+
+    def test_transfers_only_the_difference(self):
+        shared = FakeDAG()
+        _grow(shared, range(5000))
+        a, b = FakeDAG(), FakeDAG()
+        for r in shared.records.values():
+            a.insert(r)
+            b.insert(r)
+        _grow(b, [f"b-{i}" for i in range(10)], start_ts=10_000)
+        _grow(a, [f"a-{i}" for i in range(3)], start_ts=20_000)
+
+        report, client = _run(a, b, push=True)
+        assert report["fetched"] == 10
+        assert report["pushed"] == report["peer_missing"] == 3
+        assert set(a.records) == set(b.records)
+        assert report["ids_listed"] <= 13 * LEAF_SIZE  # never listed the shared history
+        assert [c for c in client.calls if c[0] == "fetch"] == [("fetch", 10)]
+
+        again, _ = _run(a, b)
+        assert again["round_trips"] == 1
+
+    def test_empty_side_gets_everything(self):
+        a, b = FakeDAG(), FakeDAG()
+        _grow(b, range(500))
+        report, _ = _run(a, b)
+        assert report["fetched"] == 500
+        assert set(a.records) == set(b.records)
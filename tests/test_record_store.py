@@ -0,0 +1,144 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the SQLite record store and the modules that sit on it."""
+
+import json
+
+import pytest
+
+from daemon.record_store import (
+    RecordStore,
+    get_record_store,
+    migrate_json_dirs,
+    reset_record_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    reset_record_store()
+    yield
+    reset_record_store()
+
+
+def _trail(tid, started, resolved=False, tags=()):
+    return {"trail_id": tid, "started": started, "context": f"problem {tid}",
+            "resolved": resolved, "tags": list(tags)}
+
+
+def _prediction(pid, status, confidence, created="2026-01-01"):
+    return {"prediction_id": pid, "statement": f"s {pid}", "status": status,
+            "confidence": confidence, "created": created}
+
+
+class TestStore:
+    def test_round_trip_and_indexed_filters(self):
+        store = get_record_store()
+        store.put_many("reasoning", [
+            _trail("a", "2026-01-01", tags=["db"]),
+            _trail("b", "2026-01-03", resolved=True, tags=["db", "net"]),
+            _trail("c", "2026-01-02", tags=["net"]),
+        ])
+        assert store.get("reasoning", "b")["resolved"] is True
+        assert store.get("reasoning", "missing") is None
+        assert store.get("reasoning", "a")["hypotheses"] == []  # schema defaults filled
+
+        ids = lambda rows: [r["trail_id"] for r in rows]
+        assert ids(store.list("reasoning", status=False)) == ["a", "c"]
+        assert ids(store.list("reasoning", tag="db", order_by="created", descending=True)) == ["b", "a"]
+        assert ids(store.list("reasoning", since="2026-01-02", limit=1, order_by="created")) == ["c"]
+        assert store.count("reasoning", status=True) == 1
+        assert store.tag_counts("reasoning") == {"db": 2, "net": 2}
+
+        store.put("reasoning", {**store.get("reasoning", "a"), "tags": ["net"]})
+        assert store.tag_counts("reasoning") == {"db": 1, "net": 3}
+        assert store.delete("reasoning", "a")
+        assert store.count("reasoning") == 2
+
+    def test_write_validates(self):
+        with pytest.raises(Exception):
+            get_record_store().put("predictions", {"prediction_id": "x"})  # no statement
+        with pytest.raises(ValueError):
+            get_record_store().list("nope")
+
+    def test_status_summary(self):
+        store = get_record_store()
+        store.put_many("predictions", [
+            _prediction("1", "correct", 0.8), _prediction("2", "correct", 0.6),
+            _prediction("3", "pending", 0.5),
+        ])
+        summary = store.status_summary("predictions", average="confidence")
+        assert summary["correct"]["count"] == 2
+        assert summary["correct"]["avg"] == pytest.approx(0.7)
+
+
+class TestLegacyImport:
+    def _legacy(self, paths):
+        paths.reasoning_dir.mkdir(parents=True, exist_ok=True)
+        for t in (_trail("old1", "2025-01-01"), _trail("old2", "2025-02-01", True)):
+            (paths.reasoning_dir / f"{t['trail_id']}.json").write_text(json.dumps(t))
+        (paths.reasoning_dir / "broken.json").write_text("{not json")
+
+    def test_imported_once_on_first_access(self, isolated_paths):
+        self._legacy(isolated_paths)
+        store = get_record_store()
+        assert store.count("reasoning") == 2
+
+        # Later edits in the store survive: the import is never repeated
+        store.put("reasoning", {**store.get("reasoning", "old1"), "resolved": True})
+        reset_record_store()
+        assert get_record_store().get("reasoning", "old1")["resolved"] is True
+
+    def test_explicit_migrate_only_adds_missing(self, isolated_paths):
+        self._legacy(isolated_paths)
+        report = migrate_json_dirs(isolated_paths, dry_run=True)
+        assert report["kinds"]["reasoning"] == {
+            "from": str(isolated_paths.reasoning_dir), "files": 3, "imported": 2, "invalid": 1}
+        assert not isolated_paths.records_db.exists()
+
+        assert migrate_json_dirs(isolated_paths)["kinds"]["reasoning"]["imported"] == 2
+        assert migrate_json_dirs(isolated_paths)["kinds"]["reasoning"]["imported"] == 0
+        assert RecordStore(isolated_paths).count("reasoning") == 2
+
+
+class TestModules:
+    def test_prediction_accuracy_and_listing(self):
+        from daemon import predictions
+
+        assert predictions.get_prediction_accuracy()["accuracy"] is None
+        get_record_store().put_many("predictions", [
+            _prediction("1", "correct", 0.9, "2026-01-01"),
+            _prediction("2", "partially_correct", 0.7, "2026-01-02"),
+            _prediction("3", "wrong", 0.5, "2026-01-03"),
+            _prediction("4", "pending", 0.4, "2026-01-04"),
+        ])
+        acc = predictions.get_prediction_accuracy()
+        assert (acc["total"], acc["checked"], acc["pending"]) == (4, 3, 1)
+        assert acc["accuracy"] == 0.5
+        assert acc["avg_confidence"] == 0.7
+        assert acc["calibration"] == -0.2
+        assert [p["prediction_id"] for p in predictions.list_predictions(n=2)] == ["4", "3"]
+        assert [p["prediction_id"] for p in predictions.list_predictions(status="wrong")] == ["3"]
+
+    def test_trails_and_outcomes(self):
+        from daemon import outcomes, reasoning
+
+        get_record_store().put_many("reasoning", [
+            _trail(str(i), f"2026-01-{i + 10}", resolved=i % 2 == 0, tags=["flaky"])
+            for i in range(5)
+        ])
+        assert reasoning.get_active_trail()["trail_id"] == "3"
+        assert len(reasoning.list_trails(resolved=True)) == 3
+        assert reasoning.get_recurring_problem_tags()[0]["count"] == 5
+
+        get_record_store().put_many("outcomes", [
+            {"outcome_id": str(i), "decision": "d", "context": "c", "predicted": "p",
+             "recorded": f"2026-02-0{i + 1}", "assessment": a}
+            for i, a in enumerate(["win", "partial_win", "loss", "too_early"])
+        ])
+        stats = outcomes.get_outcome_stats()
+        assert (stats["total"], stats["checked"], stats["unchecked"]) == (4, 3, 1)
+        assert stats["win_rate"] == 0.5
+        assert [o["outcome_id"] for o in outcomes.list_outcomes(unchecked_only=True)] == ["3"]
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the signature pool that keeps Dilithium3 work off the event loop."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from network import signing
+from network.signing import PoolBusy, SignaturePool
+
+
+def _slow_verify(delay=0.2):
+    def verify(signable, signature, public_key):
+        time.sleep(delay)  # stands in for a GIL-releasing liboqs call
+        return signature == b"good"
+    return verify
+
+
+@pytest.fixture
+def pool():
+    pools = []
+
+    def make(**kwargs):
+        p = SignaturePool(**kwargs)
+        pools.append(p)
+        return p
+
+    yield make
+    for p in pools:
+        p.shutdown()
+
+
+class TestVerify:
+    def test_batch_runs_in_parallel_and_keeps_order(self, pool):
+        p = pool(workers=4, verify_fn=_slow_verify())
+        items = [(b"m", sig, b"pk") for sig in (b"good", b"bad", b"good", b"bad")]
+
+        started = time.monotonic()
+        result = asyncio.run(p.verify_many(items))
+        assert time.monotonic() - started < 0.5  # four 200ms verifies, not 800ms
+        assert result == [True, False, True, False]
+
+        stats = p.stats()
+        assert stats["verified"] == 4
+        assert stats["rejected"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["queue_peak"] == 4
+        assert stats["verify_ms"]["avg"] >= 150
+
+    def test_event_loop_stays_responsive(self, pool):
+        p = pool(workers=1, verify_fn=_slow_verify(0.3))
+
+        async def run():
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.02)
+
+            await asyncio.gather(p.verify(b"m", b"good", b"pk"), ticker())
+            return ticks
+
+        ticks = asyncio.run(run())
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.25  # ticked while the verify was running
+
+    def test_refuses_past_max_pending(self, pool):
+        p = pool(workers=1, max_pending=2, verify_fn=_slow_verify(0.1))
+
+        async def run():
+            first = asyncio.create_task(p.verify_many([(b"m", b"good", b"pk")]))
+            await asyncio.sleep(0.02)
+            with pytest.raises(PoolBusy):
+                await p.verify_many([(b"m", b"good", b"pk")] * 2)
+            return await first
+
+        assert asyncio.run(run()) == [True]
+        assert p.stats()["busy_refusals"] == 1
+        assert p.stats()["queue_depth"] == 0
+        assert asyncio.run(p.verify_many([(b"m", b"good", b"pk")] * 2)) == [True, True]
+
+    def test_idle_pool_admits_full_size_batch(self, pool):
+        from network.sync import MAX_BATCH_RECORDS
+
+        p = pool(workers=1, verify_fn=_slow_verify(0))
+        assert p.max_pending < MAX_BATCH_RECORDS
+        items = [(b"m", b"good" if i % 3 else b"bad", b"pk") for i in range(MAX_BATCH_RECORDS)]
+        result = asyncio.run(p.verify_many(items))
+        assert result == [i % 3 != 0 for i in range(MAX_BATCH_RECORDS)]
+        stats = p.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["queue_peak"] == MAX_BATCH_RECORDS
+        assert stats["busy_refusals"] == 0
+
+
+class TestSign:
+    def test_sign_runs_on_signer_thread(self, pool):
+        p = pool(workers=2)
+        threads = []
+
+        def sign(data):
+            threads.append(threading.current_thread().name)
+            return b"sig:" + data
+
+        assert asyncio.run(p.sign(sign, b"payload")) == b"sig:payload"
+        assert threads[0].startswith("elara-sign")
+        assert p.stats()["signed"] == 1
+
+    def test_idle_pool_signs_full_witness_batch(self, pool):
+        from network.sync import MAX_WITNESS_BATCH
+
+        p = pool(workers=1)
+        assert p.max_pending < MAX_WITNESS_BATCH
+        signed = asyncio.run(p.sign_many(lambda d: b"sig:" + d, [b"m"] * MAX_WITNESS_BATCH))
+        assert signed == [b"sig:m"] * MAX_WITNESS_BATCH
+        assert p.stats()["busy_refusals"] == 0
+
+
+@pytest.mark.skipif(signing.OQS_AVAILABLE, reason="liboqs installed")
+def test_unchecked_without_liboqs():
+    assert signing.verify_signature(b"m", b"s", b"pk") is None
@@ -0,0 +1,167 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the resident write-behind state store."""
+
+import json
+import os
+import time
+
+import pytest
+
+from daemon import state_store
+from daemon.state_store import StateStore
+
+
+def _store(tmp_path, **kwargs):
+    kwargs.setdefault("durability", "batched")
+    kwargs.setdefault("window", 60.0)  # only explicit flushes, unless a test says otherwise
+    return StateStore(tmp_path / "state.json", default_factory=lambda: {"n": 0}, **kwargs)
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    calls = []
+    original = state_store.atomic_write_json
+
+    def counting(path, data, indent=2):
+        calls.append(json.loads(json.dumps(data)))
+        original(path, data, indent)
+
+    monkeypatch.setattr(state_store, "atomic_write_json", counting)
+    return calls
+
+
+class TestWriteBehind:
+    def test_saves_coalesce_into_one_snapshot(self, tmp_path, writes):
+        store = _store(tmp_path)
+        for _ in range(50):
+            state = store.load()
+            state["n"] += 1
+            store.save(state)
+        assert writes == [] and store.dirty
+        assert store.load()["n"] == 50
+
+        assert store.flush()
+        assert not store.flush()  # nothing pending
+        assert writes == [{"n": 50}]
+        assert json.loads(store.path.read_text()) == {"n": 50}
+
+    def test_timer_flushes_after_window(self, tmp_path, writes):
+        store = _store(tmp_path, window=0.05)
+        store.save({"n": 1})
+        store.save({"n": 2})
+        deadline = time.time() + 5
+        while store.dirty and time.time() < deadline:
+            time.sleep(0.01)
+        assert writes == [{"n": 2}]
+
+    def test_strict_writes_through(self, tmp_path, writes):
+        store = _store(tmp_path, durability="strict")
+        store.save({"n": 1})
+        store.save({"n": 2})
+        assert len(writes) == 2 and not store.dirty
+
+    def test_switching_to_strict_flushes_pending(self, tmp_path, writes):
+        store = _store(tmp_path)
+        store.save({"n": 3})
+        store.set_durability("strict")
+        assert writes == [{"n": 3}]
+        with pytest.raises(ValueError):
+            store.set_durability("eventually")
+
+    def test_flush_all_covers_live_stores(self, tmp_path):
+        store = _store(tmp_path)
+        store.save({"n": 7})
+        state_store.flush_all()
+        assert json.loads(store.path.read_text()) == {"n": 7}
+
+
+class TestResidentCopy:
+    def test_loads_are_private_copies(self, tmp_path):
+        store = _store(tmp_path)
+        state = store.load()
+        state["n"] = 99  # never saved
+        assert store.load()["n"] == 0
+
+        saved = {"n": 1, "items": []}
+        store.save(saved)
+        saved["items"].append("after save")
+        assert store.load()["items"] == []
+
+    def test_external_rewrite_picked_up_when_clean(self, tmp_path):
+        store = _store(tmp_path)
+        store.save({"n": 1})
+        store.flush()
+
+        store.path.write_text(json.dumps({"n": 41, "from": "other process"}))
+        os.utime(store.path, ns=(0, time.time_ns() + 10**9))
+        assert store.load()["n"] == 41
+
+        # With unsaved changes of our own, the resident copy wins
+        store.save({"n": 2})
+        store.path.write_text(json.dumps({"n": 42}))
+        assert store.load()["n"] == 2
+
+    def test_two_stores_do_not_lose_each_others_updates(self, tmp_path):
+        a, b = _store(tmp_path), _store(tmp_path)
+        a.save({**a.load(), "mood": 0.5, "a": 1})
+        a.flush()
+
+        a.save({**a.load(), "a": 2})                 # pending in A
+        b.save({**b.load(), "mood": 0.9, "b": 1})
+        b.flush()
+        assert a.load() == {"n": 0, "mood": 0.9, "a": 2, "b": 1}  # ours kept on top of theirs
+
+        a.flush()
+        assert json.loads(a.path.read_text()) == {"n": 0, "mood": 0.9, "a": 2, "b": 1}
+
+        # Both changed the same value: the later flush wins, the rest survives
+        a.save({**a.load(), "n": 1})
+        b.save({**b.load(), "n": 2, "b": 2})
+        b.flush()
+        a.flush()
+        assert json.loads(a.path.read_text())["n"] == 1
+        assert b.load() == {"n": 1, "mood": 0.9, "a": 2, "b": 2}
+
+    def test_crash_recovery_and_corrupt_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        (tmp_path / "state.json.tmp").write_text(json.dumps({"n": 5}))
+        assert _store(tmp_path).load() == {"n": 5}  # interrupted rename completed
+        assert path.exists()
+
+        path.write_text("{corrupt")
+        assert _store(tmp_path).load() == {"n": 0}
+
+
+class TestEmotionalState:
+    def test_state_core_round_trip(self, tmp_path, monkeypatch):
+        from daemon import state_core
+
+        monkeypatch.setattr(state_core, "STATE_FILE", tmp_path / "elara-state.json")
+        state_core.reset_state_store()
+        state = state_core._load_state()
+        assert "current_session" in state
+        state["allostatic_load"] = 0.25
+        state_core._save_state(state)
+        assert state_core._load_state()["allostatic_load"] == 0.25
+        assert state_core._load_state()["last_update"]
+        state_core.reset_state_store()
+        assert state_core._load_state()["allostatic_load"] == 0.25
+        assert state_core.get_state_store().path == tmp_path / "elara-state.json"
+        state_core.reset_state_store()
+
+    def test_digest_sees_unflushed_state(self, isolated_paths, monkeypatch):
+        from core.continuity import build_cognitive_digest
+        from daemon import state_core
+
+        monkeypatch.setattr(state_core, "STATE_FILE", isolated_paths.state_file)
+        state_core.reset_state_store()
+        store = state_core.get_state_store()
+        store.set_durability("batched")
+        store.window = 60.0
+        store.save({**store.load(), "allostatic_load": 0.4})
+        assert not isolated_paths.state_file.exists()
+        assert build_cognitive_digest(isolated_paths).allostatic_load == 0.4
+        state_core.reset_state_store()
@@ -735,3 +735,146 @@ class TestConcurrent:
             await client.close()
         finally:
             await node_a["server"].stop()
+
+
+# ---------------------------------------------------------------------------
+# Batched push and cursor-based pull
+# ---------------------------------------------------------------------------
+
+class TestBatchExchange:
+    """Length-prefixed batch push and paged pull between two nodes."""
+
+    @pytest.mark.asyncio
+    async def test_batch_push(self, node_a, node_b):
+        await node_a["server"].start()
+        try:
+            records = [_create_signed_record(node_b["identity"], node_b["dag"], f"batch-{i}".encode())
+                       for i in range(25)]
+            wires = [r.to_bytes() for r in records]
+
+            client = NetworkClient(timeout=5.0)
+            result = await client.push_records("127.0.0.1", node_a["port"], wires)
+            assert result["accepted"] == 25
+            assert result["rejected"] == 0
+            assert result["records_per_s"] > 0
+
+            again = await client.push_records("127.0.0.1", node_a["port"], wires[:5])
+            assert again["accepted"] == 0
+            assert again["duplicates"] == 5
+            assert node_a["dag"].stats()["total_records"] == 25
+
+            status = await client.get_status("127.0.0.1", node_a["port"])
+            assert status["signatures"]["verified"] == 25
+            assert status["signatures"]["queue_depth"] == 0
+            await client.close()
+        finally:
+            await node_a["server"].stop()
+
+    @pytest.mark.asyncio
+    async def test_pull_pages_whole_dag(self, node_a):
+        await node_a["server"].start()
+        try:
+            ids = {_create_signed_record(node_a["identity"], node_a["dag"], f"page-{i}".encode()).id
+                   for i in range(23)}
+
+            client = NetworkClient(timeout=5.0)
+            seen, cursor, pages = [], None, 0
+            while True:
+                page = await client.pull_records("127.0.0.1", node_a["port"], cursor=cursor, limit=10)
+                assert "error" not in page
+                seen.extend(ValidationRecord.from_bytes(w).id for w in page["records"])
+                pages += 1
+                cursor = page["cursor"]
+                if cursor is None:
+                    break
+            assert pages == 3
+            assert len(seen) == len(set(seen)) == 23
+            assert set(seen) == ids
+            await client.close()
+        finally:
+            await node_a["server"].stop()
+
+    @pytest.mark.asyncio
+    async def test_bad_cursor_rejected(self, node_a):
+        await node_a["server"].start()
+        try:
+            client = NetworkClient(timeout=5.0)
+            page = await client.pull_records("127.0.0.1", node_a["port"], cursor="not-a-cursor")
+            assert "invalid cursor" in page["error"]
+            await client.close()
+        finally:
+            await node_a["server"].stop()
+
+
+class TestAntiEntropy:
+    """Two diverged nodes converge by exchanging only the difference."""
+
+    @pytest.mark.asyncio
+    async def test_reconcile_moves_only_missing_records(self, node_a, node_b):
+        from network.reconcile import reconcile
+
+        await node_a["server"].start()
+        try:
+            shared = [_create_signed_record(node_a["identity"], node_a["dag"], f"shared-{i}".encode())
+                      for i in range(20)]
+            for r in shared:
+                node_b["dag"].insert(r, verify_signature=False)
+            for i in range(4):
+                _create_signed_record(node_a["identity"], node_a["dag"], f"a-{i}".encode())
+            _create_signed_record(node_b["identity"], node_b["dag"], b"b-only")
+
+            client = NetworkClient(timeout=5.0)
+            report = await reconcile(client, "127.0.0.1", node_a["port"], node_b["dag"], push=True)
+            assert report["fetched"] == 4
+            assert report["pushed"] == 1
+            assert node_a["dag"].stats()["total_records"] == 25
+            assert node_b["dag"].stats()["total_records"] == 25
+
+            again = await reconcile(client, "127.0.0.1", node_a["port"], node_b["dag"])
+            assert again["round_trips"] == 1
+            await client.close()
+        finally:
+            await node_a["server"].stop()
+
+
+class TestBatchWitness:
+    """Batch counter-signing and quorum collection across live nodes."""
+
+    @pytest.mark.asyncio
+    async def test_witness_batch_endpoint(self, node_a, node_b):
+        await node_a["server"].start()
+        try:
+            records = [_create_signed_record(node_b["identity"], node_b["dag"], f"wb-{i}".encode())
+                       for i in range(10)]
+            client = NetworkClient(timeout=5.0)
+            result = await client.request_witness_batch(
+                "127.0.0.1", node_a["port"], [r.to_bytes() for r in records])
+            assert len(result["attestations"]) == 10
+            assert result["rejected"] == []
+            for r, a in zip(records, result["attestations"]):
+                assert WitnessAttestation.verify(
+                    r.signable_bytes(), bytes.fromhex(a["signature"]), node_a["identity"].public_key)
+            assert node_a["server"]._witness_manager.stats()["total_attestations"] == 10
+            await client.close()
+        finally:
+            await node_a["server"].stop()
+
+    @pytest.mark.asyncio
+    async def test_collect_quorum_from_peers(self, node_a, node_b, node_c):
+        from network.collect import collect_witnesses
+
+        await node_b["server"].start()
+        await node_c["server"].start()
+        try:
+            records = [_create_signed_record(node_a["identity"], node_a["dag"], f"q-{i}".encode())
+                       for i in range(3)]
+            peers = [PeerInfo(identity_hash=n["identity"].identity_hash, host="127.0.0.1",
+                              port=n["port"], state=PeerState.CONNECTED) for n in (node_b, node_c)]
+            client = NetworkClient(timeout=5.0)
+            report = await collect_witnesses(client, peers, records, quorum=2, deadline=10.0)
+            assert sorted(report["reached"]) == sorted(r.id for r in records)
+            assert all(p["invalid"] == 0 for p in report["peers"].values())
+            await client.close()
+        finally:
+            await node_b["server"].stop()
+            await node_c["server"].stop()
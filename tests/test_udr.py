@@ -8,7 +8,7 @@ import pytest
 from pathlib import Path
 
 from core.paths import configure, reset
-from daemon.udr import DecisionRegistry, reset_registry
+from daemon.udr import DecisionRegistry, EntityMatcher, reset_registry
 
 
 @pytest.fixture(autouse=True)
@@ -123,6 +123,51 @@ class TestCheckEntities:
         matches = reg.check_entities("arxiv techrxiv professors")
         assert len(matches) <= 2
 
+    def test_whole_words_and_separator_variants(self, reg):
+        reg.record_decision(domain="outreach", entity="esa", reason="no reply")
+        reg.record_decision(domain="upload", entity="tokenomics_whitepaper", reason="r")
+        assert reg.check_entities("more research needed") == []
+        assert reg.check_entities("email ESA again?")[0]["entity"] == "esa"
+        for text in ("the tokenomics whitepaper", "Tokenomics-Whitepaper v2",
+                     "tokenomics_whitepaper.pdf"):
+            assert [m["entity"] for m in reg.check_entities(text)] == ["tokenomics_whitepaper"]
+
+    def test_matcher_follows_record_decision(self, reg):
+        assert reg.check_entities("try arxiv") == []
+        reg.record_decision(domain="upload", entity="arxiv", reason="blocked")
+        assert len(reg.check_entities("try arxiv")) == 1
+        reg.record_decision(domain="upload", entity="arxiv", verdict="approved")
+        assert reg.check_entities("try arxiv") == []
+
+    def test_sees_other_connections_writes(self, reg):
+        assert reg.check_entities("try techrxiv") == []
+        other = DecisionRegistry()
+        other.record_decision(domain="upload", entity="techrxiv", reason="r")
+        other.close()
+        assert len(reg.check_entities("try techrxiv")) == 1
+
+    def test_overlapping_entities(self, reg):
+        reg.record_decision(domain="upload", entity="arxiv", reason="a")
+        reg.record_decision(domain="upload", entity="techrxiv", reason="b")
+        reg.record_decision(domain="upload", entity="hardware_whitepaper", reason="c")
+        matches = reg.check_entities("the hardware whitepaper went to techrxiv")
+        assert [m["entity"] for m in matches] == ["hardware_whitepaper", "techrxiv"]
+
+
+class TestEntityMatcher:
+    def test_many_patterns_one_pass(self):
+        matcher = EntityMatcher()
+        for i in range(5000):
+            matcher.add(f"vendor_{i}", f"d:vendor_{i}")
+        matcher.add("he", "d:he")
+        matcher.add("she", "d:she")
+        matcher.add("hers", "d:hers")
+        assert matcher.scan("ushers and vendor 4999, she said") == ["d:vendor_4999", "d:she"]
+        assert matcher.scan("vendor 49999") == []
+        matcher.discard("she", "d:she")
+        assert matcher.scan("she") == []
+        assert len(matcher) == 5001  # vendors + "hers"; "he" is too short to add
+
 
 # ---------------------------------------------------------------
 # List and stats
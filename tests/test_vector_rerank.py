@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for vectorized mood-congruent re-ranking in VectorMemory."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from memory import vector
+from memory.vector import VectorMemory, resonance_scores
+
+
+MOOD = {"valence": 0.7, "energy": 0.4, "openness": 0.6,
+        "emotion": "curious", "quadrant": "positive-calm"}
+
+
+def _metas(n, seed=3):
+    rng = random.Random(seed)
+    metas = []
+    for i in range(n):
+        meta = {
+            "importance": round(rng.random(), 2),
+            "encoded_valence": rng.random(),
+            "encoded_energy": rng.random(),
+            "encoded_openness": rng.random(),
+            "encoded_emotion": rng.choice(["curious", "calm", "joy", ""]),
+            "encoded_quadrant": rng.choice(["positive-calm", "negative-calm"]),
+        }
+        if i % 7 == 0:
+            meta = {"importance": 0.5}  # untagged memory
+        metas.append(meta)
+    return metas
+
+
+@pytest.fixture
+def mem(monkeypatch):
+    m = VectorMemory.__new__(VectorMemory)
+    monkeypatch.setattr(m, "_get_current_emotional_context", lambda: dict(MOOD))
+    return m
+
+
+class TestResonanceScores:
+    def test_matches_scalar(self, mem):
+        metas = _metas(200)
+        expected = [mem._calculate_resonance(m, MOOD) for m in metas]
+        assert np.allclose(resonance_scores(metas, MOOD), expected)
+
+    def test_without_discrete_emotion(self, mem):
+        metas = _metas(50)
+        mood = {"valence": 0.2, "energy": 0.9, "openness": 0.1}
+        expected = [mem._calculate_resonance(m, mood) for m in metas]
+        assert np.allclose(resonance_scores(metas, mood), expected)
+
+    def test_capped_at_one(self):
+        metas = [{"encoded_valence": 0.7, "encoded_energy": 0.4, "encoded_openness": 0.6,
+                  "importance": 1.0, "encoded_emotion": "curious"}]
+        assert resonance_scores(metas, MOOD)[0] == 1.0
+
+
+class TestRankHits:
+    def _hits(self, n):
+        rng = random.Random(11)
+        return {
+            "ids": [f"m{i}" for i in range(n)],
+            "docs": [f"doc {i}" for i in range(n)],
+            "metas": _metas(n),
+            "distances": [rng.uniform(0.1, 0.9) for _ in range(n)],
+        }
+
+    @pytest.mark.parametrize("min_importance", [0, 0.5])
+    def test_vectorized_matches_scalar(self, mem, min_importance):
+        kwargs = dict(self._hits(300), current_mood=MOOD, mood_weight=0.3,
+                      min_importance=min_importance, n_results=10)
+        scalar = mem._rank_hits_scalar(**kwargs)
+        fast = mem._rank_hits_vectorized(**kwargs)
+        assert [h["memory_id"] for h in fast] == [h["memory_id"] for h in scalar]
+        for a, b in zip(fast, scalar):
+            assert a["combined_score"] == pytest.approx(b["combined_score"])
+            assert a.keys() == b.keys()
+            assert isinstance(a["combined_score"], float)
+
+
+class FakeCollection:
+    def __init__(self, n):
+        self.n = n
+        self.requested = []
+
+    def query(self, n_results, where=None, **kwargs):
+        self.requested.append(n_results)
+        k = min(n_results, self.n)
+        return {
+            "ids": [[f"m{i}" for i in range(k)]],
+            "documents": [[f"doc {i}" for i in range(k)]],
+            "metadatas": [_metas(k)],
+            "distances": [[0.1 + i / (2 * k) for i in range(k)]],
+        }
+
+    def get(self, limit, include=None):
+        self.requested.append(limit)
+        k = min(limit, self.n)
+        return {"documents": [f"doc {i}" for i in range(k)], "metadatas": _metas(k)}
+
+
+class TestRecallWindow:
+    @pytest.fixture(autouse=True)
+    def no_side_effects(self, monkeypatch):
+        monkeypatch.setattr(vector, "CHROMA_AVAILABLE", True)
+        monkeypatch.setattr(vector, "query_args_for",
+                            lambda query, embedding=None: {"query_texts": [query]})
+
+    def test_default_window_unchanged(self, mem):
+        mem.collection = FakeCollection(1000)
+        mem.recall("q", n_results=5)
+        mem.recall("q", n_results=10)
+        assert mem.collection.requested == [15, 20]
+
+    def test_large_window(self, mem):
+        mem.collection = FakeCollection(1000)
+        results = mem.recall("q", n_results=5, window=500)
+        assert mem.collection.requested == [500]
+        assert len(results) == 5
+        scores = [r["combined_score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_mood_congruent_window(self, mem):
+        mem.collection = FakeCollection(1000)
+        results = mem.recall_mood_congruent(n_results=3, window=400)
+        assert mem.collection.requested == [400]
+        expected = sorted(
+            (mem._calculate_resonance(m, MOOD) for m in _metas(400)), reverse=True,
+        )[:3]
+        assert [r["resonance"] for r in results] == pytest.approx(expected)
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for batched attestation storage and quorum witness collection."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from network import collect
+from network.collect import collect_witnesses
+from network.types import PeerInfo, PeerState, WitnessAttestation
+from network.witness import WitnessManager
+
+
+def _att(rid, witness, sig=b"sig"):
+    return WitnessAttestation(record_id=rid, witness_identity_hash=witness,
+                              witness_signature=sig, timestamp=time.time())
+
+
+class TestBatchStore:
+    @pytest.mark.parametrize("on_disk", [True, False])
+    def test_many_rows_one_call_deduped(self, tmp_path, on_disk):
+        wm = WitnessManager(db_path=tmp_path / "att.db" if on_disk else None)
+        batch = [_att(f"r{i}", "w1") for i in range(50)] + [_att("r0", "w2")]
+        assert wm.add_attestations(batch) == 51
+        assert wm.add_attestations([_att("r0", "w1"), _att("r1", "w3")]) == 1
+        assert wm.witness_count("r0") == 2
+        assert wm.stats() == {"records_witnessed": 50, "total_attestations": 52}
+        wm.add_attestation(_att("r9", "w9"))
+        assert wm.witness_count("r9") == 2
+        wm.close()
+
+    def test_store_opened_on_another_thread(self, tmp_path):
+        # The server thread opens the store; tool calls write from elsewhere
+        made = []
+        t = threading.Thread(target=lambda: made.append(WitnessManager(db_path=tmp_path / "att.db")))
+        t.start()
+        t.join()
+        wm = made[0]
+        assert wm.add_attestations([_att("r1", "w1"), _att("r1", "w2")]) == 2
+        assert wm.witness_count("r1") == 2
+        assert len(wm.get_attestations("r1")) == 2
+        wm.close()
+
+
+class Record:
+    def __init__(self, rid):
+        self.id = rid
+
+    def signable_bytes(self):
+        return f"signable:{self.id}".encode()
+
+    def to_bytes(self):
+        return self.id.encode()
+
+
+class FakeClient:
+    """Each peer port maps to (delay seconds, forge signatures?)."""
+
+    def __init__(self, behaviour, claims=None):
+        self.behaviour = behaviour
+        self.claims = claims or {}
+        self.requests = []
+
+    async def request_witness_batch(self, host, port, wires):
+        delay, forge = self.behaviour[port]
+        self.requests.append((port, len(wires)))
+        await asyncio.sleep(delay)
+        return {
+            "witness": self.claims.get(port, f"peer-{port}"),
+            "attestations": [
+                {"record_id": w.decode(),
+                 "signature": (b"forged" if forge else f"ok:{w.decode()}".encode()).hex(),
+                 "timestamp": 1.0}
+                for w in wires
+            ],
+            "rejected": [],
+        }
+
+
+def _peer(port):
+    return PeerInfo(identity_hash=f"peer-{port}", host="127.0.0.1", port=port,
+                    state=PeerState.CONNECTED, public_key=b"pk")
+
+
+@pytest.fixture(autouse=True)
+def fake_verify(monkeypatch):
+    monkeypatch.setattr(collect, "verify_signature",
+                        lambda signable, sig, pk: sig == b"ok:" + signable.split(b":", 1)[1])
+
+
+class TestCollector:
+    def test_stops_at_quorum_without_waiting_for_slow_peer(self):
+        client = FakeClient({1: (0.01, False), 2: (0.02, False), 3: (5.0, False)})
+        records = [Record(f"rec{i}") for i in range(5)]
+        started = time.monotonic()
+        report = asyncio.run(collect_witnesses(client, [_peer(1), _peer(2), _peer(3)],
+                                               records, quorum=2, deadline=3.0))
+        assert time.monotonic() - started < 1.0
+        assert sorted(report["reached"]) == sorted(r.id for r in records)
+        assert not report["timed_out"]
+        assert report["peers"]["peer-3"]["error"] == "cancelled at quorum/deadline"
+        assert {a.witness_identity_hash for a in report["attestations"]["rec0"]} == {
+            "peer-1", "peer-2"}
+        assert sorted(client.requests) == [(1, 5), (2, 5), (3, 5)]  # one batch per peer
+
+    def test_forged_signatures_do_not_count(self):
+        client = FakeClient({1: (0.0, False), 2: (0.0, True)})
+        manager = WitnessManager()
+        report = asyncio.run(collect_witnesses(client, [_peer(1), _peer(2)], [Record("r")],
+                                               quorum=2, deadline=1.0, manager=manager))
+        assert report["short"] == {"r": 1}
+        assert report["peers"]["peer-2"]["invalid"] == 1
+        assert manager.witness_count("r") == 1
+
+    def test_peer_cannot_attest_as_another_identity(self):
+        # peer-2 signs with its own key but claims to be peer-1
+        client = FakeClient({1: (0.05, False), 2: (0.0, False)}, claims={2: "peer-1"})
+        manager = WitnessManager()
+        report = asyncio.run(collect_witnesses(client, [_peer(1), _peer(2)], [Record("r")],
+                                               quorum=2, deadline=1.0, manager=manager))
+        assert report["short"] == {"r": 1}
+        assert report["peers"]["peer-2"]["error"].startswith("answered as witness")
+        assert [a.witness_identity_hash for a in manager.get_attestations("r")] == ["peer-1"]
+
+    def test_deadline(self):
+        client = FakeClient({1: (0.0, False), 2: (5.0, False)})
+        report = asyncio.run(collect_witnesses(client, [_peer(1), _peer(2)], [Record("r")],
+                                               quorum=2, deadline=0.2))
+        assert report["timed_out"]
+        assert report["short"] == {"r": 1}
+        assert report["elapsed_s"] < 1.0